@@ -765,6 +765,44 @@ def api_key(
     api_key_banner(unmasked_api_key)
 
 
+@app.command()
+def warm_cache(
+    components_path: Path | None = typer.Option(
+        None,
+        help="Path to the directory containing custom components.",
+        show_default=False,
+    ),
+    clear: bool = typer.Option(default=False, help="Rebuild the cache from scratch."),  # noqa: FBT001
+    log_level: str = typer.Option("error", help="Logging level."),
+) -> None:
+    """Pre-build the on-disk component code cache, e.g. at image build time.
+
+    Loads every component once and persists its compiled code and template, so servers started
+    from the same installation skip building the components at startup.
+    """
+    configure(log_level=log_level)
+    from langflow.custom.code_cache import component_code_cache
+    from langflow.interface.components import aget_all_types_dict
+    from langflow.services.utils import configure_component_code_cache
+
+    settings_service = get_settings_service()
+    if components_path:
+        settings_service.settings.update_settings(components_path=components_path)
+    configure_component_code_cache(settings_service)
+    if not component_code_cache.enabled:
+        typer.echo("The component code cache is disabled.")
+        raise typer.Exit(1)
+    if clear:
+        component_code_cache.clear()
+
+    start = time.perf_counter()
+    asyncio.run(aget_all_types_dict(settings_service.settings.components_path))
+    typer.echo(
+        f"Cached {len(component_code_cache)} components in {component_code_cache.path} "
+        f"({time.perf_counter() - start:.2f}s)"
+    )
+
+
 def show_version(*, value: bool):
     if value:
         default = "DEV"
@@ -1,10 +1,10 @@
 import asyncio
-import json
 import time
 import traceback
 import uuid
 from collections.abc import AsyncIterator
 
+import orjson
 from fastapi import BackgroundTasks, HTTPException
 from fastapi.responses import JSONResponse
 from loguru import logger
@@ -192,7 +192,7 @@ async def generate_flow_events(
             components_count = len(graph.vertices)
             vertices_to_run = list(graph.vertices_to_run.union(get_top_level_vertices(graph, graph.vertices_to_run)))
 
-            await chat_service.set_cache(flow_id_str, graph)
+            await chat_service.save_run_state(graph)
             await log_telemetry(start_time, components_count, success=True)
 
         except Exception as exc:
@@ -309,7 +309,7 @@ async def generate_flow_events(
                     artifacts=artifacts,
                 )
             else:
-                await chat_service.set_cache(flow_id_str, graph)
+                await chat_service.save_run_state(graph, vertex_ids=[vertex_id])
 
             timedelta = time.perf_counter() - start_time
             duration = format_elapsed_time(timedelta)
@@ -383,8 +383,8 @@ async def generate_flow_events(
 
         # send built event or error event
         try:
-            vertex_build_response_json = vertex_build_response.model_dump_json()
-            build_data = json.loads(vertex_build_response_json)
+            # Serialized once here and embedded as-is in the event frame
+            build_data = orjson.Fragment(vertex_build_response.model_dump_json())
         except Exception as exc:
             msg = f"Error serializing vertex build response: {exc}"
             raise ValueError(msg) from exc
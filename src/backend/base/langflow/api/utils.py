@@ -4,7 +4,8 @@ import uuid
 from datetime import timedelta
 from typing import TYPE_CHECKING, Annotated, Any
 
-from fastapi import Depends, HTTPException, Query
+from fastapi import Depends, HTTPException, Query, Request, Response, UploadFile
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Params
 from loguru import logger
 from sqlalchemy import delete
@@ -18,10 +19,16 @@ from langflow.services.database.models.message import MessageTable
 from langflow.services.database.models.transactions.model import TransactionTable
 from langflow.services.database.models.vertex_builds.model import VertexBuildTable
 from langflow.services.deps import get_session, session_scope
+from langflow.services.storage.constants import STREAM_CHUNK_SIZE
+from langflow.services.storage.utils import RangeNotSatisfiableError, parse_range_header
 from langflow.services.store.utils import get_lf_version_from_pypi
+from langflow.services.write_behind.service import discard_pending_writes
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from langflow.services.chat.service import ChatService
+    from langflow.services.storage.service import StorageService
     from langflow.services.store.schema import StoreComponentCreate
 
 
@@ -185,7 +192,7 @@ async def build_graph_from_db_no_cache(flow_id: uuid.UUID, session: AsyncSession
 
 async def build_graph_from_db(flow_id: uuid.UUID, session: AsyncSession, chat_service: ChatService, **kwargs):
     graph = await build_graph_from_db_no_cache(flow_id=flow_id, session=session, **kwargs)
-    await chat_service.set_cache(str(flow_id), graph)
+    await chat_service.save_run_state(graph)
     return graph
 
 
@@ -198,7 +205,8 @@ async def build_and_cache_graph_from_data(
     # Convert flow_id to str if it's UUID
     str_flow_id = str(flow_id) if isinstance(flow_id, uuid.UUID) else flow_id
     graph = Graph.from_payload(graph_data, str_flow_id)
-    await chat_service.set_cache(str_flow_id, graph)
+    graph.set_run_id()
+    await chat_service.save_run_state(graph)
     return graph
 
 
@@ -283,6 +291,7 @@ def parse_value(value: Any, input_type: str) -> Any:
 
 async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None:
     try:
+        discard_pending_writes(flow_id)
         # TODO: Verify if deleting messages is safe in terms of session id relevance
         # If we delete messages directly, rather than setting flow_id to null,
         # it might cause unexpected behaviors because the session id could still be
@@ -363,3 +372,41 @@ async def verify_public_flow_and_get_user(flow_id: uuid.UUID, client_id: str | N
         raise HTTPException(status_code=403, detail=msg)
 
     return user, new_flow_id
+
+
+async def iter_upload_file(file: UploadFile, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read an uploaded file in chunks, so it never has to be held in memory as a whole."""
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
+async def stream_file_response(
+    storage_service: StorageService,
+    flow_id: str,
+    file_name: str,
+    request: Request,
+    *,
+    media_type: str,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Stream a file from the storage service, or the byte range asked for by the Range header of the request.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    size = await storage_service.get_file_size(flow_id, file_name)
+    try:
+        byte_range = parse_range_header(request.headers.get("range"), size)
+    except RangeNotSatisfiableError:
+        return Response(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+
+    headers = {**(headers or {}), "Accept-Ranges": "bytes", "Content-Length": str(size)}
+    if byte_range is None:
+        chunks = storage_service.get_file_stream(flow_id, file_name)
+        return StreamingResponse(chunks, media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Length"] = str(end - start + 1)
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    chunks = storage_service.get_file_stream(flow_id, file_name, start, end)
+    return StreamingResponse(chunks, status_code=206, media_type=media_type, headers=headers)
@@ -45,7 +45,6 @@ from langflow.api.v1.schemas import (
     VerticesOrderResponse,
 )
 from langflow.exceptions.component import ComponentBuildError
-from langflow.graph.graph.base import Graph
 from langflow.graph.utils import log_vertex_build
 from langflow.schema.schema import OutputValue
 from langflow.services.cache.utils import CacheMiss
@@ -112,7 +111,7 @@ async def retrieve_vertices_order(
         # and return the same structure but only with the ids
         components_count = len(graph.vertices)
         vertices_to_run = list(graph.vertices_to_run.union(get_top_level_vertices(graph, graph.vertices_to_run)))
-        await chat_service.set_cache(str(flow_id), graph)
+        await chat_service.save_run_state(graph)
         background_tasks.add_task(
             telemetry_service.log_package_playground,
             PlaygroundPayload(
@@ -275,13 +274,8 @@ async def build_vertex(
     start_time = time.perf_counter()
     error_message = None
     try:
-        graph: Graph = await chat_service.get_cache(flow_id_str)
-    except KeyError as exc:
-        raise HTTPException(status_code=404, detail="Graph not found") from exc
-
-    try:
-        cache = await chat_service.get_cache(flow_id_str)
-        if isinstance(cache, CacheMiss):
+        cached_graph = await chat_service.get_graph(flow_id_str)
+        if isinstance(cached_graph, CacheMiss):
             # If there's no cache
             logger.warning(f"No cache found for {flow_id_str}. Building graph starting at {vertex_id}")
             graph = await build_graph_from_db(
@@ -290,7 +284,7 @@ async def build_vertex(
                 chat_service=chat_service,
             )
         else:
-            graph = cache.get("result")
+            graph = cached_graph
             await graph.initialize_run()
         vertex = graph.get_vertex(vertex_id)
 
@@ -329,7 +323,7 @@ async def build_vertex(
             background_tasks.add_task(graph.end_all_traces_in_context(error=exc))
             # If there's an error building the vertex
             # we need to clear the cache
-            await chat_service.clear_cache(flow_id_str)
+            await chat_service.clear_run_state(flow_id_str)
 
         result_data_response.message = artifacts
 
@@ -354,7 +348,7 @@ async def build_vertex(
         graph.reset_inactivated_vertices()
         graph.reset_activated_vertices()
 
-        await chat_service.set_cache(flow_id_str, graph)
+        await chat_service.save_run_state(graph, vertex_ids=[vertex_id])
 
         # graph.stop_vertex tells us if the user asked
         # to stop the build of the graph at a certain vertex
@@ -405,20 +399,19 @@ async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService
     graph = None
     try:
         try:
-            cache = await chat_service.get_cache(flow_id)
+            graph = await chat_service.get_graph(flow_id)
         except Exception as exc:  # noqa: BLE001
             logger.exception("Error building Component")
             yield str(StreamData(event="error", data={"error": str(exc)}))
             return
 
-        if isinstance(cache, CacheMiss):
+        if isinstance(graph, CacheMiss):
             # If there's no cache
+            graph = None
             msg = f"No cache found for {flow_id}."
             logger.error(msg)
             yield str(StreamData(event="error", data={"error": msg}))
             return
-        else:
-            graph = cache.get("result")
 
         try:
             vertex: InterfaceVertex = graph.get_vertex(vertex_id)
@@ -479,7 +472,7 @@ async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService
     finally:
         logger.debug("Closing stream")
         if graph:
-            await chat_service.set_cache(flow_id, graph)
+            await chat_service.save_run_state(graph, vertex_ids=[vertex_id])
         yield str(StreamData(event="close", data={"message": "Stream closed"}))
 
 
@@ -32,10 +32,12 @@ from langflow.events.event_manager import create_stream_tokens_event_manager
 from langflow.exceptions.api import APIException, InvalidChatInputError
 from langflow.exceptions.serialization import SerializationError
 from langflow.graph.graph.base import Graph
+from langflow.graph.graph.plan import GraphPlan, graph_plan_cache
 from langflow.graph.schema import RunOutputs
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.interface.initialize.loading import update_params_with_load_from_db_fields
+from langflow.processing.executor import RunRejectedError
 from langflow.processing.process import process_tweaks, run_graph_internal
 from langflow.schema.graph import Tweaks
 from langflow.services.auth.utils import api_key_security, get_current_active_user
@@ -47,7 +49,7 @@ from langflow.services.database.models.user.model import User, UserRead
 from langflow.services.deps import get_session_service, get_settings_service, get_telemetry_service
 from langflow.services.settings.feature_flags import FEATURE_FLAGS
 from langflow.services.telemetry.schema import RunPayload
-from langflow.utils.compression import compress_response
+from langflow.utils.compression import payload_response
 from langflow.utils.version import get_version_info
 
 if TYPE_CHECKING:
@@ -58,20 +60,56 @@ router = APIRouter(tags=["Base"])
 
 
 @router.get("/all", dependencies=[Depends(get_current_active_user)])
-async def get_all():
+async def get_all(request: Request):
     """Retrieve all component types with compression for better performance.
 
-    Returns a compressed response containing all available component types.
+    The catalog is serialized and compressed once per change of the component cache, and served with an
+    ETag. A request whose If-None-Match header matches it gets a 304 Not Modified response.
     """
-    from langflow.interface.components import get_and_cache_all_types_dict
+    from langflow.interface.components import component_cache, get_and_cache_all_types_dict
 
     try:
-        all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
-        # Return compressed response using our utility function
-        return compress_response(all_types)
+        await get_and_cache_all_types_dict(settings_service=get_settings_service())
+        payload = await component_cache.aget_encoded()
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    return payload_response(payload, request)
+
+
+@router.get("/all/etags", dependencies=[Depends(get_current_active_user)])
+async def get_all_etags() -> dict:
+    """Retrieve the ETag of the catalog and of each component category.
+
+    Clients that hold a copy of the catalog compare these to their own to fetch only the categories that
+    changed, for example after components were lazily loaded, from `/all/{component_type}`.
+    """
+    from langflow.interface.components import component_cache, get_and_cache_all_types_dict
+
+    try:
+        await get_and_cache_all_types_dict(settings_service=get_settings_service())
+        catalog = await component_cache.aget_encoded()
+        categories = {}
+        for component_type in list(component_cache.categories()):
+            if (payload := await component_cache.aget_encoded(component_type)) is not None:
+                categories[component_type] = payload.etag
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    return {"etag": catalog.etag, "categories": categories}
+
 
+@router.get("/all/{component_type}", dependencies=[Depends(get_current_active_user)])
+async def get_component_type(component_type: str, request: Request):
+    """Retrieve the components of one category, served like `/all` with its own ETag."""
+    from langflow.interface.components import component_cache, get_and_cache_all_types_dict
+
+    try:
+        await get_and_cache_all_types_dict(settings_service=get_settings_service())
+        payload = await component_cache.aget_encoded(component_type)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
+    if payload is None:
+        raise HTTPException(status_code=404, detail=f"Component type {component_type} not found")
+    return payload_response(payload, request)
 
 
 def validate_input_and_tweaks(input_request: SimplifiedAPIRequest) -> None:
@@ -122,9 +160,14 @@ async def simple_run_flow(
         if flow.data is None:
             msg = f"Flow {flow_id_str} has no data"
             raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
+        plan_key = graph_plan_cache.make_key(flow_id_str, flow.updated_at, input_request.tweaks, stream=stream)
+        plan = graph_plan_cache.get(plan_key)
+        if plan is None:
+            graph_data = flow.data.copy()
+            graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
+            plan = GraphPlan(graph_data)
+            graph_plan_cache.set(plan_key, plan)
+        graph = Graph.from_plan(plan, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
         inputs = None
         if input_request.input_value is not None:
             inputs = [
@@ -180,6 +223,8 @@ async def simple_run_flow_task(
             event_manager=event_manager,
         )
 
+    except RunRejectedError as exc:
+        logger.warning(f"Flow {flow.id} task rejected: {exc}")
     except Exception:  # noqa: BLE001
         logger.exception(f"Error running flow {flow.id} task")
 
@@ -260,6 +305,9 @@ async def run_flow_generator(
         )
         event_manager.on_end(data={"result": result.model_dump()})
         await client_consumed_queue.get()
+    except RunRejectedError as e:
+        logger.warning(f"Flow run rejected: {e}")
+        event_manager.on_error(data={"error": f"Server busy, try again later: {e}"})
     except (ValueError, InvalidChatInputError, SerializationError) as e:
         logger.error(f"Error running flow: {e}")
         event_manager.on_error(data={"error": str(e)})
@@ -316,7 +364,12 @@ async def simplified_run_flow(
     if stream:
         asyncio_queue: asyncio.Queue = asyncio.Queue()
         asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
-        event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
+        settings = get_settings_service().settings
+        event_manager = create_stream_tokens_event_manager(
+            queue=asyncio_queue,
+            token_flush_interval=settings.token_flush_interval,
+            token_flush_bytes=settings.token_flush_bytes,
+        )
         main_task = asyncio.create_task(
             run_flow_generator(
                 flow=flow,
@@ -373,6 +426,8 @@ async def simplified_run_flow(
         raise APIException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, exception=exc, flow=flow) from exc
     except InvalidChatInputError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except RunRejectedError as exc:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(exc)) from exc
     except Exception as exc:
         background_tasks.add_task(
             telemetry_service.log_package_run,
@@ -580,6 +635,8 @@ async def experimental_run_flow(
             outputs=outputs,
             stream=stream,
         )
+    except RunRejectedError as exc:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(exc)) from exc
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)) from exc
 
@@ -1,15 +1,14 @@
-import hashlib
 from datetime import datetime, timezone
 from http import HTTPStatus
 from io import BytesIO
 from pathlib import Path
 from typing import Annotated
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile
 from fastapi.responses import StreamingResponse
 
-from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils import CurrentActiveUser, DbSession, iter_upload_file, stream_file_response
 from langflow.api.v1.schemas import UploadFileResponse
 from langflow.services.database.models.flow import Flow
 from langflow.services.deps import get_settings_service, get_storage_service
@@ -60,12 +59,21 @@ async def upload_file(
         raise HTTPException(status_code=403, detail="You don't have access to this flow")
 
     try:
-        file_content = await file.read()
         timestamp = datetime.now(tz=timezone.utc).astimezone().strftime("%Y-%m-%d_%H-%M-%S")
-        file_name = file.filename or hashlib.sha256(file_content).hexdigest()
-        full_file_name = f"{timestamp}_{file_name}"
         folder = str(flow.id)
-        await storage_service.save_file(flow_id=folder, file_name=full_file_name, data=file_content)
+        if file.filename:
+            full_file_name = f"{timestamp}_{file.filename}"
+            await storage_service.save_file_stream(folder, full_file_name, iter_upload_file(file))
+        else:
+            # Files without a name are named after their content, which is only known once saved
+            temporary_name = f"{timestamp}_{uuid4().hex}.upload"
+            stored_file = await storage_service.save_file_stream(folder, temporary_name, iter_upload_file(file))
+            full_file_name = f"{timestamp}_{stored_file.sha256}"
+            try:
+                await storage_service.rename_file(folder, temporary_name, full_file_name)
+            except Exception:
+                await storage_service.delete_file(folder, temporary_name)
+                raise
         return UploadFileResponse(flow_id=str(flow.id), file_path=f"{folder}/{full_file_name}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -73,7 +81,10 @@ async def upload_file(
 
 @router.get("/download/{flow_id}/{file_name}")
 async def download_file(
-    file_name: str, flow_id: UUID, storage_service: Annotated[StorageService, Depends(get_storage_service)]
+    file_name: str,
+    flow_id: UUID,
+    request: Request,
+    storage_service: Annotated[StorageService, Depends(get_storage_service)],
 ):
     flow_id_str = str(flow_id)
     extension = file_name.split(".")[-1]
@@ -89,19 +100,19 @@ async def download_file(
         raise HTTPException(status_code=500, detail=f"Content type not found for extension {extension}")
 
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
         headers = {
             "Content-Disposition": f"attachment; filename={file_name} filename*=UTF-8''{file_name}",
             "Content-Type": "application/octet-stream",
-            "Content-Length": str(len(file_content)),
         }
-        return StreamingResponse(BytesIO(file_content), media_type=content_type, headers=headers)
+        return await stream_file_response(
+            storage_service, flow_id_str, file_name, request, media_type=content_type, headers=headers
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
 @router.get("/images/{flow_id}/{file_name}")
-async def download_image(file_name: str, flow_id: UUID):
+async def download_image(file_name: str, flow_id: UUID, request: Request):
     storage_service = get_storage_service()
     extension = file_name.split(".")[-1]
     flow_id_str = str(flow_id)
@@ -119,8 +130,7 @@ async def download_image(file_name: str, flow_id: UUID):
         raise HTTPException(status_code=500, detail=f"Content type {content_type} is not an image")
 
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
-        return StreamingResponse(BytesIO(file_content), media_type=content_type)
+        return await stream_file_response(storage_service, flow_id_str, file_name, request, media_type=content_type)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
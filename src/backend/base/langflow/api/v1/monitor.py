@@ -18,6 +18,7 @@ from langflow.services.database.models.vertex_builds.crud import (
     get_vertex_builds_by_flow_id,
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
+from langflow.services.write_behind.service import MESSAGE, TRANSACTION, VERTEX_BUILD, flush_pending_writes
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
@@ -25,6 +26,7 @@ router = APIRouter(prefix="/monitor", tags=["Monitor"])
 @router.get("/builds")
 async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
     try:
+        await flush_pending_writes(VERTEX_BUILD)
         vertex_builds = await get_vertex_builds_by_flow_id(session, flow_id)
         return VertexBuildMapModel.from_list_of_dicts(vertex_builds)
     except Exception as e:
@@ -34,6 +36,7 @@ async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSessio
 @router.delete("/builds", status_code=204)
 async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> None:
     try:
+        await flush_pending_writes(VERTEX_BUILD)
         await delete_vertex_builds_by_flow_id(session, flow_id)
         await session.commit()
     except Exception as e:
@@ -50,6 +53,7 @@ async def get_messages(
     order_by: Annotated[str | None, Query()] = "timestamp",
 ) -> list[MessageResponse]:
     try:
+        await flush_pending_writes(MESSAGE)
         stmt = select(MessageTable)
         if flow_id:
             stmt = stmt.where(MessageTable.flow_id == flow_id)
@@ -166,6 +170,7 @@ async def get_transactions(
     params: Annotated[Params | None, Depends(custom_params)],
 ) -> Page[TransactionTable]:
     try:
+        await flush_pending_writes(TRANSACTION)
         stmt = (
             select(TransactionTable)
             .where(TransactionTable.flow_id == flow_id)
@@ -33,7 +33,7 @@ from langflow.schema.properties import Properties
 from langflow.services.auth.utils import api_key_header, api_key_query, api_key_security, get_current_user_by_jwt
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.database.models.message.model import MessageTable
-from langflow.services.deps import get_variable_service, session_scope
+from langflow.services.deps import get_variable_service, get_write_behind_service, session_scope
 from langflow.utils.voice_utils import (
     BYTES_PER_24K_FRAME,
     VAD_SAMPLE_RATE_16K,
@@ -909,7 +909,8 @@ async def process_message_queue(queue_key, session):
             message = await message_queues[queue_key].get()
 
             try:
-                await aadd_messagetables([message], session)
+                if not get_write_behind_service().enqueue_message(message):
+                    await aadd_messagetables([message], session)
                 logger.debug(f"Added message to DB: {message.text[:30]}...")
             except ValueError as e:
                 logger.error(f"Error saving message to database (ValueError): {e}")
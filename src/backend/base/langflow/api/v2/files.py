@@ -1,16 +1,14 @@
 import re
 import uuid
-from collections.abc import AsyncGenerator
 from http import HTTPStatus
 from pathlib import Path
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
 from sqlmodel import String, cast, select
 
 from langflow.api.schemas import UploadFileResponse
-from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils import CurrentActiveUser, DbSession, iter_upload_file, stream_file_response
 from langflow.services.database.models.file import File as UserFile
 from langflow.services.deps import get_settings_service, get_storage_service
 from langflow.services.storage.service import StorageService
@@ -18,12 +16,6 @@ from langflow.services.storage.service import StorageService
 router = APIRouter(tags=["Files"], prefix="/files")
 
 
-async def byte_stream_generator(file_bytes: bytes, chunk_size: int = 8192) -> AsyncGenerator[bytes, None]:
-    """Convert bytes object into an async generator that yields chunks."""
-    for i in range(0, len(file_bytes), chunk_size):
-        yield file_bytes[i : i + chunk_size]
-
-
 async def fetch_file_object(file_id: uuid.UUID, current_user: CurrentActiveUser, session: DbSession):
     # Fetch the file from the DB
     stmt = select(UserFile).where(UserFile.id == file_id)
@@ -67,11 +59,10 @@ async def upload_user_file(
             detail=f"File size is larger than the maximum file size {max_file_size_upload}MB.",
         )
 
-    # Read file content and create a unique file name
+    # Stream the file content under a unique file name
     try:
         # Create a unique file name
         file_id = uuid.uuid4()
-        file_content = await file.read()
 
         # Get file extension of the file
         file_extension = "." + file.filename.split(".")[-1] if file.filename and "." in file.filename else ""
@@ -80,7 +71,7 @@ async def upload_user_file(
         # Here we use the current user's id as the folder name
         folder = str(current_user.id)
         # Save the file using the storage service.
-        await storage_service.save_file(flow_id=folder, file_name=anonymized_file_name, data=file_content)
+        stored_file = await storage_service.save_file_stream(folder, anonymized_file_name, iter_upload_file(file))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving file: {e}") from e
 
@@ -116,8 +107,7 @@ async def upload_user_file(
             # Split the extension from the filename
             root_filename = f"{root_filename} ({count + 1})"
 
-        # Compute the file size based on the path
-        file_size = await storage_service.get_file_size(flow_id=folder, file_name=anonymized_file_name)
+        file_size = stored_file.size
 
         # Compute the file path
         file_path = f"{folder}/{anonymized_file_name}"
@@ -160,33 +150,30 @@ async def list_files(
 @router.get("/{file_id}")
 async def download_file(
     file_id: uuid.UUID,
+    request: Request,
     current_user: CurrentActiveUser,
     session: DbSession,
     storage_service: Annotated[StorageService, Depends(get_storage_service)],
 ):
-    """Download a file by its ID."""
+    """Download a file by its ID, or the byte range asked for by the Range header."""
+    # Fetch the file from the DB
+    file = await fetch_file_object(file_id, current_user, session)
     try:
-        # Fetch the file from the DB
-        file = await fetch_file_object(file_id, current_user, session)
-
         # Get the basename of the file path
         file_name = file.path.split("/")[-1]
 
-        # Get file stream
-        file_stream = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
-
-        # Ensure file_stream is an async iterator returning bytes
-        byte_stream = byte_stream_generator(file_stream)
+        # Stream the file from the storage service
+        return await stream_file_response(
+            storage_service,
+            str(current_user.id),
+            file_name,
+            request,
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{file.name}"'},
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error downloading file: {e}") from e
 
-    # Return the file as a streaming response
-    return StreamingResponse(
-        byte_stream,
-        media_type="application/octet-stream",
-        headers={"Content-Disposition": f'attachment; filename="{file.name}"'},
-    )
-
 
 @router.put("/{file_id}")
 async def edit_file_name(
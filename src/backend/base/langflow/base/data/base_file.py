@@ -1,8 +1,11 @@
 import shutil
 import tarfile
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import IO
 from zipfile import ZipFile, is_zipfile
 
 import pandas as pd
@@ -13,6 +16,10 @@ from langflow.schema import Data
 from langflow.schema.dataframe import DataFrame
 from langflow.schema.message import Message
 
+# Default budget of a batch of `BaseFileComponent.stream_files`
+DEFAULT_MAX_BATCH_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_BATCH_FILES = 100
+
 
 class BaseFileComponent(Component, ABC):
     """Base class for handling file processing components.
@@ -196,32 +203,63 @@ class BaseFileComponent(Component, ABC):
         Returns:
             list[Data]: Parsed data from the processed files.
         """
-        self._temp_dirs: list[TemporaryDirectory] = []
-        final_files = []  # Initialize to avoid UnboundLocalError
-        try:
-            # Step 1: Validate the provided paths
-            files = self._validate_and_resolve_paths()
-
-            # Step 2: Handle bundles recursively
-            all_files = self._unpack_and_collect_files(files)
+        return [data for batch in self.stream_files() for data in batch]
 
-            # Step 3: Final validation of file types
-            final_files = self._filter_and_mark_files(all_files)
-
-            # Step 4: Process files
-            processed_files = self.process_files(final_files)
+    def stream_files(
+        self,
+        *,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_batch_files: int = DEFAULT_MAX_BATCH_FILES,
+    ) -> Iterator[list[Data]]:
+        """Loads and parses file(s) batch by batch, yielding the Data of each batch as it is parsed.
+
+        Files are collected lazily: directories are walked and bundle members are copied out one at a
+        time as they are reached, instead of unpacking every bundle first. Files are handed to
+        `process_files` in batches of at most `max_batch_files` files and `max_batch_bytes` bytes, a
+        single larger file making a batch of its own. Once a batch is processed, its unpacked members
+        and the files marked for deletion are removed, so the disk space and memory in use are bounded by
+        the batch budget rather than by the size of the input.
 
-            # Extract and flatten Data objects to return
-            return [data for file in processed_files for data in file.data if file.data]
+        Args:
+            max_batch_bytes (int): The maximum size in bytes of the files of a batch.
+            max_batch_files (int): The maximum number of files of a batch.
 
+        Yields:
+            list[Data]: Parsed data from the files of each batch.
+        """
+        self._temp_dirs: list[TemporaryDirectory] = []
+        self._unpacked_paths: set[Path] = set()
+        try:
+            files = self._validate_and_resolve_paths()
+            batch: list[BaseFileComponent.BaseFile] = []
+            batch_bytes = 0
+            processed_any = False
+            for file in self._iter_filtered_files(self._iter_collected_files(files)):
+                size = file.path.stat().st_size
+                if batch and (len(batch) >= max_batch_files or batch_bytes + size > max_batch_bytes):
+                    yield self._process_batch(batch)
+                    processed_any = True
+                    batch, batch_bytes = [], 0
+                batch.append(file)
+                batch_bytes += size
+            if batch or not processed_any:
+                yield self._process_batch(batch)
         finally:
             # Delete temporary directories
             for temp_dir in self._temp_dirs:
                 temp_dir.cleanup()
 
-            # Delete files marked for deletion
-            for file in final_files:
-                if file.delete_after_processing and file.path.exists():
+    def _process_batch(self, batch: list[BaseFile]) -> list[Data]:
+        try:
+            processed_files = self.process_files(batch)
+            # Extract and flatten Data objects to return
+            return [data for file in processed_files for data in file.data if file.data]
+        finally:
+            # Delete unpacked bundle members and files marked for deletion
+            for file in batch:
+                unpacked = file.path in self._unpacked_paths
+                self._unpacked_paths.discard(file.path)
+                if (unpacked or file.delete_after_processing) and file.path.exists():
                     if file.path.is_dir():
                         shutil.rmtree(file.path)
                     else:
@@ -462,102 +500,98 @@ class BaseFileComponent(Component, ABC):
 
         return resolved_files
 
-    def _unpack_and_collect_files(self, files: list[BaseFile]) -> list[BaseFile]:
-        """Recursively unpack bundles and collect files into BaseFile instances.
+    def _iter_collected_files(self, files: list[BaseFile]) -> Iterator[BaseFile]:
+        """Lazily walk directories and bundles, yielding the files they contain.
 
         Args:
             files (list[BaseFile]): List of BaseFile instances to process.
 
-        Returns:
-            list[BaseFile]: Updated list of BaseFile instances.
+        Yields:
+            BaseFile: The files, directories and bundles being replaced by the files they contain.
         """
-        collected_files = []
-
         for file in files:
             path = file.path
-            delete_after_processing = file.delete_after_processing
-            data = file.data
-
             if path.is_dir():
                 # Recurse into directories
-                collected_files.extend(
-                    [
-                        BaseFileComponent.BaseFile(
-                            data,
-                            sub_path,
-                            delete_after_processing=delete_after_processing,
-                        )
-                        for sub_path in path.rglob("*")
-                        if sub_path.is_file()
-                    ]
+                sub_files = (
+                    BaseFileComponent.BaseFile(
+                        file.data,
+                        sub_path,
+                        delete_after_processing=file.delete_after_processing,
+                    )
+                    for sub_path in path.rglob("*")
+                    if sub_path.is_file()
                 )
+                yield from self._iter_collected_files(list(sub_files))
             elif path.suffix[1:] in self.SUPPORTED_BUNDLE_EXTENSIONS:
-                # Unpack supported bundles
-                temp_dir = TemporaryDirectory()
-                self._temp_dirs.append(temp_dir)
-                temp_dir_path = Path(temp_dir.name)
-                self._unpack_bundle(path, temp_dir_path)
-                subpaths = list(temp_dir_path.iterdir())
-                self.log(f"Unpacked bundle {path.name} into {subpaths}")
-                collected_files.extend(
-                    [
-                        BaseFileComponent.BaseFile(
-                            data,
-                            sub_path,
-                            delete_after_processing=delete_after_processing,
-                        )
-                        for sub_path in subpaths
-                    ]
-                )
+                yield from self._iter_bundle_files(file)
+                # A bundle unpacked from another bundle is not needed anymore
+                if path in self._unpacked_paths:
+                    path.unlink(missing_ok=True)
+                    self._unpacked_paths.discard(path)
             else:
-                collected_files.append(file)
+                yield file
 
-        # Recurse again if any directories or bundles are left in the list
-        if any(
-            file.path.is_dir() or file.path.suffix[1:] in self.SUPPORTED_BUNDLE_EXTENSIONS for file in collected_files
-        ):
-            return self._unpack_and_collect_files(collected_files)
-
-        return collected_files
+    def _iter_bundle_files(self, bundle_file: BaseFile) -> Iterator[BaseFile]:
+        """Copy the members of a bundle out one at a time, yielding each as soon as it is copied.
 
-    def _unpack_bundle(self, bundle_path: Path, output_dir: Path):
-        """Unpack a bundle into a temporary directory.
-
-        Args:
-            bundle_path (Path): Path to the bundle.
-            output_dir (Path): Directory where files will be extracted.
+        Members with an unsupported extension are skipped without being copied when
+        `ignore_unsupported_extensions` is set. Copied members are deleted once their batch is processed.
 
         Raises:
-            ValueError: If the bundle format is unsupported or cannot be read.
+            ValueError: If the bundle format is unsupported or a member would be written outside the
+                temporary directory.
         """
+        temp_dir = TemporaryDirectory()
+        self._temp_dirs.append(temp_dir)
+        output_dir = Path(temp_dir.name).resolve()
+        member_count = 0
+        for name, open_member in self._iter_bundle_members(bundle_file.path):
+            member_path = output_dir / name
+            # Ensure no path traversal outside `output_dir`
+            if not member_path.resolve().is_relative_to(output_dir):
+                kind = "ZIP" if is_zipfile(bundle_file.path) else "TAR"
+                msg = f"Attempted Path Traversal in {kind} File: {name}"
+                raise ValueError(msg)
+            extension = member_path.suffix[1:]
+            if (
+                self.ignore_unsupported_extensions
+                and extension.lower() not in self.valid_extensions
+                and extension not in self.SUPPORTED_BUNDLE_EXTENSIONS
+            ):
+                continue
+            member_path.parent.mkdir(parents=True, exist_ok=True)
+            with open_member() as source, member_path.open("wb") as target:
+                shutil.copyfileobj(source, target)
+            member_count += 1
+            self._unpacked_paths.add(member_path)
+            yield from self._iter_collected_files(
+                [
+                    BaseFileComponent.BaseFile(
+                        bundle_file.data,
+                        member_path,
+                        delete_after_processing=bundle_file.delete_after_processing,
+                    )
+                ]
+            )
+        self.log(f"Unpacked {member_count} files from bundle {bundle_file.path.name}")
 
-        def _safe_extract_zip(bundle: ZipFile, output_dir: Path):
-            """Safely extract ZIP files."""
-            for member in bundle.namelist():
-                member_path = output_dir / member
-                # Ensure no path traversal outside `output_dir`
-                if not member_path.resolve().is_relative_to(output_dir.resolve()):
-                    msg = f"Attempted Path Traversal in ZIP File: {member}"
-                    raise ValueError(msg)
-                bundle.extract(member, path=output_dir)
-
-        def _safe_extract_tar(bundle: tarfile.TarFile, output_dir: Path):
-            """Safely extract TAR files."""
-            for member in bundle.getmembers():
-                member_path = output_dir / member.name
-                # Ensure no path traversal outside `output_dir`
-                if not member_path.resolve().is_relative_to(output_dir.resolve()):
-                    msg = f"Attempted Path Traversal in TAR File: {member.name}"
-                    raise ValueError(msg)
-                bundle.extract(member, path=output_dir)
+    @staticmethod
+    def _iter_bundle_members(bundle_path: Path) -> Iterator[tuple[str, Callable[[], IO[bytes]]]]:
+        """Yield the name of each regular file of a ZIP or TAR bundle and a function opening it.
 
-        # Check and extract based on file type
+        TAR bundles are read as a stream, so each member must be read before moving to the next one.
+        """
         if is_zipfile(bundle_path):
             with ZipFile(bundle_path, "r") as zip_bundle:
-                _safe_extract_zip(zip_bundle, output_dir)
+                for info in zip_bundle.infolist():
+                    if not info.is_dir():
+                        yield info.filename, partial(zip_bundle.open, info)
         elif tarfile.is_tarfile(bundle_path):
-            with tarfile.open(bundle_path, "r:*") as tar_bundle:
-                _safe_extract_tar(tar_bundle, output_dir)
+            with tarfile.open(bundle_path, "r|*") as tar_bundle:
+                for member in tar_bundle:
+                    if member.isfile():
+                        yield member.name, partial(tar_bundle.extractfile, member)
         else:
             msg = f"Unsupported bundle format: {bundle_path.suffix}"
             raise ValueError(msg)
@@ -574,7 +608,10 @@ class BaseFileComponent(Component, ABC):
         Raises:
             ValueError: If unsupported files are encountered and `ignore_unsupported_extensions` is False.
         """
-        final_files = []
+        return list(self._iter_filtered_files(files))
+
+    def _iter_filtered_files(self, files: Iterable[BaseFile]) -> Iterator[BaseFile]:
+        """Lazy version of `_filter_and_mark_files`, yielding the valid files as they come."""
         ignored_files = []
 
         for file in files:
@@ -591,9 +628,7 @@ class BaseFileComponent(Component, ABC):
                 if not self.silent_errors:
                     raise ValueError(msg)
 
-            final_files.append(file)
+            yield file
 
         if ignored_files:
             self.log(f"Ignored files: {ignored_files}")
-
-        return final_files
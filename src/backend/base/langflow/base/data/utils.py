@@ -1,5 +1,9 @@
+import multiprocessing
+import os
+import threading
 import unicodedata
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from concurrent import futures
 from pathlib import Path
 
@@ -9,6 +13,7 @@ import yaml
 from defusedxml import ElementTree
 
 from langflow.schema import Data
+from langflow.utils.document_parsers import parse_pdf_to_text, read_docx_file
 
 # Types of files that can be read simply by file.read()
 # and have 100% to be completely readable
@@ -35,6 +40,10 @@ TEXT_FILE_TYPES = [
 
 IMG_FILE_TYPES = ["jpg", "jpeg", "png", "bmp", "image"]
 
+_pools_lock = threading.Lock()
+_thread_pool: futures.ThreadPoolExecutor | None = None
+_process_pool: futures.ProcessPoolExecutor | None = None
+
 
 def normalize_text(text):
     return unicodedata.normalize("NFKD", text)
@@ -120,27 +129,28 @@ def read_text_file(file_path: str) -> str:
     return file_path_.read_text(encoding=encoding)
 
 
-def read_docx_file(file_path: str) -> str:
-    from docx import Document
-
-    doc = Document(file_path)
-    return "\n\n".join([p.text for p in doc.paragraphs])
-
-
-def parse_pdf_to_text(file_path: str) -> str:
-    from pypdf import PdfReader
+def _parse_cpu_bound(parser: Callable[[str], str], file_path: str, *, use_process_pool: bool) -> str:
+    if use_process_pool:
+        try:
+            future = get_file_process_pool().submit(parser, file_path)
+        except (futures.BrokenExecutor, RuntimeError, OSError):
+            pass
+        else:
+            return future.result()
+    return parser(file_path)
 
-    with Path(file_path).open("rb") as f:
-        reader = PdfReader(f)
-        return "\n\n".join([page.extract_text() for page in reader.pages])
 
+def parse_text_file_to_data(file_path: str, *, silent_errors: bool, use_process_pool: bool = False) -> Data | None:
+    """Parse a text, PDF or DOCX file into a Data object.
 
-def parse_text_file_to_data(file_path: str, *, silent_errors: bool) -> Data | None:
+    With `use_process_pool`, PDF and DOCX files are parsed in the shared process pool so that parsing
+    several of them from threads is not serialized by the GIL.
+    """
     try:
         if file_path.endswith(".pdf"):
-            text = parse_pdf_to_text(file_path)
+            text = _parse_cpu_bound(parse_pdf_to_text, file_path, use_process_pool=use_process_pool)
         elif file_path.endswith(".docx"):
-            text = read_docx_file(file_path)
+            text = _parse_cpu_bound(read_docx_file, file_path, use_process_pool=use_process_pool)
         else:
             text = read_text_file(file_path)
 
@@ -183,6 +193,59 @@ def parse_text_file_to_data(file_path: str, *, silent_errors: bool) -> Data | No
 #     return data
 
 
+def get_file_thread_pool() -> futures.ThreadPoolExecutor:
+    """The thread pool shared by every file load of the process."""
+    global _thread_pool  # noqa: PLW0603
+    with _pools_lock:
+        if _thread_pool is None:
+            _thread_pool = futures.ThreadPoolExecutor(thread_name_prefix="langflow-file-load")
+        return _thread_pool
+
+
+def get_file_process_pool() -> futures.ProcessPoolExecutor:
+    """The process pool shared by every file load of the process, for the CPU bound document parsers."""
+    global _process_pool  # noqa: PLW0603
+    with _pools_lock:
+        if _process_pool is None:
+            # Forking a process that runs threads and an event loop is not safe, so workers are forked from a
+            # fresh server process where available and spawned otherwise
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _process_pool = futures.ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1, mp_context=multiprocessing.get_context(start_method)
+            )
+        return _process_pool
+
+
+def _submit_load(load_function: Callable, file_path: str, *, silent_errors: bool) -> futures.Future:
+    if load_function is parse_text_file_to_data:
+        return get_file_thread_pool().submit(
+            load_function, file_path, silent_errors=silent_errors, use_process_pool=True
+        )
+    return get_file_thread_pool().submit(load_function, file_path, silent_errors=silent_errors)
+
+
+def iter_load_data(
+    file_paths: Iterable[str],
+    *,
+    silent_errors: bool,
+    max_concurrency: int,
+    load_function: Callable = parse_text_file_to_data,
+) -> Iterator[Data | None]:
+    """Load files on the shared pools and yield the results in input order as they are ready.
+
+    At most `max_concurrency` files are loaded at a time, so the results held in memory stay bounded
+    when the caller consumes them as they come. Files are loaded in the shared thread pool. With the
+    default parser, PDF and DOCX files are parsed in the shared process pool.
+    """
+    pending: deque[futures.Future] = deque()
+    for file_path in file_paths:
+        if len(pending) >= max(max_concurrency, 1):
+            yield pending.popleft().result()
+        pending.append(_submit_load(load_function, file_path, silent_errors=silent_errors))
+    while pending:
+        yield pending.popleft().result()
+
+
 def parallel_load_data(
     file_paths: list[str],
     *,
@@ -190,10 +253,8 @@ def parallel_load_data(
     max_concurrency: int,
     load_function: Callable = parse_text_file_to_data,
 ) -> list[Data | None]:
-    with futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
-        loaded_files = executor.map(
-            lambda file_path: load_function(file_path, silent_errors=silent_errors),
-            file_paths,
+    return list(
+        iter_load_data(
+            file_paths, silent_errors=silent_errors, max_concurrency=max_concurrency, load_function=load_function
         )
-    # loaded_files is an iterator, so we need to convert it to a list
-    return list(loaded_files)
+    )
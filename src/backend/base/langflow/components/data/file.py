@@ -1,3 +1,5 @@
+from functools import partial
+
 from langflow.base.data import BaseFileComponent
 from langflow.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data
 from langflow.io import BoolInput, IntInput
@@ -50,10 +52,12 @@ class FileComponent(BaseFileComponent):
             list[BaseFileComponent.BaseFile]: Updated list of files with merged data.
         """
 
-        def process_file(file_path: str, *, silent_errors: bool = False) -> Data | None:
+        def process_file(file_path: str, *, silent_errors: bool = False, use_process_pool: bool = False) -> Data | None:
             """Processes a single file and returns its Data object."""
             try:
-                return parse_text_file_to_data(file_path, silent_errors=silent_errors)
+                return parse_text_file_to_data(
+                    file_path, silent_errors=silent_errors, use_process_pool=use_process_pool
+                )
             except FileNotFoundError as e:
                 msg = f"File not found: {file_path}. Error: {e}"
                 self.log(msg)
@@ -85,7 +89,8 @@ class FileComponent(BaseFileComponent):
             processed_data = parallel_load_data(
                 file_paths,
                 silent_errors=self.silent_errors,
-                load_function=process_file,
+                # Parse PDF and DOCX files in the shared process pool so they are not serialized by the GIL
+                load_function=partial(process_file, use_process_pool=True),
                 max_concurrency=concurrency,
             )
 
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-import operator
+import asyncio
+import hashlib
+import threading
+import time
+from collections import deque
 from typing import TYPE_CHECKING, Any
 
+import orjson
 from loguru import logger
 
 from langflow.custom import Component
@@ -10,15 +15,101 @@ from langflow.io import (
     BoolInput,
     DataFrameInput,
     HandleInput,
+    IntInput,
     MessageTextInput,
     MultilineInput,
     Output,
 )
 from langflow.schema import DataFrame
+from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.deps import get_shared_component_cache_service
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
     from langchain_core.runnables import Runnable
 
+# Rough number of characters per token, used to estimate the tokens of a request for the rate limit
+CHARS_PER_TOKEN = 4
+RATE_LIMIT_WINDOW = 60.0
+# Seconds the checkpoint of a run that did not complete is kept for it to be resumed
+CHECKPOINT_TTL = 60 * 60
+
+# When the checkpoints in the shared component cache were last saved, to delete the ones of abandoned runs
+_checkpoint_times: dict[str, float] = {}
+_checkpoint_times_lock = threading.Lock()
+
+
+class _RateLimiter:
+    """Sliding one-minute window over the requests and estimated tokens sent to the model.
+
+    A limit of 0 means no limit. `max_batch` gives how many requests can be sent together without going
+    over the limits, and `acquire` waits until they fit in the window. A single request estimated over
+    the token limit is let through once the window is empty, so it is delayed but never blocked forever.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._window: deque[tuple[float, int, int]] = deque()
+
+    def max_batch(self, request_tokens: Sequence[int]) -> int:
+        """Number of the next requests, estimated at `request_tokens` tokens each, that fit in one window."""
+        size = len(request_tokens)
+        if self.requests_per_minute:
+            size = min(size, self.requests_per_minute)
+        if self.tokens_per_minute:
+            total = 0
+            for index, tokens in enumerate(request_tokens[:size]):
+                total += tokens
+                if total > self.tokens_per_minute:
+                    size = index
+                    break
+        return max(size, 1)
+
+    def _usage(self, now: float) -> tuple[int, int]:
+        while self._window and now - self._window[0][0] >= RATE_LIMIT_WINDOW:
+            self._window.popleft()
+        return sum(entry[1] for entry in self._window), sum(entry[2] for entry in self._window)
+
+    def _wait_time(self, requests: int, tokens: int) -> float:
+        """Seconds until `requests` requests using about `tokens` tokens fit in the window, 0 if they fit now."""
+        now = self._clock()
+        used_requests, used_tokens = self._usage(now)
+        if not self._window:
+            return 0.0
+        if (self.requests_per_minute and used_requests + requests > self.requests_per_minute) or (
+            self.tokens_per_minute and used_tokens + tokens > self.tokens_per_minute
+        ):
+            # Wait until the oldest entry leaves the window
+            return max(self._window[0][0] + RATE_LIMIT_WINDOW - now, 0.01)
+        return 0.0
+
+    async def acquire(self, requests: int, tokens: int) -> None:
+        """Wait until `requests` requests using about `tokens` tokens fit in the window, then record them."""
+        if not self.requests_per_minute and not self.tokens_per_minute:
+            return
+        while True:
+            delay = self._wait_time(requests, tokens)
+            if not delay:
+                break
+            await self._sleep(delay)
+        self._window.append((self._clock(), requests, tokens))
+
+    def record(self, tokens: int) -> None:
+        """Count tokens that were only known after the requests were sent, such as the responses."""
+        if tokens and (self.requests_per_minute or self.tokens_per_minute):
+            self._window.append((self._clock(), 0, tokens))
+
 
 class BatchRunComponent(Component):
     display_name = "Batch Run"
@@ -66,6 +157,51 @@ class BatchRunComponent(Component):
             required=False,
             advanced=True,
         ),
+        IntInput(
+            name="chunk_size",
+            display_name="Chunk Size",
+            info=(
+                "Number of rows sent to the model per batch call, fewer if a whole chunk would exceed the "
+                "rate limits. Partial results and checkpoints are per chunk."
+            ),
+            value=100,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Maximum number of concurrent model calls within a chunk. 0 uses the model's default.",
+            value=0,
+            advanced=True,
+        ),
+        IntInput(
+            name="requests_per_minute",
+            display_name="Requests per Minute",
+            info="Maximum number of model calls per minute. 0 means no limit.",
+            value=0,
+            advanced=True,
+        ),
+        IntInput(
+            name="tokens_per_minute",
+            display_name="Tokens per Minute",
+            info="Maximum number of tokens per minute, estimated from the text length. 0 means no limit.",
+            value=0,
+            advanced=True,
+        ),
+        BoolInput(
+            name="stream_partial_results",
+            display_name="Stream Partial Results",
+            info="If True, log the rows of each chunk as soon as it completes.",
+            value=True,
+            advanced=True,
+        ),
+        BoolInput(
+            name="enable_checkpointing",
+            display_name="Enable Checkpointing",
+            info="If True, a failed run resumes from the last completed chunk when run again with the same inputs.",
+            value=True,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -108,6 +244,10 @@ class BatchRunComponent(Component):
     async def run_batch(self) -> DataFrame:
         """Process each row in df[column_name] with the language model asynchronously.
 
+        Rows are sent in chunks of `chunk_size`, within the configured rate limits. The rows of each
+        completed chunk are logged as they arrive and checkpointed, so running the component again after
+        a failure resumes from the first chunk that did not complete.
+
         Returns:
             DataFrame: A new DataFrame containing:
                 - text_input: The original input text
@@ -133,21 +273,17 @@ class BatchRunComponent(Component):
             msg = f"Column '{col_name}' not found in the DataFrame. Available columns: {', '.join(df.columns)}"
             raise ValueError(msg)
 
-        try:
-            # Convert the specified column to a list of strings
-            user_texts = df[col_name].astype(str).tolist()
-            total_rows = len(user_texts)
-
+        user_texts = df[col_name].astype(str).tolist()
+        total_rows = len(user_texts)
+        chunk_size = max(self.chunk_size or total_rows, 1)
+        checkpoint_key = self._checkpoint_key(model, system_msg, user_texts, chunk_size)
+        rows: list[dict[str, Any]] = self._load_checkpoint(checkpoint_key)
+        if rows:
+            logger.info(f"Resuming batch run from row {len(rows)}/{total_rows}")
+        else:
             logger.info(f"Processing {total_rows} rows with batch run")
 
-            # Prepare the batch of conversations
-            conversations = [
-                [{"role": "system", "content": system_msg}, {"role": "user", "content": text}]
-                if system_msg
-                else [{"role": "user", "content": text}]
-                for text in user_texts
-            ]
-
+        try:
             # Configure the model with project info and callbacks
             model = model.with_config(
                 {
@@ -156,34 +292,42 @@ class BatchRunComponent(Component):
                     "callbacks": self.get_langchain_callbacks(),
                 }
             )
+            batch_config = {"max_concurrency": self.max_concurrency} if self.max_concurrency else None
+            rate_limiter = _RateLimiter(
+                requests_per_minute=self.requests_per_minute or 0, tokens_per_minute=self.tokens_per_minute or 0
+            )
+
+            request_tokens = [(len(system_msg) + len(text)) // CHARS_PER_TOKEN for text in user_texts]
+            start = len(rows)
+            while start < total_rows:
+                # Smaller chunks when a whole chunk would go over the rate limits on its own
+                end = start + rate_limiter.max_batch(request_tokens[start : start + chunk_size])
+                texts = user_texts[start:end]
+                conversations = [
+                    [{"role": "system", "content": system_msg}, {"role": "user", "content": text}]
+                    if system_msg
+                    else [{"role": "user", "content": text}]
+                    for text in texts
+                ]
+                await rate_limiter.acquire(len(texts), sum(request_tokens[start:end]))
+                responses = await model.abatch(conversations, batch_config)
+
+                chunk_rows: list[dict[str, Any]] = []
+                for idx, (text, response) in enumerate(zip(texts, responses, strict=True), start=start):
+                    resp_text = response.content if hasattr(response, "content") else str(response)
+                    row = self._create_base_row(text_input=text, model_response=resp_text, batch_index=idx)
+                    self._add_metadata(row, success=True, system_msg=system_msg)
+                    chunk_rows.append(row)
+                rate_limiter.record(sum(len(row["model_response"]) for row in chunk_rows) // CHARS_PER_TOKEN)
+                rows.extend(chunk_rows)
+                self._save_checkpoint(checkpoint_key, rows)
 
-            # Process batches and track progress
-            responses_with_idx = [
-                (idx, response)
-                for idx, response in zip(
-                    range(len(conversations)), await model.abatch(list(conversations)), strict=True
-                )
-            ]
-
-            # Sort by index to maintain order
-            responses_with_idx.sort(key=operator.itemgetter(0))
-
-            # Build the final data with enhanced metadata
-            rows: list[dict[str, Any]] = []
-            for idx, response in responses_with_idx:
-                resp_text = response.content if hasattr(response, "content") else str(response)
-                row = self._create_base_row(
-                    text_input=user_texts[idx],
-                    model_response=resp_text,
-                    batch_index=idx,
-                )
-                self._add_metadata(row, success=True, system_msg=system_msg)
-                rows.append(row)
-
-                # Log progress
-                if (idx + 1) % max(1, total_rows // 10) == 0:
-                    logger.info(f"Processed {idx + 1}/{total_rows} rows")
+                logger.info(f"Processed {len(rows)}/{total_rows} rows")
+                if self.stream_partial_results:
+                    self.log(DataFrame(chunk_rows), name=f"Rows {start}-{end - 1}")
+                start = end
 
+            self._clear_checkpoint(checkpoint_key)
             logger.info("Batch processing completed successfully")
             return DataFrame(rows)
 
@@ -192,4 +336,61 @@ class BatchRunComponent(Component):
             logger.error(f"Data processing error: {e!s}")
             error_row = self._create_base_row()
             self._add_metadata(error_row, success=False, error=str(e))
-            return DataFrame([error_row])
+            return DataFrame([*rows, error_row])
+
+    def _checkpoint_key(self, model: Any, system_msg: str, user_texts: list[str], chunk_size: int) -> str | None:
+        """Key of the checkpoint of a run, the same for every run by the same flow and user with the same inputs."""
+        if not self.enable_checkpointing:
+            return None
+        flow_id = self.graph.flow_id if hasattr(self, "graph") else None
+        user_id = self.user_id if hasattr(self, "user_id") else None
+        digest = hashlib.sha256(
+            orjson.dumps(
+                [
+                    flow_id,
+                    user_id,
+                    type(model).__qualname__,
+                    getattr(model, "model_name", None) or getattr(model, "model", None),
+                    system_msg,
+                    user_texts,
+                    chunk_size,
+                    bool(self.enable_metadata),
+                ],
+                default=str,
+            )
+        ).hexdigest()
+        return f"batch_run:{self._id}:{digest}"
+
+    def _load_checkpoint(self, key: str | None) -> list[dict[str, Any]]:
+        if key is None:
+            return []
+        rows = get_shared_component_cache_service().get(key)
+        return [] if rows is CACHE_MISS else list(rows)
+
+    def _save_checkpoint(self, key: str | None, rows: list[dict[str, Any]]) -> None:
+        if key is not None:
+            get_shared_component_cache_service().set(key, list(rows))
+            self._track_checkpoint(key, saved=True)
+
+    def _clear_checkpoint(self, key: str | None) -> None:
+        if key is not None:
+            get_shared_component_cache_service().delete(key)
+            self._track_checkpoint(key, saved=False)
+
+    @staticmethod
+    def _track_checkpoint(key: str, *, saved: bool) -> None:
+        """Record when a checkpoint was saved, and delete the checkpoints not saved for `CHECKPOINT_TTL` seconds.
+
+        The checkpoint of a run that failed and is never run again would otherwise stay in the cache.
+        """
+        now = time.monotonic()
+        cache = get_shared_component_cache_service()
+        with _checkpoint_times_lock:
+            for stale_key, saved_at in list(_checkpoint_times.items()):
+                if now - saved_at >= CHECKPOINT_TTL:
+                    cache.delete(stale_key)
+                    del _checkpoint_times[stale_key]
+            if saved:
+                _checkpoint_times[key] = now
+            else:
+                _checkpoint_times.pop(key, None)
@@ -1,5 +1,6 @@
 from langflow.custom import Component
 from langflow.io import DataFrameInput, MultilineInput, Output, StrInput
+from langflow.schema.dataframe import DataView
 from langflow.schema.message import Message
 
 
@@ -56,8 +57,7 @@ class ParseDataFrameComponent(Component):
 
         lines = []
         # For each row in the DataFrame, build a dict and format
-        for _, row in dataframe.iterrows():
-            row_dict = row.to_dict()
+        for row_dict in DataView(dataframe).iter_dicts():
             text_line = template.format(**row_dict)  # e.g. template="{text}", row_dict={"text": "Hello"}
             lines.append(text_line)
 
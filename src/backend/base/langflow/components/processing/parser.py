@@ -9,6 +9,7 @@ from langflow.io import (
     Output,
 )
 from langflow.schema import Data, DataFrame
+from langflow.schema.dataframe import DataView
 from langflow.schema.message import Message
 
 
@@ -125,8 +126,8 @@ class ParserComponent(Component):
 
         lines = []
         if df is not None:
-            for _, row in df.iterrows():
-                formatted_text = self.template.format(**row.to_dict())
+            for row in DataView(df).iter_dicts():
+                formatted_text = self.template.format(**row)
                 lines.append(formatted_text)
         elif data is not None:
             formatted_text = self.template.format(text=data.get_text())
@@ -0,0 +1,270 @@
+import contextlib
+import hashlib
+import importlib.util
+import marshal
+import os
+import sys
+import tempfile
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from langflow.utils.validate import CompiledClass
+
+CACHE_FILE_SUFFIX = ".components"
+# Besides their own source, component templates depend on these packages
+FINGERPRINT_PACKAGES = ("langflow.base", "langflow.custom", "langflow.inputs", "langflow.io", "langflow.template")
+
+
+def installation_fingerprint() -> str:
+    """Hash the files component templates depend on, so edits and upgrades invalidate the cache.
+
+    The Langflow modules in `FINGERPRINT_PACKAGES` are identified by their path, size and modification
+    time, which catches edits of editable installs that keep the version string. Installing, upgrading
+    or removing a dependency changes the modification time of the directory it is installed in, so
+    the directories of `sys.path` are included as well.
+    """
+    digest = hashlib.sha256()
+    paths: list[Path] = []
+    for name in FINGERPRINT_PACKAGES:
+        spec = importlib.util.find_spec(name)
+        if spec is None:
+            continue
+        for location in spec.submodule_search_locations or [spec.origin]:
+            if location is None:
+                continue
+            root = Path(location)
+            paths.extend(sorted(root.rglob("*.py")) if root.is_dir() else [root])
+    paths.extend(Path(entry) for entry in sys.path if entry and Path(entry).is_absolute())
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+class ComponentCodeCache:
+    """A persistent, content-addressed cache of compiled component code and component templates.
+
+    Loading the bundled components parses, compiles and executes every component file and builds
+    its frontend template. This cache stores the marshalled code objects and the extracted templates
+    of those components in a single file per Langflow version and Python implementation, keyed by a
+    hash of each component's source. Warm starts, including every extra worker process, then skip
+    AST parsing and template building for components whose source did not change. The whole file is
+    ignored when the `installation_fingerprint` changed since it was written.
+
+    Only code compiled while loading component directories (see `recording`) is persisted, so custom
+    code sent at runtime never ends up on disk. Thread-safe using a threading Lock.
+
+    Attributes:
+        cache_dir (Path | None): Where the cache file lives. None disables the cache.
+        version (str): The Langflow version the cached entries were built with.
+        fingerprint (str | None): The `installation_fingerprint` the cached entries were built with.
+            None computes it on the first `load` or `save`.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups of code that was not cached.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None, version: str = "", fingerprint: str | None = None) -> None:
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+        self._recording = 0
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.version = version
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, cache_dir: str | Path | None, version: str) -> None:
+        """Point the cache at a directory and version. Entries are read again on the next `load`."""
+        with self._lock:
+            self.cache_dir = Path(cache_dir) if cache_dir else None
+            self.version = version
+            self._entries = {}
+            self._loaded = False
+            self._dirty = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.cache_dir is not None
+
+    @property
+    def path(self) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{self.version}-{sys.implementation.cache_tag}{CACHE_FILE_SUFFIX}"
+
+    def _get_fingerprint(self) -> str:
+        if self.fingerprint is None:
+            self.fingerprint = installation_fingerprint()
+        return self.fingerprint
+
+    @staticmethod
+    def make_key(code: str) -> str:
+        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+    def load(self) -> int:
+        """Read the cache file of the current version, once. Returns the number of cached components.
+
+        This does blocking file I/O, so async callers should run it in a thread. Lookups made before
+        the cache is loaded are misses.
+        """
+        path = self.path
+        with self._lock:
+            if self._loaded or path is None:
+                return len(self._entries)
+            self._loaded = True
+        try:
+            # The cache file is only ever written by Langflow itself, like the compiled bytecode next to its modules
+            data = marshal.loads(path.read_bytes())  # noqa: S302
+        except FileNotFoundError:
+            return 0
+        except (OSError, EOFError, ValueError, TypeError):
+            logger.warning(f"Ignoring unreadable component cache {path}")
+            return 0
+        if not isinstance(data, dict) or data.get("version") != self.version:
+            logger.debug(f"Ignoring component cache {path} built for another version")
+            return 0
+        if data.get("fingerprint") != self._get_fingerprint():
+            logger.debug(f"Ignoring component cache {path} built before Langflow or its dependencies changed")
+            return 0
+        entries = data.get("entries", {})
+        with self._lock:
+            # Entries added while the file was being read take precedence
+            self._entries = {**entries, **self._entries}
+        logger.debug(f"Loaded {len(entries)} cached components from {path}")
+        return len(entries)
+
+    def _get(self, code: str, field: str) -> Any:
+        if not self.enabled:
+            return None
+        key = self.make_key(code)
+        with self._lock:
+            value = self._entries.get(key, {}).get(field)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def _set(self, code: str, **fields: Any) -> None:
+        key = self.make_key(code)
+        with self._lock:
+            self._entries.setdefault(key, {}).update(fields)
+            self._dirty = True
+
+    def has_template(self, code: str) -> bool:
+        """Whether `code` was already loaded successfully as a component."""
+        if not self.enabled:
+            return False
+        key = self.make_key(code)
+        with self._lock:
+            return "template" in self._entries.get(key, {})
+
+    def get_output_types(self, code: str) -> list[str] | None:
+        return self._get(code, "output_types")
+
+    def get_template(self, code: str) -> tuple[str, dict] | None:
+        """Return a fresh copy of the component name and template built from `code`, if cached."""
+        entry = self._get(code, "template")
+        if entry is None:
+            return None
+        name, template = marshal.loads(entry)  # noqa: S302
+        return name, template
+
+    def set_template(self, code: str, name: str, template: dict, output_types: list[str]) -> None:
+        if not self.enabled:
+            return
+        try:
+            entry = marshal.dumps((name, template))
+        except ValueError:
+            logger.debug(f"Component {name} has a template that cannot be cached")
+            return
+        self._set(code, template=entry, output_types=list(output_types))
+
+    def get_compiled(self, code: str) -> CompiledClass | None:
+        entry = self._get(code, "compiled")
+        if entry is None:
+            return None
+        return CompiledClass(*marshal.loads(entry))  # noqa: S302
+
+    def set_compiled(self, code: str, compiled: CompiledClass) -> None:
+        """Store the compiled form of `code`. Ignored unless the cache is recording."""
+        if not self.enabled or not self._recording:
+            return
+        self._set(code, compiled=marshal.dumps(tuple(compiled)))
+
+    @contextlib.contextmanager
+    def recording(self) -> Iterator[None]:
+        """Persist the code compiled inside this block, i.e. while loading component directories."""
+        with self._lock:
+            self._recording += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._recording -= 1
+
+    def save(self) -> bool:
+        """Write the cache to disk if it changed. Returns True if the file was written.
+
+        The file is replaced atomically, so concurrent workers never read a partial file.
+        """
+        path = self.path
+        if path is None:
+            return False
+        # Keep the entries already on disk that this process never looked up
+        self.load()
+        fingerprint = self._get_fingerprint()
+        with self._lock:
+            if not self._dirty:
+                return False
+            data = marshal.dumps({"version": self.version, "fingerprint": fingerprint, "entries": self._entries})
+            self._dirty = False
+        temp_path: Path | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            temp_path = Path(temp_name)
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            temp_path.chmod(0o644)
+            temp_path.replace(path)
+        except OSError as exc:
+            logger.warning(f"Could not write the component cache to {path}: {exc}")
+            if temp_path is not None:
+                with contextlib.suppress(OSError):
+                    temp_path.unlink(missing_ok=True)
+            return False
+        logger.debug(f"Saved {len(self._entries)} components to {path}")
+        return True
+
+    def clear(self) -> None:
+        """Forget every entry and remove the cache file of the current version."""
+        with self._lock:
+            self._entries = {}
+            self._loaded = True
+            self._dirty = False
+            self.hits = 0
+            self.misses = 0
+            path = self.path
+        if path is not None:
+            with contextlib.suppress(OSError):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+component_code_cache = ComponentCodeCache()
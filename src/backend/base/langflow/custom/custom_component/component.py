@@ -3,11 +3,12 @@ from __future__ import annotations
 import ast
 import asyncio
 import inspect
+import weakref
 from collections.abc import AsyncIterator, Iterator
 from copy import deepcopy
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, get_type_hints
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import nanoid
 import pandas as pd
@@ -28,7 +29,7 @@ from langflow.field_typing import Tool  # noqa: TC001 Needed by _add_toolkit_out
 from langflow.graph.state.model import create_state_model
 from langflow.graph.utils import has_chat_output
 from langflow.helpers.custom import format_type
-from langflow.memory import astore_message, aupdate_messages, delete_message
+from langflow.memory import aadd_messages, astore_message, delete_message
 from langflow.schema.artifact import get_artifact_type, post_process_raw
 from langflow.schema.data import Data
 from langflow.schema.message import ErrorMessage, Message
@@ -47,6 +48,7 @@ if TYPE_CHECKING:
 
     from langflow.base.tools.component_tool import ComponentToolkit
     from langflow.events.event_manager import EventManager
+    from langflow.events.token_stream import TokenStream
     from langflow.graph.edge.schema import EdgeData
     from langflow.graph.vertex.base import Vertex
     from langflow.inputs.inputs import InputTypes
@@ -69,6 +71,10 @@ def _get_component_toolkit():
 BACKWARDS_COMPATIBLE_ATTRIBUTES = ["user_id", "vertex", "tracing_service"]
 CONFIG_ATTRIBUTES = ["_display_name", "_description", "_icon", "_name", "_metadata"]
 
+# Required inputs of each output method, per component class. Finding them parses the method source,
+# which would otherwise happen for every component instance of every run.
+_required_inputs_cache: weakref.WeakKeyDictionary[type, dict[tuple, list[str]]] = weakref.WeakKeyDictionary()
+
 
 class PlaceholderGraph(NamedTuple):
     """A placeholder graph structure for components, providing backwards compatibility.
@@ -99,6 +105,11 @@ class Component(CustomComponent):
     code_class_base_inheritance: ClassVar[str] = "Component"
 
     def __init__(self, **kwargs) -> None:
+        # The class-level definitions are shared by every instance, and compiled classes are cached
+        # across flows, so each instance works on its own copies of them
+        if self.inputs is not None:
+            self.inputs = list(self.inputs)
+        self.outputs = [output.model_copy() for output in self.outputs]
         # Initialize instance-specific attributes first
         if overlap := self._there_is_overlap_in_inputs_and_outputs():
             msg = f"Inputs and outputs have overlapping names: {overlap}"
@@ -523,12 +534,18 @@ class Component(CustomComponent):
         output.set_selected()
 
     def _set_output_required_inputs(self) -> None:
+        class_cache = _required_inputs_cache.setdefault(type(self), {})
+        required_input_names = frozenset(name for name, input_ in self._inputs.items() if input_.required)
         for output in self.outputs:
             if not output.method:
                 continue
             method = getattr(self, output.method, None)
             if not method or not callable(method):
                 continue
+            cache_key = (output.method, required_input_names, self._code)
+            if (required_inputs := class_cache.get(cache_key)) is not None:
+                output.required_inputs = list(required_inputs)
+                continue
             try:
                 source_code = inspect.getsource(method)
                 ast_tree = ast.parse(dedent(source_code))
@@ -538,6 +555,7 @@ class Component(CustomComponent):
             visitor = RequiredInputsVisitor(self._inputs)
             visitor.visit(ast_tree)
             output.required_inputs = sorted(visitor.required_inputs)
+            class_cache[cache_key] = list(output.required_inputs)
 
     def get_output_by_method(self, method: Callable):
         # method is a callable and output.method is a string
@@ -1282,40 +1300,51 @@ class Component(CustomComponent):
             message.session_id = session_id
         if hasattr(message, "flow_id") and isinstance(message.flow_id, str):
             message.flow_id = UUID(message.flow_id)
-        stored_message = await self._store_message(message)
-
-        self._stored_message_id = stored_message.id
-        try:
-            complete_message = ""
-            if (
-                self._should_stream_message(stored_message, message)
-                and message is not None
-                and isinstance(message.text, AsyncIterator | Iterator)
-            ):
-                complete_message = await self._stream_message(message.text, stored_message)
-                stored_message.text = complete_message
-                stored_message = await self._update_stored_message(stored_message)
-            else:
-                # Only send message event for non-streaming messages
+        if self._should_stream_message(message):
+            stored_message = await self._stream_and_store_message(message)
+        else:
+            stored_message = await self._store_message(message)
+            self._stored_message_id = stored_message.id
+            try:
                 await self._send_message_event(stored_message, id_=id_)
-        except Exception:
-            # remove the message from the database
-            await delete_message(stored_message.id)
-            raise
+            except Exception:
+                # remove the message from the database
+                await delete_message(stored_message.id)
+                raise
         self.status = stored_message
         return stored_message
 
-    async def _store_message(self, message: Message) -> Message:
-        flow_id: str | None = None
+    async def _stream_and_store_message(self, message: Message) -> Message:
+        """Stream the message tokens, then store the message once with its complete text.
+
+        The token events only need the message id, so a new message gets its id up front instead of
+        being inserted empty and updated when the stream ends. If streaming fails nothing is stored.
+        """
+        is_new = not getattr(message, "id", None)
+        if is_new:
+            message.id = uuid4()
+        if not message.flow_id and (flow_id := self._get_flow_id()):
+            message.flow_id = flow_id
+        self._stored_message_id = message.id
+        message.text = await self._stream_message(message.text, message)
+        return await self._store_message(message, is_new=is_new)
+
+    def _get_flow_id(self) -> str | None:
         if hasattr(self, "graph"):
             # Convert UUID to str if needed
-            flow_id = str(self.graph.flow_id) if self.graph.flow_id else None
-        stored_messages = await astore_message(message, flow_id=flow_id)
+            return str(self.graph.flow_id) if self.graph.flow_id else None
+        return None
+
+    async def _store_message(self, message: Message, *, is_new: bool = False) -> Message:
+        flow_id = self._get_flow_id()
+        if is_new:
+            stored_messages = await aadd_messages([message], flow_id=flow_id)
+        else:
+            stored_messages = await astore_message(message, flow_id=flow_id)
         if len(stored_messages) != 1:
             msg = "Only one message can be stored at a time."
             raise ValueError(msg)
-        stored_message = stored_messages[0]
-        return await Message.create(**stored_message.model_dump())
+        return stored_messages[0]
 
     async def _send_message_event(self, message: Message, id_: str | None = None, category: str | None = None) -> None:
         if hasattr(self, "_event_manager") and self._event_manager:
@@ -1324,75 +1353,72 @@ class Component(CustomComponent):
                 data_dict["id"] = id_
             category = category or data_dict.get("category", None)
 
-            def _send_event():
-                match category:
-                    case "error":
-                        self._event_manager.on_error(data=data_dict)
-                    case "remove_message":
-                        self._event_manager.on_remove_message(data={"id": data_dict["id"]})
-                    case _:
-                        self._event_manager.on_message(data=data_dict)
-
-            await asyncio.to_thread(_send_event)
+            match category:
+                case "error":
+                    await self._event_manager.asend("on_error", data=data_dict)
+                case "remove_message":
+                    await self._event_manager.asend("on_remove_message", data={"id": data_dict["id"]})
+                case _:
+                    await self._event_manager.asend("on_message", data=data_dict)
 
-    def _should_stream_message(self, stored_message: Message, original_message: Message) -> bool:
+    def _should_stream_message(self, message: Message) -> bool:
         return bool(
             hasattr(self, "_event_manager")
             and self._event_manager
-            and stored_message.id
-            and not isinstance(original_message.text, str)
+            and isinstance(message.text, AsyncIterator | Iterator)
         )
 
-    async def _update_stored_message(self, message: Message) -> Message:
-        """Update the stored message."""
-        if hasattr(self, "_vertex") and self._vertex is not None and hasattr(self._vertex, "graph"):
-            flow_id = (
-                UUID(self._vertex.graph.flow_id)
-                if isinstance(self._vertex.graph.flow_id, str)
-                else self._vertex.graph.flow_id
-            )
-
-            message.flow_id = flow_id
-
-        message_tables = await aupdate_messages(message)
-        if not message_tables:
-            msg = "Failed to update message"
-            raise ValueError(msg)
-        message_table = message_tables[0]
-        return await Message.create(**message_table.model_dump())
-
     async def _stream_message(self, iterator: AsyncIterator | Iterator, message: Message) -> str:
         if not isinstance(iterator, AsyncIterator | Iterator):
             msg = "The message must be an iterator or an async iterator."
             raise TypeError(msg)
 
-        if isinstance(iterator, AsyncIterator):
-            return await self._handle_async_iterator(iterator, message.id, message)
+        token_stream = self._event_manager.token_stream(message.id) if self._event_manager else None
         try:
-            complete_message = ""
-            first_chunk = True
-            for chunk in iterator:
-                complete_message = await self._process_chunk(
-                    chunk.content, complete_message, message.id, message, first_chunk=first_chunk
-                )
-                first_chunk = False
-        except Exception as e:
-            raise StreamingError(cause=e, source=message.properties.source) from e
-        else:
-            return complete_message
+            if isinstance(iterator, AsyncIterator):
+                return await self._handle_async_iterator(iterator, message.id, message, token_stream=token_stream)
+            try:
+                complete_message = ""
+                first_chunk = True
+                for chunk in iterator:
+                    complete_message = await self._process_chunk(
+                        chunk.content,
+                        complete_message,
+                        message.id,
+                        message,
+                        first_chunk=first_chunk,
+                        token_stream=token_stream,
+                    )
+                    first_chunk = False
+            except Exception as e:
+                raise StreamingError(cause=e, source=message.properties.source) from e
+            else:
+                return complete_message
+        finally:
+            if token_stream is not None:
+                await token_stream.aclose()
 
-    async def _handle_async_iterator(self, iterator: AsyncIterator, message_id: str, message: Message) -> str:
+    async def _handle_async_iterator(
+        self, iterator: AsyncIterator, message_id: str, message: Message, *, token_stream: TokenStream | None = None
+    ) -> str:
         complete_message = ""
         first_chunk = True
         async for chunk in iterator:
             complete_message = await self._process_chunk(
-                chunk.content, complete_message, message_id, message, first_chunk=first_chunk
+                chunk.content, complete_message, message_id, message, first_chunk=first_chunk, token_stream=token_stream
             )
             first_chunk = False
         return complete_message
 
     async def _process_chunk(
-        self, chunk: str, complete_message: str, message_id: str, message: Message, *, first_chunk: bool = False
+        self,
+        chunk: str,
+        complete_message: str,
+        message_id: str,
+        message: Message,
+        *,
+        first_chunk: bool = False,
+        token_stream: TokenStream | None = None,
     ) -> str:
         complete_message += chunk
         if self._event_manager:
@@ -1401,13 +1427,11 @@ class Component(CustomComponent):
                 msg_copy = message.model_copy()
                 msg_copy.text = complete_message
                 await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
-                self._event_manager.on_token,
-                data={
-                    "chunk": chunk,
-                    "id": str(message_id),
-                },
-            )
+            if token_stream is not None:
+                await token_stream.send(chunk)
+            else:
+                await self._event_manager.asend("on_token", data={"chunk": chunk, "id": str(message_id)})
+                await self._event_manager.wait_for_capacity()
         return complete_message
 
     async def send_error(
@@ -452,6 +452,9 @@ class CustomComponent(BaseComponent):
         else:
             msg = f"Invalid user id: {self.user_id}"
             raise TypeError(msg)
+        if self._vertex is not None and self._vertex.graph is not None:
+            # Within a run, the variables of the whole graph are loaded in one query
+            return await self._vertex.graph.variable_resolver.get_variable(user_id, name, field)
         async with session_scope() as session:
             return await variable_service.get_variable(user_id=user_id, name=name, field=field, session=session)
 
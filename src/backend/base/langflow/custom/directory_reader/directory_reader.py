@@ -8,6 +8,7 @@ from aiofile import async_open
 from loguru import logger
 
 from langflow.custom import Component
+from langflow.custom.code_cache import component_code_cache
 
 MAX_DEPTH = 2
 
@@ -210,10 +211,14 @@ class DirectoryReader:
             return False, f"Could not read {file_path}"
         if self.is_empty_file(file_content):
             return False, "Empty file"
-        if not self.validate_code(file_content):
+        # Components loaded successfully before already passed the checks below
+        is_cached = component_code_cache.has_template(file_content)
+        if not is_cached and not self.validate_code(file_content):
             return False, "Syntax error"
-        if self._is_type_hint_used_in_args("Optional", file_content) and not self._is_type_hint_imported(
-            "Optional", file_content
+        if (
+            not is_cached
+            and self._is_type_hint_used_in_args("Optional", file_content)
+            and not self._is_type_hint_imported("Optional", file_content)
         ):
             return (
                 False,
@@ -285,10 +290,14 @@ class DirectoryReader:
             return False, f"Could not read {file_path}"
         if self.is_empty_file(file_content):
             return False, "Empty file"
-        if not self.validate_code(file_content):
+        # Components loaded successfully before already passed the checks below
+        is_cached = component_code_cache.has_template(file_content)
+        if not is_cached and not self.validate_code(file_content):
             return False, "Syntax error"
-        if self._is_type_hint_used_in_args("Optional", file_content) and not self._is_type_hint_imported(
-            "Optional", file_content
+        if (
+            not is_cached
+            and self._is_type_hint_used_in_args("Optional", file_content)
+            and not self._is_type_hint_imported("Optional", file_content)
         ):
             return (
                 False,
@@ -352,6 +361,8 @@ class DirectoryReader:
     @staticmethod
     def get_output_types_from_code(code: str) -> list:
         """Get the output types from the code."""
+        if (output_types := component_code_cache.get_output_types(code)) is not None:
+            return output_types
         custom_component = Component(_code=code)
         types_list = custom_component._get_function_entrypoint_return_type
 
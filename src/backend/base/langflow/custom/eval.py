@@ -1,12 +1,116 @@
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+from langflow.custom.code_cache import component_code_cache
 from langflow.utils import validate
 
 if TYPE_CHECKING:
     from langflow.custom import CustomComponent
 
+DEFAULT_COMPONENT_CLASS_CACHE_SIZE = 256
+
+
+class ComponentClassCache:
+    """A process-wide, content-addressed LRU cache of compiled component classes.
+
+    Keys are the SHA-256 digest of the component code, so identical code strings
+    share a single compiled class regardless of which flow or vertex they come from.
+    Thread-safe using a threading Lock.
+
+    Attributes:
+        max_size (int): Maximum number of classes to keep. When full, the least recently used class is evicted.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that required compiling the code.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_COMPONENT_CLASS_CACHE_SIZE) -> None:
+        self._cache: OrderedDict[str, type] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(code: str) -> str:
+        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+    def get(self, code: str) -> type | None:
+        key = self.make_key(code)
+        with self._lock:
+            class_object = self._cache.get(key)
+            if class_object is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return class_object
+
+    def set(self, code: str, class_object: type) -> None:
+        if self.max_size <= 0:
+            return
+        key = self.make_key(code)
+        with self._lock:
+            self._cache[key] = class_object
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, code: str) -> bool:
+        """Remove the class compiled from `code`. Returns True if an entry was removed."""
+        with self._lock:
+            return self._cache.pop(self.make_key(code), None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def resize(self, max_size: int) -> None:
+        with self._lock:
+            self.max_size = max_size
+            while len(self._cache) > max(max_size, 0):
+                self._cache.popitem(last=False)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._cache), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+component_class_cache = ComponentClassCache()
+
 
 def eval_custom_component_code(code: str) -> type["CustomComponent"]:
-    """Evaluate custom component code."""
-    class_name = validate.extract_class_name(code)
-    return validate.create_class(code, class_name)
+    """Evaluate custom component code.
+
+    Compiled classes are cached by a hash of `code`, so evaluating the same code again
+    skips parsing, import resolution and `exec`. Bundled components are also compiled from
+    the code objects persisted by `component_code_cache`, which skips parsing in new processes.
+    """
+    if (class_object := component_class_cache.get(code)) is not None:
+        return class_object
+    compiled = component_code_cache.get_compiled(code)
+    if compiled is None:
+        class_name = validate.extract_class_name(code)
+        compiled = validate.compile_class(code, class_name)
+        component_code_cache.set_compiled(code, compiled)
+    class_object = validate.build_compiled_class(compiled)
+    component_class_cache.set(code, class_object)
+    return class_object
+
+
+def invalidate_component_class_cache(code: str | None = None) -> None:
+    """Drop the cached class for `code`, or every cached class if no code is given.
+
+    Entries are keyed by the hash of the code, so edited code never gets the class of its previous
+    version; this is only needed to free the memory the classes hold.
+    """
+    if code is None:
+        component_class_cache.clear()
+    else:
+        component_class_cache.invalidate(code)
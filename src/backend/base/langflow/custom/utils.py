@@ -14,6 +14,7 @@ from loguru import logger
 from pydantic import BaseModel
 
 from langflow.custom import CustomComponent
+from langflow.custom.code_cache import component_code_cache
 from langflow.custom.custom_component.component import Component
 from langflow.custom.directory_reader.utils import (
     abuild_custom_component_list_from_path,
@@ -533,9 +534,14 @@ def sanitize_field_config(field_config: dict | Input):
 
 
 def build_component(component):
-    """Build a single component."""
+    """Build a single component, reusing the template cached for its code if there is one."""
+    if (cached := component_code_cache.get_template(component["code"])) is not None:
+        return cached
     component_template, component_instance = create_component_template(component)
     component_name = get_instance_name(component_instance)
+    component_code_cache.set_template(
+        component["code"], component_name, component_template, output_types=component["output_types"]
+    )
     return component_name, component_template
 
 
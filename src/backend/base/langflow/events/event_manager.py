@@ -1,21 +1,25 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
+import itertools
 import json
 import time
 import uuid
+from datetime import datetime, timezone
 from functools import partial
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
+import orjson
 from fastapi.encoders import jsonable_encoder
 from loguru import logger
+from pydantic import BaseModel
 from typing_extensions import Protocol
 
+from langflow.events.token_stream import TokenStream
 from langflow.schema.playground_events import create_event_by_type
 
 if TYPE_CHECKING:
-    import asyncio
-
     from langflow.schema.log import LoggableType
 
 
@@ -27,10 +31,54 @@ class PartialEventCallback(Protocol):
     def __call__(self, *, data: LoggableType): ...
 
 
+EVENT_SEPARATOR = b"\n\n"
+_TOKEN_FRAME_PREFIX = b'{"event":"token","data":{"chunk":'
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    return jsonable_encoder(obj)
+
+
+def encode_event(event_type: str, data: Any) -> bytes:
+    """Encode an event frame in a single pass.
+
+    Pydantic models are dumped straight to JSON-compatible data and everything orjson cannot
+    serialize natively falls back to `jsonable_encoder`. `orjson.Fragment` values are embedded as-is,
+    which lets callers hand over payloads they already serialized.
+    """
+    try:
+        return orjson.dumps({"event": event_type, "data": data}, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # e.g. integers larger than 64 bits, which the standard library handles
+        return json.dumps({"event": event_type, "data": jsonable_encoder(data)}).encode("utf-8")
+
+
 class EventManager:
-    def __init__(self, queue: asyncio.Queue):
+    def __init__(self, queue: asyncio.Queue, *, token_flush_interval: float = 0.0, token_flush_bytes: int = 0):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        # Events handled by `send_event`, which only puts a frame on the queue and never blocks
+        self._queue_events: set[str] = set()
+        self.token_flush_interval = token_flush_interval
+        self.token_flush_bytes = token_flush_bytes
+        # Event ids are `{event_type}-{uuid}`: a random prefix per manager followed by a monotonic counter
+        self._event_id_prefix = str(uuid.uuid4())[:24]
+        self._event_counter = itertools.count()
+        self._timestamp_second = -1
+        self._timestamp = b""
+
+    def _next_event_id(self, event_type: str) -> str:
+        return f"{event_type}-{self._event_id_prefix}{next(self._event_counter):012x}"
+
+    def _get_timestamp(self) -> bytes:
+        now = time.time()
+        if int(now) != self._timestamp_second:
+            self._timestamp_second = int(now)
+            timestamp = datetime.fromtimestamp(now, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
+            self._timestamp = orjson.dumps(timestamp)
+        return self._timestamp
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -61,11 +109,37 @@ class EventManager:
             raise ValueError(msg)
         if callback is None:
             callback_ = partial(self.send_event, event_type=event_type)
+            self._queue_events.add(name)
         else:
             callback_ = partial(callback, manager=self, event_type=event_type)
+            self._queue_events.discard(name)
         self.events[name] = callback_
 
+    def handles_in_loop(self, name: str) -> bool:
+        """Whether the handler of event `name` can be called from the event loop without blocking it."""
+        return name in self._queue_events or name not in self.events
+
+    async def asend(self, name: str, *, data: LoggableType) -> None:
+        """Call the handler of event `name` from async code.
+
+        The built-in handlers only put a frame on the queue, so they run directly in the event loop.
+        Custom callbacks may block, so they run in a worker thread.
+        """
+        if self.handles_in_loop(name):
+            getattr(self, name)(data=data)
+        else:
+            await asyncio.to_thread(self.events[name], data=data)
+
+    def token_stream(self, message_id: Any) -> TokenStream:
+        """Create the token stream of a streamed message, coalescing tokens as configured on this manager."""
+        return TokenStream(
+            self, message_id, flush_interval=self.token_flush_interval, flush_bytes=self.token_flush_bytes
+        )
+
     def send_event(self, *, event_type: Literal["message", "error", "warning", "info", "token"], data: LoggableType):
+        if event_type == "token" and isinstance(data, dict) and isinstance(data.get("chunk"), str):
+            self.send_token(chunk=data["chunk"], id_=data.get("id"))
+            return
         try:
             if isinstance(data, dict) and event_type in {"message", "error", "warning", "info", "token"}:
                 data = create_event_by_type(event_type, **data)
@@ -73,11 +147,32 @@ class EventManager:
             logger.debug(f"Error creating playground event: {e}")
         except Exception:
             raise
-        jsonable_data = jsonable_encoder(data)
-        json_data = {"event": event_type, "data": jsonable_data}
-        event_id = f"{event_type}-{uuid.uuid4()}"
-        str_data = json.dumps(json_data) + "\n\n"
-        self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+        frame = encode_event(event_type, data) + EVENT_SEPARATOR
+        self.queue.put_nowait((self._next_event_id(event_type), frame, time.time()))
+
+    def send_token(self, *, chunk: str, id_: Any) -> None:
+        """Send a token event without building a `TokenEvent`.
+
+        The frame has the same shape as `TokenEvent`, but is assembled from pre-encoded parts.
+        """
+        frame = b"".join(
+            (
+                _TOKEN_FRAME_PREFIX,
+                orjson.dumps(chunk),
+                b',"id":',
+                orjson.dumps(id_, default=str),
+                b',"timestamp":',
+                self._get_timestamp(),
+                b"}}",
+                EVENT_SEPARATOR,
+            )
+        )
+        self.queue.put_nowait((self._next_event_id("token"), frame, time.time()))
+
+    async def wait_for_capacity(self) -> None:
+        """Wait until the queue can take more events, for queues that apply backpressure."""
+        if (wait_for_capacity := getattr(self.queue, "wait_for_capacity", None)) is not None:
+            await wait_for_capacity()
 
     def noop(self, *, data: LoggableType) -> None:
         pass
@@ -86,8 +181,8 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
-def create_default_event_manager(queue):
-    manager = EventManager(queue)
+def create_default_event_manager(queue, *, token_flush_interval: float = 0.0, token_flush_bytes: int = 0):
+    manager = EventManager(queue, token_flush_interval=token_flush_interval, token_flush_bytes=token_flush_bytes)
     manager.register_event("on_token", "token")
     manager.register_event("on_vertices_sorted", "vertices_sorted")
     manager.register_event("on_error", "error")
@@ -100,9 +195,10 @@ def create_default_event_manager(queue):
     return manager
 
 
-def create_stream_tokens_event_manager(queue):
-    manager = EventManager(queue)
+def create_stream_tokens_event_manager(queue, *, token_flush_interval: float = 0.0, token_flush_bytes: int = 0):
+    manager = EventManager(queue, token_flush_interval=token_flush_interval, token_flush_bytes=token_flush_bytes)
     manager.register_event("on_message", "add_message")
     manager.register_event("on_token", "token")
     manager.register_event("on_end", "end")
+    manager.register_event("on_error", "error")
     return manager
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from langflow.events.event_manager import EventManager
+
+
+class TokenStream:
+    """Sends the tokens of one streamed message to an event manager without leaving the event loop.
+
+    With the built-in token handler, tokens are put on the queue directly instead of through a worker
+    thread. If a flush interval or byte budget is set, consecutive chunks are merged into a single token
+    event, sent when the budget is reached, when the interval has elapsed since the first buffered chunk,
+    or when the stream is closed. Custom token callbacks may block, so they still run in a worker thread,
+    one event per chunk.
+
+    Attributes:
+        message_id (str): The id of the message the tokens belong to.
+        flush_interval (float): Seconds to buffer chunks for. 0 disables the time budget.
+        flush_bytes (int): Bytes to buffer before sending. 0 disables the byte budget.
+        events_sent (int): Number of token events sent so far.
+    """
+
+    def __init__(
+        self, event_manager: EventManager, message_id: Any, *, flush_interval: float = 0.0, flush_bytes: int = 0
+    ) -> None:
+        self._event_manager = event_manager
+        self._in_loop = event_manager.handles_in_loop("on_token")
+        self._buffer: list[str] = []
+        self._buffered_bytes = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self.message_id = str(message_id)
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self.events_sent = 0
+
+    @property
+    def coalescing(self) -> bool:
+        return self._in_loop and (self.flush_interval > 0 or self.flush_bytes > 0)
+
+    async def send(self, chunk: str) -> None:
+        """Send or buffer a chunk, then wait until the queue can take more events."""
+        if not self.coalescing:
+            await self._event_manager.asend("on_token", data={"chunk": chunk, "id": self.message_id})
+            self.events_sent += 1
+        elif chunk:
+            self._buffer.append(chunk)
+            self._buffered_bytes += len(chunk.encode("utf-8"))
+            if self.flush_bytes and self._buffered_bytes >= self.flush_bytes:
+                self.flush()
+            elif self.flush_interval and self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(self.flush_interval, self.flush)
+        await self._event_manager.wait_for_capacity()
+
+    def flush(self) -> None:
+        """Send the buffered chunks as one token event."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._buffer:
+            return
+        chunk = "".join(self._buffer)
+        self._buffer.clear()
+        self._buffered_bytes = 0
+        self._event_manager.on_token(data={"chunk": chunk, "id": self.message_id})
+        self.events_sent += 1
+
+    async def aclose(self) -> None:
+        """Send whatever is still buffered. Call this when the stream completes or fails."""
+        self.flush()
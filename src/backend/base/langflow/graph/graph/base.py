@@ -10,7 +10,6 @@ import threading
 import uuid
 from collections import defaultdict, deque
 from datetime import datetime, timezone
-from functools import partial
 from itertools import chain
 from typing import TYPE_CHECKING, Any, cast
 
@@ -20,7 +19,7 @@ from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.edge.base import CycleEdge, Edge
 from langflow.graph.graph.constants import Finish, lazy_load_vertex_dict
 from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
-from langflow.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
+from langflow.graph.graph.schema import GraphData, GraphDump, GraphScheduler, StartConfigDict, VertexBuildResult
 from langflow.graph.graph.state_manager import GraphStateManager
 from langflow.graph.graph.state_model import create_state_model_from_graph
 from langflow.graph.graph.utils import (
@@ -40,7 +39,8 @@ from langflow.logging.logger import LogConfig, configure
 from langflow.schema.dotdict import dotdict
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType
 from langflow.services.cache.utils import CacheMiss
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import get_chat_service, get_settings_service, get_tracing_service
+from langflow.services.variable.resolver import VariableResolver
 from langflow.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -50,6 +50,7 @@ if TYPE_CHECKING:
     from langflow.custom.custom_component.component import Component
     from langflow.events.event_manager import EventManager
     from langflow.graph.edge.schema import EdgeData
+    from langflow.graph.graph.plan import GraphPlan
     from langflow.graph.schema import ResultData
     from langflow.schema import Data
     from langflow.services.chat.schema import GetCache, SetCache
@@ -109,7 +110,7 @@ class Graph:
         self.vertices_to_run: set[str] = set()
         self.stop_vertex: str | None = None
         self.inactive_vertices: set = set()
-        self.edges: list[CycleEdge] = []
+        self.edges = []
         self.vertices: list[Vertex] = []
         self.run_manager = RunnableVerticesManager()
         self.state_manager = GraphStateManager()
@@ -125,6 +126,7 @@ class Graph:
         self._run_queue: deque[str] = deque()
         self._first_layer: list[str] = []
         self._lock = asyncio.Lock()
+        self._variable_resolver: VariableResolver | None = None
         self.raw_graph_data: GraphData = {"nodes": [], "edges": []}
         self._is_cyclic: bool | None = None
         self._cycles: list[tuple[str, str]] | None = None
@@ -238,6 +240,26 @@ class Graph:
         graph_dict["endpoint_name"] = str(endpoint_name)
         return graph_dict
 
+    @property
+    def edges(self) -> list[CycleEdge]:
+        return self._built_edges
+
+    @edges.setter
+    def edges(self, edges: Iterable[CycleEdge]) -> None:
+        self._built_edges: list[CycleEdge] = []
+        self._edges_by_source: dict[str, list[CycleEdge]] = defaultdict(list)
+        self._edges_by_target: dict[str, list[CycleEdge]] = defaultdict(list)
+        self._edges_by_pair: dict[tuple[str, str], list[CycleEdge]] = defaultdict(list)
+        for edge in edges:
+            self._index_edge(edge)
+
+    def _index_edge(self, edge: CycleEdge) -> None:
+        """Appends an edge to the graph and to the source, target and (source, target) indexes."""
+        self._built_edges.append(edge)
+        self._edges_by_source[edge.source_id].append(edge)
+        self._edges_by_target[edge.target_id].append(edge)
+        self._edges_by_pair[edge.source_id, edge.target_id].append(edge)
+
     def add_nodes_and_edges(self, nodes: list[NodeData], edges: list[EdgeData]) -> None:
         self._vertices = nodes
         self._edges = edges
@@ -493,6 +515,24 @@ class Graph:
         self.build_graph_maps(self.edges)
         self.define_vertices_lists()
 
+    def get_load_from_db_variable_names(self) -> set[str]:
+        """Returns the names of the variables the `load_from_db` fields of the vertices refer to."""
+        names = set()
+        for vertex in self.vertices:
+            for field in vertex.load_from_db_fields:
+                name = vertex.params.get(field)
+                if name and isinstance(name, str):
+                    names.add(name)
+        return names
+
+    @property
+    def variable_resolver(self) -> VariableResolver:
+        """The resolver of the `load_from_db` fields of the current run, recreated by `prepare`."""
+        # Graphs restored with __setstate__ don't have the attribute
+        if getattr(self, "_variable_resolver", None) is None:
+            self._variable_resolver = VariableResolver(self.get_load_from_db_variable_names())
+        return self._variable_resolver
+
     def get_state(self, name: str) -> Data | None:
         """Returns the state of the graph with the given name.
 
@@ -775,19 +815,24 @@ class Graph:
             vertex.update_raw_params({"session_id": session_id})
         # Process the graph
         try:
-            cache_service = get_chat_service()
+            chat_service = get_chat_service()
             if self.flow_id:
-                await cache_service.set_cache(self.flow_id, self)
+                if not self._run_id:
+                    self.set_run_id()
+                await chat_service.save_run_state(self)
         except Exception:  # noqa: BLE001
-            logger.exception("Error setting cache")
+            logger.exception("Error saving run state")
 
         try:
             # Prioritize the webhook component if it exists
             start_component_id = find_start_component_id(self._is_input_vertices)
+            settings = get_settings_service().settings
             await self.process(
                 start_component_id=start_component_id,
                 fallback_to_env_vars=fallback_to_env_vars,
                 event_manager=event_manager,
+                scheduler=settings.graph_scheduler,
+                max_concurrency=settings.graph_max_concurrency,
             )
             self.increment_run_count()
         except Exception as exc:
@@ -899,10 +944,12 @@ class Graph:
 
     def get_edge(self, source_id: str, target_id: str) -> CycleEdge | None:
         """Returns the edge between two vertices."""
-        for edge in self.edges:
-            if edge.source_id == source_id and edge.target_id == target_id:
-                return edge
-        return None
+        edges = self._edges_by_pair.get((source_id, target_id))
+        return edges[0] if edges else None
+
+    def get_edges_between(self, source_id: str, target_id: str) -> list[CycleEdge]:
+        """Returns every edge going from the source vertex to the target vertex."""
+        return list(self._edges_by_pair.get((source_id, target_id), ()))
 
     def build_parent_child_map(self, vertices: list[Vertex]):
         parent_child_map = defaultdict(list)
@@ -989,7 +1036,9 @@ class Graph:
             state["run_manager"] = run_manager
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
+        edges = state.pop("edges", [])
         self.__dict__.update(state)
+        self.edges = edges
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         self.state_manager = GraphStateManager()
         self.tracing_service = get_tracing_service()
@@ -1032,6 +1081,65 @@ class Graph:
         else:
             return graph
 
+    @classmethod
+    def from_plan(
+        cls,
+        plan: GraphPlan,
+        flow_id: str | None = None,
+        flow_name: str | None = None,
+        user_id: str | None = None,
+    ) -> Graph:
+        """Creates a graph from a compiled plan.
+
+        The processed nodes, validated edges, cycles and adjacency maps are taken from the plan,
+        so only the vertices and their components are built for the new graph.
+
+        Args:
+            plan: The compiled plan, see `langflow.graph.graph.plan.GraphPlan`.
+            flow_id: The ID of the flow.
+            flow_name: The flow name.
+            user_id: The user ID.
+
+        Returns:
+            Graph: The created graph.
+        """
+        graph = cls(flow_id=flow_id, flow_name=flow_name, user_id=user_id)
+        graph.raw_graph_data = plan.raw_graph_data
+        graph._graph_data = plan.graph_data()
+        graph._vertices = graph._graph_data["nodes"]
+        graph._edges = graph._graph_data["edges"]
+        graph.top_level_vertices = list(plan.top_level_vertices)
+        graph._cycle_vertices = set(plan.cycle_vertices)
+
+        graph.vertices = graph._build_vertices()
+        graph.vertex_map = {vertex.id: vertex for vertex in graph.vertices}
+        for vertex_id in chain(graph.top_level_vertices, graph.vertex_map):
+            if vertex_id in graph._cycle_vertices:
+                graph.run_manager.add_to_cycle_vertices(vertex_id)
+
+        # Plain edges are immutable once validated, cycle edges carry per-run state
+        edges = []
+        for edge in plan.edges:
+            if isinstance(edge, CycleEdge):
+                # Bypass Edge.__setstate__, which only restores the attributes needed after unpickling
+                edge_copy = CycleEdge.__new__(CycleEdge)
+                edge_copy.__dict__.update(edge.__dict__)
+                edge = edge_copy  # noqa: PLW2901
+                edge.is_fulfilled = False
+                edge.result = None
+                graph.vertex_map[edge.source_id].has_cycle_edges = True
+                graph.vertex_map[edge.target_id].has_cycle_edges = True
+            edges.append(edge)
+        graph.edges = edges
+
+        graph._build_vertex_params()
+        graph._instantiate_components_in_vertices()
+        graph._set_cache_to_vertices_in_cycle()
+        graph.assert_streaming_sequence()
+        graph.predecessor_map, graph.successor_map, graph.in_degree_map, graph.parent_child_map = plan.adjacency_maps()
+        graph.define_vertices_lists()
+        return graph
+
     def __eq__(self, /, other: object) -> bool:
         if not isinstance(other, Graph):
             return False
@@ -1160,8 +1268,12 @@ class Graph:
         """Updates the edges of a vertex."""
         # Vertex has edges, so we need to update the edges
         for edge in vertex.edges:
-            if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
-                self.edges.append(edge)
+            if (
+                edge.source_id in self.vertex_map
+                and edge.target_id in self.vertex_map
+                and edge not in self._edges_by_pair.get((edge.source_id, edge.target_id), ())
+            ):
+                self._index_edge(edge)
 
     def _build_graph(self) -> None:
         """Builds the graph from the vertices and edges."""
@@ -1281,7 +1393,10 @@ class Graph:
         self.reset_inactivated_vertices()
         self.reset_activated_vertices()
 
-        await chat_service.set_cache(str(self.flow_id or self._run_id), self)
+        if self.flow_id and not self._run_id:
+            self.set_run_id()
+        if self._run_id:
+            await chat_service.save_run_state(self, vertex_ids=[vertex_id])
         self._record_snapshot(vertex_id)
         return vertex_build_result
 
@@ -1297,6 +1412,34 @@ class Graph:
             }
         )
 
+    def get_run_state(self) -> dict[str, Any]:
+        """Returns the scheduling state of the current run, without vertices, edges or built objects."""
+        return {
+            "run_manager": self.run_manager.to_dict(),
+            "run_queue": list(self._run_queue),
+            "vertices_layers": self.vertices_layers,
+            "vertices_to_run": self.vertices_to_run,
+            "first_layer": self._first_layer,
+            "inactivated_vertices": self.inactivated_vertices,
+            "activated_vertices": self.activated_vertices,
+            "stop_vertex": self.stop_vertex,
+            "prepared": self._prepared,
+        }
+
+    def restore_run_state(self, state: dict[str, Any]) -> None:
+        """Restores a state returned by `get_run_state` on a graph built from the same payload."""
+        cycle_vertices = self.run_manager.cycle_vertices
+        self.run_manager = RunnableVerticesManager.from_dict(state["run_manager"])
+        self.run_manager.cycle_vertices = cycle_vertices
+        self._run_queue = deque(state["run_queue"])
+        self.vertices_layers = state["vertices_layers"]
+        self.vertices_to_run = state["vertices_to_run"]
+        self._first_layer = state["first_layer"]
+        self.inactivated_vertices = state["inactivated_vertices"]
+        self.activated_vertices = state["activated_vertices"]
+        self.stop_vertex = state["stop_vertex"]
+        self._prepared = state["prepared"]
+
     def _record_snapshot(self, vertex_id: str | None = None) -> None:
         self._snapshots.append(self.get_snapshot())
         if vertex_id:
@@ -1436,22 +1579,26 @@ class Graph:
         """Returns a list of edges for a given vertex."""
         # The idea here is to return the edges that have the vertex_id as source or target
         # or both
-        return [
-            edge
-            for edge in self.edges
-            if (edge.source_id == vertex_id and is_source is not False)
-            or (edge.target_id == vertex_id and is_target is not False)
-        ]
+        edges: list[CycleEdge] = []
+        if is_source is not False:
+            edges.extend(self._edges_by_source.get(vertex_id, ()))
+        if is_target is not False:
+            edges.extend(
+                edge
+                for edge in self._edges_by_target.get(vertex_id, ())
+                # A self loop was already added as an outgoing edge
+                if is_source is False or edge.source_id != vertex_id
+            )
+        return edges
 
     def get_vertices_with_target(self, vertex_id: str) -> list[Vertex]:
         """Returns the vertices connected to a vertex."""
         vertices: list[Vertex] = []
-        for edge in self.edges:
-            if edge.target_id == vertex_id:
-                vertex = self.get_vertex(edge.source_id)
-                if vertex is None:
-                    continue
-                vertices.append(vertex)
+        for edge in self._edges_by_target.get(vertex_id, ()):
+            vertex = self.vertex_map.get(edge.source_id)
+            if vertex is None:
+                continue
+            vertices.append(vertex)
         return vertices
 
     async def process(
@@ -1460,14 +1607,40 @@ class Graph:
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+        scheduler: GraphScheduler = "layered",
+        max_concurrency: int | None = None,
     ) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+        """Processes the graph.
+
+        Args:
+            fallback_to_env_vars (bool): Whether to fallback to environment variables.
+            start_component_id (str | None): The component to start the run from.
+            event_manager (EventManager | None): The event manager for the graph.
+            scheduler (GraphScheduler): "layered" runs the vertices of each layer in parallel and waits for the
+                whole layer before moving on. "dependency" starts each vertex as soon as its own predecessors
+                have finished.
+            max_concurrency (int | None): Maximum number of vertices built at the same time when using the
+                "dependency" scheduler. None or 0 means no limit.
+        """
         first_layer = self.sort_vertices(start_component_id=start_component_id)
+        await self.initialize_run()
+        if scheduler == "dependency":
+            await self._process_by_dependency(
+                first_layer,
+                fallback_to_env_vars=fallback_to_env_vars,
+                event_manager=event_manager,
+                max_concurrency=max_concurrency,
+            )
+            logger.debug("Graph processing complete")
+            return self
+        if scheduler != "layered":
+            msg = f"Invalid scheduler: {scheduler}. Expected 'layered' or 'dependency'"
+            raise ValueError(msg)
+
         vertex_task_run_count: dict[str, int] = {}
         to_process = deque(first_layer)
         layer_index = 0
         chat_service = get_chat_service()
-        await self.initialize_run()
         lock = asyncio.Lock()
         while to_process:
             current_batch = list(to_process)  # Copy current deque items to a list
@@ -1504,6 +1677,98 @@ class Graph:
         logger.debug("Graph processing complete")
         return self
 
+    async def _process_by_dependency(
+        self,
+        first_layer: list[str],
+        *,
+        fallback_to_env_vars: bool,
+        event_manager: EventManager | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        """Builds each vertex as soon as its predecessors are done, without waiting for whole layers.
+
+        Readiness is tracked by the RunnableVerticesManager, the same way `get_next_runnable_vertices`
+        is used when the frontend builds a flow vertex by vertex. A vertex that becomes runnable again
+        while it is still running, as in loops, is built again once its current run finishes. The first
+        failure cancels every vertex that is still running and is re-raised.
+        """
+        chat_service = get_chat_service()
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        lock = asyncio.Lock()
+        vertex_task_run_count: dict[str, int] = {}
+        running: dict[asyncio.Task, str] = {}
+        pending: set[str] = set()
+
+        async def _build(vertex_id: str) -> VertexBuildResult:
+            build_coro = self.build_vertex(
+                vertex_id=vertex_id,
+                user_id=self.user_id,
+                inputs_dict={},
+                fallback_to_env_vars=fallback_to_env_vars,
+                get_cache=chat_service.get_cache,
+                set_cache=chat_service.set_cache,
+                event_manager=event_manager,
+            )
+            if semaphore is None:
+                return await build_coro
+            async with semaphore:
+                return await build_coro
+
+        def _schedule(vertex_id: str) -> None:
+            if vertex_id in running.values():
+                # A loop can ask for a vertex again while it is still running: build it again once it is done
+                pending.add(vertex_id)
+                return
+            vertex = self.get_vertex(vertex_id)
+            # Mark it as being run right away so it is not picked up again while waiting for the semaphore
+            self.run_manager.add_to_vertices_being_run(vertex_id)
+            task = asyncio.create_task(
+                _build(vertex_id),
+                name=f"{vertex.display_name} Run {vertex_task_run_count.get(vertex_id, 0)}",
+            )
+            running[task] = vertex_id
+            vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
+
+        for vertex_id in first_layer:
+            _schedule(vertex_id)
+
+        try:
+            while running:
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    vertex_id = running.pop(task)
+                    result = task.result()
+                    if not isinstance(result, VertexBuildResult):
+                        msg = f"Invalid result from task {task.get_name()}: {result}"
+                        raise TypeError(msg)
+                    await log_vertex_build(
+                        flow_id=self.flow_id or "",
+                        vertex_id=result.vertex.id,
+                        valid=result.valid,
+                        params=result.params,
+                        data=result.result_dict,
+                        artifacts=result.artifacts,
+                    )
+                    logger.debug(
+                        f"Vertex {result.vertex.id}, result: {result.vertex.built_result}, "
+                        f"object: {result.vertex.built_object}"
+                    )
+                    next_runnable_vertices = await self.get_next_runnable_vertices(
+                        lock, vertex=result.vertex, cache=False
+                    )
+                    if vertex_id in pending:
+                        pending.discard(vertex_id)
+                        _schedule(vertex_id)
+                    for next_vertex_id in next_runnable_vertices:
+                        _schedule(next_vertex_id)
+        except BaseException as exc:
+            if not isinstance(exc, asyncio.CancelledError):
+                logger.error(f"Error processing graph: {exc}")
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running.keys(), return_exceptions=True)
+            raise
+
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         next_runnable_vertices = set()
         for v_id in sorted(vertex_successors_ids):
@@ -1526,9 +1791,11 @@ class Graph:
                     next_runnable_vertices.remove(v_id)
                 else:
                     self.run_manager.add_to_vertices_being_run(next_v_id)
-            if cache and self.flow_id is not None:
-                set_cache_coro = partial(get_chat_service().set_cache, key=self.flow_id)
-                await set_cache_coro(data=self, lock=lock)
+        if cache and self.flow_id is not None:
+            if not self._run_id:
+                self.set_run_id()
+            # Only the run state and this vertex's results are written, and outside of the lock
+            await get_chat_service().save_run_state(self, vertex_ids=[v_id])
         return next_runnable_vertices
 
     async def _execute_tasks(self, tasks: list[asyncio.Task], lock: asyncio.Lock) -> list[str]:
@@ -1593,9 +1860,8 @@ class Graph:
                 raise ValueError(msg)
             if state[vertex] == 0:
                 state[vertex] = 1
-                for edge in vertex.edges:
-                    if edge.source_id == vertex.id:
-                        dfs(self.get_vertex(edge.target_id))
+                for edge in self._edges_by_source.get(vertex.id, ()):
+                    dfs(self.get_vertex(edge.target_id))
                 state[vertex] = 2
                 sorted_vertices.append(vertex)
 
@@ -1656,7 +1922,7 @@ class Graph:
     def get_vertex_neighbors(self, vertex: Vertex) -> dict[Vertex, int]:
         """Returns the neighbors of a vertex."""
         neighbors: dict[Vertex, int] = {}
-        for edge in self.edges:
+        for edge in self.get_vertex_edges(vertex.id):
             if edge.source_id == vertex.id:
                 neighbor = self.get_vertex(edge.target_id)
                 if neighbor is None:
@@ -1800,6 +2066,8 @@ class Graph:
                 self.run_manager.add_to_cycle_vertices(vertex_id)
         self._first_layer = sorted(first_layer)
         self._run_queue = deque(self._first_layer)
+        # Variables are loaded once per run, in one query, when the first component needs one
+        self._variable_resolver = VariableResolver(self.get_load_from_db_variable_names())
         self._prepared = True
         self._record_snapshot()
         return self
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict, defaultdict
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from langflow.graph.graph.utils import process_flow
+
+if TYPE_CHECKING:
+    from langflow.graph.edge.base import CycleEdge
+    from langflow.graph.graph.schema import GraphData
+
+DEFAULT_GRAPH_PLAN_CACHE_SIZE = 128
+
+
+class GraphPlan:
+    """The compiled, immutable topology of a flow payload.
+
+    Compiling a plan does everything `Graph.from_payload` does that does not depend on a single run:
+    ungrouping nodes, detecting cycles, validating edge handles and building the adjacency maps.
+    `Graph.from_plan` then only has to build fresh vertices and components for each run.
+    """
+
+    def __init__(self, payload: dict) -> None:
+        from langflow.graph.graph.base import Graph
+
+        if "data" in payload:
+            payload = payload["data"]
+        template = Graph.from_payload(payload)
+        self.raw_graph_data: GraphData = template.raw_graph_data
+        # The template vertices hold references into its processed nodes, so snapshot an untouched copy
+        self._graph_data = _dumps(process_flow(self.raw_graph_data))
+        self.top_level_vertices: tuple[str, ...] = tuple(template.top_level_vertices)
+        self.cycle_vertices: frozenset[str] = frozenset(template.cycle_vertices)
+        self.edges: tuple[CycleEdge, ...] = tuple(template.edges)
+        self.predecessor_map = {key: tuple(value) for key, value in template.predecessor_map.items()}
+        self.successor_map = {key: tuple(value) for key, value in template.successor_map.items()}
+        self.in_degree_map = dict(template.in_degree_map)
+        self.parent_child_map = {key: tuple(value) for key, value in template.parent_child_map.items()}
+
+    def graph_data(self) -> dict[str, Any]:
+        """Return a private copy of the processed nodes and edges."""
+        return _loads(self._graph_data)
+
+    def adjacency_maps(
+        self,
+    ) -> tuple[dict[str, list[str]], dict[str, list[str]], dict[str, int], dict[str, list[str]]]:
+        """Return mutable copies of the predecessor, successor, in-degree and parent-child maps."""
+        return (
+            defaultdict(list, {key: list(value) for key, value in self.predecessor_map.items()}),
+            defaultdict(list, {key: list(value) for key, value in self.successor_map.items()}),
+            defaultdict(int, self.in_degree_map),
+            defaultdict(list, {key: list(value) for key, value in self.parent_child_map.items()}),
+        )
+
+
+def _dumps(data: dict) -> bytes | dict:
+    try:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return copy.deepcopy(data)
+
+
+def _loads(data: bytes | dict) -> dict:
+    if isinstance(data, bytes):
+        return orjson.loads(data)
+    return copy.deepcopy(data)
+
+
+def _json_default(obj: Any) -> Any:
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return str(obj)
+
+
+class GraphPlanCache:
+    """A process-wide LRU cache of compiled graph plans.
+
+    Plans are keyed by flow id, the flow's `updated_at` timestamp and a hash of the tweaks applied
+    to it, so saving a flow or sending different tweaks never reuses a stale plan.
+    Thread-safe using a threading Lock.
+
+    Attributes:
+        max_size (int): Maximum number of plans to keep. When full, the least recently used plan is evicted.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that required compiling a plan.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_GRAPH_PLAN_CACHE_SIZE) -> None:
+        self._cache: OrderedDict[tuple[str, str, str], GraphPlan] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(flow_id: Any, updated_at: Any, tweaks: Any = None, *, stream: bool = False) -> tuple[str, str, str]:
+        serialized = orjson.dumps([tweaks or {}, stream], option=orjson.OPT_SORT_KEYS, default=_json_default)
+        return str(flow_id), str(updated_at), hashlib.sha256(serialized).hexdigest()
+
+    def get(self, key: tuple[str, str, str]) -> GraphPlan | None:
+        with self._lock:
+            plan = self._cache.get(key)
+            if plan is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return plan
+
+    def set(self, key: tuple[str, str, str], plan: GraphPlan) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._cache[key] = plan
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, flow_id: str) -> int:
+        """Remove every plan compiled for `flow_id`. Returns the number of plans removed."""
+        flow_id = str(flow_id)
+        with self._lock:
+            keys = [key for key in self._cache if key[0] == flow_id]
+            for key in keys:
+                del self._cache[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def resize(self, max_size: int) -> None:
+        with self._lock:
+            self.max_size = max_size
+            while len(self._cache) > max(max_size, 0):
+                self._cache.popitem(last=False)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._cache), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+graph_plan_cache = GraphPlanCache()
+
+
+def invalidate_graph_plan_cache(flow_id: str | None = None) -> None:
+    """Drop the cached plans of `flow_id`, or every cached plan if no flow id is given.
+
+    Call this when a flow is saved or deleted so its next run compiles the new version.
+    """
+    if flow_id is None:
+        graph_plan_cache.clear()
+    else:
+        graph_plan_cache.invalidate(flow_id)
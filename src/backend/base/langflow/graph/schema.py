@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field, field_serializer, model_validator
+from pydantic import BaseModel, Field, field_serializer, model_serializer, model_validator
 
 from langflow.schema.schema import OutputValue, StreamURL
 from langflow.serialization import serialize
@@ -73,3 +73,12 @@ OUTPUT_COMPONENTS = [
 class RunOutputs(BaseModel):
     inputs: dict = Field(default_factory=dict)
     outputs: list[ResultData | None] = Field(default_factory=list)
+    error: str | None = None
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        serialized = handler(self)
+        # Only the failed inputs of a batch run carry an error
+        if serialized.get("error") is None:
+            serialized.pop("error", None)
+        return serialized
@@ -17,7 +17,7 @@ from langflow.services.database.models.transactions.model import TransactionBase
 from langflow.services.database.models.vertex_builds.crud import log_vertex_build as crud_log_vertex_build
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase
 from langflow.services.database.utils import session_getter
-from langflow.services.deps import get_db_service, get_settings_service
+from langflow.services.deps import get_db_service, get_settings_service, get_write_behind_service
 
 if TYPE_CHECKING:
     from langflow.api.v1.schemas import ResultDataResponse
@@ -134,6 +134,8 @@ async def log_transaction(
             error=error,
             flow_id=flow_id if isinstance(flow_id, UUID) else UUID(flow_id),
         )
+        if get_write_behind_service().enqueue_transaction(transaction):
+            return
         async with session_getter(get_db_service()) as session:
             with session.no_autoflush:
                 inserted = await crud_log_transaction(session, transaction)
@@ -166,6 +168,8 @@ async def log_vertex_build(
             # Serialize artifacts using our custom serializer
             artifacts=serialize(artifacts) if artifacts else None,
         )
+        if get_write_behind_service().enqueue_vertex_build(vertex_build):
+            return
         async with session_getter(get_db_service()) as session:
             inserted = await crud_log_vertex_build(session, vertex_build)
             logger.debug(f"Logged vertex build: {inserted.build_id}")
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
+from langflow.custom.code_cache import component_code_cache
 from langflow.custom.utils import abuild_custom_components
+from langflow.utils.compression import EncodedPayload, encode_payload
 
 if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
@@ -41,9 +44,79 @@ ENTERPRISE_FIRST_PASS_EXCLUDED_COMPONENT_TYPES = {
 
 # Create a class to manage component cache instead of using globals
 class ComponentCache:
+    """The types dictionary of every component, and its serialized, compressed forms.
+
+    The encoded catalog and per-category payloads are built on first request and kept until the
+    dictionary changes. Assigning `all_types_dict` drops them all. Code that changes the dictionary in
+    place must call `invalidate` with the category it changed.
+    """
+
     def __init__(self):
-        self.all_types_dict: dict[str, Any] | None = None
+        self._all_types_dict: dict[str, Any] | None = None
         self.fully_loaded_components: dict[str, bool] = {}
+        # Encoded payloads by category, None for the whole catalog
+        self.encoded: dict[str | None, EncodedPayload] = {}
+        self.generation = 0
+        self._encoding: dict[str | None, asyncio.Future] = {}
+
+    @property
+    def all_types_dict(self) -> dict[str, Any] | None:
+        return self._all_types_dict
+
+    @all_types_dict.setter
+    def all_types_dict(self, value: dict[str, Any] | None) -> None:
+        self._all_types_dict = value
+        self.invalidate()
+
+    def invalidate(self, component_type: str | None = None) -> None:
+        """Drop the encoded payloads of the whole catalog and of `component_type`, or of every category."""
+        self.generation += 1
+        if component_type is None:
+            self.encoded.clear()
+        else:
+            self.encoded.pop(None, None)
+            self.encoded.pop(component_type, None)
+
+    def categories(self) -> dict[str, Any]:
+        """The component types and their components. Lazy loading nests them under a "components" key."""
+        all_types = self._all_types_dict or {}
+        components = all_types.get("components")
+        return components if isinstance(components, dict) else all_types
+
+    async def aget_encoded(self, component_type: str | None = None) -> EncodedPayload | None:
+        """The encoded catalog, or the encoded components of one category, built in a worker thread.
+
+        Concurrent requests for a payload that is being built wait for that build. Returns None for an
+        unknown category.
+        """
+        if (payload := self.encoded.get(component_type)) is not None:
+            return payload
+        if (pending := self._encoding.get(component_type)) is not None:
+            return await asyncio.shield(pending)
+        if component_type is None:
+            data = self._all_types_dict or {}
+        elif (data := self.categories().get(component_type)) is None:
+            return None
+        generation = self.generation
+        future = asyncio.get_running_loop().create_future()
+        self._encoding[component_type] = future
+        try:
+            payload = await asyncio.to_thread(encode_payload, data)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved when no request is waiting for it
+            future.exception()
+            raise
+        finally:
+            self._encoding.pop(component_type, None)
+        # Keep the payload only if the dictionary did not change while it was being encoded
+        if generation == self.generation:
+            self.encoded[component_type] = payload
+        future.set_result(payload)
+        return payload
 
 
 # Singleton instance
@@ -109,8 +182,16 @@ async def get_and_cache_all_types_dict(
 
 
 async def aget_all_types_dict(components_paths: list[str]):
-    """Get all types dictionary with full component loading."""
-    return await abuild_custom_components(components_paths=components_paths)
+    """Get all types dictionary with full component loading.
+
+    The templates and compiled code of the loaded components are persisted to the component code cache,
+    so the next process skips building the components that did not change.
+    """
+    await asyncio.to_thread(component_code_cache.load)
+    with component_code_cache.recording():
+        all_types_dict = await abuild_custom_components(components_paths=components_paths)
+    await asyncio.to_thread(component_code_cache.save)
+    return all_types_dict
 
 
 async def aget_component_metadata(components_paths: list[str]):
@@ -261,6 +342,7 @@ async def ensure_component_loaded(component_type: str, component_name: str, sett
 
             # Mark as fully loaded
             component_cache.fully_loaded_components[component_key] = True
+            component_cache.invalidate(component_type)
             logger.debug(f"Component {component_type}:{component_name} fully loaded")
         else:
             logger.warning(f"Failed to fully load component {component_type}:{component_name}")
@@ -34,11 +34,13 @@ from langflow.initial_setup.setup import (
 from langflow.interface.components import get_and_cache_all_types_dict
 from langflow.interface.utils import setup_llm_caching
 from langflow.logging.logger import configure
-from langflow.middleware import ContentSizeLimitMiddleware
+from langflow.middleware import ContentSizeLimitMiddleware, RequestCancelledMiddleware
 from langflow.services.deps import (
+    get_api_key_cache_service,
     get_queue_service,
     get_settings_service,
     get_telemetry_service,
+    get_write_behind_service,
 )
 from langflow.services.utils import initialize_services, teardown_services
 
@@ -53,32 +55,6 @@ _tasks: list[asyncio.Task] = []
 MAX_PORT = 65535
 
 
-class RequestCancelledMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app) -> None:
-        super().__init__(app)
-
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        sentinel = object()
-
-        async def cancel_handler():
-            while True:
-                if await request.is_disconnected():
-                    return sentinel
-                await asyncio.sleep(0.1)
-
-        handler_task = asyncio.create_task(call_next(request))
-        cancel_task = asyncio.create_task(cancel_handler())
-
-        done, pending = await asyncio.wait([handler_task, cancel_task], return_when=asyncio.FIRST_COMPLETED)
-
-        for task in pending:
-            task.cancel()
-
-        if cancel_task in done:
-            return Response("Request was cancelled", status_code=499)
-        return await handler_task
-
-
 class JavaScriptMIMETypeMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         try:
@@ -166,6 +142,8 @@ def get_lifespan(*, fix_migration=False, version=None):
             queue_service = get_queue_service()
             if not queue_service.is_started():  # Start if not already started
                 queue_service.start()
+            get_write_behind_service().start()
+            get_api_key_cache_service().start()
             rprint(f"✓ Flows loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
             total_time = asyncio.get_event_loop().time() - start_time
@@ -202,6 +180,8 @@ def create_app():
     configure()
     lifespan = get_lifespan(version=__version__)
     app = FastAPI(lifespan=lifespan, title="Langflow", version=__version__)
+    if get_settings_service().settings.cancel_disconnected_requests:
+        app.add_middleware(RequestCancelledMiddleware)
     app.add_middleware(
         ContentSizeLimitMiddleware,
     )
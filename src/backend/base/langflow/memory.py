@@ -6,15 +6,18 @@ from uuid import UUID
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage
 from loguru import logger
-from sqlalchemy import delete
+from sqlalchemy import delete, insert, update
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.schema.message import Message
 from langflow.services.database.models.message.model import MessageRead, MessageTable
 from langflow.services.deps import session_scope
+from langflow.services.write_behind.service import MESSAGE, flush_pending_writes
 from langflow.utils.async_helpers import run_until_complete
 
+_MESSAGE_COLUMNS = frozenset(column.name for column in MessageTable.__table__.columns)  # type: ignore[attr-defined]
+
 
 def _get_variable_query(
     sender: str | None = None,
@@ -93,10 +96,11 @@ async def aget_messages(
     Returns:
         List[Data]: A list of Data objects representing the retrieved messages.
     """
+    await flush_pending_writes(MESSAGE)
     async with session_scope() as session:
         stmt = _get_variable_query(sender, sender_name, session_id, order_by, order, flow_id, limit)
         messages = await session.exec(stmt)
-        return [await Message.create(**d.model_dump()) for d in messages]
+        return [await _to_message(message) for message in messages]
 
 
 def add_messages(messages: Message | list[Message], flow_id: str | UUID | None = None):
@@ -118,43 +122,70 @@ async def aadd_messages(messages: Message | list[Message], flow_id: str | UUID |
         raise ValueError(msg)
 
     try:
-        messages_models = [MessageTable.from_message(msg, flow_id=flow_id) for msg in messages]
+        messages_models = [_to_messagetable(msg, flow_id=flow_id) for msg in messages]
         async with session_scope() as session:
-            messages_models = await aadd_messagetables(messages_models, session)
-        return [await Message.create(**message.model_dump()) for message in messages_models]
+            stored_messages = await _insert_messagetables(messages_models, session)
+            return [await _to_message(message) for message in stored_messages]
     except Exception as e:
         logger.exception(e)
         raise
 
 
-async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
+def _to_messagetable(message: Message, flow_id: str | UUID | None = None) -> MessageTable:
+    message_table = MessageTable.from_message(message, flow_id=flow_id)
+    # Keep an id assigned before storing, e.g. to a message whose tokens were streamed under it
+    if isinstance(message_id := message.data.get("id"), UUID):
+        message_table.id = message_id
+    return message_table
+
+
+async def aupdate_messages(messages: Message | list[Message]) -> list[MessageRead]:
+    """Update stored messages with one UPDATE ... RETURNING statement each and a single commit."""
     if not isinstance(messages, list):
         messages = [messages]
 
     async with session_scope() as session:
-        updated_messages: list[MessageTable] = []
-        for message in messages:
-            msg = await session.get(MessageTable, message.id)
-            if msg:
-                msg = msg.sqlmodel_update(message.model_dump(exclude_unset=True, exclude_none=True))
-                # Convert flow_id to UUID if it's a string preventing error when saving to database
-                if msg.flow_id and isinstance(msg.flow_id, str):
-                    msg.flow_id = UUID(msg.flow_id)
-                session.add(msg)
-                await session.commit()
-                await session.refresh(msg)
-                updated_messages.append(msg)
-            else:
-                error_message = f"Message with id {message.id} not found"
-                logger.warning(error_message)
-                raise ValueError(error_message)
-        return [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
+        return [_to_message_read(message) for message in await _update_messagetables(messages, session)]
+
+
+async def _update_messagetables(messages: list[Message], session: AsyncSession) -> list[MessageTable]:
+    updated_messages: list[MessageTable] = []
+    for message in messages:
+        message_id = message.id if isinstance(message.id, UUID) else UUID(str(message.id))
+        values = {
+            key: value
+            for key, value in message.model_dump(exclude_unset=True, exclude_none=True).items()
+            if key in _MESSAGE_COLUMNS and key != "id"
+        }
+        # Convert flow_id to UUID if it's a string preventing error when saving to database
+        if isinstance(values.get("flow_id"), str):
+            values["flow_id"] = UUID(values["flow_id"])
+        if values:
+            stmt = update(MessageTable).where(col(MessageTable.id) == message_id).values(**values)
+            msg = (await session.exec(stmt.returning(MessageTable))).scalar_one_or_none()
+        else:
+            msg = await session.get(MessageTable, message_id)
+        if msg:
+            updated_messages.append(msg)
+        else:
+            error_message = f"Message with id {message.id} not found"
+            logger.warning(error_message)
+            raise ValueError(error_message)
+    return updated_messages
 
 
 async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession):
+    """Insert the messages with a single INSERT ... RETURNING statement and commit."""
+    return [_to_message_read(message) for message in await _insert_messagetables(messages, session)]
+
+
+async def _insert_messagetables(messages: list[MessageTable], session: AsyncSession) -> list[MessageTable]:
+    if not messages:
+        return []
     try:
-        for message in messages:
-            session.add(message)
+        stmt = insert(MessageTable).returning(MessageTable, sort_by_parameter_order=True)
+        result = await session.exec(stmt, params=[_column_values(message) for message in messages])
+        stored_messages = list(result.scalars())
         try:
             await session.commit()
             # This is a hack.
@@ -162,8 +193,6 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
             # while build_flow does not.
         except asyncio.CancelledError:
             await session.commit()
-        for message in messages:
-            await session.refresh(message)
     except asyncio.CancelledError as e:
         logger.exception(e)
         error_msg = "Operation cancelled"
@@ -172,14 +201,32 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
         logger.exception(e)
         raise
 
-    new_messages = []
-    for msg in messages:
-        msg.properties = json.loads(msg.properties) if isinstance(msg.properties, str) else msg.properties  # type: ignore[arg-type]
-        msg.content_blocks = [json.loads(j) if isinstance(j, str) else j for j in msg.content_blocks]  # type: ignore[arg-type]
-        msg.category = msg.category or ""
-        new_messages.append(msg)
+    return stored_messages
+
+
+def _column_values(message: MessageTable) -> dict:
+    return {column: getattr(message, column) for column in _MESSAGE_COLUMNS}
+
+
+def _row_values(message: MessageTable) -> dict:
+    # Read the row values instead of decoding them on the row itself, which would mark it dirty
+    values = _column_values(message)
+    values["properties"] = (
+        json.loads(values["properties"]) if isinstance(values["properties"], str) else values["properties"]
+    )
+    values["content_blocks"] = [json.loads(j) if isinstance(j, str) else j for j in values["content_blocks"] or []]
+    return values
+
+
+def _to_message_read(message: MessageTable) -> MessageRead:
+    values = _row_values(message)
+    values["category"] = values["category"] or ""
+    return MessageRead.model_validate(values)
+
 
-    return [MessageRead.model_validate(message, from_attributes=True) for message in new_messages]
+async def _to_message(message: MessageTable) -> Message:
+    """Build the Message of a stored row straight from its values."""
+    return await Message.create(**_row_values(message))
 
 
 def delete_messages(session_id: str) -> None:
@@ -274,7 +321,9 @@ async def astore_message(
         # if message has an id and exist in the database, update it
         # if not raise an error and add the message to the database
         try:
-            return await aupdate_messages([message])
+            async with session_scope() as session:
+                updated_messages = await _update_messagetables([message], session)
+                return [await _to_message(updated_message) for updated_message in updated_messages]
         except ValueError as e:
             logger.error(e)
     if flow_id and not isinstance(flow_id, UUID):
@@ -1,3 +1,6 @@
+import asyncio
+
+import anyio
 from fastapi import HTTPException
 from loguru import logger
 
@@ -57,3 +60,74 @@ class ContentSizeLimitMiddleware:
 
         wrapper = self.receive_wrapper(receive)
         await self.app(scope, wrapper, send)
+
+
+class RequestCancelledMiddleware:
+    """Cancels the handling of an HTTP request when its client disconnects.
+
+    A single task per request reads the ASGI `receive` channel and hands the messages over to the
+    application, one message ahead at most, so request bodies are still read as the application consumes
+    them. When the client disconnects before the response is complete, the application is cancelled
+    right away and, if it had not started a response yet, a 499 response is sent. Nothing is polled, so
+    idle requests cost no event loop wakeups, and streaming responses are covered as well.
+
+    Args:
+      app (ASGI application): ASGI application
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Messages for the application, or the exception `receive` raised
+        messages: asyncio.Queue = asyncio.Queue(maxsize=1)
+        disconnected = False
+        response_started = False
+        response_complete = False
+        app_scope = anyio.CancelScope()
+
+        async def watch_disconnect() -> None:
+            nonlocal disconnected
+            while not disconnected:
+                try:
+                    message = await receive()
+                except Exception as exc:  # noqa: BLE001
+                    await messages.put(exc)
+                    return
+                if message["type"] == "http.disconnect":
+                    disconnected = True
+                    if not response_complete:
+                        app_scope.cancel()
+                await messages.put(message)
+
+        async def wrapped_receive():
+            if disconnected and messages.empty():
+                return {"type": "http.disconnect"}
+            message = await messages.get()
+            if isinstance(message, Exception):
+                raise message
+            return message
+
+        async def wrapped_send(message) -> None:
+            nonlocal response_started, response_complete
+            if message["type"] == "http.response.start":
+                response_started = True
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+            await send(message)
+
+        watcher = asyncio.create_task(watch_disconnect())
+        try:
+            with app_scope:
+                await self.app(scope, wrapped_receive, wrapped_send)
+        finally:
+            watcher.cancel()
+        if app_scope.cancelled_caught:
+            logger.debug(f"Client disconnected, cancelled {scope['method']} {scope['path']}")
+            if not response_started:
+                await send({"type": "http.response.start", "status": 499, "headers": []})
+                await send({"type": "http.response.body", "body": b"Request was cancelled"})
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import cache
+from typing import TYPE_CHECKING, Any, Literal
+
+from loguru import logger
+
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+AdmissionPolicy = Literal["queue", "reject"]
+
+# Set while a run holds a slot, so the flows it runs in turn (e.g. through the Run Flow component) don't
+# wait for slots their own parent run is holding
+_admitted: ContextVar[bool] = ContextVar("run_executor_admitted", default=False)
+
+
+class RunRejectedError(Exception):
+    """Raised when a run is not admitted because the run executor is saturated."""
+
+
+class RunExecutor:
+    """Admission control for flow runs, with a global and a per-flow concurrency limit.
+
+    A run is admitted when fewer than `max_concurrency` runs are active and fewer than the limit of its
+    flow, `flow_limits[flow_id]` or `max_concurrency_per_flow`, are active for that flow. A limit of 0
+    means no limit. When a run cannot be admitted, the `queue` policy makes it wait for a slot, in
+    arrival order among the runs that could take that slot, for at most `queue_timeout` seconds and with
+    at most `max_queue_size` runs waiting. The `reject` policy, a full queue and a timeout raise
+    `RunRejectedError`.
+
+    `stats` reports the active and queued runs, the admitted and rejected counts and the time admitted
+    runs spent in the queue.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 0,
+        max_concurrency_per_flow: int = 0,
+        flow_limits: dict[str, int] | None = None,
+        policy: AdmissionPolicy = "queue",
+        max_queue_size: int = 0,
+        queue_timeout: float = 0,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_flow = max_concurrency_per_flow
+        self.flow_limits = dict(flow_limits or {})
+        self.policy = policy
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self.active_per_flow: Counter[str | None] = Counter()
+        self._waiters: deque[tuple[str | None, asyncio.Future]] = deque()
+        self.admitted = 0
+        self.rejected = 0
+        self.queued_total = 0
+        self.total_queue_time = 0.0
+        self.max_queue_time = 0.0
+
+    def _flow_limit(self, flow_id: str | None) -> int:
+        if flow_id is not None and flow_id in self.flow_limits:
+            return self.flow_limits[flow_id]
+        return self.max_concurrency_per_flow
+
+    def _can_admit(self, flow_id: str | None) -> bool:
+        if self.max_concurrency and self.active >= self.max_concurrency:
+            return False
+        if flow_id is None:
+            return True
+        flow_limit = self._flow_limit(flow_id)
+        return not flow_limit or self.active_per_flow[flow_id] < flow_limit
+
+    def _take(self, flow_id: str | None) -> None:
+        self.active += 1
+        self.active_per_flow[flow_id] += 1
+
+    def _release(self, flow_id: str | None) -> None:
+        self.active -= 1
+        self.active_per_flow[flow_id] -= 1
+        if not self.active_per_flow[flow_id]:
+            del self.active_per_flow[flow_id]
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Hand the free slots to the oldest waiting runs that can take them."""
+        for waiter in list(self._waiters):
+            if self.max_concurrency and self.active >= self.max_concurrency:
+                break
+            flow_id, future = waiter
+            if future.done():
+                self._waiters.remove(waiter)
+            elif self._can_admit(flow_id):
+                self._waiters.remove(waiter)
+                self._take(flow_id)
+                future.set_result(None)
+
+    def _reject(self, reason: str) -> RunRejectedError:
+        self.rejected += 1
+        if self.rejected == 1 or self.rejected % 100 == 0:
+            logger.warning(f"Run rejected: {reason}, {self.rejected} runs rejected so far")
+        return RunRejectedError(reason)
+
+    async def _wait_for_slot(self, flow_id: str | None) -> None:
+        if self.policy == "reject":
+            msg = "too many concurrent runs"
+            raise self._reject(msg)
+        if self.max_queue_size and len(self._waiters) >= self.max_queue_size:
+            msg = "too many runs waiting"
+            raise self._reject(msg)
+        future = asyncio.get_running_loop().create_future()
+        waiter = (flow_id, future)
+        self._waiters.append(waiter)
+        self.queued_total += 1
+        try:
+            await asyncio.wait_for(future, self.queue_timeout or None)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if future.done() and not future.cancelled():
+                # The slot was handed over as the wait ended: give it to the next run
+                self._release(flow_id)
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if isinstance(exc, asyncio.TimeoutError):
+                msg = f"no run slot became available within {self.queue_timeout}s"
+                raise self._reject(msg) from exc
+            raise
+
+    @asynccontextmanager
+    async def admit(self, flow_id: str | None) -> AsyncIterator[None]:
+        """Hold a run slot of `flow_id` for the duration of the block, waiting or raising per the policy."""
+        if _admitted.get():
+            yield
+            return
+        start = time.monotonic()
+        if self._can_admit(flow_id):
+            self._take(flow_id)
+        else:
+            await self._wait_for_slot(flow_id)
+        queue_time = time.monotonic() - start
+        self.admitted += 1
+        self.total_queue_time += queue_time
+        self.max_queue_time = max(self.max_queue_time, queue_time)
+        token = _admitted.set(True)
+        try:
+            yield
+        finally:
+            _admitted.reset(token)
+            self._release(flow_id)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "active": self.active,
+            "active_per_flow": {str(flow_id): count for flow_id, count in self.active_per_flow.items()},
+            "queued": len(self._waiters),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "queued_total": self.queued_total,
+            "max_queue_time": self.max_queue_time,
+            "mean_queue_time": self.total_queue_time / self.admitted if self.admitted else 0.0,
+        }
+
+
+@cache
+def get_run_executor() -> RunExecutor:
+    """The run executor shared by every run of the process, configured from the settings."""
+    settings = get_settings_service().settings
+    return RunExecutor(
+        max_concurrency=settings.run_max_concurrency,
+        max_concurrency_per_flow=settings.run_max_concurrency_per_flow,
+        flow_limits=settings.run_flow_max_concurrency,
+        policy=settings.run_admission_policy,
+        max_queue_size=settings.run_max_queue_size,
+        queue_timeout=settings.run_queue_timeout,
+    )
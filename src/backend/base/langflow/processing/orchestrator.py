@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import copy
 from dataclasses import dataclass
+from functools import cache
 from typing import TYPE_CHECKING, TypedDict, cast
 
 from langgraph.graph import END, StateGraph
 from loguru import logger
 
 from langflow.graph.schema import RunOutputs
+from langflow.processing.executor import get_run_executor
+from langflow.services.deps import get_settings_service
 
 if TYPE_CHECKING:
     from langflow.events.event_manager import EventManager
@@ -23,6 +28,23 @@ class _RunConfig:
     input_type: InputType | None
 
 
+@dataclass
+class _BatchOptions:
+    graph: Graph
+    outputs: list[str]
+    session_id: str
+    stream: bool
+    fallback_to_env_vars: bool
+    event_manager: EventManager | None
+    max_concurrency: int
+
+
+class OrchestratorState(TypedDict, total=False):
+    options: _BatchOptions
+    run_configs: list[_RunConfig]
+    run_outputs: list[RunOutputs]
+
+
 def _normalize_run_configs(
     inputs: list[dict[str, str]],
     inputs_components: list[list[str]] | None,
@@ -42,10 +64,77 @@ def _normalize_run_configs(
 
     return [
         _RunConfig(inputs=run_inputs, components=components, input_type=input_type)
-        for run_inputs, components, input_type in zip(normalized_inputs, normalized_components, normalized_types, strict=True)
+        for run_inputs, components, input_type in zip(
+            normalized_inputs, normalized_components, normalized_types, strict=True
+        )
     ]
 
 
+def _isolated_graph(template: Graph) -> Graph:
+    """Return a fresh copy of `template` with its own vertices, run id and run state."""
+    graph = copy.deepcopy(template)
+    graph.session_id = template.session_id
+    graph.context = dict(template.context)
+    graph.set_run_id()
+    return graph
+
+
+async def _run_once(graph: Graph, run_config: _RunConfig, options: _BatchOptions) -> RunOutputs:
+    vertex_outputs = await graph._run(
+        inputs=run_config.inputs,
+        input_components=run_config.components,
+        input_type=run_config.input_type,
+        outputs=options.outputs,
+        stream=options.stream,
+        session_id=options.session_id,
+        fallback_to_env_vars=options.fallback_to_env_vars,
+        event_manager=options.event_manager,
+    )
+    run_output_object = RunOutputs(inputs=run_config.inputs, outputs=vertex_outputs)
+    logger.debug(f"Run outputs: {run_output_object}")
+    return run_output_object
+
+
+async def _run_batch(run_configs: list[_RunConfig], options: _BatchOptions) -> list[RunOutputs]:
+    """Run every config on its own copy of the graph, at most `max_concurrency` at a time.
+
+    The first config runs on the caller's graph so it reflects a run like it would sequentially.
+    Copies are taken from a snapshot made before any run starts, so they never see half-built state.
+    """
+    template = _isolated_graph(options.graph)
+    semaphore = asyncio.Semaphore(options.max_concurrency)
+
+    async def run_item(index: int, run_config: _RunConfig) -> RunOutputs:
+        async with semaphore:
+            try:
+                graph = options.graph if index == 0 else _isolated_graph(template)
+                return await _run_once(graph, run_config, options)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(f"Run {index} of {len(run_configs)} failed: {exc}")
+                return RunOutputs(inputs=run_config.inputs, outputs=[], error=str(exc))
+
+    return list(await asyncio.gather(*(run_item(index, config) for index, config in enumerate(run_configs))))
+
+
+async def _execute_graph(state: OrchestratorState):
+    options = state["options"]
+    run_configs = state["run_configs"]
+    if len(run_configs) > 1 and options.max_concurrency > 1:
+        return {"run_outputs": await _run_batch(run_configs, options)}
+
+    return {"run_outputs": [await _run_once(options.graph, run_config, options) for run_config in run_configs]}
+
+
+@cache
+def _get_orchestrator():
+    """Compile the orchestrator once; the graph and run options travel in the state of each call."""
+    workflow = StateGraph(OrchestratorState)
+    workflow.add_node("execute_graph", _execute_graph)
+    workflow.set_entry_point("execute_graph")
+    workflow.add_edge("execute_graph", END)
+    return workflow.compile()
+
+
 async def run_graph_with_orchestrator(
     graph: Graph,
     inputs: list[dict[str, str]],
@@ -57,40 +146,37 @@ async def run_graph_with_orchestrator(
     stream: bool = False,
     fallback_to_env_vars: bool = False,
     event_manager: EventManager | None = None,
+    max_concurrency: int | None = None,
 ) -> list[RunOutputs]:
+    """Run `graph` once per input and return one `RunOutputs` per input, in input order.
+
+    A single input runs on `graph` itself and any error is raised. Several inputs run concurrently,
+    each on an isolated copy of the graph and at most `max_concurrency` at a time (defaults to the
+    `orchestrator_max_concurrency` setting); an input that fails is reported in the `error` field of
+    its `RunOutputs` instead of failing the whole batch. A concurrency of 1 runs the inputs one after
+    another on `graph`, raising on the first error.
+
+    The run waits for a slot of the shared `RunExecutor`, which applies the global and per-flow run
+    concurrency limits and raises `RunRejectedError` when the run is not admitted.
+    """
     run_configs = _normalize_run_configs(inputs=inputs, inputs_components=inputs_components, types=types)
     if session_id:
         graph.session_id = session_id
-
-    class OrchestratorState(TypedDict, total=False):
-        run_configs: list[_RunConfig]
-        run_outputs: list[RunOutputs]
-
-    async def execute_graph(state: OrchestratorState):
-        run_outputs: list[RunOutputs] = []
-        for run_config in state["run_configs"]:
-            vertex_outputs = await graph._run(
-                inputs=run_config.inputs,
-                input_components=run_config.components,
-                input_type=run_config.input_type,
-                outputs=outputs or [],
-                stream=stream,
-                session_id=session_id or "",
-                fallback_to_env_vars=fallback_to_env_vars,
-                event_manager=event_manager,
-            )
-            run_output_object = RunOutputs(inputs=run_config.inputs, outputs=vertex_outputs)
-            logger.debug(f"Run outputs: {run_output_object}")
-            run_outputs.append(run_output_object)
-        return {"run_outputs": run_outputs}
-
-    workflow = StateGraph(OrchestratorState)
-    workflow.add_node("execute_graph", execute_graph)
-    workflow.set_entry_point("execute_graph")
-    workflow.add_edge("execute_graph", END)
-
-    app = workflow.compile()
-    result = await app.ainvoke({"run_configs": run_configs})
+    if max_concurrency is None:
+        max_concurrency = get_settings_service().settings.orchestrator_max_concurrency
+
+    options = _BatchOptions(
+        graph=graph,
+        outputs=outputs or [],
+        session_id=session_id or "",
+        stream=stream,
+        fallback_to_env_vars=fallback_to_env_vars,
+        event_manager=event_manager,
+        max_concurrency=max_concurrency,
+    )
+    flow_id = getattr(graph, "flow_id", None)
+    async with get_run_executor().admit(str(flow_id) if flow_id else None):
+        result = await _get_orchestrator().ainvoke({"options": options, "run_configs": run_configs})
     if not isinstance(result, dict):
         msg = "Invalid LangGraph result format"
         raise TypeError(msg)
@@ -1,11 +1,76 @@
-from typing import cast
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any, cast, overload
 
+import numpy as np
 import pandas as pd
 from langchain_core.documents import Document
 from pandas import DataFrame as pandas_DataFrame
 
 from langflow.schema.data import Data
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def _is_arrow_table(data: Any) -> bool:
+    return type(data).__module__.startswith("pyarrow") and hasattr(data, "to_pandas")
+
+
+class DataView(Sequence[Data]):
+    """A read-only sequence of `Data` over the rows of a DataFrame, built one row at a time on access.
+
+    Each column is converted to Python values once, the first time a row is read, so indexing and
+    iterating never go through `iloc` or build the `Data` of rows that are not read.
+    """
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self._frame = frame
+        self._keys = list(frame.columns)
+        self._columns: list[list] | None = None
+
+    def _get_columns(self) -> list[list]:
+        if self._columns is None:
+            self._columns = [self._column_values(self._frame.iloc[:, position]) for position in range(len(self._keys))]
+        return self._columns
+
+    @staticmethod
+    def _column_values(series: pd.Series) -> list:
+        if isinstance(series.dtype, np.dtype):
+            return series.tolist()
+        # Extension dtypes, e.g. nullable integers, would give `pd.NA` for missing values
+        return series.astype(object).where(series.notna(), None).tolist()
+
+    def __len__(self) -> int:
+        return len(self._frame)
+
+    @overload
+    def __getitem__(self, index: int) -> Data: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Data]: ...
+
+    def __getitem__(self, index: int | slice) -> Data | list[Data]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(len(self))[index]]
+        columns = self._get_columns()
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "DataView index out of range"
+            raise IndexError(msg)
+        return Data(data={key: column[index] for key, column in zip(self._keys, columns, strict=True)})
+
+    def __iter__(self) -> Iterator[Data]:
+        keys = self._keys
+        for row in zip(*self._get_columns(), strict=True):
+            yield Data(data=dict(zip(keys, row, strict=True)))
+
+    def iter_dicts(self) -> Iterator[dict]:
+        """Iterate over the rows as plain dictionaries, without building `Data` objects."""
+        keys = self._keys
+        for row in zip(*self._get_columns(), strict=True):
+            yield dict(zip(keys, row, strict=True))
+
 
 class DataFrame(pandas_DataFrame):
     """A pandas DataFrame subclass specialized for handling collections of Data objects.
@@ -19,6 +84,7 @@ class DataFrame(pandas_DataFrame):
             - List[Dict]: List of dictionaries
             - Dict: Dictionary of arrays/lists
             - pandas.DataFrame: Existing DataFrame
+            - pyarrow.Table: Arrow table, converted column by column
             - Any format supported by pandas.DataFrame
         **kwargs: Additional arguments passed to pandas.DataFrame constructor
 
@@ -31,11 +97,16 @@ class DataFrame(pandas_DataFrame):
 
         >>> # From dictionary of lists
         >>> dataset = DataFrame({"name": ["John", "Jane"], "age": [30, 25]})
+
+        >>> # Appending rows one at a time
+        >>> buffer = DataFrameBuffer()
+        >>> buffer.append({"name": "John"})
+        >>> dataset = buffer.to_dataframe()
     """
 
     def __init__(
         self,
-        data: list[dict] | list[Data] | pd.DataFrame | None = None,
+        data: "list[dict] | list[Data] | pd.DataFrame | pa.Table | None" = None,
         text_key: str = "text",
         default_value: str = "",
         **kwargs,
@@ -59,6 +130,19 @@ class DataFrame(pandas_DataFrame):
             self._update(data, **kwargs)
         elif isinstance(data, dict | pd.DataFrame):  # Fixed type check syntax
             self._update(data, **kwargs)
+        elif _is_arrow_table(data):
+            self._update(data.to_pandas(), **kwargs)
+
+    @classmethod
+    def from_arrow(cls, table: "pa.Table", text_key: str = "text", default_value: str = "") -> "DataFrame":
+        """Creates a DataFrame from an Arrow table."""
+        return cls(table, text_key=text_key, default_value=default_value)
+
+    def to_arrow(self) -> "pa.Table":
+        """Converts the DataFrame to an Arrow table, without the index."""
+        import pyarrow as pa
+
+        return pa.Table.from_pandas(self, preserve_index=False)
 
     def _update(self, data, **kwargs):
         """Helper method to update DataFrame with new data."""
@@ -87,9 +171,11 @@ class DataFrame(pandas_DataFrame):
 
     def to_data_list(self) -> list[Data]:
         """Converts the DataFrame back to a list of Data objects."""
-        list_of_dicts = self.to_dict(orient="records")
-        # suggested change: [Data(**row) for row in list_of_dicts]
-        return [Data(data=row) for row in list_of_dicts]
+        return list(self.data_view())
+
+    def data_view(self) -> DataView:
+        """Returns a lazy sequence of Data objects over the rows, for reading rows without converting them all."""
+        return DataView(self)
 
     def add_row(self, data: dict | Data) -> "DataFrame":
         """Adds a single row to the dataset.
@@ -100,6 +186,9 @@ class DataFrame(pandas_DataFrame):
         Returns:
             DataFrame: A new DataFrame with the added row
 
+        Each call copies the whole DataFrame. To add rows one at a time, collect them in a
+        `DataFrameBuffer` instead.
+
         Example:
             >>> dataset = DataFrame([{"name": "John"}])
             >>> dataset = dataset.add_row({"name": "Jane"})
@@ -117,6 +206,9 @@ class DataFrame(pandas_DataFrame):
 
         Returns:
             DataFrame: A new DataFrame with the added rows
+
+        Each call copies the whole DataFrame. To add rows one at a time, collect them in a
+        `DataFrameBuffer` instead.
         """
         processed_data = []
         for item in data:
@@ -178,3 +270,50 @@ class DataFrame(pandas_DataFrame):
         if not isinstance(other, DataFrame | pd.DataFrame):  # Non-DataFrame case
             return False
         return super().__eq__(other)
+
+
+class DataFrameBuffer:
+    """Collects rows and builds a DataFrame from them once, instead of copying the DataFrame per row.
+
+    Args:
+        base: Rows to start from. The new rows are added after them.
+        text_key: The text key of the built DataFrame, by default the one of `base` or "text".
+        default_value: The default value of the built DataFrame, by default the one of `base` or "".
+
+    Example:
+        >>> buffer = DataFrameBuffer()
+        >>> for name in ["John", "Jane"]:
+        ...     buffer.append({"name": name})
+        >>> dataset = buffer.to_dataframe()
+    """
+
+    def __init__(
+        self,
+        base: pd.DataFrame | None = None,
+        text_key: str | None = None,
+        default_value: str | None = None,
+    ) -> None:
+        self._base = base
+        self._rows: list[dict] = []
+        self.text_key = text_key or getattr(base, "text_key", "text")
+        self.default_value = default_value if default_value is not None else getattr(base, "default_value", "")
+
+    def __len__(self) -> int:
+        return (0 if self._base is None else len(self._base)) + len(self._rows)
+
+    def append(self, row: dict | Data) -> None:
+        self._rows.append(row.data if isinstance(row, Data) else row)
+
+    def extend(self, rows: list[dict | Data]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def to_dataframe(self) -> DataFrame:
+        """Builds a DataFrame from the base and the collected rows. The buffer can still be appended to."""
+        new_df = DataFrame(self._rows, text_key=self.text_key, default_value=self.default_value)
+        if self._base is None or self._base.empty:
+            return new_df
+        if new_df.empty:
+            return DataFrame(self._base.copy(), text_key=self.text_key, default_value=self.default_value)
+        combined = pd.concat([self._base, new_df], ignore_index=True)
+        return DataFrame(combined, text_key=self.text_key, default_value=self.default_value)
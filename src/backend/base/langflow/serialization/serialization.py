@@ -1,6 +1,8 @@
-from collections.abc import AsyncIterator, Generator, Iterator
+from collections.abc import AsyncIterator, Callable, Generator, Iterator
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import lru_cache
+from itertools import islice
 from typing import Any, cast
 from uuid import UUID
 
@@ -25,14 +27,14 @@ class _UnserializableSentinel:
 UNSERIALIZABLE_SENTINEL = _UnserializableSentinel()
 
 
-def _serialize_str(obj: str, max_length: int | None, _) -> str:
+def _serialize_str(obj: str, max_length: int | None, *_) -> str:
     """Truncate long strings with ellipsis if max_length provided."""
     if max_length is None or len(obj) <= max_length:
         return obj
     return obj[:max_length] + "..."
 
 
-def _serialize_bytes(obj: bytes, max_length: int | None, _) -> str:
+def _serialize_bytes(obj: bytes, max_length: int | None, *_) -> str:
     """Decode bytes to string and truncate if max_length provided."""
     if max_length is not None:
         return (
@@ -219,6 +221,161 @@ def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | Non
             return UNSERIALIZABLE_SENTINEL
 
 
+# A handler returns the serialized value. Container handlers return the new container and push
+# (value, container, key) entries on the stack for the values that still have to be serialized.
+_Stack = list[tuple[Any, Any, Any]]
+_Handler = Callable[[Any, int | None, int | None, _Stack], Any]
+
+# DataFrame columns of these dtype kinds hold only bools, integers, floats or complex numbers,
+# which `tolist` already returns as the Python values `serialize` would produce.
+_NATIVE_DTYPE_KINDS = frozenset("biufc")
+
+# Values of these exact types are copied into their container without going through the stack
+_SCALAR_TYPES = frozenset({type(None), bool, int, float})
+
+
+def _handle_as_is(obj: Any, *_) -> Any:
+    return obj
+
+
+def _handle_dict(obj: dict, max_length: int | None, _max_items: int | None, stack: _Stack) -> dict:
+    result = {}
+    for key, value in obj.items():
+        cls = type(value)
+        if cls in _SCALAR_TYPES:
+            result[key] = value
+        elif cls is str:
+            result[key] = _serialize_str(value, max_length)
+        else:
+            result[key] = None
+            stack.append((value, result, key))
+    return result
+
+
+def _handle_list_tuple(obj: list | tuple, max_length: int | None, max_items: int | None, stack: _Stack) -> list:
+    truncated = max_items is not None and len(obj) > max_items
+    # Slice lazily so only the items that are kept get copied
+    items = islice(obj, max_items) if truncated else obj
+    result: list = []
+    for index, item in enumerate(items):
+        cls = type(item)
+        if cls in _SCALAR_TYPES:
+            result.append(item)
+        elif cls is str:
+            result.append(_serialize_str(item, max_length))
+        else:
+            result.append(None)
+            stack.append((item, result, index))
+    if truncated:
+        result.append(None)
+        stack.append((f"... [truncated {len(obj) - len(result) + 1} items]", result, len(result) - 1))
+    return result
+
+
+def _handle_pydantic(obj: BaseModel, max_length: int | None, max_items: int | None, stack: _Stack) -> dict:
+    return _handle_dict(obj.model_dump(), max_length, max_items, stack)
+
+
+def _handle_dataframe(obj: pd.DataFrame, max_length: int | None, max_items: int | None, stack: _Stack) -> list:
+    """Build the records column by column instead of through `to_dict(orient="records")`."""
+    if max_items is not None and len(obj) > max_items:
+        obj = obj.head(max_items)
+    columns = list(obj.columns)
+    # With duplicate column names the last column wins, as in `to_dict`
+    last_positions = {column: position for position, column in enumerate(columns)}
+    values = []
+    pending = []
+    for position, column in enumerate(columns):
+        series = obj.iloc[:, position]
+        if isinstance(series.dtype, np.dtype):
+            values.append(series.tolist())
+            if series.dtype.kind in _NATIVE_DTYPE_KINDS:
+                continue
+        else:
+            # Extension dtypes, e.g. nullable integers, have their own missing value handling
+            column_records = series.to_frame().to_dict(orient="records")
+            values.append([next(iter(record.values())) for record in column_records])
+        if last_positions[column] == position:
+            pending.append(position)
+    records = [dict(zip(columns, row, strict=True)) for row in zip(*values, strict=True)]
+    for position in pending:
+        column = columns[position]
+        for value, record in zip(values[position], records, strict=True):
+            cls = type(value)
+            if cls is str:
+                record[column] = _serialize_str(value, max_length)
+            elif cls not in _SCALAR_TYPES:
+                stack.append((value, record, column))
+    return records
+
+
+def _handle_series(obj: pd.Series, max_length: int | None, max_items: int | None, _stack: _Stack) -> dict:
+    if max_items is not None and len(obj) > max_items:
+        obj = obj.head(max_items)
+    return {
+        index: _truncate_value(value, max_length, max_items)
+        for index, value in zip(obj.index, obj.tolist(), strict=True)
+    }
+
+
+class _Redirect:
+    """Returned by a handler whose object serializes like another value, e.g. a Document like its JSON."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+def _handle_document(obj: Document, *_) -> _Redirect:
+    return _Redirect(obj.to_json())
+
+
+def _handle_pydantic_v1(obj: BaseModelV1, *_) -> _Redirect:
+    if hasattr(obj, "to_json"):
+        return _Redirect(obj.to_json())
+    return _Redirect(obj.dict())
+
+
+def _handle_other(obj: Any, max_length: int | None, max_items: int | None, _stack: _Stack) -> Any:
+    return _serialize_fallback(obj, max_length, max_items)
+
+
+@lru_cache(maxsize=1024)
+def _get_handler(cls: type) -> _Handler:
+    """Pick the handler for a concrete type once, in the order `_serialize_dispatcher` checks instances."""
+    if cls is type(None) or issubclass(cls, int | float | bool | complex):
+        return _handle_as_is
+    handler: _Handler = _handle_other
+    if issubclass(cls, str):
+        handler = _serialize_str
+    elif issubclass(cls, bytes):
+        handler = _serialize_bytes
+    elif issubclass(cls, datetime):
+        handler = _serialize_datetime
+    elif issubclass(cls, Decimal):
+        handler = _serialize_decimal
+    elif issubclass(cls, UUID):
+        handler = _serialize_uuid
+    elif issubclass(cls, Document):
+        handler = _handle_document
+    elif issubclass(cls, AsyncIterator | Generator | Iterator):
+        handler = _serialize_iterator
+    elif issubclass(cls, BaseModel):
+        handler = _handle_pydantic
+    elif issubclass(cls, BaseModelV1):
+        handler = _handle_pydantic_v1
+    elif issubclass(cls, dict):
+        handler = _handle_dict
+    elif issubclass(cls, pd.DataFrame):
+        handler = _handle_dataframe
+    elif issubclass(cls, pd.Series):
+        handler = _handle_series
+    elif issubclass(cls, list | tuple):
+        handler = _handle_list_tuple
+    return handler
+
+
 def serialize(
     obj: Any,
     max_length: int | None = None,
@@ -228,8 +385,46 @@ def serialize(
 ) -> Any:
     """Unified serialization with optional truncation support.
 
-    Coordinates specialized serializers through a dispatcher pattern.
-    Maintains recursive processing for nested structures.
+    Walks nested containers with an explicit stack instead of recursing, using a handler cached per
+    concrete type. Lists are truncated before they are copied and DataFrames are converted column by
+    column. Types without a dedicated handler go through `_serialize_dispatcher`.
+
+    Args:
+        obj: Object to serialize
+        max_length: Maximum length for string values, None for no truncation
+        max_items: Maximum items in list-like structures, None for no truncation
+        to_str: If True, return a string representation of the object if serialization fails
+    """
+    if obj is None:
+        return None
+    handler = _get_handler(type(obj))
+    if handler is _handle_other:
+        return _serialize_fallback(obj, max_length, max_items, to_str=to_str)
+
+    root: list[Any] = [None]
+    stack: _Stack = [(obj, root, 0)]
+    while stack:
+        value, target, key = stack.pop()
+        try:
+            result = _get_handler(type(value))(value, max_length, max_items, stack)
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f"Cannot serialize object {value}: {e!s}")
+            result = "[Unserializable Object]"
+        if isinstance(result, _Redirect):
+            stack.append((result.value, target, key))
+        else:
+            target[key] = result
+    return root[0]
+
+
+def _serialize_fallback(
+    obj: Any,
+    max_length: int | None = None,
+    max_items: int | None = None,
+    *,
+    to_str: bool = False,
+) -> Any:
+    """Serialize a value of a type `serialize` has no dedicated handler for.
 
     Args:
         obj: Object to serialize
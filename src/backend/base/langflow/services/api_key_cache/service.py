@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, NamedTuple
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import case, update
+
+from langflow.services.base import Service
+from langflow.services.database.models.api_key.model import ApiKey
+from langflow.services.database.utils import session_getter
+from langflow.services.deps import get_db_service
+
+if TYPE_CHECKING:
+    from langflow.services.database.models.user.model import UserRead
+    from langflow.services.settings.service import SettingsService
+
+
+class ApiKeyPrincipal(NamedTuple):
+    """The API key and user an API key authenticates as."""
+
+    api_key_id: UUID
+    user: UserRead
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    principal: ApiKeyPrincipal | None
+
+
+def _hash_key(api_key: str) -> str:
+    # Only hashes are kept in memory, never the keys themselves
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+class ApiKeyCacheService(Service):
+    """Caches the user each API key authenticates as, and counts API key uses in memory.
+
+    Authenticating a request with an API key used to load the key and its user from the database, then
+    increment the `total_uses` of the key in a separate session, so every request updated the same row
+    of a busy key. Validated keys are now cached for `ttl` seconds and unknown keys for `negative_ttl`
+    seconds, with at most `max_size` keys cached. Deleting a key or changing its user removes it from
+    the cache of this process; other processes see the change when their entry expires.
+
+    Uses are counted per key and written every `flush_interval` seconds with a single UPDATE. They are
+    only counted while the worker runs, see `start`. Otherwise `record_use` returns False and the caller
+    updates the key directly.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to query the database.
+        flushed (int): Uses written to the database.
+    """
+
+    name = "api_key_cache_service"
+
+    def __init__(self, settings_service: SettingsService) -> None:
+        settings = settings_service.settings
+        self.ttl = settings.api_key_cache_ttl
+        self.negative_ttl = settings.api_key_negative_cache_ttl
+        self.max_size = settings.api_key_cache_max_size
+        self.flush_interval = settings.api_key_usage_flush_interval
+        self._entries: dict[str, _Entry] = {}
+        self._uses: dict[UUID, int] = {}
+        self._last_used: dict[UUID, datetime] = {}
+        self._flush_lock = asyncio.Lock()
+        self._worker_task: asyncio.Task | None = None
+        self.hits = 0
+        self.misses = 0
+        self.flushed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._worker_task is not None and not self._worker_task.done()
+
+    def get(self, api_key: str) -> tuple[bool, ApiKeyPrincipal | None]:
+        """Look up a key. Returns whether it was cached and, if so, its principal or None for an unknown key."""
+        key_hash = _hash_key(api_key)
+        entry = self._entries.get(key_hash)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                del self._entries[key_hash]
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, entry.principal
+
+    def set(self, api_key: str, principal: ApiKeyPrincipal | None) -> None:
+        """Cache the principal of a key, or None if the key does not exist."""
+        ttl = self.ttl if principal is not None else self.negative_ttl
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        key_hash = _hash_key(api_key)
+        self._entries.pop(key_hash, None)
+        while len(self._entries) >= self.max_size:
+            # Entries are kept in insertion order, so this drops the oldest one
+            del self._entries[next(iter(self._entries))]
+        self._entries[key_hash] = _Entry(time.monotonic() + ttl, principal)
+
+    def invalidate_key(self, api_key: str) -> None:
+        self._entries.pop(_hash_key(api_key), None)
+
+    def invalidate_user(self, user_id: UUID | str) -> None:
+        """Drop the cached keys of a user that was changed or deleted."""
+        user_id = UUID(str(user_id))
+        self._entries = {
+            key_hash: entry
+            for key_hash, entry in self._entries.items()
+            if entry.principal is None or entry.principal.user.id != user_id
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def record_use(self, api_key_id: UUID | str) -> bool:
+        """Count a use of a key. Returns False if the caller should update the key directly."""
+        if not self.running:
+            return False
+        api_key_id = UUID(str(api_key_id))
+        self._uses[api_key_id] = self._uses.get(api_key_id, 0) + 1
+        self._last_used[api_key_id] = datetime.now(timezone.utc)
+        return True
+
+    def pending(self) -> int:
+        """The number of counted uses not written yet."""
+        return sum(self._uses.values())
+
+    async def flush(self) -> int:
+        """Write the counted uses with one UPDATE. Returns the number of uses written."""
+        async with self._flush_lock:
+            uses, self._uses = self._uses, {}
+            last_used, self._last_used = self._last_used, {}
+            if not uses:
+                return 0
+            statement = (
+                update(ApiKey)
+                .where(ApiKey.id.in_(list(uses)))
+                .values(
+                    total_uses=ApiKey.total_uses + case(uses, value=ApiKey.id, else_=0),
+                    last_used_at=case(last_used, value=ApiKey.id, else_=ApiKey.last_used_at),
+                )
+            )
+            try:
+                async with session_getter(get_db_service()) as session:
+                    await session.exec(statement)
+                    await session.commit()
+            except Exception:  # noqa: BLE001
+                logger.exception(f"Error writing the uses of {len(uses)} API keys")
+                self._restore(uses, last_used)
+                return 0
+            except BaseException:
+                # Cancelled while writing, keep the uses for the next flush
+                self._restore(uses, last_used)
+                raise
+            written = sum(uses.values())
+            self.flushed += written
+            return written
+
+    def _restore(self, uses: dict[UUID, int], last_used: dict[UUID, datetime]) -> None:
+        """Add uses that could not be written back to the ones counted since."""
+        for api_key_id, count in uses.items():
+            self._uses[api_key_id] = self._uses.get(api_key_id, 0) + count
+        for api_key_id, used_at in last_used.items():
+            self._last_used[api_key_id] = max(used_at, self._last_used.get(api_key_id, used_at))
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self) -> None:
+        if self.running or self.flush_interval <= 0:
+            return
+        self._worker_task = asyncio.create_task(self._run())
+        logger.debug("API key cache service started")
+
+    async def stop(self) -> None:
+        """Stop the worker, then write the counted uses."""
+        if self._worker_task is not None:
+            self._worker_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker_task
+            self._worker_task = None
+        await self.flush()
+
+    async def teardown(self) -> None:
+        await self.stop()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "cached": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "pending_uses": self.pending(),
+            "flushed_uses": self.flushed,
+        }
@@ -3,7 +3,8 @@ import random
 import warnings
 from collections.abc import Coroutine
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Annotated
+from functools import lru_cache
+from typing import Annotated
 from uuid import UUID
 
 from cryptography.fernet import Fernet
@@ -14,15 +15,13 @@ from loguru import logger
 from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette.websockets import WebSocket
 
-from langflow.services.database.models.api_key.crud import check_key
+from langflow.services.api_key_cache.service import ApiKeyPrincipal
+from langflow.services.database.models.api_key.crud import get_api_key_with_user, record_api_key_use
 from langflow.services.database.models.user.crud import get_user_by_id, get_user_by_username, update_user_last_login_at
 from langflow.services.database.models.user.model import User, UserRead
-from langflow.services.deps import get_db_service, get_session, get_settings_service
+from langflow.services.deps import get_api_key_cache_service, get_db_service, get_session, get_settings_service
 from langflow.services.settings.service import SettingsService
 
-if TYPE_CHECKING:
-    from langflow.services.database.models.api_key.model import ApiKey
-
 oauth2_login = OAuth2PasswordBearer(tokenUrl="api/v1/login", auto_error=False)
 
 API_KEY_NAME = "x-api-key"
@@ -39,40 +38,54 @@ async def api_key_security(
     header_param: Annotated[str, Security(api_key_header)],
 ) -> UserRead | None:
     settings_service = get_settings_service()
-    result: ApiKey | User | None
-
-    async with get_db_service().with_session() as db:
-        if settings_service.auth_settings.AUTO_LOGIN:
-            # Get the first user
-            if not settings_service.auth_settings.SUPERUSER:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Missing first superuser credentials",
-                )
 
+    if settings_service.auth_settings.AUTO_LOGIN:
+        # Get the first user
+        if not settings_service.auth_settings.SUPERUSER:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Missing first superuser credentials",
+            )
+        async with get_db_service().with_session() as db:
             result = await get_user_by_username(db, settings_service.auth_settings.SUPERUSER)
-
-        elif not query_param and not header_param:
+        if not result:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail="An API key must be passed as query or header",
+                detail="Invalid or missing API key",
             )
+        return UserRead.model_validate(result, from_attributes=True)
+
+    if not query_param and not header_param:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="An API key must be passed as query or header",
+        )
 
-        elif query_param:
-            result = await check_key(db, query_param)
+    principal = await get_api_key_principal(query_param or header_param)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid or missing API key",
+        )
+    record_api_key_use(principal.api_key_id)
+    # The cached user is shared by the requests of the key, so hand each one its own copy
+    return principal.user.model_copy()
 
-        else:
-            result = await check_key(db, header_param)
 
-        if not result:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Invalid or missing API key",
+async def get_api_key_principal(api_key: str) -> ApiKeyPrincipal | None:
+    """The API key and user an API key authenticates as, from the API key cache or the database."""
+    cache = get_api_key_cache_service()
+    cached, principal = cache.get(api_key)
+    if cached:
+        return principal
+    async with get_db_service().with_session() as db:
+        api_key_object = await get_api_key_with_user(db, api_key)
+        if api_key_object is not None:
+            principal = ApiKeyPrincipal(
+                api_key_object.id, UserRead.model_validate(api_key_object.user, from_attributes=True)
             )
-        if isinstance(result, User):
-            return UserRead.model_validate(result, from_attributes=True)
-    msg = "Invalid result type"
-    raise ValueError(msg)
+    cache.set(api_key, principal)
+    return principal
 
 
 async def get_current_user(
@@ -361,10 +374,15 @@ def ensure_valid_key(s: str) -> bytes:
     return key
 
 
+@lru_cache(maxsize=8)
+def _fernet_for_key(secret_key: str) -> Fernet:
+    # Deriving the key of a short secret seeds the random module, so do it once per secret
+    return Fernet(ensure_valid_key(secret_key))
+
+
 def get_fernet(settings_service: SettingsService):
     secret_key: str = settings_service.auth_settings.SECRET_KEY.get_secret_value()
-    valid_key = ensure_valid_key(secret_key)
-    return Fernet(valid_key)
+    return _fernet_for_key(secret_key)
 
 
 def encrypt_api_key(api_key: str, settings_service: SettingsService):
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+DEFAULT_LOCK_STRIPES = 256
+DEFAULT_MAX_TRACKED_KEYS = 1024
+SLOW_LOCK_WAIT_SECONDS = 0.1
+
+LockT = TypeVar("LockT")
+
+
+class StripedLocks(Generic[LockT]):
+    """A fixed pool of locks, shared by the keys that hash to the same stripe.
+
+    Unlike a `defaultdict` of locks, memory does not grow with the number of distinct keys, so
+    long-running workers that see millions of flow and vertex ids do not leak one lock per id.
+    Two keys may share a stripe, so never acquire the lock of a key while holding the lock of another.
+    """
+
+    def __init__(self, factory: Callable[[], LockT], stripes: int = DEFAULT_LOCK_STRIPES) -> None:
+        if stripes < 1:
+            msg = "The number of lock stripes must be at least 1"
+            raise ValueError(msg)
+        self._factory = factory
+        self._locks: list[LockT] = [factory() for _ in range(stripes)]
+
+    def __getitem__(self, key: Hashable) -> LockT:
+        return self._locks[hash(key) % len(self._locks)]
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+
+class AsyncStripedLocks(StripedLocks[asyncio.Lock]):
+    """Striped `asyncio.Lock`s that are recreated when they are used from another event loop.
+
+    An `asyncio.Lock` binds to the loop it first waits on, and the stripes outlive any single loop.
+    """
+
+    def __init__(self, stripes: int = DEFAULT_LOCK_STRIPES) -> None:
+        super().__init__(asyncio.Lock, stripes)
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def __getitem__(self, key: Hashable) -> asyncio.Lock:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None and loop is not self._loop:
+            if self._loop is not None:
+                self._locks = [self._factory() for _ in range(len(self._locks))]
+            self._loop = loop
+        return super().__getitem__(key)
+
+
+class LockWaitStats:
+    """Time spent waiting for cache locks, overall and for the most recently used keys.
+
+    Per-key statistics are kept for at most `max_keys` keys, evicting the least recently used one,
+    so tracking does not grow with the number of distinct keys either. Waits longer than
+    `slow_threshold` seconds are logged. Thread-safe using a threading Lock.
+
+    Attributes:
+        acquisitions (int): Number of lock acquisitions recorded.
+        contended (int): Number of acquisitions that had to wait.
+        total_wait (float): Total time spent waiting, in seconds.
+        max_wait (float): Longest single wait, in seconds.
+    """
+
+    def __init__(
+        self, max_keys: int = DEFAULT_MAX_TRACKED_KEYS, slow_threshold: float = SLOW_LOCK_WAIT_SECONDS
+    ) -> None:
+        self._keys: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_keys = max_keys
+        self.slow_threshold = slow_threshold
+        self.acquisitions = 0
+        self.contended = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, key: str, wait: float) -> None:
+        with self._lock:
+            self.acquisitions += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            if wait > 0:
+                self.contended += 1
+            if self.max_keys <= 0:
+                return
+            stats = self._keys.get(key)
+            if stats is None:
+                stats = self._keys[key] = {"acquisitions": 0, "total_wait": 0.0, "max_wait": 0.0}
+                while len(self._keys) > self.max_keys:
+                    self._keys.popitem(last=False)
+            else:
+                self._keys.move_to_end(key)
+            stats["acquisitions"] += 1
+            stats["total_wait"] += wait
+            stats["max_wait"] = max(stats["max_wait"], wait)
+        if wait > self.slow_threshold:
+            logger.debug(f"Waited {wait:.3f}s for the cache lock of {key}")
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the wait statistics of `key`, if it is still tracked."""
+        with self._lock:
+            stats = self._keys.get(key)
+            return dict(stats) if stats is not None else None
+
+    def slowest(self, limit: int = 10) -> list[tuple[str, dict[str, Any]]]:
+        """Return the tracked keys with the longest total wait, longest first."""
+        with self._lock:
+            items = [(key, dict(stats)) for key, stats in self._keys.items()]
+        return sorted(items, key=lambda item: item[1]["total_wait"], reverse=True)[:limit]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys.clear()
+            self.acquisitions = 0
+            self.contended = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "acquisitions": self.acquisitions,
+                "contended": self.contended,
+                "total_wait": self.total_wait,
+                "max_wait": self.max_wait,
+                "tracked_keys": len(self._keys),
+            }
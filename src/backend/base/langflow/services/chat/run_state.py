@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from langflow.services.cache.utils import CACHE_MISS, CacheMiss
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
+    from langflow.graph.graph.base import Graph
+
+RUN_STATE_PREFIX = "run_state"
+
+
+class RunStateStore:
+    """Incremental persistence of graph runs on top of the chat cache.
+
+    Instead of writing the whole `Graph` to the cache after every step, a run is stored as:
+
+    - a pointer from the flow id to the current run id (written once per run),
+    - the raw flow payload the graph was built from (written once per run),
+    - the scheduling state of the `RunnableVerticesManager` (small, rewritten after each step),
+    - one delta per built vertex with its results (written once per vertex build).
+
+    Graphs that are still alive in this process are returned directly, as long as they belong to the run
+    the flow id points to. Otherwise the graph is rebuilt from the stored payload and the deltas are
+    applied on top of it. Starting a new run of a flow removes everything stored for its previous run.
+    """
+
+    def __init__(
+        self,
+        get_cache: Callable[[str], Awaitable[Any]],
+        set_cache: Callable[[str, Any], Awaitable[bool]],
+        clear_cache: Callable[[str], Awaitable[None]],
+    ) -> None:
+        self._get_cache = get_cache
+        self._set_cache = set_cache
+        self._clear_cache = clear_cache
+        self._live_graphs: weakref.WeakValueDictionary[str, Graph] = weakref.WeakValueDictionary()
+        self._persisted_payloads: set[str] = set()
+        self._persisted_vertices: dict[str, set[str]] = {}
+
+    @staticmethod
+    def flow_key(flow_id: str) -> str:
+        return f"{RUN_STATE_PREFIX}:{flow_id}"
+
+    @staticmethod
+    def payload_key(run_id: str) -> str:
+        return f"{RUN_STATE_PREFIX}:{run_id}:payload"
+
+    @staticmethod
+    def state_key(run_id: str) -> str:
+        return f"{RUN_STATE_PREFIX}:{run_id}:state"
+
+    @staticmethod
+    def vertex_key(run_id: str, vertex_id: str) -> str:
+        return f"{RUN_STATE_PREFIX}:{run_id}:vertex:{vertex_id}"
+
+    async def save(self, graph: Graph, vertex_ids: Iterable[str] = ()) -> None:
+        """Persist the run state of `graph` and the results of the vertices in `vertex_ids`."""
+        key = str(graph.flow_id or graph.run_id)
+        run_id = graph.run_id
+        self._live_graphs[key] = graph
+
+        if run_id not in self._persisted_payloads:
+            previous = _unwrap(await self._get_cache(self.flow_key(key)))
+            if previous is not CACHE_MISS and previous["run_id"] != run_id:
+                # Only the run the flow id points to can be loaded, so the previous one is dropped
+                await self._clear_run(previous["run_id"])
+            weakref.finalize(graph, self._forget_run, run_id)
+            await self._set_cache(
+                self.flow_key(key),
+                {
+                    "run_id": run_id,
+                    "flow_name": graph.flow_name,
+                    "user_id": graph.user_id,
+                    "session_id": graph.session_id,
+                },
+            )
+            await self._set_cache(self.payload_key(run_id), graph.raw_graph_data)
+            self._persisted_payloads.add(run_id)
+            self._persisted_vertices[run_id] = set()
+
+        persisted_vertices = self._persisted_vertices[run_id]
+        for vertex_id in vertex_ids:
+            vertex = graph.get_vertex(vertex_id)
+            if not vertex.built:
+                continue
+            await self._set_cache(
+                self.vertex_key(run_id, vertex_id),
+                {
+                    "built": vertex.built,
+                    "results": vertex.results,
+                    "artifacts": vertex.artifacts,
+                    "built_object": vertex.built_object,
+                    "built_result": vertex.built_result,
+                    "full_data": vertex.full_data,
+                },
+            )
+            persisted_vertices.add(vertex_id)
+
+        state = graph.get_run_state()
+        state["built_vertices"] = sorted(persisted_vertices)
+        await self._set_cache(self.state_key(run_id), state)
+
+    async def load(self, flow_id: str) -> Graph | CacheMiss:
+        """Return the graph of the current run of `flow_id`, rebuilding it from the stored deltas if needed."""
+        pointer = _unwrap(await self._get_cache(self.flow_key(flow_id)))
+        if pointer is CACHE_MISS:
+            self._live_graphs.pop(flow_id, None)
+            return CACHE_MISS
+        run_id = pointer["run_id"]
+        # With a shared cache another worker may have started a newer run, which the pointer then refers to
+        if (graph := self._live_graphs.get(flow_id)) is not None and graph.run_id == run_id:
+            return graph
+        payload = _unwrap(await self._get_cache(self.payload_key(run_id)))
+        state = _unwrap(await self._get_cache(self.state_key(run_id)))
+        if payload is CACHE_MISS or state is CACHE_MISS or not payload.get("nodes"):
+            return CACHE_MISS
+
+        from langflow.graph.graph.base import Graph
+
+        graph = Graph.from_payload(payload, flow_id, pointer["flow_name"], pointer["user_id"])
+        if pointer.get("session_id"):
+            graph.session_id = pointer["session_id"]
+        graph.set_run_id(run_id)
+        graph.restore_run_state(state)
+
+        for vertex_id in state.get("built_vertices", []):
+            vertex_state = _unwrap(await self._get_cache(self.vertex_key(run_id, vertex_id)))
+            if vertex_state is CACHE_MISS:
+                continue
+            vertex = graph.get_vertex(vertex_id)
+            vertex.built = vertex_state["built"]
+            vertex.results = vertex_state["results"]
+            vertex.artifacts = vertex_state["artifacts"]
+            vertex.built_object = vertex_state["built_object"]
+            vertex.built_result = vertex_state["built_result"]
+            vertex.full_data = vertex_state["full_data"]
+            try:
+                vertex.finalize_build()
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).debug(f"Error restoring vertex {vertex_id}")
+                vertex.built = False
+
+        self._live_graphs[flow_id] = graph
+        weakref.finalize(graph, self._forget_run, run_id)
+        self._persisted_payloads.add(run_id)
+        self._persisted_vertices[run_id] = set(state.get("built_vertices", []))
+        return graph
+
+    def _forget_run(self, run_id: str) -> None:
+        self._persisted_payloads.discard(run_id)
+        self._persisted_vertices.pop(run_id, None)
+
+    async def clear(self, flow_id: str) -> None:
+        """Forget the current run of `flow_id`."""
+        self._live_graphs.pop(flow_id, None)
+        pointer = _unwrap(await self._get_cache(self.flow_key(flow_id)))
+        await self._clear_cache(self.flow_key(flow_id))
+        if pointer is CACHE_MISS:
+            return
+        await self._clear_run(pointer["run_id"])
+
+    async def _clear_run(self, run_id: str) -> None:
+        # The run may have been saved by another worker sharing the cache, which only its state lists
+        vertex_ids = self._persisted_vertices.pop(run_id, set())
+        state = _unwrap(await self._get_cache(self.state_key(run_id)))
+        if state is not CACHE_MISS:
+            vertex_ids.update(state.get("built_vertices", []))
+        for vertex_id in vertex_ids:
+            await self._clear_cache(self.vertex_key(run_id, vertex_id))
+        self._persisted_payloads.discard(run_id)
+        await self._clear_cache(self.payload_key(run_id))
+        await self._clear_cache(self.state_key(run_id))
+
+
+def _unwrap(cached: Any) -> Any:
+    """Return the value stored by `ChatService.set_cache`, or CACHE_MISS."""
+    if isinstance(cached, CacheMiss) or not isinstance(cached, dict) or "result" not in cached:
+        return CACHE_MISS
+    return cached["result"]
@@ -1,22 +1,89 @@
+from __future__ import annotations
+
 import asyncio
-from collections import defaultdict
+import contextlib
+import time
 from threading import RLock
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService, CacheService
+from langflow.services.cache.service import ThreadingInMemoryCache
+from langflow.services.chat.locks import DEFAULT_LOCK_STRIPES, AsyncStripedLocks, LockWaitStats, StripedLocks
+from langflow.services.chat.run_state import RunStateStore
 from langflow.services.deps import get_cache_service
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable
+
+    from langflow.graph.graph.base import Graph
+    from langflow.services.cache.utils import CacheMiss
+
 
 class ChatService(Service):
     """Service class for managing chat-related operations."""
 
     name = "chat_service"
 
-    def __init__(self) -> None:
-        self.async_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
-        self._sync_cache_locks: dict[str, RLock] = defaultdict(RLock)
+    def __init__(self, lock_stripes: int = DEFAULT_LOCK_STRIPES) -> None:
+        self.async_cache_locks = AsyncStripedLocks(lock_stripes)
+        self._sync_cache_locks: StripedLocks[RLock] = StripedLocks(RLock, lock_stripes)
+        self.lock_wait_stats = LockWaitStats()
         self.cache_service: CacheService | AsyncBaseCacheService = get_cache_service()
+        # Operations on the in-memory cache are plain dict lookups, cheaper than a hop to a worker thread
+        self._run_sync_in_loop = isinstance(self.cache_service, ThreadingInMemoryCache)
+        self.run_state_store = RunStateStore(self.get_cache, self.set_cache, self.clear_cache)
+
+    @contextlib.asynccontextmanager
+    async def _async_key_lock(self, key: str) -> AsyncIterator[contextlib.nullcontext]:
+        """Hold the lock stripe of `key` and record how long it took to acquire.
+
+        Yields a no-op lock to pass to the cache service, which would otherwise acquire the stripe again.
+        """
+        lock = self.async_cache_locks[key]
+        if lock.locked():
+            start = time.perf_counter()
+            await lock.acquire()
+            wait = time.perf_counter() - start
+        else:
+            await lock.acquire()
+            wait = 0.0
+        try:
+            self.lock_wait_stats.record(key, wait)
+            yield contextlib.nullcontext()
+        finally:
+            lock.release()
+
+    def _call_locked(self, key: str, func: Callable[..., Any], *args: Any) -> Any:
+        lock = self._sync_cache_locks[key]
+        wait = 0.0
+        if not lock.acquire(blocking=False):
+            start = time.perf_counter()
+            lock.acquire()
+            wait = time.perf_counter() - start
+        try:
+            self.lock_wait_stats.record(key, wait)
+            return func(*args, lock=lock)
+        finally:
+            lock.release()
+
+    async def _call_sync(self, key: str, func: Callable[..., Any], *args: Any, lock: Any = None) -> Any:
+        """Run an operation of the synchronous cache service under the lock stripe of `key`.
+
+        For the in-memory cache the operation runs directly in the event loop when the stripe is free,
+        and only falls back to a worker thread when another thread holds it.
+        """
+        if lock is not None:
+            return await asyncio.to_thread(func, *args, lock=lock)
+        if self._run_sync_in_loop:
+            stripe = self._sync_cache_locks[key]
+            if stripe.acquire(blocking=False):
+                try:
+                    self.lock_wait_stats.record(key, 0.0)
+                    return func(*args, lock=stripe)
+                finally:
+                    stripe.release()
+        return await asyncio.to_thread(self._call_locked, key, func, *args)
 
     async def set_cache(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool:
         """Set the cache for a client.
@@ -34,11 +101,13 @@ class ChatService(Service):
             "type": type(data),
         }
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            await self.cache_service.upsert(str(key), result_dict, lock=lock or self.async_cache_locks[key])
+            if lock is not None:
+                await self.cache_service.upsert(str(key), result_dict, lock=lock)
+            else:
+                async with self._async_key_lock(key) as held:
+                    await self.cache_service.upsert(str(key), result_dict, lock=held)
             return await self.cache_service.contains(key)
-        await asyncio.to_thread(
-            self.cache_service.upsert, str(key), result_dict, lock=lock or self._sync_cache_locks[key]
-        )
+        await self._call_sync(key, self.cache_service.upsert, str(key), result_dict, lock=lock)
         return key in self.cache_service
 
     async def get_cache(self, key: str, lock: asyncio.Lock | None = None) -> Any:
@@ -52,8 +121,11 @@ class ChatService(Service):
             Any: The cached data.
         """
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
-        return await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
+            if lock is not None:
+                return await self.cache_service.get(key, lock=lock)
+            async with self._async_key_lock(key) as held:
+                return await self.cache_service.get(key, lock=held)
+        return await self._call_sync(key, self.cache_service.get, key, lock=lock)
 
     async def clear_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
         """Clear the cache for a client.
@@ -63,5 +135,39 @@ class ChatService(Service):
             lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
         """
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
-        return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
+            if lock is not None:
+                return await self.cache_service.delete(key, lock=lock)
+            async with self._async_key_lock(key) as held:
+                return await self.cache_service.delete(key, lock=held)
+        return await self._call_sync(key, self.cache_service.delete, key, lock=lock)
+
+    async def save_run_state(self, graph: Graph, vertex_ids: Iterable[str] = ()) -> None:
+        """Persist the run state of a graph incrementally.
+
+        Only the scheduling state and the results of `vertex_ids` are written; the flow payload is
+        written once per run. See `RunStateStore`.
+
+        Args:
+            graph (Graph): The graph being run.
+            vertex_ids (Iterable[str]): The vertices whose results changed since the last call.
+        """
+        await self.run_state_store.save(graph, vertex_ids)
+
+    async def get_graph(self, flow_id: str) -> Graph | CacheMiss:
+        """Get the graph of the current run of a flow.
+
+        Args:
+            flow_id (str): The flow ID.
+
+        Returns:
+            Graph | CacheMiss: The graph, rebuilt from the persisted run state if it is not alive in this process.
+        """
+        return await self.run_state_store.load(flow_id)
+
+    async def clear_run_state(self, flow_id: str) -> None:
+        """Clear the persisted run state of a flow.
+
+        Args:
+            flow_id (str): The flow ID.
+        """
+        await self.run_state_store.clear(flow_id)
@@ -11,7 +11,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from langflow.services.database.models import User
 from langflow.services.database.models.api_key import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
 from langflow.services.database.utils import session_getter
-from langflow.services.deps import get_db_service
+from langflow.services.deps import get_api_key_cache_service, get_db_service
 
 if TYPE_CHECKING:
     from sqlmodel.sql.expression import SelectOfScalar
@@ -37,6 +37,7 @@ async def create_api_key(session: AsyncSession, api_key_create: ApiKeyCreate, us
     session.add(api_key)
     await session.commit()
     await session.refresh(api_key)
+    get_api_key_cache_service().invalidate_key(generated_api_key)
     unmasked = UnmaskedApiKeyRead.model_validate(api_key, from_attributes=True)
     unmasked.api_key = generated_api_key
     return unmasked
@@ -49,19 +50,32 @@ async def delete_api_key(session: AsyncSession, api_key_id: UUID) -> None:
         raise ValueError(msg)
     await session.delete(api_key)
     await session.commit()
+    get_api_key_cache_service().invalidate_key(api_key.api_key)
 
 
 update_total_uses_tasks: set[asyncio.Task] = set()
 
 
+async def get_api_key_with_user(session: AsyncSession, api_key: str) -> ApiKey | None:
+    """Get an API key and its user, without counting a use."""
+    query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
+    return (await session.exec(query)).first()
+
+
+def record_api_key_use(api_key_id: UUID) -> None:
+    """Count a use of an API key, written in batches by the API key cache service when it runs."""
+    if get_api_key_cache_service().record_use(api_key_id):
+        return
+    task = asyncio.create_task(update_total_uses(api_key_id))
+    task.add_done_callback(update_total_uses_tasks.discard)
+    update_total_uses_tasks.add(task)
+
+
 async def check_key(session: AsyncSession, api_key: str) -> User | None:
     """Check if the API key is valid."""
-    query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
-    api_key_object: ApiKey | None = (await session.exec(query)).first()
+    api_key_object = await get_api_key_with_user(session, api_key)
     if api_key_object is not None:
-        task = asyncio.create_task(update_total_uses(api_key_object.id))
-        task.add_done_callback(update_total_uses_tasks.discard)
-        update_total_uses_tasks.add(task)
+        record_api_key_use(api_key_object.id)
         return api_key_object.user
     return None
 
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from uuid import UUID
 
 from loguru import logger
@@ -52,16 +53,8 @@ async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> Tra
         # Get max entries setting
         max_entries = get_settings_service().settings.max_transactions_to_keep
 
-        # Delete older entries in a single transaction
-        delete_older = delete(TransactionTable).where(
-            TransactionTable.flow_id == transaction.flow_id,
-            col(TransactionTable.id).in_(
-                select(TransactionTable.id)
-                .where(TransactionTable.flow_id == transaction.flow_id)
-                .order_by(col(TransactionTable.timestamp).desc())
-                .offset(max_entries - 1)  # Keep newest max_entries-1 plus the one we're adding
-            ),
-        )
+        # Delete older entries in a single transaction, keeping newest max_entries-1 plus the one we're adding
+        delete_older = _delete_older_transactions(transaction.flow_id, keep=max_entries - 1)
 
         # Add new entry and execute delete in same transaction
         db.add(table)
@@ -74,6 +67,34 @@ async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> Tra
     return table
 
 
+def _delete_older_transactions(flow_id: UUID, keep: int):
+    return delete(TransactionTable).where(
+        TransactionTable.flow_id == flow_id,
+        col(TransactionTable.id).in_(
+            select(TransactionTable.id)
+            .where(TransactionTable.flow_id == flow_id)
+            .order_by(col(TransactionTable.timestamp).desc())
+            .offset(keep)
+        ),
+    )
+
+
+async def prune_transactions(db: AsyncSession, flow_ids: Iterable[UUID], max_entries: int | None = None) -> None:
+    """Delete the oldest transactions of each flow, keeping its newest `max_entries` transactions.
+
+    Used by the write-behind service to enforce retention on a schedule instead of on every insert.
+    The caller commits.
+
+    Args:
+        db: Database session
+        flow_ids: The flows whose transactions to prune
+        max_entries: Transactions to keep per flow. If None, uses system settings.
+    """
+    max_entries = max_entries or get_settings_service().settings.max_transactions_to_keep
+    for flow_id in flow_ids:
+        await db.exec(_delete_older_transactions(flow_id, keep=max_entries))
+
+
 def transform_transaction_table(
     transaction: list[TransactionTable] | TransactionTable,
 ) -> list[TransactionReadResponse]:
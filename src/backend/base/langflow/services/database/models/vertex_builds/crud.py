@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from uuid import UUID
 
 from sqlmodel import col, delete, func, select
@@ -95,30 +96,10 @@ async def log_vertex_build(
         await db.flush()
 
         # 2) Delete older builds for this vertex, keeping newest max_per_vertex
-        keep_vertex_subq = (
-            select(VertexBuildTable.build_id)
-            .where(
-                VertexBuildTable.flow_id == vertex_build.flow_id,
-                VertexBuildTable.id == vertex_build.id,
-            )
-            .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
-            .limit(max_per_vertex)
-        )
-        delete_vertex_older = delete(VertexBuildTable).where(
-            VertexBuildTable.flow_id == vertex_build.flow_id,
-            VertexBuildTable.id == vertex_build.id,
-            col(VertexBuildTable.build_id).not_in(keep_vertex_subq),
-        )
-        await db.exec(delete_vertex_older)
+        await db.exec(_delete_older_vertex_builds(vertex_build.flow_id, vertex_build.id, max_per_vertex))
 
         # 3) Delete older builds globally, keeping newest max_global
-        keep_global_subq = (
-            select(VertexBuildTable.build_id)
-            .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
-            .limit(max_global)
-        )
-        delete_global_older = delete(VertexBuildTable).where(col(VertexBuildTable.build_id).not_in(keep_global_subq))
-        await db.exec(delete_global_older)
+        await db.exec(_delete_older_builds_globally(max_global))
 
         # 4) Commit transaction
         await db.commit()
@@ -130,6 +111,59 @@ async def log_vertex_build(
     return table
 
 
+def _delete_older_vertex_builds(flow_id: UUID, vertex_id: str, keep: int):
+    keep_vertex_subq = (
+        select(VertexBuildTable.build_id)
+        .where(
+            VertexBuildTable.flow_id == flow_id,
+            VertexBuildTable.id == vertex_id,
+        )
+        .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+        .limit(keep)
+    )
+    return delete(VertexBuildTable).where(
+        VertexBuildTable.flow_id == flow_id,
+        VertexBuildTable.id == vertex_id,
+        col(VertexBuildTable.build_id).not_in(keep_vertex_subq),
+    )
+
+
+def _delete_older_builds_globally(keep: int):
+    keep_global_subq = (
+        select(VertexBuildTable.build_id)
+        .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+        .limit(keep)
+    )
+    return delete(VertexBuildTable).where(col(VertexBuildTable.build_id).not_in(keep_global_subq))
+
+
+async def prune_vertex_builds(
+    db: AsyncSession,
+    vertices: Iterable[tuple[UUID, str]],
+    *,
+    max_builds_to_keep: int | None = None,
+    max_builds_per_vertex: int | None = None,
+) -> None:
+    """Enforce the build history limits of `log_vertex_build` for many vertices at once.
+
+    Used by the write-behind service to prune on a schedule instead of on every insert. The caller commits.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        vertices (Iterable[tuple[UUID, str]]): The (flow id, vertex id) pairs whose builds to prune.
+        max_builds_to_keep (int | None, optional): Maximum number of builds to keep globally.
+            If None, uses system settings.
+        max_builds_per_vertex (int | None, optional): Maximum number of builds to keep per vertex.
+            If None, uses system settings.
+    """
+    settings = get_settings_service().settings
+    max_global = max_builds_to_keep or settings.max_vertex_builds_to_keep
+    max_per_vertex = max_builds_per_vertex or settings.max_vertex_builds_per_vertex
+    for flow_id, vertex_id in vertices:
+        await db.exec(_delete_older_vertex_builds(flow_id, vertex_id, max_per_vertex))
+    await db.exec(_delete_older_builds_globally(max_global))
+
+
 async def delete_vertex_builds_by_flow_id(db: AsyncSession, flow_id: UUID) -> None:
     """Delete all vertex builds associated with a specific flow ID.
 
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
 
     from sqlmodel.ext.asyncio.session import AsyncSession
 
+    from langflow.services.api_key_cache.service import ApiKeyCacheService
     from langflow.services.cache.service import AsyncBaseCacheService, CacheService
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
@@ -26,6 +27,7 @@ if TYPE_CHECKING:
     from langflow.services.telemetry.service import TelemetryService
     from langflow.services.tracing.service import TracingService
     from langflow.services.variable.service import VariableService
+    from langflow.services.write_behind.service import WriteBehindService
 
 
 def get_service(service_type: ServiceType, default=None):
@@ -247,3 +249,17 @@ def get_queue_service() -> JobQueueService:
     from langflow.services.job_queue.factory import JobQueueServiceFactory
 
     return get_service(ServiceType.JOB_QUEUE_SERVICE, JobQueueServiceFactory())
+
+
+def get_write_behind_service() -> WriteBehindService:
+    """Retrieves the WriteBehindService instance from the service manager."""
+    from langflow.services.write_behind.factory import WriteBehindServiceFactory
+
+    return get_service(ServiceType.WRITE_BEHIND_SERVICE, WriteBehindServiceFactory())
+
+
+def get_api_key_cache_service() -> ApiKeyCacheService:
+    """Retrieves the ApiKeyCacheService instance from the service manager."""
+    from langflow.services.api_key_cache.factory import ApiKeyCacheServiceFactory
+
+    return get_service(ServiceType.API_KEY_CACHE_SERVICE, ApiKeyCacheServiceFactory())
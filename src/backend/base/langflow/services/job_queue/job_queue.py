@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Literal
+
+import orjson
+from loguru import logger
+
+OverflowPolicy = Literal["coalesce", "drop", "block"]
+EVENT_SEPARATOR = b"\n\n"
+
+
+class QueueMemoryBudget:
+    """Tracks the bytes held by every job queue, so that a few slow consumers cannot grow memory unbounded.
+
+    Attributes:
+        max_bytes (int): The maximum number of bytes all queues may hold together. 0 means no limit.
+        used_bytes (int): The number of bytes currently held by all queues.
+    """
+
+    def __init__(self, max_bytes: int = 0) -> None:
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+
+    def exceeded(self, extra_bytes: int = 0) -> bool:
+        return self.max_bytes > 0 and self.used_bytes + extra_bytes > self.max_bytes
+
+
+class JobQueue(asyncio.Queue):
+    """An event queue for a single job that applies an overflow policy once it is full.
+
+    Items are `(event_id, frame, put_time)` tuples as produced by `EventManager`. The queue is full when it
+    holds `max_events` items or `max_bytes` bytes, or when the shared `QueueMemoryBudget` is exhausted.
+    What happens to a new event then depends on `overflow_policy`:
+
+    - "coalesce": a token event is merged into the token event queued right before it, if any.
+    - "drop": token events are dropped. The final message still carries the complete text.
+    - "block": producers awaiting `wait_for_capacity` are paused until the consumer catches up. When only the
+      shared budget is exhausted, token events are dropped instead, since other jobs hold that memory.
+
+    Events other than tokens are never coalesced or dropped, so the frontend always receives every
+    build, message and end event.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_events: int = 0,
+        max_bytes: int = 0,
+        overflow_policy: OverflowPolicy = "coalesce",
+        memory_budget: QueueMemoryBudget | None = None,
+    ) -> None:
+        super().__init__()
+        if overflow_policy not in {"coalesce", "drop", "block"}:
+            msg = f"Invalid overflow policy: {overflow_policy}"
+            raise ValueError(msg)
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self.overflow_policy = overflow_policy
+        self.memory_budget = memory_budget or QueueMemoryBudget()
+        self.bytes = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.high_watermark = 0
+        self._has_capacity = asyncio.Event()
+        self._has_capacity.set()
+
+    def is_full(self, extra_bytes: int = 0) -> bool:
+        """Check whether this queue has reached its own event or byte limit."""
+        return (self.max_events > 0 and self.qsize() >= self.max_events) or (
+            self.max_bytes > 0 and self.bytes + extra_bytes > self.max_bytes
+        )
+
+    def put_nowait(self, item: tuple[Any, bytes | None, float]) -> None:
+        event_id, frame, _ = item
+        if frame is not None and _is_token(event_id):
+            queue_full = self.is_full(len(frame))
+            budget_exceeded = self.memory_budget.exceeded(len(frame))
+            if (queue_full or budget_exceeded) and self._handle_overflow(item, budget_exceeded=budget_exceeded):
+                return
+        super().put_nowait(item)
+
+    async def wait_for_capacity(self) -> None:
+        """Wait until the queue is below its limits. Only pauses producers with the "block" policy."""
+        while self.overflow_policy == "block" and self.is_full():
+            self._has_capacity.clear()
+            await self._has_capacity.wait()
+
+    def metrics(self) -> dict[str, Any]:
+        """Return the depth, size, lag and overflow counters of the queue."""
+        lag = 0.0
+        if self._queue and isinstance(put_time := self._queue[0][2], float):
+            lag = max(time.time() - put_time, 0.0)
+        return {
+            "depth": self.qsize(),
+            "bytes": self.bytes,
+            "lag": lag,
+            "high_watermark": self.high_watermark,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "overflow_policy": self.overflow_policy,
+        }
+
+    def _handle_overflow(self, item: tuple[Any, bytes, float], *, budget_exceeded: bool) -> bool:
+        """Apply the overflow policy to a token event. Returns True if the event must not be queued."""
+        policy = self.overflow_policy
+        if policy == "block" and not budget_exceeded:
+            return False
+        if policy == "coalesce" and self._coalesce(item):
+            self.coalesced += 1
+            return True
+        if policy in {"drop", "block"}:
+            self.dropped += 1
+            return True
+        return False
+
+    def _coalesce(self, item: tuple[Any, bytes, float]) -> bool:
+        if not self._queue:
+            return False
+        last_event_id, last_frame, last_put_time = self._queue[-1]
+        if last_frame is None or not _is_token(last_event_id):
+            return False
+        try:
+            last_event = orjson.loads(last_frame)
+            event = orjson.loads(item[1])
+        except orjson.JSONDecodeError:
+            logger.debug("Could not decode token events to coalesce them")
+            return False
+        if last_event["data"].get("id") != event["data"].get("id"):
+            return False
+        last_event["data"]["chunk"] += event["data"]["chunk"]
+        merged_frame = orjson.dumps(last_event) + EVENT_SEPARATOR
+        self._account(len(merged_frame) - len(last_frame))
+        # Keep the put time of the older event so the lag metric stays accurate
+        self._queue[-1] = (last_event_id, merged_frame, last_put_time)
+        return True
+
+    def _account(self, size: int) -> None:
+        self.bytes += size
+        self.memory_budget.used_bytes += size
+
+    def _put(self, item: tuple[Any, bytes | None, float]) -> None:
+        super()._put(item)
+        if item[1] is not None:
+            self._account(len(item[1]))
+        self.high_watermark = max(self.high_watermark, self.qsize())
+
+    def _get(self) -> tuple[Any, bytes | None, float]:
+        item = super()._get()
+        if item[1] is not None:
+            self._account(-len(item[1]))
+        if not self.is_full():
+            self._has_capacity.set()
+        return item
+
+
+def _is_token(event_id: Any) -> bool:
+    return isinstance(event_id, str) and event_id.startswith("token-")
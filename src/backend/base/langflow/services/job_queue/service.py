@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
 from langflow.events.event_manager import EventManager, create_default_event_manager
 from langflow.services.base import Service
+from langflow.services.job_queue.job_queue import JobQueue, QueueMemoryBudget
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
 
 
 class JobQueueService(Service):
@@ -17,6 +22,7 @@ class JobQueueService(Service):
       - Launch and manage asynchronous tasks that process these job queues.
       - Safely clean up resources by cancelling active tasks and emptying queues.
       - Automatically perform periodic cleanup of inactive or completed job queues.
+      - Bound each queue and all queues together, see `JobQueue` for the overflow policies.
 
     Attributes:
         name (str): Unique identifier for the service.
@@ -27,6 +33,7 @@ class JobQueueService(Service):
               * The asyncio.Task processing the job (if any).
         _cleanup_task (asyncio.Task | None): Background task for periodic cleanup.
         _closed (bool): Flag indicating whether the service is currently active.
+        memory_budget (QueueMemoryBudget): The bytes held by all job queues and their shared limit.
 
     Example:
         service = JobQueueService()
@@ -41,12 +48,19 @@ class JobQueueService(Service):
 
     name = "job_queue_service"
 
-    def __init__(self) -> None:
+    def __init__(self, settings_service: SettingsService | None = None) -> None:
         """Initialize the JobQueueService.
 
         Sets up the internal registry for job queues, initializes the cleanup task, and sets the service state
-        to active.
+        to active. Queue limits are read from `settings_service` if given, otherwise queues are unbounded.
         """
+        settings = settings_service.settings if settings_service else None
+        self.max_events = settings.job_queue_max_events if settings else 0
+        self.max_bytes = settings.job_queue_max_bytes if settings else 0
+        self.overflow_policy = settings.job_queue_overflow_policy if settings else "coalesce"
+        self.memory_budget = QueueMemoryBudget(settings.job_queue_memory_budget if settings else 0)
+        self.token_flush_interval = settings.token_flush_interval if settings else 0.0
+        self.token_flush_bytes = settings.token_flush_bytes if settings else 0
         self._queues: dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None]] = {}
         self._cleanup_task: asyncio.Task | None = None
         self._closed = False
@@ -122,8 +136,15 @@ class JobQueueService(Service):
             logger.error(msg)
             raise RuntimeError(msg)
 
-        main_queue: asyncio.Queue = asyncio.Queue()
-        event_manager = create_default_event_manager(main_queue)
+        main_queue = JobQueue(
+            max_events=self.max_events,
+            max_bytes=self.max_bytes,
+            overflow_policy=self.overflow_policy,
+            memory_budget=self.memory_budget,
+        )
+        event_manager = create_default_event_manager(
+            main_queue, token_flush_interval=self.token_flush_interval, token_flush_bytes=self.token_flush_bytes
+        )
 
         # Register the queue without an active task.
         self._queues[job_id] = (main_queue, event_manager, None)
@@ -186,6 +207,20 @@ class JobQueueService(Service):
 
         return self._queues[job_id]
 
+    def get_queue_metrics(self) -> dict[str, Any]:
+        """Return the depth, lag and overflow counters of every job queue, and the shared memory budget.
+
+        Returns:
+            dict[str, Any]: A dictionary with a `jobs` mapping of job IDs to queue metrics and a `memory_budget`
+                entry with the bytes used by all queues and their limit.
+        """
+        return {
+            "jobs": {
+                job_id: queue.metrics() for job_id, (queue, _, _) in self._queues.items() if isinstance(queue, JobQueue)
+            },
+            "memory_budget": {"used_bytes": self.memory_budget.used_bytes, "max_bytes": self.memory_budget.max_bytes},
+        }
+
     async def cleanup_job(self, job_id: str) -> None:
         """Clean up and release resources for a specific job.
 
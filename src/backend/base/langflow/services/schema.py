@@ -20,3 +20,5 @@ class ServiceType(str, Enum):
     TRACING_SERVICE = "tracing_service"
     TELEMETRY_SERVICE = "telemetry_service"
     JOB_QUEUE_SERVICE = "job_queue_service"
+    WRITE_BEHIND_SERVICE = "write_behind_service"
+    API_KEY_CACHE_SERVICE = "api_key_cache_service"
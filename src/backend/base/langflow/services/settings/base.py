@@ -174,6 +174,9 @@ class Settings(BaseSettings):
     """Whether to store environment variables as Global Variables in the database."""
     variables_to_get_from_environment: list[str] = VARIABLES_TO_GET_FROM_ENVIRONMENT
     """List of environment variables to get from the environment and store in the database."""
+    variable_cache_ttl: float = 0.0
+    """Seconds the decrypted Global Variables of a user are cached between flow runs. 0 disables the cache.
+    Changes made through another process are seen once the cached values expire."""
     worker_timeout: int = 300
     """Timeout for the API calls in seconds."""
     tenant_isolation_enabled: bool = False
@@ -189,6 +192,10 @@ class Settings(BaseSettings):
     do_not_track: bool = False
     """If set to True, Langflow will not track telemetry."""
     telemetry_base_url: str = "https://langflow.gateway.scarf.sh"
+    telemetry_flush_interval: float = 60.0
+    """Interval in seconds at which queued telemetry events and aggregated component counters are sent."""
+    telemetry_max_queue_size: int = 1000
+    """Maximum number of telemetry events to queue between sends. When full, the oldest event is dropped."""
     transactions_storage_enabled: bool = True
     """If set to True, Langflow will track transactions between flows."""
     vertex_builds_storage_enabled: bool = True
@@ -219,8 +226,21 @@ class Settings(BaseSettings):
     """The maximum number of retries for the health check."""
     max_file_size_upload: int = 100
     """The maximum file size for the upload in MB."""
+    cancel_disconnected_requests: bool = False
+    """If set to True, the handling of an HTTP request is cancelled as soon as its client disconnects, and a 499 is
+    returned if no response was started. This applies to every route, so work a handler does before responding is
+    not completed for clients that disconnect early."""
     deactivate_tracing: bool = False
     """If set to True, tracing will be deactivated."""
+    trace_export_workers: int = 2
+    """Number of worker threads that send spans to the tracing backends, shared by all runs."""
+    trace_export_max_queue_size: int = 10_000
+    """Maximum number of spans each trace export worker buffers before applying `trace_export_drop_policy`."""
+    trace_export_batch_size: int = 100
+    """Maximum number of spans a trace export worker takes from its queue at a time."""
+    trace_export_drop_policy: Literal["drop_newest", "drop_oldest"] = "drop_newest"
+    """Which span to drop when a trace export queue is full. The start and end of a component trace are dropped
+    together, and the end of a run is never dropped."""
     max_transactions_to_keep: int = 3000
     """The maximum number of transactions to keep in the database."""
     max_vertex_builds_to_keep: int = 3000
@@ -229,6 +249,77 @@ class Settings(BaseSettings):
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
+    graph_scheduler: Literal["layered", "dependency"] = "layered"
+    """How graph runs schedule their vertices. 'layered' waits for every vertex of a layer before starting the
+    next layer. 'dependency' starts each vertex as soon as its own predecessors have finished."""
+    graph_max_concurrency: int = 0
+    """The maximum number of vertices built concurrently by the 'dependency' scheduler. 0 means no limit."""
+    orchestrator_max_concurrency: int = 8
+    """The maximum number of inputs of a single run request executed concurrently, each on its own copy of the
+    flow. 1 runs the inputs one after another on the same graph."""
+    run_max_concurrency: int = 0
+    """The maximum number of flow runs (`/api/v1/run`, the Run Flow component, ...) executed concurrently by the
+    process. 0 means no limit."""
+    run_max_concurrency_per_flow: int = 0
+    """The maximum number of concurrent runs of a single flow. 0 means no limit."""
+    run_flow_max_concurrency: dict[str, int] = {}
+    """Per-flow overrides of `run_max_concurrency_per_flow`, keyed by flow id, to cap expensive flows."""
+    run_admission_policy: Literal["queue", "reject"] = "queue"
+    """What happens to a run when a concurrency limit is reached. 'queue' waits for a slot and 'reject'
+    fails the run right away, with a 429 response for the run endpoints."""
+    run_max_queue_size: int = 0
+    """The maximum number of runs waiting for a slot before new runs are rejected. 0 means no limit."""
+    run_queue_timeout: float = 0
+    """The maximum number of seconds a run waits for a slot before it is rejected. 0 means no limit."""
+    component_class_cache_size: int = 256
+    """The maximum number of compiled component classes kept in memory, keyed by a hash of their code.
+    Set to 0 to disable the cache."""
+    component_code_cache: bool = True
+    """Persist the compiled code and templates of the loaded components to disk, keyed by the Langflow version
+    and a hash of each component's source, so new processes skip building the components that did not change.
+    The cache is rebuilt when the Langflow component modules or the installed packages change."""
+    component_code_cache_dir: str | None = None
+    """Where the component code cache is stored. Defaults to a 'component_cache' folder in the config directory.
+    Pre-warm it at image build time with `langflow warm-cache`."""
+    graph_plan_cache_size: int = 128
+    """The maximum number of compiled flow plans kept in memory for `/api/v1/run`, keyed by flow id,
+    last update time and tweaks. Set to 0 to disable the cache."""
+    job_queue_max_events: int = 10_000
+    """The maximum number of events buffered for a single build job before its overflow policy applies.
+    0 means no limit."""
+    job_queue_max_bytes: int = 16 * 1024 * 1024
+    """The maximum number of bytes buffered for a single build job before its overflow policy applies.
+    0 means no limit."""
+    job_queue_overflow_policy: Literal["coalesce", "drop", "block"] = "coalesce"
+    """What happens to token events when a job queue is full. 'coalesce' merges consecutive tokens of a message,
+    'drop' discards them and 'block' pauses the producer until the consumer catches up."""
+    job_queue_memory_budget: int = 256 * 1024 * 1024
+    """The maximum number of bytes buffered by all build jobs together. 0 means no limit."""
+    write_behind_enabled: bool = True
+    """If set to True, transactions, vertex builds and voice mode messages are buffered and written to the database
+    in bulk by a background worker instead of one commit per row."""
+    write_behind_batch_size: int = 500
+    """The number of buffered rows of one kind that triggers a write before the flush interval elapses."""
+    write_behind_flush_interval: float = 1.0
+    """The maximum number of seconds a buffered row waits before it is written."""
+    write_behind_max_buffer_size: int = 10_000
+    """The maximum number of rows buffered for writing. Further rows are written directly. 0 means no limit."""
+    write_behind_retention_interval: float = 60.0
+    """Seconds between the pruning runs that apply max_transactions_to_keep and the vertex build limits
+    to the rows written in bulk."""
+    api_key_cache_ttl: float = 30.0
+    """Seconds a validated API key and its user are cached. 0 disables the cache."""
+    api_key_negative_cache_ttl: float = 5.0
+    """Seconds an unknown API key is remembered as invalid. 0 disables negative caching."""
+    api_key_cache_max_size: int = 10_000
+    """The maximum number of API keys cached. The oldest entries are dropped first."""
+    api_key_usage_flush_interval: float = 10.0
+    """Seconds between the writes of the aggregated API key use counts. 0 updates the key on every use."""
+    token_flush_interval: float = 0.0
+    """Seconds to merge consecutive streamed tokens of a message into one token event, e.g. 0.02.
+    0 sends every token as its own event."""
+    token_flush_bytes: int = 0
+    """The number of bytes of merged tokens after which a token event is sent right away. 0 means no byte budget."""
 
     # MCP Server
     mcp_server_enabled: bool = True
@@ -1,8 +1,17 @@
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
 import anyio
 from aiofile import async_open
 from loguru import logger
 
-from .service import StorageService
+from .constants import STREAM_CHUNK_SIZE
+from .service import StorageService, StoredFile
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
 
 
 class LocalStorageService(StorageService):
@@ -42,6 +51,47 @@ class LocalStorageService(StorageService):
             logger.exception(f"Error saving file {file_name} in flow {flow_id}")
             raise
 
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> StoredFile:
+        """Save a file in the local storage from an async iterator of chunks.
+
+        The chunks are written to a temporary file as they come, which replaces the file once complete, so
+        an interrupted upload never leaves a partial file behind.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be saved.
+            chunks: The byte content of the file.
+
+        Returns:
+            The size and SHA-256 digest of the file.
+        """
+        folder_path = self.data_dir / flow_id
+        await folder_path.mkdir(parents=True, exist_ok=True)
+        file_path = folder_path / file_name
+        partial_path = folder_path / f".{file_name}.part"
+
+        digest = hashlib.sha256()
+        size = 0
+        completed = False
+        try:
+            async with async_open(str(partial_path), "wb") as f:
+                async for chunk in chunks:
+                    digest.update(chunk)
+                    size += len(chunk)
+                    await f.write(chunk)
+            await partial_path.replace(file_path)
+            completed = True
+        except Exception:
+            logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            raise
+        finally:
+            if not completed:
+                # Also runs when the upload is cancelled, e.g. because the client disconnected
+                with anyio.CancelScope(shield=True):
+                    await partial_path.unlink(missing_ok=True)
+        logger.info(f"File {file_name} saved successfully in flow {flow_id}.")
+        return StoredFile(size, digest.hexdigest())
+
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         """Retrieve a file from the local storage.
 
@@ -67,6 +117,42 @@ class LocalStorageService(StorageService):
         logger.debug(f"File {file_name} retrieved successfully from flow {flow_id}.")
         return content
 
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a file from the local storage in chunks.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be read.
+            start: The offset of the first byte to read.
+            end: The offset of the last byte to read, or None to read to the end of the file.
+            chunk_size: The maximum size of the chunks.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+
+        remaining = None if end is None else end - start + 1
+        async with async_open(str(file_path), "rb") as f:
+            f.seek(start)
+            while remaining is None or remaining > 0:
+                chunk = await f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
     async def list_files(self, flow_id: str):
         """List all files in a specified flow.
 
@@ -96,6 +182,16 @@ class LocalStorageService(StorageService):
         logger.info(f"Listed {len(files)} files in flow {flow_id}.")
         return files
 
+    async def rename_file(self, flow_id: str, file_name: str, new_file_name: str) -> None:
+        """Rename a file in the local storage, replacing any file named `new_file_name`.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        folder_path = self.data_dir / flow_id
+        await (folder_path / file_name).replace(folder_path / new_file_name)
+        logger.info(f"File {file_name} renamed to {new_file_name} in flow {flow_id}.")
+
     async def delete_file(self, flow_id: str, file_name: str) -> None:
         """Delete a file from the local storage.
 
@@ -113,7 +209,7 @@ class LocalStorageService(StorageService):
         """Perform any cleanup operations when the service is being torn down."""
         # No specific teardown actions required for local
 
-    async def get_file_size(self, flow_id: str, file_name: str) -> None:
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
         """Get the size of a file in the local storage."""
         # Get the file size from the file path
         file_path = self.data_dir / flow_id / file_name
@@ -1,8 +1,22 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from typing import TYPE_CHECKING
+
+import anyio
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from loguru import logger
 
-from .service import StorageService
+from .constants import STREAM_CHUNK_SIZE
+from .service import StorageService, StoredFile
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+# S3 requires every part of a multipart upload but the last one to be at least 5 MiB
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
 
 
 class S3StorageService(StorageService):
@@ -36,6 +50,79 @@ class S3StorageService(StorageService):
             logger.exception(f"Error saving file {file_name} in folder {folder}")
             raise
 
+    async def save_file_stream(self, folder: str, file_name: str, chunks: AsyncIterable[bytes]) -> StoredFile:
+        """Save a file to the S3 bucket from an async iterator of chunks.
+
+        Files smaller than a part are uploaded with a single request, larger ones with a multipart upload
+        of `MULTIPART_PART_SIZE` parts, so at most one part is held in memory. The multipart upload is
+        aborted if saving fails.
+
+        Args:
+            folder: The folder in the bucket to save the file.
+            file_name: The name of the file to be saved.
+            chunks: The byte content of the file.
+
+        Returns:
+            The size and SHA-256 digest of the file.
+        """
+        key = f"{folder}/{file_name}"
+        digest = hashlib.sha256()
+        size = 0
+        buffer = bytearray()
+        upload_id = None
+        parts: list[dict] = []
+
+        async def upload_part(data: bytes) -> None:
+            nonlocal upload_id
+            if upload_id is None:
+                response = await asyncio.to_thread(self.s3_client.create_multipart_upload, Bucket=self.bucket, Key=key)
+                upload_id = response["UploadId"]
+            part_number = len(parts) + 1
+            response = await asyncio.to_thread(
+                self.s3_client.upload_part,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=data,
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+        try:
+            async for chunk in chunks:
+                digest.update(chunk)
+                size += len(chunk)
+                buffer += chunk
+                while len(buffer) >= MULTIPART_PART_SIZE:
+                    await upload_part(bytes(buffer[:MULTIPART_PART_SIZE]))
+                    del buffer[:MULTIPART_PART_SIZE]
+            if upload_id is None:
+                await asyncio.to_thread(self.s3_client.put_object, Bucket=self.bucket, Key=key, Body=bytes(buffer))
+            else:
+                if buffer:
+                    await upload_part(bytes(buffer))
+                await asyncio.to_thread(
+                    self.s3_client.complete_multipart_upload,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except BaseException:
+            if upload_id is not None:
+                # Also runs when the upload is cancelled, e.g. because the client disconnected
+                with anyio.CancelScope(shield=True):
+                    try:
+                        await asyncio.to_thread(
+                            self.s3_client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id
+                        )
+                    except ClientError:
+                        logger.exception(f"Error aborting the upload of file {file_name} in folder {folder}")
+            logger.exception(f"Error saving file {file_name} in folder {folder}")
+            raise
+        logger.info(f"File {file_name} saved successfully in folder {folder}.")
+        return StoredFile(size, digest.hexdigest())
+
     async def get_file(self, folder: str, file_name: str):
         """Retrieve a file from the S3 bucket.
 
@@ -57,6 +144,52 @@ class S3StorageService(StorageService):
             logger.exception(f"Error retrieving file {file_name} from folder {folder}")
             raise
 
+    async def get_file_stream(
+        self,
+        folder: str,
+        file_name: str,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a file from the S3 bucket in chunks, requesting only the bytes `start` to `end`.
+
+        Args:
+            folder: The folder in the bucket where the file is stored.
+            file_name: The name of the file to be read.
+            start: The offset of the first byte to read.
+            end: The offset of the last byte to read, or None to read to the end of the file.
+            chunk_size: The maximum size of the chunks.
+        """
+        extra_args = {}
+        # S3 rejects any range of an empty object, so whole files are read without one
+        if start or end is not None:
+            extra_args["Range"] = f"bytes={start}-{'' if end is None else end}"
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.get_object, Bucket=self.bucket, Key=f"{folder}/{file_name}", **extra_args
+            )
+        except ClientError:
+            logger.exception(f"Error retrieving file {file_name} from folder {folder}")
+            raise
+        body = response["Body"]
+        try:
+            while chunk := await asyncio.to_thread(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    async def get_file_size(self, folder: str, file_name: str) -> int:
+        """Get the size of a file in the S3 bucket without downloading it."""
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=self.bucket, Key=f"{folder}/{file_name}"
+            )
+        except ClientError:
+            logger.exception(f"Error retrieving the size of file {file_name} from folder {folder}")
+            raise
+        return response["ContentLength"]
+
     async def list_files(self, folder: str):
         """List all files in a specified folder of the S3 bucket.
 
@@ -79,6 +212,27 @@ class S3StorageService(StorageService):
         logger.info(f"{len(files)} files listed in folder {folder}.")
         return files
 
+    async def rename_file(self, folder: str, file_name: str, new_file_name: str) -> None:
+        """Rename a file in the S3 bucket by copying it within the bucket and deleting the original.
+
+        Args:
+            folder: The folder in the bucket where the file is stored.
+            file_name: The name of the file to be renamed.
+            new_file_name: The new name of the file.
+        """
+        try:
+            await asyncio.to_thread(
+                self.s3_client.copy_object,
+                Bucket=self.bucket,
+                Key=f"{folder}/{new_file_name}",
+                CopySource={"Bucket": self.bucket, "Key": f"{folder}/{file_name}"},
+            )
+            await asyncio.to_thread(self.s3_client.delete_object, Bucket=self.bucket, Key=f"{folder}/{file_name}")
+        except ClientError:
+            logger.exception(f"Error renaming file {file_name} to {new_file_name} in folder {folder}")
+            raise
+        logger.info(f"File {file_name} renamed to {new_file_name} in folder {folder}.")
+
     async def delete_file(self, folder: str, file_name: str) -> None:
         """Delete a file from the S3 bucket.
 
@@ -1,17 +1,28 @@
 from __future__ import annotations
 
+import hashlib
 from abc import abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 import anyio
 
 from langflow.services.base import Service
+from langflow.services.storage.constants import STREAM_CHUNK_SIZE
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
 
 
+class StoredFile(NamedTuple):
+    """The size and SHA-256 hex digest of a file written by `StorageService.save_file_stream`."""
+
+    size: int
+    sha256: str
+
+
 class StorageService(Service):
     name = "storage_service"
 
@@ -35,6 +46,52 @@ class StorageService(Service):
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         raise NotImplementedError
 
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> StoredFile:
+        """Save a file from an async iterator of chunks, hashing it as it is written.
+
+        Backends should override this to write the chunks as they come. This implementation joins them and
+        calls `save_file`.
+        """
+        digest = hashlib.sha256()
+        parts = []
+        async for chunk in chunks:
+            digest.update(chunk)
+            parts.append(chunk)
+        data = b"".join(parts)
+        await self.save_file(flow_id, file_name, data)
+        return StoredFile(len(data), digest.hexdigest())
+
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read the bytes `start` to `end` (inclusive, or to the end of the file) of a file in chunks.
+
+        Backends should override this to read the chunks as they are sent. This implementation calls
+        `get_file`.
+        """
+        data = await self.get_file(flow_id, file_name)
+        stop = len(data) if end is None else min(end + 1, len(data))
+        for offset in range(start, stop, chunk_size):
+            yield data[offset : min(offset + chunk_size, stop)]
+
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
+        """Get the size of a file in bytes."""
+        return len(await self.get_file(flow_id, file_name))
+
+    async def rename_file(self, flow_id: str, file_name: str, new_file_name: str) -> None:
+        """Rename a file, replacing any file named `new_file_name`.
+
+        Backends should override this to rename the file in place. This implementation copies it in chunks
+        and deletes the original.
+        """
+        await self.save_file_stream(flow_id, new_file_name, self.get_file_stream(flow_id, file_name))
+        await self.delete_file(flow_id, file_name)
+
     @abstractmethod
     async def list_files(self, flow_id: str) -> list[str]:
         raise NotImplementedError
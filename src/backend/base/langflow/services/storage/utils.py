@@ -1,5 +1,41 @@
 from langflow.services.storage.constants import EXTENSION_TO_CONTENT_TYPE
 
 
+class RangeNotSatisfiableError(ValueError):
+    """Raised when the byte range requested by a Range header is outside of the file."""
+
+
 def build_content_type_from_extension(extension: str):
     return EXTENSION_TO_CONTENT_TYPE.get(extension.lower(), "application/octet-stream")
+
+
+def parse_range_header(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse an HTTP Range header into the offsets of the first and last requested bytes of a file.
+
+    Returns None when the whole file should be sent: without a header, with a unit other than bytes, or
+    when several ranges are requested, which servers may answer with the whole file.
+
+    Raises:
+        RangeNotSatisfiableError: If the range is malformed or starts after the end of the file.
+    """
+    if not range_header:
+        return None
+    unit, _, ranges = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+    first, _, last = ranges.strip().partition("-")
+    try:
+        start = int(first) if first else None
+        end = int(last) if last else None
+    except ValueError as exc:
+        raise RangeNotSatisfiableError(range_header) from exc
+    if start is None:
+        # A suffix range, the last `end` bytes of the file
+        if end is None or end <= 0 or size == 0:
+            raise RangeNotSatisfiableError(range_header)
+        return max(size - end, 0), size - 1
+    if end is None:
+        end = size - 1
+    if start < 0 or start >= size or end < start:
+        raise RangeNotSatisfiableError(range_header)
+    return start, min(end, size - 1)
@@ -50,7 +50,8 @@ class ObservableGaugeWrapper:
         )
 
     def _callback(self, _options: CallbackOptions):
-        return [Observation(value, attributes=dict(labels)) for labels, value in self._values.items()]
+        # Values can be set from another thread while the metrics are collected
+        return [Observation(value, attributes=dict(labels)) for labels, value in list(self._values.items())]
 
         # return [Observation(self._value)]
 
@@ -140,6 +141,27 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             metric_type=MetricType.COUNTER,
             labels={"flow_id": mandatory_label},
         )
+        self._add_metric(
+            name="trace_export_pending",
+            description="The number of spans waiting in a trace export queue",
+            unit="",
+            metric_type=MetricType.OBSERVABLE_GAUGE,
+            labels={"worker": mandatory_label},
+        )
+        self._add_metric(
+            name="trace_export_dropped",
+            description="The number of spans a trace export worker dropped because its queue was full",
+            unit="",
+            metric_type=MetricType.OBSERVABLE_GAUGE,
+            labels={"worker": mandatory_label},
+        )
+        self._add_metric(
+            name="trace_export_max_lag",
+            description="The longest time a span waited in a trace export queue",
+            unit="s",
+            metric_type=MetricType.OBSERVABLE_GAUGE,
+            labels={"worker": mandatory_label},
+        )
 
     def __init__(self, *, prometheus_enabled: bool = True):
         # Only initialize once
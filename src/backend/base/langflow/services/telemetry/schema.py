@@ -36,3 +36,13 @@ class ComponentPayload(BaseModel):
     component_seconds: int = Field(serialization_alias="componentSeconds")
     component_success: bool = Field(serialization_alias="componentSuccess")
     component_error_message: str | None = Field(serialization_alias="componentErrorMessage")
+
+
+class ComponentBatchPayload(BaseModel):
+    component_name: str = Field(serialization_alias="componentName")
+    component_count: int = Field(serialization_alias="componentCount")
+    component_error_count: int = Field(serialization_alias="componentErrorCount")
+    component_seconds: int = Field(serialization_alias="componentSeconds")
+    component_seconds_histogram: str = Field(serialization_alias="componentSecondsHistogram")
+    component_error_message: str | None = Field(None, serialization_alias="componentErrorMessage")
+    interval_seconds: int = Field(serialization_alias="intervalSeconds")
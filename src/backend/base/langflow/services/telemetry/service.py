@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import os
 import platform
+import time
+from bisect import bisect_left
+from collections import deque
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
@@ -12,6 +16,7 @@ from loguru import logger
 from langflow.services.base import Service
 from langflow.services.telemetry.opentelemetry import OpenTelemetry
 from langflow.services.telemetry.schema import (
+    ComponentBatchPayload,
     ComponentPayload,
     PlaygroundPayload,
     RunPayload,
@@ -26,14 +31,70 @@ if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
 
 
+# Upper bounds, in seconds, of the component build time histogram buckets; the last bucket is unbounded
+COMPONENT_SECONDS_BUCKETS = (1, 5, 10, 30, 60, 300)
+
+
+class ComponentStats:
+    """Counters and a build time histogram for the builds of one component during a send interval."""
+
+    __slots__ = ("count", "error_count", "last_error_message", "seconds", "seconds_histogram")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.error_count = 0
+        self.seconds = 0
+        self.seconds_histogram = [0] * (len(COMPONENT_SECONDS_BUCKETS) + 1)
+        self.last_error_message: str | None = None
+
+    def add(self, payload: ComponentPayload) -> None:
+        self.count += 1
+        self.seconds += payload.component_seconds
+        self.seconds_histogram[bisect_left(COMPONENT_SECONDS_BUCKETS, payload.component_seconds)] += 1
+        if not payload.component_success:
+            self.error_count += 1
+            self.last_error_message = payload.component_error_message
+
+    def to_payload(self, component_name: str, interval_seconds: int) -> ComponentBatchPayload:
+        bounds = [*map(str, COMPONENT_SECONDS_BUCKETS), "+Inf"]
+        histogram = ",".join(f"{bound}:{count}" for bound, count in zip(bounds, self.seconds_histogram, strict=True))
+        return ComponentBatchPayload(
+            component_name=component_name,
+            component_count=self.count,
+            component_error_count=self.error_count,
+            component_seconds=self.seconds,
+            component_seconds_histogram=histogram,
+            component_error_message=self.last_error_message,
+            interval_seconds=interval_seconds,
+        )
+
+
 class TelemetryService(Service):
+    """Sends anonymous usage events in periodic batches.
+
+    Events are queued and sent every `telemetry_flush_interval` seconds instead of one request per event
+    as they happen. Component builds, which happen once per vertex, are not queued individually: they
+    are merged into per-component counters and build time histograms and sent as one
+    `ComponentBatchPayload` per component and interval. The queue holds at most
+    `telemetry_max_queue_size` events and drops the oldest one when full.
+    """
+
     name = "telemetry_service"
 
     def __init__(self, settings_service: SettingsService):
         super().__init__()
         self.settings_service = settings_service
-        self.base_url = settings_service.settings.telemetry_base_url
-        self.telemetry_queue: asyncio.Queue = asyncio.Queue()
+        settings = settings_service.settings
+        self.base_url = settings.telemetry_base_url
+        self.flush_interval = settings.telemetry_flush_interval
+        self.telemetry_queue: deque[tuple[BaseModel, str | None]] = deque(
+            maxlen=max(settings.telemetry_max_queue_size, 1)
+        )
+        self.component_stats: dict[str, ComponentStats] = {}
+        self.dropped = 0
+        self._interval_start = time.monotonic()
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
         self.client = httpx.AsyncClient(timeout=10.0)  # Set a reasonable timeout
         self.running = False
         self._stopping = False
@@ -49,13 +110,10 @@ class TelemetryService(Service):
 
     async def telemetry_worker(self) -> None:
         while self.running:
-            func, payload, path = await self.telemetry_queue.get()
-            try:
-                await func(payload, path)
-            except Exception:  # noqa: BLE001
-                logger.error("Error sending telemetry data")
-            finally:
-                self.telemetry_queue.task_done()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            self._wakeup.clear()
+            await self.flush()
 
     async def send_telemetry_data(self, payload: BaseModel, path: str | None = None) -> None:
         if self.do_not_track:
@@ -80,16 +138,23 @@ class TelemetryService(Service):
             logger.error("Unexpected error occurred")
 
     async def log_package_run(self, payload: RunPayload) -> None:
-        await self._queue_event((self.send_telemetry_data, payload, "run"))
+        await self._queue_event(payload, "run")
 
     async def log_package_shutdown(self) -> None:
         payload = ShutdownPayload(time_running=(datetime.now(timezone.utc) - self._start_time).seconds)
-        await self._queue_event(payload)
+        await self._queue_event(payload, "shutdown")
 
-    async def _queue_event(self, payload) -> None:
+    async def _queue_event(self, payload: BaseModel, path: str | None) -> None:
         if self.do_not_track or self._stopping:
             return
-        await self.telemetry_queue.put(payload)
+        if len(self.telemetry_queue) == self.telemetry_queue.maxlen:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(f"Telemetry queue is full, {self.dropped} events dropped so far")
+        self.telemetry_queue.append((payload, path))
+        if len(self.telemetry_queue) == self.telemetry_queue.maxlen:
+            # Send what is queued now rather than dropping events until the next interval
+            self._wakeup.set()
 
     def _get_langflow_desktop(self) -> bool:
         # Coerce to bool, could be 1, 0, True, False, "1", "0", "True", "False"
@@ -111,13 +176,24 @@ class TelemetryService(Service):
             auto_login=self.settings_service.auth_settings.AUTO_LOGIN,
             desktop=self._get_langflow_desktop(),
         )
-        await self._queue_event((self.send_telemetry_data, payload, None))
+        await self._queue_event(payload, None)
 
     async def log_package_playground(self, payload: PlaygroundPayload) -> None:
-        await self._queue_event((self.send_telemetry_data, payload, "playground"))
+        await self._queue_event(payload, "playground")
 
     async def log_package_component(self, payload: ComponentPayload) -> None:
-        await self._queue_event((self.send_telemetry_data, payload, "component"))
+        if self.do_not_track or self._stopping:
+            return
+        stats = self.component_stats.get(payload.component_name)
+        if stats is None:
+            stats = self.component_stats[payload.component_name] = ComponentStats()
+        stats.add(payload)
+
+    def _take_component_batches(self) -> list[tuple[BaseModel, str | None]]:
+        stats, self.component_stats = self.component_stats, {}
+        now = time.monotonic()
+        interval_seconds, self._interval_start = int(now - self._interval_start), now
+        return [(stats_.to_payload(name, interval_seconds), "component_batch") for name, stats_ in stats.items()]
 
     def start(self) -> None:
         if self.running or self.do_not_track:
@@ -125,18 +201,24 @@ class TelemetryService(Service):
         try:
             self.running = True
             self._start_time = datetime.now(timezone.utc)
+            self._interval_start = time.monotonic()
             self.worker_task = asyncio.create_task(self.telemetry_worker())
             self.log_package_version_task = asyncio.create_task(self.log_package_version())
         except Exception:  # noqa: BLE001
             logger.exception("Error starting telemetry service")
 
     async def flush(self) -> None:
+        """Send the queued events and the component counters aggregated since the previous send."""
         if self.do_not_track:
             return
-        try:
-            await self.telemetry_queue.join()
-        except Exception:  # noqa: BLE001
-            logger.exception("Error flushing logs")
+        async with self._flush_lock:
+            events = [*self.telemetry_queue, *self._take_component_batches()]
+            self.telemetry_queue.clear()
+            for payload, path in events:
+                try:
+                    await self.send_telemetry_data(payload, path)
+                except Exception:  # noqa: BLE001
+                    logger.error("Error sending telemetry data")
 
     @staticmethod
     async def _cancel_task(task: asyncio.Task, cancel_msg: str) -> None:
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
     from uuid import UUID
 
     from langchain.callbacks.base import BaseCallbackHandler
@@ -14,6 +15,14 @@ if TYPE_CHECKING:
 
 
 class BaseTracer(ABC):
+    """A tracing backend for the runs of a graph.
+
+    `add_trace`, `end_trace` and `end` are called on a trace export thread, in the order they were
+    queued, through `export_batch`. Only `ready` and `get_langchain_callback` are called from the event
+    loop. The tracing service holds `lock` around each exported call and around `get_langchain_callback`,
+    so a tracer never runs two of its methods at the same time.
+    """
+
     trace_id: UUID
 
     @abstractmethod
@@ -28,6 +37,12 @@ class BaseTracer(ABC):
     ) -> None:
         raise NotImplementedError
 
+    @property
+    def lock(self) -> threading.RLock:
+        """The lock serializing the calls of the export threads and of the event loop on this tracer."""
+        # Tracers don't call the base __init__, so the lock is created on first use; setdefault is atomic
+        return self.__dict__.setdefault("_tracer_lock", threading.RLock())
+
     @property
     @abstractmethod
     def ready(self) -> bool:
@@ -69,3 +84,11 @@ class BaseTracer(ABC):
     @abstractmethod
     def get_langchain_callback(self) -> BaseCallbackHandler | None:
         raise NotImplementedError
+
+    def export_batch(self, calls: Sequence[Callable[[], None]]) -> None:
+        """Run queued calls of this tracer in order, on a trace export thread.
+
+        Tracers whose backend can send several spans in one request can override this to do so.
+        """
+        for call in calls:
+            call()
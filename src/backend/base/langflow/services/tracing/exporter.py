@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Literal
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Sequence
+
+DropPolicy = Literal["drop_newest", "drop_oldest"]
+
+
+class _Span:
+    __slots__ = ("args", "droppable", "ends_trace", "enqueued_at", "func", "trace")
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        args: tuple,
+        *,
+        droppable: bool,
+        trace: Hashable | None,
+        ends_trace: bool,
+    ) -> None:
+        self.func = func
+        self.args = args
+        self.droppable = droppable
+        self.trace = trace
+        self.ends_trace = ends_trace
+        self.enqueued_at = time.monotonic()
+
+    def run(self) -> None:
+        try:
+            self.func(*self.args)
+        except Exception:  # noqa: BLE001
+            logger.exception("Error processing trace_func")
+
+
+def _run_calls(key: Hashable, calls: Sequence[Callable[[], None]]) -> None:  # noqa: ARG001
+    for call in calls:
+        call()
+
+
+class _Worker:
+    """A worker thread and the FIFO lanes it drains, one lane per key."""
+
+    def __init__(self, exporter: TraceExporter, index: int) -> None:
+        self.exporter = exporter
+        self.index = index
+        self.lanes: dict[Hashable, deque[_Span]] = {}
+        # Whether the traces started on a lane and not ended yet were kept (True) or dropped (False)
+        self.traces: dict[tuple[Hashable, Hashable], bool] = {}
+        self.size = 0
+        self.busy = False
+        self.condition = threading.Condition()
+        self.thread: threading.Thread | None = None
+        # Updated by this worker's thread, or under the condition for `dropped`
+        self.exported = 0
+        self.dropped = 0
+        self.max_lag = 0.0
+        self.total_lag = 0.0
+
+    def start(self) -> None:
+        self.thread = threading.Thread(target=self.run, name=f"langflow-trace-export-{self.index}", daemon=True)
+        self.thread.start()
+
+    def put(self, key: Hashable, span: _Span) -> bool:
+        queued = self._put(key, span)
+        self.exporter.notify_update()
+        return queued
+
+    def _put(self, key: Hashable, span: _Span) -> bool:
+        with self.condition:
+            kept = None if span.trace is None else self.traces.get((key, span.trace))
+            if kept is not None:
+                # The rest of a trace shares the fate of its first span, so no end is exported without its start
+                if span.ends_trace:
+                    del self.traces[key, span.trace]
+                if not kept:
+                    self._record_dropped()
+                    return False
+                span.droppable = False
+            elif span.droppable and self.size >= self.exporter.max_queue_size and not self._make_room():
+                if span.trace is not None and not span.ends_trace:
+                    self.traces[key, span.trace] = False
+                self._record_dropped()
+                return False
+            elif span.trace is not None and not span.ends_trace:
+                self.traces[key, span.trace] = True
+            self.lanes.setdefault(key, deque()).append(span)
+            self.size += 1
+            # Threads waiting in `wait_idle` share the condition, so wake them all
+            self.condition.notify_all()
+        return True
+
+    def _make_room(self) -> bool:
+        """Drop the oldest droppable span and the queued rest of its trace, under `drop_oldest`."""
+        if self.exporter.drop_policy != "drop_oldest":
+            return False
+        oldest: tuple[float, Hashable, _Span] | None = None
+        for key, lane in self.lanes.items():
+            for span in lane:
+                if span.droppable:
+                    if oldest is None or span.enqueued_at < oldest[0]:
+                        oldest = (span.enqueued_at, key, span)
+                    break
+        if oldest is None:
+            return False
+        _, key, dropped = oldest
+        lane = self.lanes[key]
+        spans = [dropped]
+        if dropped.trace is not None:
+            spans += [span for span in lane if span is not dropped and span.trace == dropped.trace]
+            if any(span.ends_trace for span in spans):
+                self.traces.pop((key, dropped.trace), None)
+            else:
+                self.traces[key, dropped.trace] = False
+        for span in spans:
+            lane.remove(span)
+            self._record_dropped()
+        if not lane:
+            del self.lanes[key]
+        self.size -= len(spans)
+        return True
+
+    def _record_dropped(self) -> None:
+        self.dropped += 1
+        dropped = self.exporter.dropped
+        if dropped == 1 or dropped % 1000 == 0:
+            logger.warning(f"Trace export queue is full, {dropped} spans dropped so far")
+
+    def _take_batch(self) -> list[tuple[Hashable, list[_Span]]]:
+        """Take up to `batch_size` spans, in order within each lane, going over the lanes in turn."""
+        batch: list[tuple[Hashable, list[_Span]]] = []
+        taken = 0
+        for key in list(self.lanes):
+            lane = self.lanes[key]
+            spans = [lane.popleft() for _ in range(min(len(lane), self.exporter.batch_size - taken))]
+            batch.append((key, spans))
+            taken += len(spans)
+            if not lane:
+                del self.lanes[key]
+            if taken >= self.exporter.batch_size:
+                break
+        self.size -= taken
+        return batch
+
+    def run(self) -> None:
+        while True:
+            with self.condition:
+                self.busy = False
+                self.condition.notify_all()
+                while not self.size and not self.exporter.stopping:
+                    self.condition.wait()
+                if not self.size:
+                    return
+                batch = self._take_batch()
+                self.busy = True
+            for key, spans in batch:
+                now = time.monotonic()
+                for span in spans:
+                    lag = now - span.enqueued_at
+                    self.max_lag = max(self.max_lag, lag)
+                    self.total_lag += lag
+                self.exported += len(spans)
+                try:
+                    self.exporter.export_batch(key, [span.run for span in spans])
+                except Exception:  # noqa: BLE001
+                    logger.exception("Error exporting a batch of trace spans")
+            self.exporter.notify_update()
+
+    def wait_idle(self, deadline: float | None) -> bool:
+        with self.condition:
+            while self.size or self.busy:
+                timeout = None if deadline is None else deadline - time.monotonic()
+                if timeout is not None and timeout <= 0:
+                    return False
+                self.condition.wait(timeout)
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pending": self.size,
+            "exported": self.exported,
+            "dropped": self.dropped,
+            "max_lag": self.max_lag,
+            "mean_lag": self.total_lag / self.exported if self.exported else 0.0,
+        }
+
+
+class TraceExporter:
+    """Runs tracer calls on a small pool of worker threads so tracing backends never block the event loop.
+
+    Every key, such as a tracer, gets its own FIFO lane, so its calls stay in order. Lanes are spread over
+    `workers` threads, which take spans in batches of up to `batch_size` going over their lanes in turn,
+    so a slow backend delays the export of other spans but never the caller. The spans a worker takes
+    from a lane are handed over together to `export_batch(key, calls)`, which runs the calls in order by
+    default and lets a tracer send them to its backend at once.
+
+    Each worker buffers at most `max_queue_size` droppable spans. When it is full, `drop_policy` decides
+    whether the new span or the oldest buffered span is dropped. Spans submitted with the same `trace`
+    on a lane are kept or dropped together, up to the one submitted with `ends_trace=True`, so the end
+    of a trace is never exported without its start. Spans submitted with `droppable=False`, such as the
+    end of a run, are always kept.
+
+    `stats` reports the queued, processed and dropped spans and the export lag, the time in seconds
+    spans waited in the queue before being processed, in total and for each worker. `on_update` is
+    called whenever they change: after a span is queued or dropped, and after a batch is exported.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 2,
+        max_queue_size: int = 10_000,
+        batch_size: int = 100,
+        drop_policy: DropPolicy = "drop_newest",
+        export_batch: Callable[[Hashable, Sequence[Callable[[], None]]], None] = _run_calls,
+        on_update: Callable[[], None] | None = None,
+    ) -> None:
+        self.max_queue_size = max_queue_size
+        self.batch_size = max(batch_size, 1)
+        self.drop_policy = drop_policy
+        self.export_batch = export_batch
+        self.on_update = on_update
+        self.stopping = False
+        self._workers = [_Worker(self, index) for index in range(max(workers, 1))]
+        self._start_lock = threading.Lock()
+        self._started = False
+
+    def submit(
+        self,
+        key: Hashable,
+        func: Callable[..., Any],
+        *args: Any,
+        droppable: bool = True,
+        trace: Hashable | None = None,
+        ends_trace: bool = False,
+    ) -> bool:
+        """Queue `func(*args)` on the lane of `key`. Returns False if the span was dropped."""
+        if self.stopping:
+            return False
+        if not self._started:
+            self._start()
+        worker = self._workers[hash(key) % len(self._workers)]
+        return worker.put(key, _Span(func, args, droppable=droppable, trace=trace, ends_trace=ends_trace))
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._started:
+                return
+            for worker in self._workers:
+                worker.start()
+            self._started = True
+
+    def notify_update(self) -> None:
+        if self.on_update is None:
+            return
+        try:
+            self.on_update()
+        except Exception:  # noqa: BLE001
+            logger.exception("Error reporting the trace export stats")
+
+    @property
+    def dropped(self) -> int:
+        return sum(worker.dropped for worker in self._workers)
+
+    def pending(self) -> int:
+        return sum(worker.size for worker in self._workers)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every queued span has been processed. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        return all(worker.wait_idle(deadline) for worker in self._workers)
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Process the queued spans, then stop the worker threads."""
+        self.stopping = True
+        for worker in self._workers:
+            with worker.condition:
+                worker.condition.notify_all()
+        for worker in self._workers:
+            if worker.thread is not None:
+                worker.thread.join(timeout)
+
+    def stats(self) -> dict[str, Any]:
+        workers = [worker.stats() for worker in self._workers]
+        exported = sum(worker["exported"] for worker in workers)
+        return {
+            "pending": sum(worker["pending"] for worker in workers),
+            "exported": exported,
+            "dropped": sum(worker["dropped"] for worker in workers),
+            "max_lag": max(worker["max_lag"] for worker in workers),
+            "mean_lag": sum(worker.total_lag for worker in self._workers) / exported if exported else 0.0,
+            "workers": workers,
+        }
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import threading
 from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
@@ -40,6 +41,8 @@ class LangFuseTracer(BaseTracer):
         self.session_id = session_id
         self.flow_id = trace_name.split(" - ")[-1]
         self.spans: dict = OrderedDict()  # spans that are not ended
+        # add_trace and end_trace run on the trace export threads, get_langchain_callback on the event loop
+        self._spans_lock = threading.Lock()
 
         config = self._get_config()
         self._ready: bool = self.setup_langfuse(config) if config else False
@@ -110,7 +113,8 @@ class LangFuseTracer(BaseTracer):
         # else:
         span = self.trace.span(**content_span)
 
-        self.spans[trace_id] = span
+        with self._spans_lock:
+            self.spans[trace_id] = span
 
     @override
     def end_trace(
@@ -125,7 +129,8 @@ class LangFuseTracer(BaseTracer):
         if not self._ready:
             return
 
-        span = self.spans.pop(trace_id, None)
+        with self._spans_lock:
+            span = self.spans.pop(trace_id, None)
         if span:
             output: dict = {}
             output |= outputs or {}
@@ -157,7 +162,8 @@ class LangFuseTracer(BaseTracer):
             return None
 
         # get callback from parent span
-        stateful_client = self.spans[next(reversed(self.spans))] if len(self.spans) > 0 else self.trace
+        with self._spans_lock:
+            stateful_client = self.spans[next(reversed(self.spans))] if len(self.spans) > 0 else self.trace
         return stateful_client.get_langchain_handler()
 
     @staticmethod
@@ -10,8 +10,11 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from langflow.services.base import Service
+from langflow.services.telemetry.opentelemetry import OpenTelemetry
+from langflow.services.tracing.exporter import TraceExporter
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
     from uuid import UUID
 
     from langchain.callbacks.base import BaseCallbackHandler
@@ -74,10 +77,7 @@ class TraceContext:
         self.tracers: dict[str, BaseTracer] = {}
         self.all_inputs: dict[str, dict] = defaultdict(dict)
         self.all_outputs: dict[str, dict] = defaultdict(dict)
-
-        self.traces_queue: asyncio.Queue = asyncio.Queue()
         self.running = False
-        self.worker_task: asyncio.Task | None = None
 
 
 class ComponentTraceContext:
@@ -119,26 +119,52 @@ class TracingService(Service):
 
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
-        self.deactivated = self.settings_service.settings.deactivate_tracing
-
-    async def _trace_worker(self, trace_context: TraceContext) -> None:
-        while trace_context.running or not trace_context.traces_queue.empty():
-            trace_func, args = await trace_context.traces_queue.get()
-            try:
-                trace_func(*args)
-            except Exception:  # noqa: BLE001
-                logger.exception("Error processing trace_func")
-            finally:
-                trace_context.traces_queue.task_done()
-
-    async def _start(self, trace_context: TraceContext) -> None:
-        if trace_context.running:
-            return
-        try:
-            trace_context.running = True
-            trace_context.worker_task = asyncio.create_task(self._trace_worker(trace_context))
-        except Exception:  # noqa: BLE001
-            logger.exception("Error starting tracing service")
+        settings = self.settings_service.settings
+        self.deactivated = settings.deactivate_tracing
+        self.ot = OpenTelemetry(prometheus_enabled=settings.prometheus_enabled)
+        self.exporter = TraceExporter(
+            workers=settings.trace_export_workers,
+            max_queue_size=settings.trace_export_max_queue_size,
+            batch_size=settings.trace_export_batch_size,
+            drop_policy=settings.trace_export_drop_policy,
+            export_batch=self._export_batch,
+            on_update=self._report_stats,
+        )
+
+    @staticmethod
+    def _export_batch(tracer: BaseTracer, calls: Sequence[Callable[[], None]]) -> None:
+        lock = tracer.lock
+
+        def locked(call: Callable[[], None]) -> Callable[[], None]:
+            def run() -> None:
+                with lock:
+                    call()
+
+            return run
+
+        # Lock each call rather than the whole batch, so the event loop never waits for more than one call
+        tracer.export_batch([locked(call) for call in calls])
+
+    def _export(self, trace_context: TraceContext, trace_func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Hand a tracer call over to the export workers, one lane per tracer."""
+        for tracer in trace_context.tracers.values():
+            if tracer.ready:
+                self.exporter.submit(tracer, trace_func, tracer, *args, **kwargs)
+
+    def _report_stats(self) -> None:
+        """Publish the queue size, dropped spans and export lag of each export worker as metrics."""
+        for index, stats in enumerate(self.exporter.stats()["workers"]):
+            labels = {"worker": str(index)}
+            self.ot.update_gauge("trace_export_pending", stats["pending"], labels)
+            self.ot.update_gauge("trace_export_dropped", stats["dropped"], labels)
+            self.ot.update_gauge("trace_export_max_lag", stats["max_lag"], labels)
+
+    async def flush(self, timeout: float | None = None) -> bool:
+        """Wait until the export workers have processed every queued tracer call."""
+        return await asyncio.to_thread(self.exporter.flush, timeout)
+
+    async def teardown(self) -> None:
+        await asyncio.to_thread(self.exporter.shutdown, 5.0)
 
     def _initialize_langsmith_tracer(self, trace_context: TraceContext) -> None:
         langsmith_tracer = _get_langsmith_tracer()
@@ -205,7 +231,6 @@ class TracingService(Service):
         """Start a trace for a graph run.
 
         - create a trace context
-        - start a worker for this trace context
         - initialize the tracers
         """
         if self.deactivated:
@@ -214,7 +239,7 @@ class TracingService(Service):
             project_name = project_name or os.getenv("LANGCHAIN_PROJECT", "Langflow")
             trace_context = TraceContext(run_id, run_name, project_name, user_id, session_id)
             trace_context_var.set(trace_context)
-            await self._start(trace_context)
+            trace_context.running = True
             self._initialize_langsmith_tracer(trace_context)
             self._initialize_langwatch_tracer(trace_context)
             self._initialize_langfuse_tracer(trace_context)
@@ -223,38 +248,18 @@ class TracingService(Service):
         except Exception as e:  # noqa: BLE001
             logger.debug(f"Error initializing tracers: {e}")
 
-    async def _stop(self, trace_context: TraceContext) -> None:
-        try:
-            trace_context.running = False
-            # check the qeue is empty
-            if not trace_context.traces_queue.empty():
-                await trace_context.traces_queue.join()
-            if trace_context.worker_task:
-                trace_context.worker_task.cancel()
-                trace_context.worker_task = None
-
-        except Exception:  # noqa: BLE001
-            logger.exception("Error stopping tracing service")
-
-    def _end_all_tracers(self, trace_context: TraceContext, outputs: dict, error: Exception | None = None) -> None:
-        for tracer in trace_context.tracers.values():
-            if tracer.ready:
-                try:
-                    # why all_inputs and all_outputs? why metadata=outputs?
-                    tracer.end(
-                        trace_context.all_inputs,
-                        outputs=trace_context.all_outputs,
-                        error=error,
-                        metadata=outputs,
-                    )
-                except Exception:  # noqa: BLE001
-                    logger.exception("Error ending all traces")
+    @staticmethod
+    def _end_tracer(
+        tracer: BaseTracer, inputs: dict, outputs: dict, error: Exception | None, metadata: dict | None
+    ) -> None:
+        # why all_inputs and all_outputs? why metadata=outputs?
+        tracer.end(inputs, outputs=outputs, error=error, metadata=metadata)
 
     async def end_tracers(self, outputs: dict, error: Exception | None = None) -> None:
         """End the trace for a graph run.
 
-        - stop worker for current trace_context
-        - call end for all the tracers
+        - queue the end of the run for all the tracers, after the component traces already queued
+        - return without waiting for the tracing backends, see `flush`
         """
         if self.deactivated:
             return
@@ -262,8 +267,16 @@ class TracingService(Service):
         if trace_context is None:
             msg = "called end_tracers but no trace context found"
             raise RuntimeError(msg)
-        await self._stop(trace_context)
-        self._end_all_tracers(trace_context, outputs, error)
+        trace_context.running = False
+        self._export(
+            trace_context,
+            self._end_tracer,
+            trace_context.all_inputs,
+            trace_context.all_outputs,
+            error,
+            outputs,
+            droppable=False,
+        )
 
     @staticmethod
     def _cleanup_inputs(inputs: dict[str, Any]):
@@ -273,47 +286,37 @@ class TracingService(Service):
                 inputs[key] = "*****"  # avoid logging api_keys for security reasons
         return inputs
 
-    def _start_component_traces(
-        self,
-        component_trace_context: ComponentTraceContext,
-        trace_context: TraceContext,
-    ) -> None:
-        inputs = self._cleanup_inputs(component_trace_context.inputs)
-        component_trace_context.inputs = inputs
-        component_trace_context.inputs_metadata = component_trace_context.inputs_metadata or {}
-        for tracer in trace_context.tracers.values():
-            if not tracer.ready:
-                continue
-            try:
-                tracer.add_trace(
-                    component_trace_context.trace_id,
-                    component_trace_context.trace_name,
-                    component_trace_context.trace_type,
-                    inputs,
-                    component_trace_context.inputs_metadata,
-                    component_trace_context.vertex,
-                )
-            except Exception:  # noqa: BLE001
-                logger.exception(f"Error starting trace {component_trace_context.trace_name}")
-
-    def _end_component_traces(
-        self,
+    @staticmethod
+    def _start_component_trace(tracer: BaseTracer, component_trace_context: ComponentTraceContext) -> None:
+        try:
+            tracer.add_trace(
+                component_trace_context.trace_id,
+                component_trace_context.trace_name,
+                component_trace_context.trace_type,
+                component_trace_context.inputs,
+                component_trace_context.inputs_metadata,
+                component_trace_context.vertex,
+            )
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Error starting trace {component_trace_context.trace_name}")
+
+    @staticmethod
+    def _end_component_trace(
+        tracer: BaseTracer,
         component_trace_context: ComponentTraceContext,
-        trace_context: TraceContext,
+        outputs: dict[str, Any],
         error: Exception | None = None,
     ) -> None:
-        for tracer in trace_context.tracers.values():
-            if tracer.ready:
-                try:
-                    tracer.end_trace(
-                        trace_id=component_trace_context.trace_id,
-                        trace_name=component_trace_context.trace_name,
-                        outputs=trace_context.all_outputs[component_trace_context.trace_name],
-                        error=error,
-                        logs=component_trace_context.logs[component_trace_context.trace_name],
-                    )
-                except Exception:  # noqa: BLE001
-                    logger.exception(f"Error ending trace {component_trace_context.trace_name}")
+        try:
+            tracer.end_trace(
+                trace_id=component_trace_context.trace_id,
+                trace_name=component_trace_context.trace_name,
+                outputs=outputs,
+                error=error,
+                logs=component_trace_context.logs[component_trace_context.trace_name],
+            )
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Error ending trace {component_trace_context.trace_name}")
 
     @asynccontextmanager
     async def trace_component(
@@ -346,17 +349,26 @@ class TracingService(Service):
             msg = "called trace_component but no trace context found"
             raise RuntimeError(msg)
         trace_context.all_inputs[trace_name] |= inputs or {}
-        await trace_context.traces_queue.put((self._start_component_traces, (component_trace_context, trace_context)))
+        component_trace_context.inputs = self._cleanup_inputs(component_trace_context.inputs)
+        # The start and end of the component are kept or dropped together by the exporter
+        self._export(trace_context, self._start_component_trace, component_trace_context, trace=component_trace_context)
+        error: Exception | None = None
         try:
             yield self
         except Exception as e:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, e))
-            )
+            error = e
             raise
-        else:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, None))
+        finally:
+            # Also end the trace of a cancelled build, so the exporter doesn't keep it open
+            outputs = trace_context.all_outputs[trace_name]
+            self._export(
+                trace_context,
+                self._end_component_trace,
+                component_trace_context,
+                outputs,
+                error,
+                trace=component_trace_context,
+                ends_trace=True,
             )
 
     @property
@@ -418,7 +430,8 @@ class TracingService(Service):
         for tracer in trace_context.tracers.values():
             if not tracer.ready:  # type: ignore[truthy-function]
                 continue
-            langchain_callback = tracer.get_langchain_callback()
+            with tracer.lock:
+                langchain_callback = tracer.get_langchain_callback()
             if langchain_callback:
                 callbacks.append(langchain_callback)
         return callbacks
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from loguru import logger
@@ -130,6 +131,16 @@ async def teardown_superuser(settings_service, session: AsyncSession) -> None:
 
 async def teardown_services() -> None:
     """Teardown all the services."""
+    try:
+        from langflow.services.manager import service_manager
+
+        # Write the buffered rows and API key uses while the database service is still up
+        if (write_behind_service := service_manager.services.get(ServiceType.WRITE_BEHIND_SERVICE)) is not None:
+            await write_behind_service.stop()
+        if (api_key_cache_service := service_manager.services.get(ServiceType.API_KEY_CACHE_SERVICE)) is not None:
+            await api_key_cache_service.stop()
+    except Exception as exc:  # noqa: BLE001
+        logger.exception(exc)
     try:
         async with get_db_service().with_session() as session:
             await teardown_superuser(get_settings_service(), session)
@@ -243,3 +254,32 @@ async def initialize_services(*, fix_migration: bool = False) -> None:
         logger.warning(f"Error assigning orphaned flows to the superuser: {exc!s}")
     await clean_transactions(settings_service, session)
     await clean_vertex_builds(settings_service, session)
+    configure_component_class_cache(settings_service)
+    configure_component_code_cache(settings_service)
+    configure_graph_plan_cache(settings_service)
+
+
+def configure_component_class_cache(settings_service: SettingsService) -> None:
+    """Apply the configured size limit to the compiled component class cache."""
+    from langflow.custom.eval import component_class_cache
+
+    component_class_cache.resize(settings_service.settings.component_class_cache_size)
+
+
+def configure_component_code_cache(settings_service: SettingsService) -> None:
+    """Point the persistent component code cache at its directory, or disable it."""
+    from langflow.custom.code_cache import component_code_cache
+    from langflow.utils.version import get_version_info
+
+    settings = settings_service.settings
+    cache_dir = None
+    if settings.component_code_cache and (settings.component_code_cache_dir or settings.config_dir):
+        cache_dir = settings.component_code_cache_dir or Path(settings.config_dir) / "component_cache"
+    component_code_cache.configure(cache_dir, get_version_info()["version"])
+
+
+def configure_graph_plan_cache(settings_service: SettingsService) -> None:
+    """Apply the configured size limit to the compiled flow plan cache."""
+    from langflow.graph.graph.plan import graph_plan_cache
+
+    graph_plan_cache.resize(settings_service.settings.graph_plan_cache_size)
@@ -1,4 +1,6 @@
 import abc
+from collections.abc import Iterable
+from typing import NamedTuple
 from uuid import UUID
 
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -7,6 +9,13 @@ from langflow.services.base import Service
 from langflow.services.database.models.variable.model import Variable, VariableRead
 
 
+class ResolvedVariable(NamedTuple):
+    """The type and decrypted value of a variable."""
+
+    type: str | None
+    value: str
+
+
 class VariableService(Service):
     """Abstract base class for a variable service."""
 
@@ -35,6 +44,25 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    async def get_variables(
+        self,
+        user_id: UUID | str,  # noqa: ARG002
+        names: Iterable[str],  # noqa: ARG002
+        session: AsyncSession,  # noqa: ARG002
+    ) -> dict[str, ResolvedVariable] | None:
+        """Get the values of several variables at once.
+
+        Args:
+            user_id: The user ID.
+            names: The names of the variables.
+            session: The database session.
+
+        Returns:
+            The variables that were found and have a value, by name, or None if the service cannot look up
+            several variables at once, in which case callers use `get_variable`.
+        """
+        return None
+
     @abc.abstractmethod
     async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
         """List all variables.
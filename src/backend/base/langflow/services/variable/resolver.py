@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from langflow.services.deps import get_variable_service, session_scope
+from langflow.services.variable.constants import CREDENTIAL_TYPE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from langflow.services.variable.base import ResolvedVariable, VariableService
+
+
+class VariableResolver:
+    """Resolves the `load_from_db` fields of a graph run, loading the variables they use in one query.
+
+    The resolver is created when the graph is prepared, with the names of the variables its vertices
+    refer to. The first lookup of a user loads all of them at once and keeps their decrypted values for
+    the rest of the run, so components sharing a variable such as `OPENAI_API_KEY` don't query the
+    database and decrypt it again. Names that were not known up front are loaded on first use.
+
+    Lookups behave like `VariableService.get_variable`. If the variable service cannot look up several
+    variables at once, every lookup is delegated to `get_variable`.
+
+    Attributes:
+        names (set[str]): The variables loaded by the first lookup of a user.
+        queries (int): The number of batched lookups made.
+    """
+
+    def __init__(self, names: Iterable[str] = (), variable_service: VariableService | None = None) -> None:
+        self.names = set(names)
+        self._variable_service = variable_service
+        self._resolved: dict[UUID, dict[str, ResolvedVariable | None]] = {}
+        self._lock = asyncio.Lock()
+        self._batched = True
+        self.queries = 0
+
+    @property
+    def variable_service(self) -> VariableService:
+        if self._variable_service is None:
+            self._variable_service = get_variable_service()
+        return self._variable_service
+
+    async def _load(self, user_id: UUID, name: str) -> dict[str, ResolvedVariable | None] | None:
+        if not self._batched:
+            return None
+        resolved = self._resolved.get(user_id)
+        if resolved is not None and name in resolved:
+            return resolved
+        async with self._lock:
+            resolved = self._resolved.setdefault(user_id, {})
+            if name in resolved:
+                return resolved
+            names = {name} if resolved else self.names | {name}
+            async with session_scope() as session:
+                variables = await self.variable_service.get_variables(user_id, names, session)
+            if variables is None:
+                self._batched = False
+                return None
+            self.queries += 1
+            resolved.update((variable_name, variables.get(variable_name)) for variable_name in names)
+            return resolved
+
+    async def get_variable(self, user_id: UUID | str, name: str, field: str) -> str:
+        """Get the decrypted value of a variable of a user, for the field `field` of a component."""
+        user_id = UUID(str(user_id))
+        resolved = await self._load(user_id, name)
+        if resolved is None:
+            async with session_scope() as session:
+                return await self.variable_service.get_variable(
+                    user_id=user_id, name=name, field=field, session=session
+                )
+
+        variable = resolved[name]
+        if variable is None:
+            msg = f"{name} variable not found."
+            raise ValueError(msg)
+        if variable.type == CREDENTIAL_TYPE and field == "session_id":
+            msg = (
+                f"variable {name} of type 'Credential' cannot be used in a Session ID field "
+                "because its purpose is to prevent the exposure of values."
+            )
+            raise TypeError(msg)
+        return variable.value
@@ -1,22 +1,23 @@
 from __future__ import annotations
 
 import os
+import time
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
+from uuid import UUID
 
 from loguru import logger
-from sqlmodel import select
+from sqlmodel import col, select
 from typing_extensions import override
 
 from langflow.services.auth import utils as auth_utils
 from langflow.services.base import Service
 from langflow.services.database.models.variable.model import Variable, VariableCreate, VariableRead, VariableUpdate
-from langflow.services.variable.base import VariableService
+from langflow.services.variable.base import ResolvedVariable, VariableService
 from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
-    from uuid import UUID
+    from collections.abc import Iterable, Sequence
 
     from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -26,6 +27,12 @@ if TYPE_CHECKING:
 class DatabaseVariableService(VariableService, Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        # Values returned by `get_variables` by user, with their expiry, when `variable_cache_ttl` is set
+        self._cache: dict[UUID, dict[str, tuple[float, ResolvedVariable | None]]] = {}
+
+    def invalidate_cache(self, user_id: UUID | str) -> None:
+        """Drop the cached variables of a user. Called whenever one of its variables changes."""
+        self._cache.pop(UUID(str(user_id)), None)
 
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -80,6 +87,38 @@ class DatabaseVariableService(VariableService, Service):
         # we decrypt the value
         return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
 
+    @override
+    async def get_variables(
+        self, user_id: UUID | str, names: Iterable[str], session: AsyncSession
+    ) -> dict[str, ResolvedVariable]:
+        user_id = UUID(str(user_id))
+        names = set(names)
+        ttl = self.settings_service.settings.variable_cache_ttl
+        now = time.monotonic()
+        cached = self._cache.get(user_id, {}) if ttl > 0 else {}
+        resolved: dict[str, ResolvedVariable] = {}
+        missing = set()
+        for name in names:
+            entry = cached.get(name)
+            if entry is None or entry[0] <= now:
+                missing.add(name)
+            elif entry[1] is not None:
+                resolved[name] = entry[1]
+        if not missing:
+            return resolved
+
+        stmt = select(Variable).where(Variable.user_id == user_id, col(Variable.name).in_(missing))
+        loaded: dict[str, ResolvedVariable | None] = dict.fromkeys(missing)
+        for variable in (await session.exec(stmt)).all():
+            if variable.value:
+                value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+                loaded[variable.name] = ResolvedVariable(variable.type, value)
+        if ttl > 0:
+            # Unknown names are cached too, so a flow that falls back to environment variables stays cheap
+            self._cache.setdefault(user_id, {}).update((name, (now + ttl, value)) for name, value in loaded.items())
+        resolved.update((name, value) for name, value in loaded.items() if value is not None)
+        return resolved
+
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
         variables = list((await session.exec(stmt)).all())
@@ -121,6 +160,7 @@ class DatabaseVariableService(VariableService, Service):
         variable.value = encrypted
         session.add(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
         await session.refresh(variable)
         return variable
 
@@ -145,6 +185,7 @@ class DatabaseVariableService(VariableService, Service):
 
         session.add(db_variable)
         await session.commit()
+        self.invalidate_cache(user_id)
         await session.refresh(db_variable)
         return db_variable
 
@@ -162,6 +203,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
 
     @override
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
@@ -172,6 +214,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
 
     async def create_variable(
         self,
@@ -192,5 +235,6 @@ class DatabaseVariableService(VariableService, Service):
         variable = Variable.model_validate(variable_base, from_attributes=True, update={"user_id": user_id})
         session.add(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
         await session.refresh(variable)
         return variable
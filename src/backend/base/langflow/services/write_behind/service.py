@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import exc as sqlalchemy_exc
+
+from langflow.services.base import Service
+from langflow.services.database.models.transactions.crud import prune_transactions
+from langflow.services.database.models.transactions.model import TransactionTable
+from langflow.services.database.models.vertex_builds.crud import prune_vertex_builds
+from langflow.services.database.models.vertex_builds.model import VertexBuildTable
+from langflow.services.database.utils import session_getter
+from langflow.services.deps import get_db_service
+
+if TYPE_CHECKING:
+    from sqlmodel import SQLModel
+
+    from langflow.services.database.models.message.model import MessageTable
+    from langflow.services.database.models.transactions.model import TransactionBase
+    from langflow.services.database.models.vertex_builds.model import VertexBuildBase
+    from langflow.services.settings.service import SettingsService
+
+TRANSACTION = "transaction"
+VERTEX_BUILD = "vertex_build"
+MESSAGE = "message"
+ROW_KINDS = (TRANSACTION, VERTEX_BUILD, MESSAGE)
+
+
+class WriteBehindService(Service):
+    """Buffers transaction, vertex build and message rows and writes them to the database in bulk.
+
+    Logging a transaction or a vertex build used to open a session, insert one row, run the retention
+    query and commit, once per vertex. Rows are now appended to a bounded in-memory buffer and a
+    background worker writes each kind with a single bulk INSERT and commit when `batch_size` rows are
+    pending or every `flush_interval` seconds. Retention pruning runs every `retention_interval` seconds
+    for the flows and vertices that received rows since the previous run.
+
+    Rows are only buffered while the worker runs, see `start`, and while the buffer holds fewer than
+    `max_buffer_size` rows, so memory never grows without bound. Otherwise the `enqueue_*` methods return
+    False and the caller writes the row directly, so a full buffer slows callers down instead of losing rows.
+
+    Attributes:
+        flushed (dict[str, int]): Rows written to the database, per kind.
+        overflowed (dict[str, int]): Rows handed back to the caller because the buffer was full, per kind.
+        failed (dict[str, int]): Rows that could not be written, per kind.
+    """
+
+    name = "write_behind_service"
+
+    def __init__(self, settings_service: SettingsService) -> None:
+        settings = settings_service.settings
+        self.enabled = settings.write_behind_enabled
+        self.batch_size = max(settings.write_behind_batch_size, 1)
+        self.flush_interval = settings.write_behind_flush_interval
+        self.max_buffer_size = settings.write_behind_max_buffer_size
+        self.retention_interval = settings.write_behind_retention_interval
+        self.max_transactions_to_keep = settings.max_transactions_to_keep
+        self.max_vertex_builds_to_keep = settings.max_vertex_builds_to_keep
+        self.max_vertex_builds_per_vertex = settings.max_vertex_builds_per_vertex
+        self._buffers: dict[str, list[SQLModel]] = {kind: [] for kind in ROW_KINDS}
+        self._pending_flows: set[UUID] = set()
+        self._pending_vertices: set[tuple[UUID, str]] = set()
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._worker_task: asyncio.Task | None = None
+        self._last_pruned = time.monotonic()
+        self.flushed: dict[str, int] = dict.fromkeys(ROW_KINDS, 0)
+        self.overflowed: dict[str, int] = dict.fromkeys(ROW_KINDS, 0)
+        self.failed: dict[str, int] = dict.fromkeys(ROW_KINDS, 0)
+
+    @property
+    def running(self) -> bool:
+        return self._worker_task is not None and not self._worker_task.done()
+
+    def pending(self, kind: str | None = None) -> int:
+        """The number of buffered rows, of one kind or in total."""
+        if kind is not None:
+            return len(self._buffers[kind])
+        return sum(len(rows) for rows in self._buffers.values())
+
+    def enqueue_transaction(self, transaction: TransactionBase) -> bool:
+        """Buffer a transaction. Returns False if the caller should write it directly."""
+        if not self.running or not self._append(TRANSACTION, TransactionTable(**transaction.model_dump())):
+            return False
+        self._pending_flows.add(transaction.flow_id)
+        return True
+
+    def enqueue_vertex_build(self, vertex_build: VertexBuildBase) -> bool:
+        """Buffer a vertex build. Returns False if the caller should write it directly."""
+        if not self.running or not self._append(VERTEX_BUILD, VertexBuildTable(**vertex_build.model_dump())):
+            return False
+        self._pending_vertices.add((vertex_build.flow_id, vertex_build.id))
+        return True
+
+    def enqueue_message(self, message: MessageTable) -> bool:
+        """Buffer a message that nothing reads back right away. Returns False if the caller should write it directly.
+
+        `aget_messages` flushes the buffered messages before querying, so reads still see them.
+        """
+        return self.running and self._append(MESSAGE, message)
+
+    def _append(self, kind: str, row: SQLModel) -> bool:
+        if self.max_buffer_size and self.pending() >= self.max_buffer_size:
+            self.overflowed[kind] += 1
+            if self.overflowed[kind] == 1 or self.overflowed[kind] % 1000 == 0:
+                logger.warning(
+                    f"Write-behind buffer is full, {self.overflowed[kind]} {kind} rows written directly so far"
+                )
+            return False
+        buffer = self._buffers[kind]
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def discard_flow(self, flow_id: UUID) -> int:
+        """Drop the buffered rows of a flow that is being deleted. Returns the number of rows dropped."""
+        if isinstance(flow_id, str):
+            flow_id = UUID(flow_id)
+        removed = 0
+        for kind, rows in self._buffers.items():
+            kept = [row for row in rows if getattr(row, "flow_id", None) != flow_id]
+            removed += len(rows) - len(kept)
+            self._buffers[kind] = kept
+        self._pending_flows.discard(flow_id)
+        self._pending_vertices = {key for key in self._pending_vertices if key[0] != flow_id}
+        return removed
+
+    async def flush(self, kind: str | None = None) -> int:
+        """Write the buffered rows, of one kind or all of them. Returns the number of rows written."""
+        kinds = [kind] if kind is not None else list(ROW_KINDS)
+        # A flush in progress may still be writing rows that are no longer buffered, so wait for it
+        if not any(self._buffers[kind_] for kind_ in kinds) and not self._flush_lock.locked():
+            return 0
+        async with self._flush_lock:
+            written = 0
+            for kind_ in kinds:
+                rows, self._buffers[kind_] = self._buffers[kind_], []
+                if rows:
+                    written += await self._write(kind_, rows)
+            return written
+
+    async def _write(self, kind: str, rows: list[SQLModel]) -> int:
+        try:
+            async with session_getter(get_db_service()) as session:
+                session.add_all(rows)
+                await session.commit()
+        except sqlalchemy_exc.IntegrityError:
+            # e.g. a row of a flow that was deleted meanwhile: keep the rows that can still be written
+            return await self._write_one_by_one(kind, rows)
+        except Exception:  # noqa: BLE001
+            self.failed[kind] += len(rows)
+            logger.exception(f"Error writing {len(rows)} {kind} rows")
+            return 0
+        self.flushed[kind] += len(rows)
+        return len(rows)
+
+    async def _write_one_by_one(self, kind: str, rows: list[SQLModel]) -> int:
+        written = 0
+        async with session_getter(get_db_service()) as session:
+            for row in rows:
+                try:
+                    session.add(row)
+                    await session.commit()
+                    written += 1
+                except sqlalchemy_exc.SQLAlchemyError:
+                    await session.rollback()
+                    self.failed[kind] += 1
+        self.flushed[kind] += written
+        if written < len(rows):
+            logger.debug(f"Could not write {len(rows) - written} of {len(rows)} {kind} rows")
+        return written
+
+    async def prune(self) -> None:
+        """Apply the retention limits to the flows and vertices that received rows since the last run."""
+        flow_ids, self._pending_flows = self._pending_flows, set()
+        vertices, self._pending_vertices = self._pending_vertices, set()
+        self._last_pruned = time.monotonic()
+        if not flow_ids and not vertices:
+            return
+        try:
+            async with session_getter(get_db_service()) as session:
+                if flow_ids:
+                    await prune_transactions(session, flow_ids, self.max_transactions_to_keep)
+                if vertices:
+                    await prune_vertex_builds(
+                        session,
+                        vertices,
+                        max_builds_to_keep=self.max_vertex_builds_to_keep,
+                        max_builds_per_vertex=self.max_vertex_builds_per_vertex,
+                    )
+                await session.commit()
+        except Exception:  # noqa: BLE001
+            logger.exception("Error pruning transactions and vertex builds")
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            self._wakeup.clear()
+            await self.flush()
+            if time.monotonic() - self._last_pruned >= self.retention_interval:
+                await self.prune()
+
+    def start(self) -> None:
+        if not self.enabled or self.running:
+            return
+        self._worker_task = asyncio.create_task(self._run())
+        logger.debug("Write-behind service started")
+
+    async def stop(self) -> None:
+        """Stop the worker, then write every buffered row and apply retention."""
+        if self._worker_task is not None:
+            self._worker_task.cancel()
+            await asyncio.wait([self._worker_task])
+            self._worker_task = None
+        await self.flush()
+        await self.prune()
+
+    async def teardown(self) -> None:
+        await self.stop()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            "pending": {kind: len(rows) for kind, rows in self._buffers.items()},
+            "flushed": dict(self.flushed),
+            "overflowed": dict(self.overflowed),
+            "failed": dict(self.failed),
+        }
+
+
+async def flush_pending_writes(kind: str | None = None) -> None:
+    """Write the rows buffered by the write-behind service, if it is running, so a query can see them."""
+    from langflow.services.deps import get_write_behind_service
+
+    await get_write_behind_service().flush(kind)
+
+
+def discard_pending_writes(flow_id: UUID) -> None:
+    """Drop the rows buffered for a flow that is being deleted."""
+    from langflow.services.deps import get_write_behind_service
+
+    get_write_behind_service().discard_flow(flow_id)
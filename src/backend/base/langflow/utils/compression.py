@@ -1,10 +1,20 @@
 import gzip
+import hashlib
 import json
 from typing import Any
 
-from fastapi import Response
+import orjson
+from fastapi import Request, Response
 from fastapi.encoders import jsonable_encoder
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Served when the client accepts them, in order of preference
+PAYLOAD_ENCODINGS = ("br", "gzip")
+
 
 def compress_response(data: Any) -> Response:
     """Compress data and return it as a FastAPI Response with appropriate headers."""
@@ -17,3 +27,76 @@ def compress_response(data: Any) -> Response:
         media_type="application/json",
         headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding", "Content-Length": str(len(compressed_data))},
     )
+
+
+class EncodedPayload:
+    """A JSON payload serialized and compressed once, to be served many times.
+
+    Attributes:
+        body (bytes): The JSON document.
+        encoded (dict[str, bytes]): The compressed variants of `body`, by content coding. Brotli is only
+            included when the `brotli` package is installed.
+        etag (str): A weak ETag derived from a hash of `body`, shared by all the variants.
+    """
+
+    def __init__(self, body: bytes, encoded: dict[str, bytes]) -> None:
+        self.body = body
+        self.encoded = encoded
+        self.etag = f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+    def __len__(self) -> int:
+        return len(self.body)
+
+
+def encode_payload(data: Any) -> EncodedPayload:
+    """Serialize `data` to JSON and compress it with gzip and, if available, brotli.
+
+    This is CPU bound for large payloads, so call it from a worker thread.
+    """
+    body = orjson.dumps(data, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS)
+    encoded = {"gzip": gzip.compress(body, compresslevel=6)}
+    if brotli is not None:
+        encoded["br"] = brotli.compress(body, quality=5)
+    return EncodedPayload(body, encoded)
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        quality = next((param[2:] for param in params if param.startswith("q=")), "1")
+        try:
+            if float(quality) <= 0:
+                continue
+        except ValueError:
+            continue
+        if coding:
+            accepted.add(coding.lower())
+    return accepted
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header matches `etag`, using the weak comparison."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def payload_response(payload: EncodedPayload, request: Request) -> Response:
+    """Serve a precomputed payload, or 304 Not Modified if the client already has it.
+
+    The variant is picked from the Accept-Encoding header of the request. Clients are asked to revalidate
+    before reusing their copy, which costs them a 304 when nothing changed.
+    """
+    headers = {"ETag": payload.etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), payload.etag):
+        return Response(status_code=304, headers=headers)
+    accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+    for coding in PAYLOAD_ENCODINGS:
+        if coding in payload.encoded and (coding in accepted or "*" in accepted):
+            headers["Content-Encoding"] = coding
+            return Response(content=payload.encoded[coding], media_type="application/json", headers=headers)
+    return Response(content=payload.body, media_type="application/json", headers=headers)
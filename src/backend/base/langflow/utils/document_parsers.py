@@ -0,0 +1,22 @@
+"""CPU bound document parsers.
+
+This module only imports the standard library and the parser libraries, so the worker processes of
+`langflow.base.data.utils.get_file_process_pool` start without importing Langflow.
+"""
+
+from pathlib import Path
+
+
+def read_docx_file(file_path: str) -> str:
+    from docx import Document
+
+    doc = Document(file_path)
+    return "\n\n".join([p.text for p in doc.paragraphs])
+
+
+def parse_pdf_to_text(file_path: str) -> str:
+    from pypdf import PdfReader
+
+    with Path(file_path).open("rb") as f:
+        reader = PdfReader(f)
+        return "\n\n".join([page.extract_text() for page in reader.pages])
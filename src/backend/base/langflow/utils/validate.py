@@ -2,8 +2,8 @@ import ast
 import contextlib
 import importlib
 import warnings
-from types import FunctionType
-from typing import Optional, Union
+from types import CodeType, FunctionType
+from typing import NamedTuple, Optional, Union
 
 from langchain_core._api.deprecation import LangChainDeprecationWarning
 from loguru import logger
@@ -169,6 +169,19 @@ def create_function(code, function_name):
     return wrapped_function
 
 
+class CompiledClass(NamedTuple):
+    """The compiled form of a class definition string, ready to be executed without parsing it again.
+
+    `steps` holds the module-level statements in order: `("import", name, module)` and
+    `("import_from", module, names)` tuples for imports, and `("exec", code)` tuples for
+    class, function and assignment statements. Every field can be serialized with `marshal`.
+    """
+
+    class_name: str
+    steps: tuple[tuple, ...]
+    class_code: CodeType
+
+
 def create_class(code, class_name):
     """Dynamically create a class from a string of code and a specified class name.
 
@@ -182,6 +195,19 @@ def create_class(code, class_name):
     Raises:
         ValueError: If the code contains syntax errors or the class definition is invalid
     """
+    return build_compiled_class(compile_class(code, class_name))
+
+
+def compile_class(code: str, class_name: str) -> CompiledClass:
+    """Parse and compile a class definition string without executing it.
+
+    Args:
+        code: String containing the Python code defining the class
+        class_name: Name of the class to be compiled
+
+    Returns:
+        The compiled module statements and class body.
+    """
     if not hasattr(ast, "TypeIgnore"):
         ast.TypeIgnore = create_type_ignore_class()
 
@@ -194,12 +220,22 @@ def create_class(code, class_name):
     # Add DEFAULT_IMPORT_STRING
     code = DEFAULT_IMPORT_STRING + "\n" + code
     module = ast.parse(code)
-    exec_globals = prepare_global_scope(module)
+    steps = compile_global_scope(module)
 
     class_code = extract_class_code(module, class_name)
-    compiled_class = compile_class_code(class_code)
+    return CompiledClass(class_name, steps, compile_class_code(class_code))
+
+
+def build_compiled_class(compiled: CompiledClass):
+    """Execute a compiled class definition and return the class.
+
+    Raises:
+        ModuleNotFoundError: If a module imported by the code is not installed
+        ValueError: If the class definition is invalid
+    """
+    exec_globals = execute_global_scope(compiled.steps)
     try:
-        return build_class_constructor(compiled_class, exec_globals, class_name)
+        return build_class_constructor(compiled.class_code, exec_globals, compiled.class_name)
     except ValidationError as e:
         messages = [error["msg"].split(",", 1) for error in e.errors()]
         error_message = "\n".join([message[1] if len(message) > 1 else message[0] for message in messages])
@@ -231,41 +267,64 @@ def prepare_global_scope(module):
     Raises:
         ModuleNotFoundError: If a module is not found in the code
     """
-    exec_globals = globals().copy()
+    return execute_global_scope(compile_global_scope(module))
+
+
+def compile_global_scope(module) -> tuple[tuple, ...]:
+    """Compiles the imports and definitions of a module into the steps run by `execute_global_scope`.
+
+    Args:
+        module: AST parsed module
+
+    Returns:
+        The module-level statements in order, see `CompiledClass.steps`
+    """
+    steps: list[tuple] = []
     for node in module.body:
         if isinstance(node, ast.Import):
-            for alias in node.names:
-                try:
-                    exec_globals[alias.asname or alias.name] = importlib.import_module(alias.name)
-                except ModuleNotFoundError as e:
-                    msg = f"Module {alias.name} not found. Please install it and try again."
-                    raise ModuleNotFoundError(msg) from e
+            steps.extend(("import", alias.asname or alias.name, alias.name) for alias in node.names)
         elif isinstance(node, ast.ImportFrom) and node.module is not None:
+            steps.append(("import_from", node.module, tuple(alias.name for alias in node.names)))
+        elif isinstance(node, ast.ClassDef | ast.FunctionDef | ast.Assign):
+            # Compile and execute the definition to properly create classes and functions
+            steps.append(("exec", compile(ast.Module(body=[node], type_ignores=[]), "<string>", "exec")))
+    return tuple(steps)
+
+
+def execute_global_scope(steps: tuple[tuple, ...]) -> dict:
+    """Runs the steps returned by `compile_global_scope` and returns the resulting global scope.
+
+    Raises:
+        ModuleNotFoundError: If a module is not found in the code
+    """
+    exec_globals = globals().copy()
+    for kind, *args in steps:
+        if kind == "import":
+            name, module_name = args
+            try:
+                exec_globals[name] = importlib.import_module(module_name)
+            except ModuleNotFoundError as e:
+                msg = f"Module {module_name} not found. Please install it and try again."
+                raise ModuleNotFoundError(msg) from e
+        elif kind == "import_from":
+            module_name, names = args
             try:
                 with warnings.catch_warnings():
                     warnings.simplefilter("ignore", LangChainDeprecationWarning)
-                    imported_module = importlib.import_module(node.module)
-                    for alias in node.names:
+                    imported_module = importlib.import_module(module_name)
+                    for name in names:
                         try:
                             # First try getting it as an attribute
-                            exec_globals[alias.name] = getattr(imported_module, alias.name)
+                            exec_globals[name] = getattr(imported_module, name)
                         except AttributeError:
                             # If that fails, try importing the full module path
-                            full_module_path = f"{node.module}.{alias.name}"
-                            exec_globals[alias.name] = importlib.import_module(full_module_path)
+                            full_module_path = f"{module_name}.{name}"
+                            exec_globals[name] = importlib.import_module(full_module_path)
             except ModuleNotFoundError as e:
-                msg = f"Module {node.module} not found. Please install it and try again"
+                msg = f"Module {module_name} not found. Please install it and try again"
                 raise ModuleNotFoundError(msg) from e
-        elif isinstance(node, ast.ClassDef):
-            # Compile and execute the class definition to properly create the class
-            class_code = compile(ast.Module(body=[node], type_ignores=[]), "<string>", "exec")
-            exec(class_code, exec_globals)
-        elif isinstance(node, ast.FunctionDef):
-            function_code = compile(ast.Module(body=[node], type_ignores=[]), "<string>", "exec")
-            exec(function_code, exec_globals)
-        elif isinstance(node, ast.Assign):
-            assign_code = compile(ast.Module(body=[node], type_ignores=[]), "<string>", "exec")
-            exec(assign_code, exec_globals)
+        else:
+            exec(args[0], exec_globals)
     return exec_globals
 
 
@@ -0,0 +1,176 @@
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+from langflow.base.data import BaseFileComponent
+from langflow.base.data import utils as data_utils
+from langflow.base.data.utils import (
+    TEXT_FILE_TYPES,
+    iter_load_data,
+    parallel_load_data,
+    parse_text_file_to_data,
+)
+from langflow.schema import Data
+
+
+class RecordingFileComponent(BaseFileComponent):
+    """Parses text files and records the files of every batch handed to `process_files`."""
+
+    VALID_EXTENSIONS = TEXT_FILE_TYPES
+    inputs = [*BaseFileComponent._base_inputs]
+    outputs = [*BaseFileComponent._base_outputs]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batches: list[list[Path]] = []
+
+    def process_files(self, file_list):
+        if not file_list:
+            msg = "No files to process."
+            raise ValueError(msg)
+        self.batches.append([file.path for file in file_list])
+        data = [parse_text_file_to_data(str(file.path), silent_errors=self.silent_errors) for file in file_list]
+        return self.rollup_data(file_list, data)
+
+
+def make_component(*paths: Path, **attributes) -> RecordingFileComponent:
+    component = RecordingFileComponent()
+    component.set_attributes(
+        {
+            "path": [str(path) for path in paths],
+            "silent_errors": False,
+            **attributes,
+        }
+    )
+    return component
+
+
+def write_zip(path: Path, members: dict[str, bytes]) -> Path:
+    with zipfile.ZipFile(path, "w") as bundle:
+        for name, content in members.items():
+            bundle.writestr(name, content)
+    return path
+
+
+def write_tar(path: Path, members: dict[str, bytes]) -> Path:
+    with tarfile.open(path, "w:gz") as bundle:
+        for name, content in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            bundle.addfile(info, io.BytesIO(content))
+    return path
+
+
+def texts(data_list: list[Data]) -> list[str]:
+    return sorted(data.data["text"] for data in data_list)
+
+
+def test_bundle_members_are_streamed_in_batches_and_deleted_after_each_batch(tmp_path):
+    bundle = write_zip(tmp_path / "docs.zip", {f"doc{index}.txt": f"text {index}".encode() for index in range(7)})
+    component = make_component(bundle)
+
+    batches = component.stream_files(max_batch_files=3)
+    first = next(batches)
+    assert len(first) == 3
+    assert len(component.batches) == 1
+    assert not any(path.exists() for path in component.batches[0])
+    rest = [data for batch in batches for data in batch]
+
+    assert [len(batch) for batch in component.batches] == [3, 3, 1]
+    assert texts(first + rest) == [f"text {index}" for index in range(7)]
+    assert not any(Path(temp_dir.name).exists() for temp_dir in component._temp_dirs)
+
+
+def test_batches_respect_the_byte_budget(tmp_path):
+    paths = []
+    for index, size in enumerate([30, 30, 30, 120]):
+        path = tmp_path / f"file{index}.txt"
+        path.write_text("x" * size)
+        paths.append(path)
+    component = make_component(*paths)
+
+    data_list = component.load_files_base()
+
+    assert len(data_list) == 4
+    assert [len(batch) for batch in component.stream_files(max_batch_bytes=70)] == [2, 1, 1]
+
+
+def test_nested_tar_and_zip_bundles_are_streamed(tmp_path):
+    inner = write_zip(tmp_path / "inner.zip", {"nested/inner.txt": b"inner", "image.png": b"not text"})
+    bundle = write_tar(tmp_path / "outer.tar.gz", {"outer.md": b"outer", "inner.zip": inner.read_bytes()})
+    inner.unlink()
+    component = make_component(bundle)
+
+    data_list = component.load_files_base()
+
+    assert texts(data_list) == ["inner", "outer"]
+    assert [path.name for batch in component.batches for path in batch] == ["outer.md", "inner.txt"]
+
+
+def test_path_traversal_in_bundles_is_rejected(tmp_path):
+    bundle = write_zip(tmp_path / "evil.zip", {"../evil.txt": b"evil"})
+    component = make_component(bundle)
+
+    with pytest.raises(ValueError, match="Attempted Path Traversal in ZIP File"):
+        component.load_files_base()
+    assert not (tmp_path / "evil.txt").exists()
+
+
+def test_server_files_marked_for_deletion_are_removed_after_processing(tmp_path):
+    server_file = tmp_path / "server.txt"
+    server_file.write_text("server")
+    component = make_component(
+        file_path=[Data(data={"file_path": str(server_file)})], delete_server_file_after_processing=True
+    )
+
+    assert texts(component.load_files_base()) == ["server"]
+    assert not server_file.exists()
+
+
+def test_no_files_still_reaches_process_files(tmp_path):
+    component = make_component(write_zip(tmp_path / "empty.zip", {"image.png": b"not text"}))
+
+    with pytest.raises(ValueError, match="No files to process"):
+        component.load_files_base()
+
+
+def test_iter_load_data_keeps_order_and_bounds_the_files_in_flight(tmp_path, monkeypatch):
+    paths = []
+    for index in range(10):
+        path = tmp_path / f"file{index}.txt"
+        path.write_text(f"text {index}")
+        paths.append(str(path))
+    submitted = []
+    submit_load = data_utils._submit_load
+
+    def recording_submit(load_function, file_path, *, silent_errors):
+        submitted.append(file_path)
+        return submit_load(load_function, file_path, silent_errors=silent_errors)
+
+    monkeypatch.setattr(data_utils, "_submit_load", recording_submit)
+
+    results = iter_load_data(paths, silent_errors=False, max_concurrency=3)
+    assert next(results).data["text"] == "text 0"
+    assert len(submitted) == 3
+    assert [data.data["text"] for data in results] == [f"text {index}" for index in range(1, 10)]
+    assert data_utils.get_file_thread_pool() is data_utils.get_file_thread_pool()
+
+
+def test_documents_are_parsed_in_the_shared_process_pool(tmp_path):
+    from docx import Document
+
+    paths = []
+    for index in range(2):
+        document = Document()
+        document.add_paragraph(f"paragraph {index}")
+        path = tmp_path / f"doc{index}.docx"
+        document.save(path)
+        paths.append(str(path))
+
+    data_list = parallel_load_data(paths, silent_errors=False, max_concurrency=2)
+
+    assert [data.data["text"] for data in data_list] == ["paragraph 0", "paragraph 1"]
+    assert data_utils._process_pool is not None
+    assert parse_text_file_to_data(paths[0], silent_errors=False).data["text"] == "paragraph 0"
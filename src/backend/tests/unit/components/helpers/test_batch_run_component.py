@@ -1,8 +1,12 @@
 import re
+from types import SimpleNamespace
 
 import pytest
-from langflow.components.helpers.batch_run import BatchRunComponent
+from langflow.components.helpers import batch_run
+from langflow.components.helpers.batch_run import BatchRunComponent, _RateLimiter
 from langflow.schema import DataFrame
+from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.deps import get_shared_component_cache_service
 
 from tests.base import ComponentTestBaseWithoutClient
 from tests.unit.mock_language_model import MockLanguageModel
@@ -233,3 +237,136 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
         assert all(str(num) in text for num, text in zip(test_df["text"], result["text_input"], strict=False))
         result_dicts = result.to_dict("records")
         assert all(row["metadata"]["processing_status"] == "success" for row in result_dicts)
+
+    async def test_rows_are_sent_in_chunks_and_logged(self):
+        calls = []
+
+        class RecordingModel(MockLanguageModel):
+            async def abatch(self, messages, *args, **_):
+                calls.append((len(messages), args))
+                return await super().abatch(messages)
+
+        component = BatchRunComponent(
+            model=RecordingModel(),
+            df=DataFrame({"text": [f"row {index}" for index in range(5)]}),
+            column_name="text",
+            chunk_size=2,
+            max_concurrency=3,
+        )
+
+        result = await component.run_batch()
+
+        assert [size for size, _ in calls] == [2, 2, 1]
+        assert all(args == ({"max_concurrency": 3},) for _, args in calls)
+        assert result["batch_index"].tolist() == [0, 1, 2, 3, 4]
+        assert result["model_response"].tolist() == [f"Response for row {index}" for index in range(5)]
+        assert [log.name for log in component._logs] == ["Rows 0-1", "Rows 2-3", "Rows 4-4"]
+
+    async def test_failed_run_resumes_from_the_last_completed_chunk(self):
+        sent = []
+
+        class FlakyModel(MockLanguageModel):
+            fail: bool = True
+
+            async def abatch(self, messages, *_, **__):
+                if self.fail and sent:
+                    self.fail = False
+                    msg = "Rate limit exceeded"
+                    raise RuntimeError(msg)
+                sent.extend(message[-1]["content"] for message in messages)
+                return await super().abatch(messages)
+
+        component = BatchRunComponent(
+            model=FlakyModel(),
+            df=DataFrame({"text": ["a", "b", "c", "d"]}),
+            column_name="text",
+            chunk_size=2,
+        )
+
+        with pytest.raises(RuntimeError, match="Rate limit exceeded"):
+            await component.run_batch()
+        result = await component.run_batch()
+
+        assert sent == ["a", "b", "c", "d"]
+        assert result["text_input"].tolist() == ["a", "b", "c", "d"]
+        assert result["batch_index"].tolist() == [0, 1, 2, 3]
+        # The checkpoint is cleared once the run completes
+        sent.clear()
+        await component.run_batch()
+        assert sent == ["a", "b", "c", "d"]
+
+    async def test_requests_per_minute_limit_waits_for_the_window(self):
+        clock = [0.0]
+        sleeps = []
+
+        async def sleep(delay):
+            sleeps.append(delay)
+            clock[0] += delay
+
+        rate_limiter = _RateLimiter(requests_per_minute=3, clock=lambda: clock[0], sleep=sleep)
+        for _ in range(3):
+            assert rate_limiter.max_batch([1] * 2) == 2
+            await rate_limiter.acquire(2, 2)
+
+        # Each chunk of 2 requests has to wait for the previous one to leave the window
+        assert sleeps == [60.0, 60.0]
+
+    def test_chunks_are_capped_at_the_rate_limits(self):
+        assert _RateLimiter(requests_per_minute=3).max_batch([1] * 10) == 3
+        assert _RateLimiter(tokens_per_minute=100).max_batch([40, 40, 40, 40]) == 2
+        # A single request over the token limit is still sent on its own
+        assert _RateLimiter(tokens_per_minute=100).max_batch([150, 10]) == 1
+        assert _RateLimiter().max_batch([1] * 10) == 10
+
+    async def test_checkpoints_of_abandoned_runs_expire(self):
+        class FailingModel(MockLanguageModel):
+            async def abatch(self, messages, *_, **__):
+                if messages[0][-1]["content"] == "b":
+                    msg = "Rate limit exceeded"
+                    raise RuntimeError(msg)
+                return await super().abatch(messages)
+
+        component = BatchRunComponent(
+            model=FailingModel(), df=DataFrame({"text": ["a", "b"]}), column_name="text", chunk_size=1
+        )
+        with pytest.raises(RuntimeError, match="Rate limit exceeded"):
+            await component.run_batch()
+        (key,) = [key for key in batch_run._checkpoint_times if key.startswith(f"batch_run:{component._id}:")]
+        assert get_shared_component_cache_service().get(key) is not CACHE_MISS
+
+        # Saving any other checkpoint once the TTL is over deletes the abandoned one
+        batch_run._checkpoint_times[key] -= batch_run.CHECKPOINT_TTL
+        other = BatchRunComponent(model=MockLanguageModel(), df=DataFrame({"text": ["c"]}), column_name="text")
+        await other.run_batch()
+
+        assert key not in batch_run._checkpoint_times
+        assert get_shared_component_cache_service().get(key) is CACHE_MISS
+
+    async def test_checkpoints_are_not_shared_between_flows_or_users(self):
+        sent = []
+
+        class FailingModel(MockLanguageModel):
+            async def abatch(self, messages, *_, **__):
+                if messages[0][-1]["content"] == "b":
+                    msg = "Rate limit exceeded"
+                    raise RuntimeError(msg)
+                sent.extend(message[-1]["content"] for message in messages)
+                return await super().abatch(messages)
+
+        def run_of(flow_id, user_id):
+            component = BatchRunComponent(
+                _id="BatchRunComponent-abcde",
+                model=FailingModel(),
+                df=DataFrame({"text": ["a", "b"]}),
+                column_name="text",
+                chunk_size=1,
+            )
+            component._vertex = SimpleNamespace(graph=SimpleNamespace(flow_id=flow_id, user_id=user_id))
+            return component
+
+        for flow_id, user_id in [("flow", "user"), ("flow", "other user"), ("other flow", "user"), ("flow", "user")]:
+            with pytest.raises(RuntimeError, match="Rate limit exceeded"):
+                await run_of(flow_id, user_id).run_batch()
+
+        # The same node of a copied flow has the same id, only the second run of the first flow and user resumes
+        assert sent == ["a", "a", "a"]
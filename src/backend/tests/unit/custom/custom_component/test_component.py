@@ -5,8 +5,11 @@ from langflow.components.crewai import CrewAIAgentComponent, SequentialTaskCompo
 from langflow.components.custom_component import CustomComponent
 from langflow.components.inputs import ChatInput
 from langflow.components.outputs import ChatOutput
+from langflow.custom import Component
 from langflow.custom.utils import update_component_build_config
+from langflow.inputs import MessageTextInput
 from langflow.schema import dotdict
+from langflow.schema.message import Message
 from langflow.template import Output
 from typing_extensions import override
 
@@ -99,3 +102,22 @@ async def test_update_component_build_config_async():
     build_config = dotdict()
     build_config = await update_component_build_config(component, build_config, "", "")
     assert build_config["foo"] == "bar"
+
+
+def test_instances_do_not_change_the_class_definitions():
+    class SharedComponent(Component):
+        inputs = [MessageTextInput(name="input_value", required=True)]
+        outputs = [Output(name="message", method="build_message")]
+
+        def build_message(self) -> Message:
+            return Message(text=self.input_value)
+
+    first = SharedComponent()
+    first.set(extra_value="extra")
+    second = SharedComponent()
+
+    assert [input_.name for input_ in first.inputs] == ["input_value", "extra_value"]
+    assert [input_.name for input_ in SharedComponent.inputs] == ["input_value"]
+    assert [input_.name for input_ in second.inputs] == ["input_value"]
+    assert first.outputs[0].required_inputs == ["input_value"]
+    assert SharedComponent.outputs[0].required_inputs is None
@@ -1,12 +1,15 @@
 import asyncio
 import time
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from langflow import memory as memory_module
+from langflow.custom.custom_component import component as component_module
 from langflow.custom.custom_component.component import Component
 from langflow.events.event_manager import EventManager
+from langflow.memory import aget_messages
 from langflow.schema.content_block import ContentBlock
 from langflow.schema.content_types import TextContent, ToolContent
 from langflow.schema.message import Message
@@ -252,3 +255,61 @@ async def test_component_streaming_message():
             tokens.append(event)
 
     assert len(tokens) > 0
+
+
+class StreamedChunk:
+    def __init__(self, content: str):
+        self.content = content
+
+
+@pytest.mark.usefixtures("client")
+async def test_component_streaming_message_is_stored_once_with_the_complete_text():
+    queue = asyncio.Queue()
+    component = ComponentForTesting()
+    component.set_event_manager(EventManager(queue))
+    component._event_manager.register_event("on_message", "message")
+    component._event_manager.register_event("on_token", "token")
+
+    async def text_generator():
+        for chunk in ["Hello", " ", "World"]:
+            yield StreamedChunk(chunk)
+
+    message = Message(sender="AI", session_id="test_session", sender_name="AI", text=text_generator())
+    with patch.object(memory_module, "_update_messagetables", AsyncMock()) as update_messagetables:
+        sent_message = await component.send_message(message)
+
+    update_messagetables.assert_not_called()
+    assert sent_message.text == "Hello World"
+    stored = await aget_messages(session_id="test_session")
+    assert [(stored_message.id, stored_message.text) for stored_message in stored] == [(sent_message.id, "Hello World")]
+    token_ids = set()
+    while not queue.empty():
+        _, event_data, _ = queue.get_nowait()
+        event = event_data.decode("utf-8")
+        if '"token"' in event:
+            token_ids.add(str(sent_message.id) in event)
+    assert token_ids == {True}
+
+
+@pytest.mark.usefixtures("client")
+async def test_component_failed_stream_stores_nothing():
+    component = ComponentForTesting()
+    component.set_event_manager(EventManager(asyncio.Queue()))
+    component._event_manager.register_event("on_message", "message")
+    component._event_manager.register_event("on_token", "token")
+
+    async def failing_generator():
+        yield StreamedChunk("Hello")
+        msg = "stream broke"
+        raise RuntimeError(msg)
+
+    message = Message(sender="AI", session_id="failed_session", sender_name="AI", text=failing_generator())
+    with (
+        patch.object(component_module, "aadd_messages", AsyncMock()) as aadd_messages,
+        patch.object(component_module, "delete_message", AsyncMock()) as delete_message,
+        pytest.raises(RuntimeError, match="stream broke"),
+    ):
+        await component.send_message(message)
+
+    aadd_messages.assert_not_called()
+    delete_message.assert_not_called()
@@ -0,0 +1,115 @@
+import os
+import sys
+
+import pytest
+from langflow.custom import eval as eval_module
+from langflow.custom import utils as custom_utils
+from langflow.custom.code_cache import ComponentCodeCache, installation_fingerprint
+from langflow.custom.directory_reader import directory_reader
+from langflow.custom.directory_reader.directory_reader import DirectoryReader
+from langflow.custom.eval import component_class_cache, eval_custom_component_code
+
+CODE = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+
+
+class DiskCachedComponent(Component):
+    display_name = "Disk Cached Component"
+    inputs = [MessageTextInput(name="text", display_name="Text")]
+    outputs = [Output(display_name="Text", name="text_output", method="build_text")]
+
+    def build_text(self) -> str:
+        return self.text
+"""
+
+
+def _install(cache: ComponentCodeCache, monkeypatch) -> ComponentCodeCache:
+    for module in (eval_module, custom_utils, directory_reader):
+        monkeypatch.setattr(module, "component_code_cache", cache)
+    component_class_cache.clear()
+    return cache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    yield _install(ComponentCodeCache(tmp_path, version="1.0.0"), monkeypatch)
+    component_class_cache.clear()
+
+
+def _restart(cache: ComponentCodeCache, monkeypatch) -> ComponentCodeCache:
+    """Simulate a new process reading the cache written by the previous one."""
+    cache = _install(ComponentCodeCache(cache.cache_dir, version=cache.version), monkeypatch)
+    cache.load()
+    return cache
+
+
+def test_compiled_code_is_reused_by_a_new_process(cache, monkeypatch):
+    with cache.recording():
+        eval_custom_component_code(CODE)
+    assert cache.save()
+
+    cache = _restart(cache, monkeypatch)
+
+    def fail(*_args, **_kwargs):
+        msg = "should not parse cached code"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr("langflow.utils.validate.compile_class", fail)
+    component_class = eval_custom_component_code(CODE)
+    assert component_class.__name__ == "DiskCachedComponent"
+    assert component_class(text="hello").build_text() == "hello"
+    assert cache.stats()["hits"] == 1
+
+
+def test_code_compiled_outside_recording_is_not_persisted(cache):
+    eval_custom_component_code(CODE)
+
+    assert cache.get_compiled(CODE) is None
+    assert not cache.save()
+
+
+def test_templates_are_reused_and_returned_as_copies(cache, monkeypatch):
+    component = {"code": CODE, "output_types": DirectoryReader.get_output_types_from_code(CODE)}
+    name, template = custom_utils.build_component(component)
+    assert cache.save()
+
+    cache = _restart(cache, monkeypatch)
+    monkeypatch.setattr(custom_utils, "create_component_template", None)
+
+    assert cache.has_template(CODE)
+    assert DirectoryReader.get_output_types_from_code(CODE) == component["output_types"]
+    cached_name, cached_template = custom_utils.build_component(component)
+    assert (cached_name, cached_template) == (name, template)
+    cached_template["display_name"] = "changed"
+    assert custom_utils.build_component(component)[1]["display_name"] == template["display_name"]
+
+
+def test_cache_of_another_version_installation_or_corrupted_cache_is_ignored(cache, monkeypatch):
+    with cache.recording():
+        eval_custom_component_code(CODE)
+    cache.save()
+
+    other_version = ComponentCodeCache(cache.cache_dir, version="2.0.0")
+    assert other_version.load() == 0
+    assert other_version.get_compiled(CODE) is None
+
+    other_installation = ComponentCodeCache(cache.cache_dir, version="1.0.0", fingerprint="edited")
+    assert other_installation.load() == 0
+    assert other_installation.get_compiled(CODE) is None
+
+    cache.path.write_bytes(b"not a cache")
+    cache = _restart(cache, monkeypatch)
+    assert cache.get_compiled(CODE) is None
+    assert eval_custom_component_code(CODE).__name__ == "DiskCachedComponent"
+
+
+def test_fingerprint_changes_when_installed_packages_change(tmp_path, monkeypatch):
+    monkeypatch.setattr("sys.path", [*sys.path, str(tmp_path)])
+    fingerprint = installation_fingerprint()
+    assert installation_fingerprint() == fingerprint
+
+    (tmp_path / "new_dependency").mkdir()
+    os.utime(tmp_path, ns=(0, 0))
+
+    assert installation_fingerprint() != fingerprint
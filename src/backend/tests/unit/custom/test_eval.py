@@ -0,0 +1,77 @@
+import pytest
+from langflow.custom.eval import ComponentClassCache, component_class_cache, eval_custom_component_code
+
+CODE = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+
+
+class CachedComponent(Component):
+    display_name = "Cached Component"
+    inputs = [MessageTextInput(name="text", display_name="Text")]
+    outputs = [Output(display_name="Text", name="text_output", method="build_text")]
+
+    def build_text(self) -> str:
+        return self.text
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    component_class_cache.clear()
+    yield
+    component_class_cache.clear()
+
+
+def test_eval_custom_component_code_reuses_compiled_class():
+    first = eval_custom_component_code(CODE)
+    second = eval_custom_component_code(CODE)
+
+    assert first is second
+    assert first.__name__ == "CachedComponent"
+    assert component_class_cache.stats()["hits"] == 1
+    assert component_class_cache.stats()["misses"] == 1
+
+
+def test_eval_custom_component_code_recompiles_after_invalidation():
+    first = eval_custom_component_code(CODE)
+    assert component_class_cache.invalidate(CODE)
+
+    second = eval_custom_component_code(CODE)
+
+    assert first is not second
+    assert component_class_cache.stats()["misses"] == 2
+
+
+def test_eval_custom_component_code_does_not_cache_errors():
+    with pytest.raises(TypeError):
+        eval_custom_component_code("x = 1")
+
+    assert len(component_class_cache) == 0
+
+
+def test_component_class_cache_evicts_least_recently_used():
+    cache = ComponentClassCache(max_size=2)
+    cache.set("a", int)
+    cache.set("b", str)
+    assert cache.get("a") is int
+
+    cache.set("c", float)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is int
+    assert cache.get("c") is float
+
+
+def test_component_class_cache_resize_and_disable():
+    cache = ComponentClassCache(max_size=3)
+    for code, cls in (("a", int), ("b", str), ("c", float)):
+        cache.set(code, cls)
+
+    cache.resize(1)
+    assert len(cache) == 1
+    assert cache.get("c") is float
+
+    cache.resize(0)
+    cache.set("d", bytes)
+    assert len(cache) == 0
@@ -3,9 +3,12 @@ import json
 import time
 import uuid
 
+import orjson
 import pytest
+from fastapi.encoders import jsonable_encoder
 from langflow.events.event_manager import EventManager
 from langflow.schema.log import LoggableType
+from langflow.schema.playground_events import PlaygroundEvent, TokenEvent, create_event_by_type
 
 
 class TestEventManager:
@@ -210,3 +213,79 @@ class TestEventManager:
         # Accessing a non-registered event callback should return the 'noop' function
         callback = event_manager.on_non_existing_event
         assert callback.__name__ == "noop"
+
+    # Token events use a pre-encoded frame with the same shape as TokenEvent
+    async def test_token_event_frame_matches_token_event(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+
+        manager.on_token(data={"chunk": 'Hello "world"\n', "id": "message-id"})
+
+        event_id, frame, _ = await queue.get()
+        assert event_id.startswith("token-")
+        assert frame.endswith(b"\n\n")
+        event = json.loads(frame)
+        assert event["event"] == "token"
+        assert event["data"]["chunk"] == 'Hello "world"\n'
+        assert event["data"]["id"] == "message-id"
+        assert set(event["data"]) == set(TokenEvent.model_fields)
+
+    # Pydantic payloads are encoded by alias and pre-serialized fragments are embedded as-is
+    async def test_send_event_encodes_models_and_fragments(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_end_vertex", "end_vertex")
+        manager.register_event("on_message", "add_message")
+
+        manager.on_end_vertex(data={"build_data": orjson.Fragment(b'{"id":"vertex-1","valid":true}')})
+        manager.on_message(data=PlaygroundEvent(id=uuid.UUID(int=1), text="hi"))
+
+        _, end_vertex_frame, _ = await queue.get()
+        _, message_frame, _ = await queue.get()
+        assert json.loads(end_vertex_frame) == {
+            "event": "end_vertex",
+            "data": {"build_data": {"id": "vertex-1", "valid": True}},
+        }
+        message = json.loads(message_frame)["data"]
+        assert message["id"] == str(uuid.UUID(int=1))
+        assert message["text"] == "hi"
+
+    # Event ids are unique, ordered and keep the `{event_type}-{uuid}` format
+    def test_event_ids_are_monotonic(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        for i in range(20):
+            manager.send_event(event_type="token", data={"chunk": str(i), "id": "message-id"})
+
+        event_ids = [queue.get_nowait()[0] for _ in range(20)]
+        assert event_ids == sorted(event_ids)
+        assert len(set(event_ids)) == 20
+        uuid.UUID(event_ids[-1].removeprefix("token-"))
+
+    @pytest.mark.benchmark
+    def test_token_events_per_second(self):
+        def legacy_send_event(queue, event_type, data):
+            data = create_event_by_type(event_type, **data)
+            json_data = {"event": event_type, "data": jsonable_encoder(data)}
+            str_data = json.dumps(json_data) + "\n\n"
+            queue.put_nowait((f"{event_type}-{uuid.uuid4()}", str_data.encode("utf-8"), time.time()))
+
+        events = 5000
+        data = {"chunk": "token ", "id": str(uuid.uuid4())}
+
+        queue = asyncio.Queue()
+        start = time.perf_counter()
+        for _ in range(events):
+            legacy_send_event(queue, "token", data)
+        legacy_events_per_second = events / (time.perf_counter() - start)
+
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        start = time.perf_counter()
+        for _ in range(events):
+            manager.send_event(event_type="token", data=data)
+        events_per_second = events / (time.perf_counter() - start)
+
+        assert queue.qsize() == events
+        assert events_per_second > legacy_events_per_second * 2
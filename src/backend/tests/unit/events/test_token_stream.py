@@ -0,0 +1,157 @@
+import asyncio
+import threading
+import time
+
+import orjson
+import pytest
+from langflow.custom.custom_component.component import Component
+from langflow.events import event_manager as event_manager_module
+from langflow.events.event_manager import EventManager, create_default_event_manager
+from langflow.schema.message import Message
+
+
+def drain_chunks(queue: asyncio.Queue) -> list[str]:
+    chunks = []
+    while not queue.empty():
+        _, frame, _ = queue.get_nowait()
+        event = orjson.loads(frame)
+        if event["event"] == "token":
+            chunks.append(event["data"]["chunk"])
+    return chunks
+
+
+@pytest.fixture
+def no_thread_hops(monkeypatch):
+    async def fail(*_args, **_kwargs):
+        msg = "should not leave the event loop"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(event_manager_module.asyncio, "to_thread", fail)
+
+
+@pytest.mark.usefixtures("no_thread_hops")
+async def test_tokens_are_sent_from_the_event_loop():
+    queue = asyncio.Queue()
+    token_stream = create_default_event_manager(queue).token_stream("message-1")
+
+    for chunk in ["Hello", " ", "World"]:
+        await token_stream.send(chunk)
+    await token_stream.aclose()
+
+    assert drain_chunks(queue) == ["Hello", " ", "World"]
+    assert token_stream.events_sent == 3
+
+
+@pytest.mark.usefixtures("no_thread_hops")
+async def test_tokens_are_coalesced_on_a_byte_budget_and_flushed_on_close():
+    queue = asyncio.Queue()
+    token_stream = create_default_event_manager(queue, token_flush_bytes=10).token_stream("message-1")
+
+    for chunk in ["Hello", " ", "World", "!"]:
+        await token_stream.send(chunk)
+    assert drain_chunks(queue) == ["Hello World"]
+
+    await token_stream.aclose()
+    assert drain_chunks(queue) == ["!"]
+
+
+async def test_tokens_are_coalesced_on_a_time_budget():
+    queue = asyncio.Queue()
+    token_stream = create_default_event_manager(queue, token_flush_interval=0.01).token_stream("message-1")
+
+    for chunk in ["a", "b", "c"]:
+        await token_stream.send(chunk)
+    assert queue.empty()
+
+    await asyncio.sleep(0.05)
+    assert drain_chunks(queue) == ["abc"]
+    await token_stream.aclose()
+    assert queue.empty()
+
+
+async def test_custom_token_callbacks_run_in_a_thread_without_coalescing():
+    queue = asyncio.Queue()
+    manager = EventManager(queue, token_flush_bytes=1024)
+    threads = set()
+
+    def callback(*, manager, event_type, data):
+        threads.add(threading.get_ident())
+        time.sleep(0.001)
+        manager.send_event(event_type=event_type, data=data)
+
+    manager.register_event("on_token", "token", callback)
+    token_stream = manager.token_stream("message-1")
+
+    for chunk in ["a", "b"]:
+        await token_stream.send(chunk)
+
+    assert not token_stream.coalescing
+    assert drain_chunks(queue) == ["a", "b"]
+    assert threading.get_ident() not in threads
+
+
+class StreamChunk:
+    def __init__(self, content: str):
+        self.content = content
+
+
+async def test_component_streams_coalesced_tokens_and_flushes_on_completion():
+    queue = asyncio.Queue()
+    component = Component()
+    component.set_event_manager(create_default_event_manager(queue, token_flush_bytes=1024))
+
+    async def chunks():
+        for chunk in ["Hello", " ", "World"]:
+            yield StreamChunk(chunk)
+
+    message = Message(text="", id="message-1")
+    complete_message = await component._stream_message(chunks(), message)
+
+    assert complete_message == "Hello World"
+    assert drain_chunks(queue) == ["Hello World"]
+
+
+async def _stream_session(send, tokens: int, interval: float) -> None:
+    for index in range(tokens):
+        await send(f"token-{index} ")
+        await asyncio.sleep(interval)
+
+
+@pytest.mark.benchmark
+async def test_in_loop_token_dispatch_keeps_up_with_many_concurrent_streams():
+    sessions, tokens, interval = 500, 40, 1 / 200
+
+    async def run(make_send) -> tuple[float, int]:
+        queue = asyncio.Queue()
+        senders = [make_send(create_default_event_manager(queue), index) for index in range(sessions)]
+        start = time.perf_counter()
+        await asyncio.gather(*(_stream_session(send, tokens, interval) for send, _ in senders))
+        for _, close in senders:
+            await close()
+        return time.perf_counter() - start, queue.qsize()
+
+    def thread_per_token(manager, index):
+        async def send(chunk):
+            await asyncio.to_thread(manager.on_token, data={"chunk": chunk, "id": str(index)})
+
+        async def close():
+            pass
+
+        return send, close
+
+    def in_loop(manager, index):
+        token_stream = manager.token_stream(str(index))
+        return token_stream.send, token_stream.aclose
+
+    def coalescing(manager, index):
+        manager.token_flush_interval = 0.02
+        token_stream = manager.token_stream(str(index))
+        return token_stream.send, token_stream.aclose
+
+    threaded_time, threaded_events = await run(thread_per_token)
+    in_loop_time, in_loop_events = await run(in_loop)
+    _, coalesced_events = await run(coalescing)
+
+    assert threaded_events == in_loop_events == sessions * tokens
+    assert in_loop_time < threaded_time
+    assert coalesced_events < in_loop_events / 2
@@ -0,0 +1,103 @@
+import copy
+import json
+import time
+
+import pytest
+from langflow.graph import Graph
+
+
+@pytest.fixture
+def chat_output_node():
+    payload = json.loads(pytest.MEMORY_CHATBOT_NO_LLM.read_text(encoding="utf-8"))["data"]
+    return next(node for node in payload["nodes"] if node["data"]["type"] == "ChatOutput")
+
+
+def _edge(source_id: str, target_id: str) -> dict:
+    return {
+        "id": f"edge-{source_id}-{target_id}",
+        "source": source_id,
+        "target": target_id,
+        "data": {
+            "sourceHandle": {
+                "dataType": "ChatOutput",
+                "id": source_id,
+                "name": "message",
+                "output_types": ["Message"],
+            },
+            "targetHandle": {"fieldName": "input_value", "id": target_id, "inputTypes": ["Message"], "type": "str"},
+        },
+    }
+
+
+def build_tree_payload(node: dict, size: int) -> dict:
+    """A binary tree of `size` chained Chat Output nodes."""
+    nodes = []
+    for index in range(size):
+        new_node = copy.deepcopy(node)
+        new_node["id"] = new_node["data"]["id"] = f"ChatOutput-{index}"
+        nodes.append(new_node)
+    edges = [_edge(f"ChatOutput-{(index - 1) // 2}", f"ChatOutput-{index}") for index in range(1, size)]
+    return {"nodes": nodes, "edges": edges}
+
+
+def _edge_ids(edges) -> list[tuple[str, str]]:
+    return sorted((edge.source_id, edge.target_id) for edge in edges)
+
+
+def test_edge_lookups_match_a_full_scan(chat_output_node):
+    graph = Graph.from_payload(build_tree_payload(chat_output_node, 15))
+
+    for vertex in graph.vertices:
+        assert _edge_ids(graph.get_vertex_edges(vertex.id)) == _edge_ids(
+            edge for edge in graph.edges if vertex.id in {edge.source_id, edge.target_id}
+        )
+        assert _edge_ids(vertex.outgoing_edges) == _edge_ids(e for e in graph.edges if e.source_id == vertex.id)
+        assert _edge_ids(vertex.incoming_edges) == _edge_ids(e for e in graph.edges if e.target_id == vertex.id)
+    assert graph.get_edge("ChatOutput-1", "ChatOutput-3").target_id == "ChatOutput-3"
+    assert graph.get_edge("ChatOutput-3", "ChatOutput-1") is None
+    assert [vertex.id for vertex in graph.get_vertices_with_target("ChatOutput-4")] == ["ChatOutput-1"]
+    assert list(graph.get_vertex("ChatOutput-0").get_edge_with_target("ChatOutput-2")) == [
+        graph.get_edge("ChatOutput-0", "ChatOutput-2")
+    ]
+    sorted_ids = [vertex.id for vertex in graph.topological_sort()]
+    assert all(
+        sorted_ids.index(f"ChatOutput-{(i - 1) // 2}") < sorted_ids.index(f"ChatOutput-{i}") for i in range(1, 15)
+    )
+
+
+def test_edge_indexes_follow_remove_vertex_and_update(chat_output_node):
+    graph = Graph.from_payload(build_tree_payload(chat_output_node, 7))
+
+    graph.remove_vertex("ChatOutput-1")
+
+    assert graph.get_vertex_edges("ChatOutput-1") == []
+    assert graph.get_edge("ChatOutput-0", "ChatOutput-1") is None
+    assert graph.get_vertices_with_target("ChatOutput-3") == []
+    assert _edge_ids(graph.get_vertex_edges("ChatOutput-0")) == [("ChatOutput-0", "ChatOutput-2")]
+
+    graph.update(Graph.from_payload(build_tree_payload(chat_output_node, 7)))
+
+    assert graph.get_edge("ChatOutput-0", "ChatOutput-1") is not None
+    assert _edge_ids(graph.get_vertex_edges("ChatOutput-1")) == [
+        ("ChatOutput-0", "ChatOutput-1"),
+        ("ChatOutput-1", "ChatOutput-3"),
+        ("ChatOutput-1", "ChatOutput-4"),
+    ]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", [100, 1000, 5000])
+def test_build_and_sort_synthetic_graph(chat_output_node, size):
+    payload = build_tree_payload(chat_output_node, size)
+
+    start = time.perf_counter()
+    graph = Graph.from_payload(payload)
+    built = time.perf_counter()
+    sorted_vertices = graph.topological_sort()
+    graph.sort_vertices()
+    for vertex in graph.vertices:
+        graph.get_vertex_edges(vertex.id)
+    end = time.perf_counter()
+
+    assert len(sorted_vertices) == size
+    print(f"{size} nodes: build {built - start:.3f}s, sort and lookups {end - built:.3f}s")  # noqa: T201
@@ -0,0 +1,104 @@
+import json
+import time
+
+import pytest
+from langflow.graph import Graph
+from langflow.graph.edge.base import CycleEdge
+from langflow.graph.graph.plan import GraphPlan, GraphPlanCache
+
+
+@pytest.fixture
+def memory_chatbot_payload():
+    return json.loads(pytest.MEMORY_CHATBOT_NO_LLM.read_text(encoding="utf-8"))["data"]
+
+
+@pytest.fixture
+def loop_payload():
+    return json.loads(pytest.LOOP_TEST.read_text(encoding="utf-8"))["data"]
+
+
+def _topology(graph: Graph) -> dict:
+    return {
+        "vertices": sorted(vertex.id for vertex in graph.vertices),
+        "edges": sorted(repr(edge) for edge in graph.edges),
+        "cycle_edges": sorted(repr(edge) for edge in graph.edges if edge.is_cycle),
+        "predecessor_map": {key: sorted(value) for key, value in graph.predecessor_map.items() if value},
+        "successor_map": {key: sorted(value) for key, value in graph.successor_map.items() if value},
+        "in_degree_map": {key: value for key, value in graph.in_degree_map.items() if value},
+        "cycle_vertices": graph.cycle_vertices,
+        "inputs": graph._is_input_vertices,
+        "outputs": graph._is_output_vertices,
+        "params": {vertex.id: sorted(vertex.params) for vertex in graph.vertices},
+    }
+
+
+@pytest.mark.parametrize("payload_fixture", ["memory_chatbot_payload", "loop_payload"])
+def test_graph_from_plan_matches_graph_from_payload(payload_fixture, request):
+    payload = request.getfixturevalue(payload_fixture)
+
+    from_payload = Graph.from_payload(payload, flow_id="flow", user_id="user")
+    from_plan = Graph.from_plan(GraphPlan(payload), flow_id="flow", user_id="user")
+
+    assert _topology(from_plan) == _topology(from_payload)
+    assert from_plan.flow_id == "flow"
+    assert all(vertex.custom_component is not None for vertex in from_plan.vertices)
+
+
+def test_graphs_from_the_same_plan_do_not_share_run_state(loop_payload):
+    plan = GraphPlan(loop_payload)
+
+    first = Graph.from_plan(plan)
+    second = Graph.from_plan(plan)
+
+    assert not {id(vertex) for vertex in first.vertices} & {id(vertex) for vertex in second.vertices}
+    assert first._vertices is not second._vertices
+    assert first.predecessor_map is not second.predecessor_map
+    cycle_edges = [edge for edge in first.edges if isinstance(edge, CycleEdge)]
+    assert cycle_edges
+    cycle_edges[0].is_fulfilled = True
+    assert not any(edge.is_fulfilled for edge in second.edges if isinstance(edge, CycleEdge))
+
+    first.get_vertex(first.vertices[0].id).built = True
+    assert not second.get_vertex(first.vertices[0].id).built
+
+
+def test_plan_cache_key_changes_with_flow_version_tweaks_and_stream():
+    key = GraphPlanCache.make_key("flow", "2024-01-01", {"a": {"b": 1}})
+
+    assert key == GraphPlanCache.make_key("flow", "2024-01-01", {"a": {"b": 1}})
+    assert key != GraphPlanCache.make_key("flow", "2024-01-02", {"a": {"b": 1}})
+    assert key != GraphPlanCache.make_key("flow", "2024-01-01", {"a": {"b": 2}})
+    assert key != GraphPlanCache.make_key("flow", "2024-01-01", {"a": {"b": 1}}, stream=True)
+    assert GraphPlanCache.make_key("flow", None) == GraphPlanCache.make_key("flow", None, {})
+
+
+def test_plan_cache_invalidates_every_plan_of_a_flow(memory_chatbot_payload):
+    cache = GraphPlanCache(max_size=3)
+    plan = GraphPlan(memory_chatbot_payload)
+    cache.set(GraphPlanCache.make_key("flow-1", "v1"), plan)
+    cache.set(GraphPlanCache.make_key("flow-1", "v1", {"x": "y"}), plan)
+    cache.set(GraphPlanCache.make_key("flow-2", "v1"), plan)
+
+    assert cache.invalidate("flow-1") == 2
+
+    assert cache.get(GraphPlanCache.make_key("flow-1", "v1")) is None
+    assert cache.get(GraphPlanCache.make_key("flow-2", "v1")) is plan
+    assert cache.stats() == {"size": 1, "max_size": 3, "hits": 1, "misses": 1}
+
+
+@pytest.mark.benchmark
+def test_graph_from_plan_is_faster_than_from_payload(memory_chatbot_payload):
+    plan = GraphPlan(memory_chatbot_payload)
+    iterations = 20
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        Graph.from_payload(memory_chatbot_payload)
+    from_payload = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        Graph.from_plan(plan)
+    from_plan = time.perf_counter() - start
+
+    assert from_plan < from_payload
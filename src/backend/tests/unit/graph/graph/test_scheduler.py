@@ -0,0 +1,201 @@
+import asyncio
+import time
+
+import pytest
+from langflow.custom import Component
+from langflow.exceptions.component import ComponentBuildError
+from langflow.graph import Graph
+from langflow.inputs import FloatInput, MessageTextInput
+from langflow.schema.message import Message
+from langflow.template import Output
+
+
+class DelayComponent(Component):
+    display_name = "Delay"
+    inputs = [
+        MessageTextInput(name="input_value", value=""),
+        FloatInput(name="delay", value=0.0),
+    ]
+    outputs = [Output(name="message", method="build_message")]
+
+    async def build_message(self) -> Message:
+        await asyncio.sleep(self.delay)
+        finished.append(self._id)
+        return Message(text=f"{self.input_value}>{self._id}")
+
+
+class FailingComponent(Component):
+    display_name = "Failing"
+    inputs = [MessageTextInput(name="input_value", value="")]
+    outputs = [Output(name="message", method="build_message")]
+
+    async def build_message(self) -> Message:
+        msg = "boom"
+        raise ValueError(msg)
+
+
+finished: list[str] = []
+
+
+@pytest.fixture(autouse=True)
+def _no_vertex_build_logging(monkeypatch):
+    async def _noop(**_kwargs):
+        return None
+
+    monkeypatch.setattr("langflow.graph.graph.base.log_vertex_build", _noop)
+    finished.clear()
+
+
+def _connect(graph: Graph, source: Component, target: Component) -> None:
+    graph.add_component_edge(source._id, ("message", "input_value"), target._id)
+
+
+def build_slow_branch_graph() -> Graph:
+    """Build root -> slow and root -> fast -> after_fast."""
+    graph = Graph()
+    root = DelayComponent(_id="root", input_value="start")
+    slow = DelayComponent(_id="slow", delay=0.3)
+    fast = DelayComponent(_id="fast")
+    after_fast = DelayComponent(_id="after_fast")
+    for component in (root, slow, fast, after_fast):
+        graph.add_component(component)
+    _connect(graph, root, slow)
+    _connect(graph, root, fast)
+    _connect(graph, fast, after_fast)
+    graph.prepare()
+    return graph
+
+
+def build_fan_out_graph(width: int, depth: int) -> Graph:
+    """A root fanning out into `width` independent chains; each chain has one slow vertex at a different depth."""
+    graph = Graph()
+    root = DelayComponent(_id="root", input_value="start")
+    graph.add_component(root)
+    for branch in range(width):
+        previous = root
+        for level in range(depth):
+            delay = 0.1 if level == branch % depth else 0.0
+            component = DelayComponent(_id=f"b{branch}_l{level}", delay=delay)
+            graph.add_component(component)
+            _connect(graph, previous, component)
+            previous = component
+    graph.prepare()
+    return graph
+
+
+def _results(graph: Graph) -> dict[str, str]:
+    return {vertex.id: vertex.results["message"].text for vertex in graph.vertices if vertex.built}
+
+
+@pytest.mark.parametrize("scheduler", ["layered", "dependency"])
+async def test_process_builds_every_vertex(scheduler):
+    graph = build_slow_branch_graph()
+
+    await graph.process(fallback_to_env_vars=False, scheduler=scheduler)
+
+    assert _results(graph) == {
+        "root": "start>root",
+        "slow": "start>root>slow",
+        "fast": "start>root>fast",
+        "after_fast": "start>root>fast>after_fast",
+    }
+
+
+async def test_dependency_scheduler_does_not_wait_for_slow_siblings():
+    layered = build_slow_branch_graph()
+    await layered.process(fallback_to_env_vars=False, scheduler="layered")
+    assert finished.index("after_fast") > finished.index("slow")
+
+    finished.clear()
+    dependency = build_slow_branch_graph()
+    await dependency.process(fallback_to_env_vars=False, scheduler="dependency")
+    assert finished.index("after_fast") < finished.index("slow")
+
+
+async def test_dependency_scheduler_respects_max_concurrency(monkeypatch):
+    graph = build_fan_out_graph(width=6, depth=1)
+    running = 0
+    peak = 0
+    original_build_vertex = graph.build_vertex
+
+    async def tracking_build_vertex(*args, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            return await original_build_vertex(*args, **kwargs)
+        finally:
+            running -= 1
+
+    monkeypatch.setattr(graph, "build_vertex", tracking_build_vertex)
+
+    await graph.process(fallback_to_env_vars=False, scheduler="dependency", max_concurrency=2)
+
+    assert peak == 2
+    assert len(_results(graph)) == 7
+
+
+async def test_dependency_scheduler_rebuilds_vertices_requested_while_running(monkeypatch):
+    graph = build_slow_branch_graph()
+    original_build_vertex = graph.build_vertex
+    original_get_next_runnable_vertices = graph.get_next_runnable_vertices
+    built: list[str] = []
+
+    async def tracking_build_vertex(vertex_id, **kwargs):
+        result = await original_build_vertex(vertex_id, **kwargs)
+        built.append(vertex_id)
+        return result
+
+    async def looping_get_next_runnable_vertices(lock, vertex, *, cache=True):
+        next_runnable_vertices = await original_get_next_runnable_vertices(lock, vertex, cache=cache)
+        if vertex.id == "fast":
+            # Like the end of a loop, ask for "slow" again while its first run is still going
+            next_runnable_vertices.append("slow")
+        return next_runnable_vertices
+
+    monkeypatch.setattr(graph, "build_vertex", tracking_build_vertex)
+    monkeypatch.setattr(graph, "get_next_runnable_vertices", looping_get_next_runnable_vertices)
+
+    await graph.process(fallback_to_env_vars=False, scheduler="dependency")
+
+    assert built == ["root", "fast", "after_fast", "slow", "slow"]
+
+
+async def test_dependency_scheduler_cancels_running_vertices_on_failure():
+    graph = Graph()
+    root = DelayComponent(_id="root", input_value="start")
+    slow = DelayComponent(_id="slow", delay=5)
+    failing = FailingComponent(_id="failing")
+    for component in (root, slow, failing):
+        graph.add_component(component)
+    _connect(graph, root, slow)
+    _connect(graph, root, failing)
+    graph.prepare()
+
+    start = time.perf_counter()
+    with pytest.raises(ComponentBuildError, match="boom"):
+        await graph.process(fallback_to_env_vars=False, scheduler="dependency")
+
+    assert time.perf_counter() - start < 2
+    assert "slow" not in finished
+
+
+async def test_process_rejects_unknown_scheduler():
+    graph = build_slow_branch_graph()
+    with pytest.raises(ValueError, match="Invalid scheduler"):
+        await graph.process(fallback_to_env_vars=False, scheduler="random")
+
+
+@pytest.mark.benchmark
+async def test_fan_out_wall_clock_layered_vs_dependency():
+    """Benchmark a wide fan-out flow where every chain has a slow vertex at a different depth."""
+    timings = {}
+    for scheduler in ("layered", "dependency"):
+        graph = build_fan_out_graph(width=8, depth=4)
+        start = time.perf_counter()
+        await graph.process(fallback_to_env_vars=False, scheduler=scheduler)
+        timings[scheduler] = time.perf_counter() - start
+        assert len(_results(graph)) == 33
+
+    # Layered mode pays for the slow vertex of every layer (~0.4s), dependency mode only for one per chain (~0.1s)
+    assert timings["dependency"] < timings["layered"] * 0.6
@@ -0,0 +1,95 @@
+import time
+
+import pandas as pd
+import pytest
+from langflow.schema.data import Data
+from langflow.schema.dataframe import DataFrame, DataFrameBuffer
+
+# Large enough to show the difference between the approaches, small enough for the default test run
+ROWS = 100_000
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+@pytest.fixture(scope="module")
+def records():
+    return [{"id": index, "text": f"row {index}", "score": index * 0.5} for index in range(ROWS)]
+
+
+@pytest.mark.benchmark
+def test_dataframe_from_records(records):
+    data_frame, elapsed = _timed(lambda: DataFrame(records))
+    _, pandas_elapsed = _timed(lambda: pd.DataFrame(records))
+
+    assert len(data_frame) == ROWS
+    assert data_frame.iloc[-1].to_dict() == records[-1]
+    print(f"{ROWS} records to DataFrame: {elapsed:.3f}s, pandas {pandas_elapsed:.3f}s")  # noqa: T201
+
+
+@pytest.mark.benchmark
+def test_dataframe_from_data_list(records):
+    data_list = [Data(data=record) for record in records]
+
+    data_frame, elapsed = _timed(lambda: DataFrame(data_list))
+
+    assert data_frame["id"].tolist()[:3] == [0, 1, 2]
+    print(f"{ROWS} Data to DataFrame: {elapsed:.3f}s")  # noqa: T201
+
+
+@pytest.mark.benchmark
+def test_dataframe_to_data(records):
+    data_frame = DataFrame(records)
+
+    view, view_elapsed = _timed(lambda: data_frame.data_view()[ROWS - 1])
+    data_list, list_elapsed = _timed(data_frame.to_data_list)
+    _, records_elapsed = _timed(lambda: [Data(data=row) for row in data_frame.to_dict(orient="records")])
+
+    assert view.data == records[-1]
+    assert data_list[0].data == records[0]
+    print(  # noqa: T201
+        f"{ROWS} rows to Data: view {view_elapsed:.3f}s, to_data_list {list_elapsed:.3f}s, "
+        f"records {records_elapsed:.3f}s"
+    )
+
+
+@pytest.mark.benchmark
+def test_dataframe_arrow_round_trip(records):
+    data_frame = DataFrame(records)
+
+    table, to_arrow = _timed(data_frame.to_arrow)
+    restored, from_arrow = _timed(lambda: DataFrame.from_arrow(table))
+
+    assert len(restored) == ROWS
+    print(f"{ROWS} rows Arrow round trip: to_arrow {to_arrow:.3f}s, from_arrow {from_arrow:.3f}s")  # noqa: T201
+
+
+@pytest.mark.benchmark
+def test_buffer_append(records):
+    appended = records[:20_000]
+
+    def append_rows():
+        buffer = DataFrameBuffer()
+        for record in appended:
+            buffer.append(record)
+        return buffer.to_dataframe()
+
+    data_frame, buffered = _timed(append_rows)
+    # add_row copies the whole DataFrame on every call, so only time a few thousand rows
+    small = appended[:500]
+
+    def add_rows_one_by_one():
+        data_frame = DataFrame()
+        for record in small:
+            data_frame = data_frame.add_row(record)
+        return data_frame
+
+    _, add_row = _timed(add_rows_one_by_one)
+
+    assert len(data_frame) == len(appended)
+    print(  # noqa: T201
+        f"Appending {len(appended)} rows: buffer {buffered:.3f}s; add_row {len(small)} rows: {add_row:.3f}s"
+    )
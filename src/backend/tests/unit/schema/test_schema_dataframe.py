@@ -2,7 +2,7 @@ import pandas as pd
 import pytest
 from langchain_core.documents import Document
 from langflow.schema.data import Data
-from langflow.schema.dataframe import DataFrame
+from langflow.schema.dataframe import DataFrame, DataFrameBuffer, DataView
 
 
 @pytest.fixture
@@ -64,3 +64,64 @@ class TestDataFrameSchema:
 
         non_empty_df = DataFrame({"name": ["John"], "text": ["name is John"]})
         assert bool(non_empty_df)
+
+    def test_records_with_different_keys_are_left_to_pandas(self):
+        data_frame = DataFrame([Data(data={"name": "John", "age": 30}), Data(data={"name": "Jane"})])
+
+        assert data_frame.columns.tolist() == ["name", "age"]
+        assert data_frame["age"].isna().tolist() == [False, True]
+
+    def test_arrow_round_trip(self, sample_dataframe):
+        data_frame = DataFrame(sample_dataframe, text_key="name")
+
+        table = data_frame.to_arrow()
+        restored = DataFrame.from_arrow(table, text_key="name")
+
+        assert table.column_names == ["name", "text"]
+        assert restored.text_key == "name"
+        assert restored.to_dict(orient="records") == sample_dataframe.to_dict(orient="records")
+
+    def test_data_view_reads_rows_lazily(self, sample_dataframe):
+        data_frame = DataFrame(sample_dataframe.assign(count=[1, 2]))
+        view = data_frame.data_view()
+
+        assert isinstance(view, DataView)
+        assert len(view) == 2
+        assert view._columns is None
+        assert view[-1].data == {"name": "Jane", "text": "name is Jane", "count": 2}
+        assert type(view[0].data["count"]) is int
+        assert [item.data for item in view[:1]] == [{"name": "John", "text": "name is John", "count": 1}]
+        assert list(view.iter_dicts()) == data_frame.to_dict(orient="records")
+        assert data_frame.to_data_list() == list(view)
+        with pytest.raises(IndexError):
+            view[2]
+
+    def test_data_view_of_nullable_columns(self):
+        data_frame = DataFrame(
+            {
+                "count": pd.array([1, None], dtype="Int64"),
+                "flag": pd.array([True, None], dtype="boolean"),
+                "label": pd.array(["a", None], dtype="string"),
+            }
+        )
+        view = data_frame.data_view()
+
+        assert [item.data for item in view] == [
+            {"count": 1, "flag": True, "label": "a"},
+            {"count": None, "flag": None, "label": None},
+        ]
+        assert list(view.iter_dicts()) == data_frame.to_dict(orient="records")
+
+    def test_buffer_builds_the_dataframe_once(self, sample_dataframe):
+        buffer = DataFrameBuffer(DataFrame(sample_dataframe, text_key="name"))
+        buffer.append({"name": "Bob", "text": "name is Bob"})
+        buffer.extend([Data(data={"name": "Alice", "text": "name is Alice"})])
+
+        data_frame = buffer.to_dataframe()
+
+        assert len(buffer) == 4
+        assert isinstance(data_frame, DataFrame)
+        assert data_frame.text_key == "name"
+        assert data_frame["name"].tolist() == ["John", "Jane", "Bob", "Alice"]
+        assert data_frame.index.tolist() == [0, 1, 2, 3]
+        assert DataFrameBuffer().to_dataframe().empty
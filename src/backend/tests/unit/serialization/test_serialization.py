@@ -1,5 +1,6 @@
 import math
 from datetime import datetime, timezone
+from decimal import Decimal
 from typing import Any
 
 import numpy as np
@@ -8,7 +9,7 @@ from hypothesis import given, settings
 from hypothesis import strategies as st
 from langchain_core.documents import Document
 from langflow.serialization.constants import MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
-from langflow.serialization.serialization import serialize, serialize_or_str
+from langflow.serialization.serialization import _get_handler, _handle_dict, serialize, serialize_or_str
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic.v1 import BaseModel as PydanticV1BaseModel
 
@@ -342,3 +343,76 @@ class TestSerializationHypothesis:
         assert isinstance(result, dict)
         assert len(result) == MAX_ITEMS_LENGTH
         assert all(isinstance(v, int) for v in result.values())
+
+
+class TestIterativeSerialization:
+    """Tests for the stack based walk and the per-type handlers."""
+
+    def test_deeply_nested_values_do_not_hit_the_recursion_limit(self) -> None:
+        nested: list = []
+        current = nested
+        for _ in range(10_000):
+            inner: list = []
+            current.append(inner)
+            current = inner
+        current.append("leaf")
+
+        result = serialize(nested)
+
+        for _ in range(10_000):
+            result = result[0]
+        assert result == ["leaf"]
+
+    def test_handler_is_cached_per_concrete_type(self) -> None:
+        class CustomDict(dict):
+            pass
+
+        _get_handler.cache_clear()
+        serialize([{"a": 1}, CustomDict(b=2), CustomDict(c=3)])
+
+        assert _get_handler(CustomDict) is _handle_dict
+        assert _get_handler.cache_info().misses == 3
+
+    def test_list_is_truncated_without_copying_it(self) -> None:
+        class CountingList(list):
+            iterated = 0
+
+            def __iter__(self):
+                for item in super().__iter__():
+                    CountingList.iterated += 1
+                    yield item
+
+        result = serialize(CountingList(range(10_000)), max_items=3)
+
+        assert result == [0, 1, 2, "... [truncated 9997 items]"]
+        assert CountingList.iterated == 3
+
+    def test_dataframe_matches_records_conversion(self) -> None:
+        dataframe = pd.DataFrame(
+            {
+                "int": [1, 2, 3],
+                "float": [1.5, np.nan, 3.0],
+                "text": ["a" * 30, "b", None],
+                "when": pd.to_datetime(["2024-01-01", "2024-01-02", None]),
+                "nested": [{"x": np.int64(1)}, [1, 2, 3, 4, 5], Decimal("1.5")],
+                "nullable": pd.array([1, None, 3], dtype="Int64"),
+            }
+        )
+
+        result = serialize(dataframe, max_length=10, max_items=2)
+
+        expected = serialize(dataframe.head(2).to_dict(orient="records"), max_length=10, max_items=2)
+        assert repr(result) == repr(expected)
+        assert result[1]["nullable"] is None
+        assert result[1]["nested"] == [1, 2, "... [trunc..."]
+
+    def test_unserializable_value_only_replaces_its_own_slot(self) -> None:
+        class Broken(PydanticBaseModel):
+            def model_dump(self, **_kwargs):
+                msg = "broken"
+                raise ValueError(msg)
+
+        assert serialize({"ok": [1, "two"], "broken": Broken()}) == {
+            "ok": [1, "two"],
+            "broken": "[Unserializable Object]",
+        }
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+from langflow.schema.message import Message
+from langflow.serialization.constants import MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
+from langflow.serialization.serialization import serialize
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(("max_length", "max_items"), [(None, None), (MAX_TEXT_LENGTH, MAX_ITEMS_LENGTH)])
+def test_serialize_nested_dicts(max_length, max_items):
+    payload = {
+        "results": [
+            {"id": index, "tags": [f"tag-{tag}" for tag in range(20)], "scores": {"a": index * 1.5, "b": None}}
+            for index in range(5000)
+        ]
+    }
+
+    result = serialize(payload, max_length, max_items)
+
+    assert result["results"][1] == payload["results"][1]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("max_items", [None, MAX_ITEMS_LENGTH])
+def test_serialize_large_dataframe(max_items):
+    rows = 100_000
+    dataframe = pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "score": np.random.default_rng(0).random(rows),
+            "flag": np.arange(rows) % 2 == 0,
+            "text": [f"row {index}" for index in range(rows)],
+        }
+    )
+    head = dataframe if max_items is None else dataframe.head(max_items)
+
+    result = serialize(dataframe, MAX_TEXT_LENGTH, max_items)
+
+    # The DataFrame is serialized column by column, with the same output as going through its records
+    assert result == serialize(head.to_dict(orient="records"), MAX_TEXT_LENGTH, max_items)
+
+
+@pytest.mark.benchmark
+def test_serialize_long_message_list():
+    messages = [
+        Message(text=f"message {index} " * 20, sender="Machine", sender_name="AI", session_id="session")
+        for index in range(2000)
+    ]
+
+    result = serialize(messages, MAX_TEXT_LENGTH, MAX_ITEMS_LENGTH)
+
+    assert len(result) == MAX_ITEMS_LENGTH + 1
+    assert result[0]["text"] == messages[0].text
@@ -0,0 +1,135 @@
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from langflow.services.api_key_cache import service as api_key_cache_module
+from langflow.services.api_key_cache.service import ApiKeyCacheService, ApiKeyPrincipal
+from langflow.services.database.models.api_key.model import ApiKey
+from langflow.services.database.models.user.model import User, UserRead
+from langflow.services.settings.base import Settings
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.fixture
+def settings():
+    settings = Settings()
+    # Settings are only read from the environment, so override them after creation
+    settings.api_key_cache_ttl = 30
+    settings.api_key_negative_cache_ttl = 5
+    settings.api_key_cache_max_size = 2
+    settings.api_key_usage_flush_interval = 60
+    return settings
+
+
+@pytest.fixture
+async def service(settings, async_session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(api_key_cache_module, "get_db_service", lambda: SimpleNamespace(engine=async_session.bind))
+    service = ApiKeyCacheService(SimpleNamespace(settings=settings))
+    service.start()
+    yield service
+    await service.stop()
+
+
+def make_principal(user_id=None) -> ApiKeyPrincipal:
+    user = User(id=user_id or uuid4(), username="user", password="password", is_active=True)  # noqa: S106
+    user = UserRead.model_validate(user, from_attributes=True)
+    return ApiKeyPrincipal(uuid4(), user)
+
+
+async def test_keys_are_cached_with_a_shorter_ttl_for_unknown_keys(service, monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(api_key_cache_module.time, "monotonic", lambda: clock[0])
+    principal = make_principal()
+
+    assert service.get("sk-valid") == (False, None)
+    service.set("sk-valid", principal)
+    service.set("sk-unknown", None)
+
+    assert service.get("sk-valid") == (True, principal)
+    assert service.get("sk-unknown") == (True, None)
+    clock[0] = 10
+    assert service.get("sk-valid") == (True, principal)
+    assert service.get("sk-unknown") == (False, None)
+    clock[0] = 40
+    assert service.get("sk-valid") == (False, None)
+    assert service.stats()["hits"] == 3
+
+
+async def test_keys_are_invalidated_and_bounded(service):
+    first, second = make_principal(), make_principal()
+    service.set("sk-first", first)
+    service.set("sk-second", second)
+    service.set("sk-third", None)
+
+    # The oldest key was dropped to stay within max_size
+    assert service.get("sk-first") == (False, None)
+
+    service.invalidate_user(second.user.id)
+    service.set("sk-first", first)
+    service.invalidate_key("sk-third")
+
+    assert service.get("sk-second") == (False, None)
+    assert service.get("sk-third") == (False, None)
+    assert service.get("sk-first") == (True, first)
+
+
+async def test_uses_are_aggregated_and_written_in_one_update(service, async_session):
+    user = User(username="api-key-user", password="password", is_active=True)  # noqa: S106
+    busy, quiet = ApiKey(api_key="sk-busy", user=user), ApiKey(api_key="sk-quiet", user=user, total_uses=5)
+    async_session.add_all([busy, quiet])
+    await async_session.commit()
+
+    for _ in range(3):
+        assert service.record_use(busy.id)
+    assert service.record_use(str(quiet.id))
+    assert service.pending() == 4
+
+    assert await service.flush() == 4
+
+    await async_session.refresh(busy)
+    await async_session.refresh(quiet)
+    assert (busy.total_uses, quiet.total_uses) == (3, 6)
+    assert busy.last_used_at is not None
+    assert service.pending() == 0
+
+
+async def test_uses_are_kept_when_the_update_fails(service, async_session, monkeypatch):
+    user = User(username="api-key-user", password="password", is_active=True)  # noqa: S106
+    api_key = ApiKey(api_key="sk-key", user=user)
+    async_session.add(api_key)
+    await async_session.commit()
+    service.record_use(api_key.id)
+    service.record_use(api_key.id)
+
+    def failing_db_service():
+        msg = "database is locked"
+        raise RuntimeError(msg)
+
+    with monkeypatch.context() as patched:
+        patched.setattr(api_key_cache_module, "get_db_service", failing_db_service)
+        assert await service.flush() == 0
+    # Uses counted after the failed write are added to the ones that were not written
+    service.record_use(api_key.id)
+    assert service.pending() == 3
+
+    assert await service.flush() == 3
+    await async_session.refresh(api_key)
+    assert api_key.total_uses == 3
+
+
+async def test_uses_are_written_on_stop_and_not_counted_when_stopped(service, async_session, monkeypatch):
+    monkeypatch.setattr(service, "flush_interval", 0.01)
+    user = User(username="api-key-user", password="password", is_active=True)  # noqa: S106
+    api_key = ApiKey(api_key="sk-key", user=user)
+    async_session.add(api_key)
+    await async_session.commit()
+
+    service.record_use(api_key.id)
+    await service.stop()
+    await async_session.refresh(api_key)
+
+    assert api_key.total_uses == 1
+    assert not service.running
+    assert not service.record_use(api_key.id)
+    await asyncio.sleep(0)
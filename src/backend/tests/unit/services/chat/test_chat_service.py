@@ -0,0 +1,109 @@
+import asyncio
+import threading
+
+import pytest
+from langflow.services.cache.service import AsyncInMemoryCache, ThreadingInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.chat import service as chat_service_module
+from langflow.services.chat.locks import AsyncStripedLocks, LockWaitStats
+from langflow.services.chat.service import ChatService
+
+
+def make_chat_service(monkeypatch, cache, lock_stripes: int = 8) -> ChatService:
+    monkeypatch.setattr(chat_service_module, "get_cache_service", lambda: cache)
+    return ChatService(lock_stripes=lock_stripes)
+
+
+async def test_lock_count_does_not_grow_with_distinct_keys(monkeypatch):
+    chat_service = make_chat_service(monkeypatch, ThreadingInMemoryCache())
+
+    for index in range(1000):
+        await chat_service.set_cache(f"vertex-{index}", index)
+        assert (await chat_service.get_cache(f"vertex-{index}"))["result"] == index
+
+    assert len(chat_service._sync_cache_locks) == 8
+    assert len(chat_service.async_cache_locks) == 8
+    assert chat_service.lock_wait_stats.stats()["tracked_keys"] == 1000
+
+
+async def test_in_memory_cache_is_used_without_a_thread_hop(monkeypatch):
+    chat_service = make_chat_service(monkeypatch, ThreadingInMemoryCache())
+
+    async def fail(*_args, **_kwargs):
+        msg = "should not leave the event loop"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(chat_service_module.asyncio, "to_thread", fail)
+
+    assert await chat_service.set_cache("key", {"a": 1})
+    assert (await chat_service.get_cache("key"))["result"] == {"a": 1}
+    await chat_service.clear_cache("key")
+    assert await chat_service.get_cache("key") is CACHE_MISS
+
+
+async def test_in_memory_cache_falls_back_to_a_thread_when_the_stripe_is_held(monkeypatch):
+    chat_service = make_chat_service(monkeypatch, ThreadingInMemoryCache())
+    await chat_service.set_cache("key", "value")
+    stripe = chat_service._sync_cache_locks["key"]
+    acquired = threading.Event()
+    release = threading.Event()
+
+    def hold_stripe():
+        with stripe:
+            acquired.set()
+            release.wait()
+
+    holder = threading.Thread(target=hold_stripe)
+    holder.start()
+    acquired.wait()
+    pending = asyncio.create_task(chat_service.get_cache("key"))
+    await asyncio.sleep(0.05)
+    assert not pending.done()
+
+    release.set()
+    assert (await pending)["result"] == "value"
+    await asyncio.to_thread(holder.join)
+    stats = chat_service.lock_wait_stats.get("key")
+    assert stats["acquisitions"] == 2
+    assert stats["max_wait"] > 0
+
+
+async def test_async_cache_records_lock_wait_per_key(monkeypatch):
+    chat_service = make_chat_service(monkeypatch, AsyncInMemoryCache())
+
+    await asyncio.gather(*(chat_service.set_cache("flow", index) for index in range(5)))
+
+    assert (await chat_service.get_cache("flow"))["result"] in range(5)
+    assert chat_service.lock_wait_stats.get("flow")["acquisitions"] == 6
+    assert chat_service.lock_wait_stats.stats()["acquisitions"] == 6
+
+
+def test_async_striped_locks_are_recreated_for_a_new_event_loop():
+    locks = AsyncStripedLocks(stripes=2)
+
+    async def contend():
+        lock = locks["flow"]
+        async with lock:
+            waiter = asyncio.create_task(lock.acquire())
+            await asyncio.sleep(0)
+        await waiter
+        lock.release()
+        return lock
+
+    first = asyncio.run(contend())
+    second = asyncio.run(contend())
+
+    assert first is not second
+
+
+def test_lock_wait_stats_track_a_bounded_number_of_keys():
+    stats = LockWaitStats(max_keys=2)
+    stats.record("a", 0.5)
+    stats.record("b", 0.0)
+    stats.record("c", 0.2)
+
+    assert stats.get("a") is None
+    assert [key for key, _ in stats.slowest()] == ["c", "b"]
+    assert stats.stats() == pytest.approx(
+        {"acquisitions": 3, "contended": 2, "total_wait": 0.7, "max_wait": 0.5, "tracked_keys": 2}
+    )
@@ -0,0 +1,161 @@
+import gc
+import json
+import pickle
+import weakref
+
+import pytest
+from langflow.graph import Graph
+from langflow.services.cache.utils import CACHE_MISS, CacheMiss
+from langflow.services.chat.run_state import RunStateStore
+
+
+class PicklingCache:
+    """Stand-in for a serializing backend (Redis, disk) that records the bytes written per key."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+        self.writes: list[tuple[str, int]] = []
+
+    async def get(self, key, lock=None):  # noqa: ARG002
+        if key not in self.data:
+            return CACHE_MISS
+        return pickle.loads(self.data[key])  # noqa: S301
+
+    async def set(self, key, data, lock=None):  # noqa: ARG002
+        pickled = pickle.dumps({"result": data, "type": type(data)})
+        self.data[key] = pickled
+        self.writes.append((key, len(pickled)))
+        return True
+
+    async def clear(self, key, lock=None):  # noqa: ARG002
+        self.data.pop(key, None)
+
+
+@pytest.fixture
+def cache():
+    return PicklingCache()
+
+
+@pytest.fixture
+def store(cache):
+    return RunStateStore(cache.get, cache.set, cache.clear)
+
+
+@pytest.fixture
+def payload():
+    return json.loads(pytest.MEMORY_CHATBOT_NO_LLM.read_text(encoding="utf-8"))
+
+
+def build_graph(payload: dict) -> Graph:
+    graph = Graph.from_payload(payload["data"], flow_id="flow-1", flow_name="Memory Chatbot", user_id="user-1")
+    graph.set_run_id()
+    graph.prepare()
+    return graph
+
+
+@pytest.fixture
+def graph(payload):
+    return build_graph(payload)
+
+
+def _mark_built(graph: Graph, vertex_id: str) -> None:
+    vertex = graph.get_vertex(vertex_id)
+    vertex.built = True
+    vertex.results = {"message": "hello"}
+    vertex.artifacts = {}
+    vertex.built_object = {"message": "hello"}
+    vertex.built_result = {"message": "hello"}
+    vertex.full_data = vertex.data
+
+
+async def test_payload_is_written_once_per_run(store, cache, graph):
+    await store.save(graph)
+    first_vertex = graph.first_layer[0]
+    _mark_built(graph, first_vertex)
+    await store.save(graph, vertex_ids=[first_vertex])
+    await store.save(graph)
+
+    written_keys = [key for key, _ in cache.writes]
+    payload_key = RunStateStore.payload_key(graph.run_id)
+    assert written_keys.count(payload_key) == 1
+    assert written_keys.count(RunStateStore.vertex_key(graph.run_id, first_vertex)) == 1
+    assert written_keys.count(RunStateStore.state_key(graph.run_id)) == 3
+
+    payload_size = dict(cache.writes)[payload_key]
+    step_sizes = [size for key, size in cache.writes if key == RunStateStore.state_key(graph.run_id)]
+    assert max(step_sizes) < payload_size / 10
+
+
+async def test_live_graph_is_returned_without_rebuilding(store, graph):
+    await store.save(graph)
+
+    assert await store.load("flow-1") is graph
+
+
+async def test_live_graph_of_an_older_run_is_not_returned(store, cache, payload):
+    graph = build_graph(payload)
+    await store.save(graph)
+
+    # Another worker sharing the cache starts a new run of the same flow
+    other_store = RunStateStore(cache.get, cache.set, cache.clear)
+    newer = build_graph(payload)
+    await other_store.save(newer)
+
+    restored = await store.load("flow-1")
+
+    assert restored is not graph
+    assert restored.run_id == newer.run_id
+
+
+async def test_graph_is_rebuilt_from_payload_and_deltas(store, payload):
+    graph = build_graph(payload)
+    first_vertex = graph.first_layer[0]
+    graph.run_manager.add_to_vertices_being_run(first_vertex)
+    _mark_built(graph, first_vertex)
+    await store.save(graph, vertex_ids=[first_vertex])
+    run_id = graph.run_id
+    expected_run_state = graph.run_manager.to_dict()
+    graph_ref = weakref.ref(graph)
+    del graph
+    gc.collect()
+
+    restored = await store.load("flow-1")
+
+    assert isinstance(restored, Graph)
+    assert restored is not graph_ref()
+    assert restored.run_id == run_id
+    assert restored.flow_name == "Memory Chatbot"
+    assert restored.run_manager.to_dict() == expected_run_state
+    vertex = restored.get_vertex(first_vertex)
+    assert vertex.built
+    assert vertex.results == {"message": "hello"}
+    assert not any(v.built for v in restored.vertices if v.id != first_vertex)
+
+
+async def test_clear_removes_run_state(store, cache, graph):
+    first_vertex = graph.first_layer[0]
+    _mark_built(graph, first_vertex)
+    await store.save(graph, vertex_ids=[first_vertex])
+
+    await store.clear("flow-1")
+
+    assert cache.data == {}
+    assert isinstance(await store.load("flow-1"), CacheMiss)
+
+
+async def test_new_run_of_a_flow_removes_the_previous_run(store, cache, payload):
+    first = build_graph(payload)
+    first_vertex = first.first_layer[0]
+    _mark_built(first, first_vertex)
+    await store.save(first, vertex_ids=[first_vertex])
+
+    # The second run is saved by another worker, which doesn't know the vertices of the first one
+    second = build_graph(payload)
+    await RunStateStore(cache.get, cache.set, cache.clear).save(second)
+
+    assert not [key for key in cache.data if first.run_id in key]
+    assert set(cache.data) == {
+        RunStateStore.flow_key("flow-1"),
+        RunStateStore.payload_key(second.run_id),
+        RunStateStore.state_key(second.run_id),
+    }
@@ -0,0 +1,124 @@
+import asyncio
+import json
+
+import pytest
+from langflow.events.event_manager import create_default_event_manager
+from langflow.services.job_queue.job_queue import JobQueue, QueueMemoryBudget
+from langflow.services.job_queue.service import JobQueueService
+
+
+def _send_tokens(queue: JobQueue, chunks: list[str], message_id: str = "message-1") -> None:
+    event_manager = create_default_event_manager(queue)
+    for chunk in chunks:
+        event_manager.on_token(data={"chunk": chunk, "id": message_id})
+
+
+def _drain(queue: JobQueue) -> list[dict]:
+    events = []
+    while not queue.empty():
+        _, frame, _ = queue.get_nowait()
+        events.append(json.loads(frame))
+    return events
+
+
+async def test_coalesce_policy_merges_consecutive_tokens():
+    queue = JobQueue(max_events=2, overflow_policy="coalesce")
+    event_manager = create_default_event_manager(queue)
+    event_manager.on_build_start(data={"id": "vertex-1"})
+
+    _send_tokens(queue, ["Hel", "lo", " wor", "ld"])
+    _send_tokens(queue, ["!"], message_id="message-2")
+
+    events = _drain(queue)
+    assert [event["event"] for event in events] == ["build_start", "token", "token"]
+    assert events[1]["data"]["chunk"] == "Hello world"
+    assert (events[2]["data"]["chunk"], events[2]["data"]["id"]) == ("!", "message-2")
+    assert queue.coalesced == 3
+    assert queue.bytes == 0
+
+
+async def test_drop_policy_never_drops_other_events():
+    queue = JobQueue(max_events=1, overflow_policy="drop")
+    event_manager = create_default_event_manager(queue)
+
+    _send_tokens(queue, ["a", "b", "c"])
+    event_manager.on_end(data={})
+
+    assert [event["event"] for event in _drain(queue)] == ["token", "end"]
+    assert queue.dropped == 2
+
+
+async def test_block_policy_pauses_producer_until_consumer_catches_up():
+    queue = JobQueue(max_events=2, overflow_policy="block")
+    _send_tokens(queue, ["a", "b"])
+
+    waiter = asyncio.create_task(create_default_event_manager(queue).wait_for_capacity())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    queue.get_nowait()
+    await asyncio.wait_for(waiter, timeout=1)
+    assert queue.qsize() == 1
+
+
+async def test_memory_budget_is_shared_between_queues():
+    budget = QueueMemoryBudget(max_bytes=250)
+    first = JobQueue(overflow_policy="block", memory_budget=budget)
+    second = JobQueue(overflow_policy="coalesce", memory_budget=budget)
+
+    # The first token fits the budget, the second one does not and the producer cannot wait for other jobs
+    _send_tokens(first, ["x" * 100, "y" * 100])
+    _send_tokens(second, ["a", "b"])
+
+    assert first.dropped == 1
+    assert second.coalesced == 1
+    assert budget.used_bytes == first.bytes + second.bytes
+
+    _drain(first)
+    _drain(second)
+    assert budget.used_bytes == 0
+
+
+async def test_queue_metrics_report_depth_and_lag():
+    queue = JobQueue(max_events=10)
+    _send_tokens(queue, ["a", "b"])
+    await asyncio.sleep(0.01)
+
+    metrics = queue.metrics()
+
+    assert metrics["depth"] == 2
+    assert metrics["high_watermark"] == 2
+    assert metrics["lag"] > 0
+    assert metrics["bytes"] == queue.bytes > 0
+
+
+def test_invalid_overflow_policy():
+    with pytest.raises(ValueError, match="Invalid overflow policy"):
+        JobQueue(overflow_policy="ignore")
+
+
+async def test_service_creates_bounded_queues_from_settings():
+    class Settings:
+        job_queue_max_events = 5
+        job_queue_max_bytes = 1024
+        job_queue_overflow_policy = "drop"
+        job_queue_memory_budget = 4096
+        token_flush_interval = 0.02
+        token_flush_bytes = 512
+
+    class SettingsService:
+        settings = Settings()
+
+    service = JobQueueService(SettingsService())
+    queue, event_manager = service.create_queue("job-1")
+    event_manager.on_token(data={"chunk": "a", "id": "message-1"})
+
+    assert isinstance(queue, JobQueue)
+    assert (queue.max_events, queue.max_bytes, queue.overflow_policy) == (5, 1024, "drop")
+    assert (event_manager.token_flush_interval, event_manager.token_flush_bytes) == (0.02, 512)
+    metrics = service.get_queue_metrics()
+    assert metrics["jobs"]["job-1"]["depth"] == 1
+    assert metrics["memory_budget"] == {"used_bytes": queue.bytes, "max_bytes": 4096}
+
+    await service.cleanup_job("job-1")
+    assert service.memory_budget.used_bytes == 0
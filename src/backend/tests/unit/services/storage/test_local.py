@@ -0,0 +1,67 @@
+import hashlib
+from types import SimpleNamespace
+
+import pytest
+from langflow.services.storage.local import LocalStorageService
+
+
+@pytest.fixture
+def storage(tmp_path):
+    settings_service = SimpleNamespace(settings=SimpleNamespace(config_dir=str(tmp_path)))
+    return LocalStorageService(None, settings_service)
+
+
+async def chunked(data: bytes, chunk_size: int):
+    for offset in range(0, len(data), chunk_size):
+        yield data[offset : offset + chunk_size]
+
+
+async def collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+async def test_save_file_stream_hashes_as_it_writes(storage):
+    data = bytes(range(256)) * 1000
+
+    stored = await storage.save_file_stream("flow", "data.bin", chunked(data, 1000))
+
+    assert stored.size == len(data)
+    assert stored.sha256 == hashlib.sha256(data).hexdigest()
+    assert await storage.get_file("flow", "data.bin") == data
+    assert await storage.list_files("flow") == ["data.bin"]
+
+
+async def test_save_file_stream_leaves_nothing_behind_on_failure(storage):
+    async def failing():
+        yield b"partial"
+        msg = "connection lost"
+        raise ConnectionError(msg)
+
+    with pytest.raises(ConnectionError):
+        await storage.save_file_stream("flow", "data.bin", failing())
+
+    assert await storage.list_files("flow") == []
+
+
+async def test_get_file_stream_reads_ranges_in_chunks(storage):
+    data = b"0123456789" * 10
+    await storage.save_file("flow", "data.txt", data)
+
+    chunks = [chunk async for chunk in storage.get_file_stream("flow", "data.txt", chunk_size=30)]
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    assert await collect(storage.get_file_stream("flow", "data.txt", 5, 24, chunk_size=7)) == data[5:25]
+    assert await collect(storage.get_file_stream("flow", "data.txt", 95)) == data[95:]
+    with pytest.raises(FileNotFoundError):
+        await collect(storage.get_file_stream("flow", "missing.txt"))
+
+
+async def test_rename_file_replaces_the_target(storage):
+    await storage.save_file("flow", "upload.part", b"new")
+    await storage.save_file("flow", "data.txt", b"old")
+
+    await storage.rename_file("flow", "upload.part", "data.txt")
+
+    assert await storage.get_file("flow", "data.txt") == b"new"
+    assert await storage.list_files("flow") == ["data.txt"]
+    with pytest.raises(FileNotFoundError):
+        await storage.rename_file("flow", "upload.part", "other.txt")
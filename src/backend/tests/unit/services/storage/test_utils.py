@@ -0,0 +1,25 @@
+import pytest
+from langflow.services.storage.utils import RangeNotSatisfiableError, parse_range_header
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("bytes=0-9", (0, 9)),
+        ("bytes=10-", (10, 99)),
+        ("bytes=-10", (90, 99)),
+        ("bytes=-500", (0, 99)),
+        ("bytes=50-500", (50, 99)),
+        ("bytes=0-1,5-6", None),
+        ("items=0-9", None),
+    ],
+)
+def test_parse_range_header(header, expected):
+    assert parse_range_header(header, 100) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=100-", "bytes=9-5", "bytes=-0", "bytes=a-b", "bytes=-"])
+def test_parse_range_header_not_satisfiable(header):
+    with pytest.raises(RangeNotSatisfiableError):
+        parse_range_header(header, 100)
@@ -0,0 +1,131 @@
+import asyncio
+from types import SimpleNamespace
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+from langflow.services.settings.base import Settings
+from langflow.services.telemetry.schema import ComponentPayload, PlaygroundPayload, RunPayload
+from langflow.services.telemetry.service import TelemetryService
+
+
+class TelemetryEndpoint:
+    """Stands in for the telemetry endpoint and records every request it receives."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200)
+
+    def paths(self) -> list[str]:
+        # Leave out the version event sent on start
+        return [request.url.path for request in self.requests if request.url.path != "/"]
+
+    def params(self, path: str) -> list[dict[str, str]]:
+        return [
+            {key: values[0] for key, values in parse_qs(request.url.query.decode()).items()}
+            for request in self.requests
+            if request.url.path == path
+        ]
+
+
+@pytest.fixture
+def settings():
+    settings = Settings()
+    # Settings are only read from the environment, so override them after creation
+    settings.do_not_track = False
+    settings.telemetry_base_url = "http://telemetry.test"
+    settings.telemetry_flush_interval = 60
+    settings.telemetry_max_queue_size = 3
+    return settings
+
+
+@pytest.fixture
+def endpoint():
+    return TelemetryEndpoint()
+
+
+@pytest.fixture
+async def service(settings, endpoint, monkeypatch):
+    monkeypatch.delenv("DO_NOT_TRACK", raising=False)
+    service = TelemetryService(SimpleNamespace(settings=settings))
+    await service.client.aclose()
+    service.client = httpx.AsyncClient(transport=httpx.MockTransport(endpoint))
+    yield service
+    await service.client.aclose()
+
+
+def component_payload(name: str, seconds: int, *, success: bool = True) -> ComponentPayload:
+    return ComponentPayload(
+        component_name=name,
+        component_seconds=seconds,
+        component_success=success,
+        component_error_message=None if success else f"{name} failed",
+    )
+
+
+async def test_component_builds_are_sent_as_one_batch_per_component(service, endpoint):
+    for index in range(1000):
+        await service.log_package_component(component_payload("ChatInput", index % 3))
+    await service.log_package_component(component_payload("OpenAIModel", 7))
+    await service.log_package_component(component_payload("OpenAIModel", 400, success=False))
+
+    assert endpoint.requests == []
+    await service.flush()
+
+    assert endpoint.paths() == ["/component_batch", "/component_batch"]
+    chat_input, openai_model = endpoint.params("/component_batch")
+    assert chat_input["componentName"] == "ChatInput"
+    assert chat_input["componentCount"] == "1000"
+    assert chat_input["componentErrorCount"] == "0"
+    assert chat_input["componentSeconds"] == str(sum(index % 3 for index in range(1000)))
+    assert chat_input["componentSecondsHistogram"] == "1:667,5:333,10:0,30:0,60:0,300:0,+Inf:0"
+    assert openai_model["componentCount"] == "2"
+    assert openai_model["componentErrorCount"] == "1"
+    assert openai_model["componentErrorMessage"] == "OpenAIModel failed"
+    assert openai_model["componentSecondsHistogram"] == "1:0,5:0,10:1,30:0,60:0,300:0,+Inf:1"
+
+    await service.flush()
+    assert len(endpoint.requests) == 2
+
+
+async def test_full_queue_drops_the_oldest_events(service, endpoint):
+    for index in range(5):
+        await service.log_package_run(RunPayload(run_seconds=index, run_success=True))
+
+    assert service.dropped == 2
+    await service.flush()
+
+    assert [params["runSeconds"] for params in endpoint.params("/run")] == ["2", "3", "4"]
+
+
+async def test_worker_sends_in_periodic_batches_and_stop_flushes(service, endpoint, settings):
+    service.flush_interval = 0.05
+    service.start()
+
+    for index in range(100):
+        await service.log_package_component(component_payload("ChatInput", 0))
+        await service.log_package_playground(
+            PlaygroundPayload(playground_seconds=index, playground_success=True, playground_component_count=1)
+        )
+    await asyncio.sleep(0.15)
+    assert endpoint.paths() == ["/playground"] * settings.telemetry_max_queue_size + ["/component_batch"]
+
+    await service.log_package_component(component_payload("ChatInput", 0))
+    await service.stop()
+    assert endpoint.paths()[-1] == "/component_batch"
+    assert not service.running
+    await service.log_package_component(component_payload("ChatInput", 0))
+    assert not service.component_stats
+
+
+async def test_do_not_track_sends_nothing(service, endpoint):
+    service.do_not_track = True
+
+    await service.log_package_component(component_payload("ChatInput", 0))
+    await service.log_package_run(RunPayload(run_seconds=0, run_success=True))
+    await service.flush()
+
+    assert endpoint.requests == []
@@ -0,0 +1,196 @@
+import threading
+import time
+
+import pytest
+from langflow.services.tracing.exporter import TraceExporter
+
+
+@pytest.fixture
+def gate():
+    """Holds the worker on its first span so the next ones stay queued."""
+    event = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        event.wait(5)
+
+    yield block, started, event
+    event.set()
+
+
+def test_spans_of_a_lane_are_exported_in_order():
+    exporter = TraceExporter(workers=2, batch_size=3)
+    exported = []
+
+    for index in range(20):
+        exporter.submit(("trace", "tracer"), exported.append, index)
+
+    assert exporter.flush(5)
+    assert exported == list(range(20))
+    stats = exporter.stats()
+    assert stats["exported"] == 20
+    assert stats["pending"] == 0
+    assert stats["dropped"] == 0
+    exporter.shutdown(5)
+
+
+def test_drop_newest_keeps_the_queued_spans(gate):
+    block, started, release = gate
+    exporter = TraceExporter(workers=1, max_queue_size=2, drop_policy="drop_newest")
+    exported = []
+
+    exporter.submit("lane", block)
+    assert started.wait(5)
+    results = [exporter.submit("lane", exported.append, index) for index in range(4)]
+    release.set()
+
+    assert exporter.flush(5)
+    assert results == [True, True, False, False]
+    assert exported == [0, 1]
+    assert exporter.dropped == 2
+    exporter.shutdown(5)
+
+
+def test_drop_oldest_keeps_the_latest_spans(gate):
+    block, started, release = gate
+    exporter = TraceExporter(workers=1, max_queue_size=2, drop_policy="drop_oldest")
+    exported = []
+
+    exporter.submit("lane", block)
+    assert started.wait(5)
+    for index in range(4):
+        assert exporter.submit("lane", exported.append, index)
+    release.set()
+
+    assert exporter.flush(5)
+    assert exported == [2, 3]
+    assert exporter.stats()["dropped"] == 2
+    exporter.shutdown(5)
+
+
+def test_spans_that_are_not_droppable_are_always_kept(gate):
+    block, started, release = gate
+    exporter = TraceExporter(workers=1, max_queue_size=1)
+    exported = []
+
+    exporter.submit("lane", block)
+    assert started.wait(5)
+    exporter.submit("lane", exported.append, "span")
+    assert not exporter.submit("lane", exported.append, "dropped")
+    assert exporter.submit("lane", exported.append, "end", droppable=False)
+    release.set()
+
+    assert exporter.flush(5)
+    assert exported == ["span", "end"]
+    exporter.shutdown(5)
+
+
+def test_stats_report_the_export_lag(gate):
+    block, started, release = gate
+    exporter = TraceExporter(workers=1)
+
+    exporter.submit("lane", block)
+    assert started.wait(5)
+    exporter.submit("lane", lambda: None)
+    time.sleep(0.05)
+    release.set()
+
+    assert exporter.flush(5)
+    stats = exporter.stats()
+    assert stats["max_lag"] >= 0.05
+    assert 0 < stats["mean_lag"] <= stats["max_lag"]
+    exporter.shutdown(5)
+
+
+def test_shutdown_exports_the_queued_spans_and_rejects_new_ones():
+    exporter = TraceExporter(workers=1)
+    exported = []
+
+    for index in range(10):
+        exporter.submit("lane", exported.append, index)
+    exporter.shutdown(5)
+
+    assert exported == list(range(10))
+    assert not exporter.submit("lane", exported.append, 10)
+
+
+def test_drop_newest_drops_the_end_of_a_dropped_trace(gate):
+    block, started, release = gate
+    exporter = TraceExporter(workers=1, max_queue_size=1, drop_policy="drop_newest")
+    exported = []
+
+    exporter.submit("lane", block)
+    assert started.wait(5)
+    assert exporter.submit("lane", exported.append, "start a", trace="a")
+    assert not exporter.submit("lane", exported.append, "start b", trace="b")
+    assert not exporter.submit("lane", exported.append, "end b", trace="b", ends_trace=True)
+    assert exporter.submit("lane", exported.append, "end a", trace="a", ends_trace=True)
+    release.set()
+
+    assert exporter.flush(5)
+    assert exported == ["start a", "end a"]
+    assert exporter.dropped == 2
+    exporter.shutdown(5)
+
+
+def test_drop_oldest_drops_whole_traces(gate):
+    block, started, release = gate
+    exporter = TraceExporter(workers=1, max_queue_size=2, drop_policy="drop_oldest")
+    exported = []
+
+    exporter.submit("lane", block)
+    assert started.wait(5)
+    for trace in "abc":
+        assert exporter.submit("lane", exported.append, f"start {trace}", trace=trace)
+    for trace in "abc":
+        exporter.submit("lane", exported.append, f"end {trace}", trace=trace, ends_trace=True)
+    release.set()
+
+    assert exporter.flush(5)
+    assert exported == ["start b", "start c", "end b", "end c"]
+    assert exporter.dropped == 2
+    exporter.shutdown(5)
+
+
+def test_spans_of_a_lane_are_exported_in_one_batch(gate):
+    block, started, release = gate
+    batches = []
+
+    def export_batch(key, calls):
+        batches.append((key, len(calls)))
+        for call in calls:
+            call()
+
+    exporter = TraceExporter(workers=1, batch_size=10, export_batch=export_batch)
+    exporter.submit("first", block)
+    assert started.wait(5)
+    for _ in range(3):
+        exporter.submit("first", lambda: None)
+        exporter.submit("second", lambda: None)
+    release.set()
+
+    assert exporter.flush(5)
+    assert batches == [("first", 1), ("first", 3), ("second", 3)]
+    stats = exporter.stats()
+    assert stats["exported"] == 7
+    assert stats["workers"][0]["exported"] == 7
+    exporter.shutdown(5)
+
+
+def test_updates_are_reported_when_spans_are_queued_dropped_and_exported(gate):
+    block, started, release = gate
+    reported = []
+    exporter = TraceExporter(workers=1, max_queue_size=1)
+    exporter.on_update = lambda: reported.append((exporter.pending(), exporter.dropped))
+
+    exporter.submit("tracer", block)
+    assert started.wait(5)
+    exporter.submit("tracer", lambda: None)
+    exporter.submit("tracer", lambda: None)
+    assert reported[-2:] == [(1, 0), (1, 1)]
+
+    release.set()
+    assert exporter.flush(5)
+    assert reported[-1] == (0, 1)
+    exporter.shutdown(5)
@@ -0,0 +1,32 @@
+import threading
+import uuid
+from collections import OrderedDict
+from unittest.mock import MagicMock
+
+from langflow.services.tracing.langfuse import LangFuseTracer
+
+
+def test_span_ended_by_the_exporter_while_getting_the_langchain_callback(monkeypatch):
+    monkeypatch.setattr(LangFuseTracer, "_get_config", staticmethod(dict))
+    tracer = LangFuseTracer("flow - id", "chain", "project", uuid.uuid4())
+    tracer._ready = True
+    tracer.trace = MagicMock()
+    threads = []
+
+    class Spans(OrderedDict):
+        def __reversed__(self):
+            keys = list(super().__reversed__())
+            # The export thread ends the span between the lookup of the last key and of its span
+            thread = threading.Thread(target=tracer.end_trace, args=("component", "Component"))
+            thread.start()
+            thread.join(0.1)
+            threads.append(thread)
+            return iter(keys)
+
+    tracer.spans = Spans()
+    tracer.add_trace("component", "Component", "chain", {})
+    span = tracer.spans["component"]
+
+    assert tracer.get_langchain_callback() is span.get_langchain_handler.return_value
+    threads[0].join(5)
+    assert not tracer.spans
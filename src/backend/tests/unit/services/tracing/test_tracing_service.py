@@ -1,4 +1,6 @@
 import asyncio
+import threading
+import time
 import uuid
 from unittest.mock import MagicMock, patch
 
@@ -103,8 +105,10 @@ def mock_settings_service():
 
 
 @pytest.fixture
-def tracing_service(mock_settings_service):
-    return TracingService(mock_settings_service)
+async def tracing_service(mock_settings_service):
+    service = TracingService(mock_settings_service)
+    yield service
+    await service.teardown()
 
 
 @pytest.fixture
@@ -171,6 +175,7 @@ async def test_start_end_tracers(tracing_service):
     assert "arize_phoenix" in trace_context.tracers
 
     await tracing_service.end_tracers(outputs)
+    await tracing_service.flush()
 
     # Verify end method was called for all tracers
     trace_context = trace_context_var.get()
@@ -179,8 +184,6 @@ async def test_start_end_tracers(tracing_service):
         assert tracer.metadata_param == outputs
         assert tracer.outputs_param == trace_context.all_outputs
 
-    # Verify worker_task is cancelled
-    assert trace_context.worker_task is None
     assert not trace_context.running
 
 
@@ -212,7 +215,7 @@ async def test_trace_component(tracing_service, mock_component):
         assert component_context.inputs_metadata == metadata
 
         # Verify add_trace method was called for tracers
-        await asyncio.sleep(0.1)  # Wait for async queue processing
+        await tracing_service.flush()
         trace_context = trace_context_var.get()
         for tracer in trace_context.tracers.values():
             assert tracer.add_trace_list[0]["trace_id"] == mock_component._vertex.id
@@ -235,7 +238,7 @@ async def test_trace_component(tracing_service, mock_component):
         assert trace_context.all_outputs[trace_name] == outputs
 
     # Verify end_trace method was called for tracers
-    await asyncio.sleep(0.1)  # Wait for async queue processing
+    await tracing_service.flush()
     for tracer in trace_context.tracers.values():
         assert tracer.end_trace_list[0]["trace_id"] == mock_component._vertex.id
         assert tracer.end_trace_list[0]["trace_name"] == trace_name
@@ -269,7 +272,7 @@ async def test_trace_component_with_exception(tracing_service, mock_component):
             raise test_exception
 
     # Verify end_trace method was called with exception
-    await asyncio.sleep(0.1)  # Wait for async queue processing
+    await tracing_service.flush()
     trace_context = trace_context_var.get()
     for tracer in trace_context.tracers.values():
         assert tracer.end_trace_list[0]["error"] == test_exception
@@ -415,16 +418,14 @@ async def test_trace_worker_with_exception(tracing_service):
         msg = "Mock trace function exception"
         raise ValueError(msg)
 
-    with patch("langflow.services.tracing.service.logger.exception") as mock_logger:
+    with patch("langflow.services.tracing.exporter.logger.exception") as mock_logger:
         # Remove incorrect context manager usage
         await tracing_service.start_tracers(run_id, run_name, user_id, session_id, project_name)
 
-        # Get trace_context and add failing trace function to queue
-        trace_context = trace_context_var.get()
-        await trace_context.traces_queue.put((failing_trace_func, ()))
-
-        # Wait for async queue processing
-        await asyncio.sleep(0.1)
+        # Queue the failing trace function on the lane of a tracer
+        tracer = next(iter(trace_context_var.get().tracers.values()))
+        tracing_service.exporter.submit(tracer, failing_trace_func)
+        await tracing_service.flush()
 
         # Verify exception was logged
         mock_logger.assert_called_with("Error processing trace_func")
@@ -465,6 +466,7 @@ async def test_concurrent_tracing(tracing_service, mock_component):
         await task2
 
         await tracing_service.end_tracers({"final_output": f"{task_prefix}_final_output"})
+        await tracing_service.flush()
         trace_context = trace_context_var.get()
         return trace_context.tracers["langfuse"]
 
@@ -517,3 +519,120 @@ async def test_concurrent_tracing(tracing_service, mock_component):
     assert tracer2.session_id == "session_id2"
     assert dict(tracer2.outputs_param.get("run_id2 trace_name1")) == {"output_key": "task2_run_id2 component1_output"}
     assert dict(tracer2.outputs_param.get("run_id2 trace_name2")) == {"output_key": "task2_run_id2 component2_output"}
+
+
+class SlowTracer(MockTracer):
+    def add_trace(self, *args, **kwargs) -> None:
+        time.sleep(0.2)
+        super().add_trace(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_slow_tracer_does_not_delay_the_build(tracing_service, mock_component):
+    """A slow tracing backend delays the export of spans, never the build itself."""
+    with (
+        patch("langflow.services.tracing.service._get_langsmith_tracer", return_value=SlowTracer),
+        patch("langflow.services.tracing.service._get_langwatch_tracer", return_value=MockTracer),
+        patch("langflow.services.tracing.service._get_langfuse_tracer", return_value=MockTracer),
+        patch("langflow.services.tracing.service._get_arize_phoenix_tracer", return_value=MockTracer),
+        patch("langflow.services.tracing.service._get_opik_tracer", return_value=MockTracer),
+    ):
+        await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+
+    start = time.perf_counter()
+    for index in range(5):
+        async with tracing_service.trace_component(mock_component, f"trace {index}", {}):
+            pass
+    await tracing_service.end_tracers({})
+    assert time.perf_counter() - start < 0.2
+
+    slow_tracer = trace_context_var.get().tracers["langsmith"]
+    assert not slow_tracer.end_called
+
+    await tracing_service.flush()
+    assert [trace["trace_name"] for trace in slow_tracer.add_trace_list] == [f"trace {index}" for index in range(5)]
+    assert slow_tracer.end_called
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_cancelled_component_build_ends_its_trace(tracing_service, mock_component):
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+
+    with pytest.raises(asyncio.CancelledError):
+        async with tracing_service.trace_component(mock_component, "test_component_trace", {}):
+            raise asyncio.CancelledError
+
+    await tracing_service.end_tracers({})
+    await tracing_service.flush()
+    for tracer in trace_context_var.get().tracers.values():
+        assert [trace["trace_name"] for trace in tracer.end_trace_list] == ["test_component_trace"]
+        assert tracer.end_trace_list[0]["error"] is None
+
+
+@pytest.mark.asyncio
+async def test_export_stats_are_reported_as_spans_are_queued_and_exported(tracing_service, mock_component):
+    gauges = {}
+    tracing_service.ot = MagicMock()
+    tracing_service.ot.update_gauge.side_effect = lambda name, value, labels: gauges.__setitem__(
+        (name, labels["worker"]), value
+    )
+    with (
+        patch("langflow.services.tracing.service._get_langsmith_tracer", return_value=SlowTracer),
+        patch("langflow.services.tracing.service._get_langwatch_tracer", return_value=MockTracer),
+        patch("langflow.services.tracing.service._get_langfuse_tracer", return_value=MockTracer),
+        patch("langflow.services.tracing.service._get_arize_phoenix_tracer", return_value=MockTracer),
+        patch("langflow.services.tracing.service._get_opik_tracer", return_value=MockTracer),
+    ):
+        await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+    for index in range(3):
+        async with tracing_service.trace_component(mock_component, f"trace {index}", {}):
+            pass
+
+    # The slow tracer is still exporting, and the run has not ended yet
+    assert {name for name, _ in gauges} == {"trace_export_pending", "trace_export_dropped", "trace_export_max_lag"}
+    assert {worker for _, worker in gauges} == {
+        str(index) for index in range(tracing_service.settings_service.settings.trace_export_workers)
+    }
+    assert sum(value for (name, _), value in gauges.items() if name == "trace_export_pending") > 0
+
+    await tracing_service.end_tracers({})
+    await tracing_service.flush()
+    assert all(value == 0 for (name, _), value in gauges.items() if name == "trace_export_pending")
+
+
+class BlockingTracer(MockTracer):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.adding = threading.Event()
+        self.calls: list[str] = []
+
+    def add_trace(self, *args, **kwargs) -> None:
+        self.adding.set()
+        time.sleep(0.2)
+        super().add_trace(*args, **kwargs)
+        self.calls.append("add_trace")
+
+    def get_langchain_callback(self):
+        self.calls.append("get_langchain_callback")
+        return super().get_langchain_callback()
+
+
+@pytest.mark.asyncio
+async def test_langchain_callback_is_not_taken_while_the_tracer_is_exporting(tracing_service, mock_component):
+    with (
+        patch("langflow.services.tracing.service._get_langsmith_tracer", return_value=BlockingTracer),
+        patch("langflow.services.tracing.service._get_langwatch_tracer", return_value=MockTracer),
+        patch("langflow.services.tracing.service._get_langfuse_tracer", return_value=MockTracer),
+        patch("langflow.services.tracing.service._get_arize_phoenix_tracer", return_value=MockTracer),
+        patch("langflow.services.tracing.service._get_opik_tracer", return_value=MockTracer),
+    ):
+        await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+    tracer = trace_context_var.get().tracers["langsmith"]
+
+    async with tracing_service.trace_component(mock_component, "test_component_trace", {}):
+        assert await asyncio.to_thread(tracer.adding.wait, 5)
+        tracing_service.get_langchain_callbacks()
+
+    assert tracer.calls == ["add_trace", "get_langchain_callback"]
+    await tracing_service.end_tracers({})
@@ -0,0 +1,77 @@
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import pytest
+from langflow.services.variable.base import ResolvedVariable
+from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
+from langflow.services.variable.resolver import VariableResolver
+
+
+class FakeVariableService:
+    def __init__(self, variables, *, batched=True):
+        self.variables = variables
+        self.batched = batched
+        self.batches = []
+        self.lookups = []
+
+    async def get_variables(self, user_id, names, session):  # noqa: ARG002
+        if not self.batched:
+            return None
+        self.batches.append(set(names))
+        return {name: self.variables[name] for name in names if name in self.variables}
+
+    async def get_variable(self, user_id, name, field, session):  # noqa: ARG002
+        self.lookups.append(name)
+        return self.variables[name].value
+
+
+@pytest.fixture(autouse=True)
+def no_database(monkeypatch):
+    @asynccontextmanager
+    async def session_scope():
+        yield None
+
+    monkeypatch.setattr("langflow.services.variable.resolver.session_scope", session_scope)
+
+
+async def test_resolver_loads_the_variables_of_a_run_once():
+    service = FakeVariableService(
+        {
+            "OPENAI_API_KEY": ResolvedVariable(CREDENTIAL_TYPE, "sk-1"),
+            "MODEL": ResolvedVariable(GENERIC_TYPE, "gpt"),
+        }
+    )
+    resolver = VariableResolver({"OPENAI_API_KEY", "MODEL"}, service)
+    user_id = uuid4()
+
+    for _ in range(15):
+        assert await resolver.get_variable(user_id, "OPENAI_API_KEY", "api_key") == "sk-1"
+    assert await resolver.get_variable(str(user_id), "MODEL", "session_id") == "gpt"
+    assert service.batches == [{"OPENAI_API_KEY", "MODEL"}]
+
+    # Names unknown when the graph was prepared are loaded on their own
+    with pytest.raises(ValueError, match="OTHER variable not found."):
+        await resolver.get_variable(user_id, "OTHER", "api_key")
+    with pytest.raises(ValueError, match="OTHER variable not found."):
+        await resolver.get_variable(user_id, "OTHER", "api_key")
+    assert service.batches == [{"OPENAI_API_KEY", "MODEL"}, {"OTHER"}]
+    assert resolver.queries == 2
+
+
+async def test_resolver_keeps_the_checks_of_get_variable():
+    service = FakeVariableService({"OPENAI_API_KEY": ResolvedVariable(CREDENTIAL_TYPE, "sk-1")})
+    resolver = VariableResolver({"OPENAI_API_KEY"}, service)
+
+    with pytest.raises(TypeError, match="cannot be used in a Session ID field"):
+        await resolver.get_variable(uuid4(), "OPENAI_API_KEY", "session_id")
+
+
+async def test_resolver_falls_back_to_get_variable():
+    service = FakeVariableService({"OPENAI_API_KEY": ResolvedVariable(CREDENTIAL_TYPE, "sk-1")}, batched=False)
+    resolver = VariableResolver({"OPENAI_API_KEY"}, service)
+    user_id = uuid4()
+
+    assert await resolver.get_variable(user_id, "OPENAI_API_KEY", "api_key") == "sk-1"
+    assert await resolver.get_variable(user_id, "OPENAI_API_KEY", "api_key") == "sk-1"
+    assert service.lookups == ["OPENAI_API_KEY", "OPENAI_API_KEY"]
+    assert resolver.queries == 0
@@ -6,7 +6,8 @@ import pytest
 from langflow.services.database.models.variable.model import VariableUpdate
 from langflow.services.deps import get_settings_service
 from langflow.services.settings.constants import VARIABLES_TO_GET_FROM_ENVIRONMENT
-from langflow.services.variable.constants import CREDENTIAL_TYPE
+from langflow.services.variable.base import ResolvedVariable
+from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 from langflow.services.variable.service import DatabaseVariableService
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import SQLModel
@@ -99,6 +100,35 @@ async def test_get_variable__typeerror(service, session: AsyncSession):
     assert "purpose is to prevent the exposure of value" in str(exc.value)
 
 
+async def test_get_variables(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "first", "value1", session=session)
+    await service.create_variable(user_id, "second", "value2", type_=GENERIC_TYPE, session=session)
+    await service.create_variable(uuid4(), "third", "value3", session=session)
+
+    result = await service.get_variables(user_id, ["first", "second", "third", "missing"], session=session)
+
+    assert result == {
+        "first": ResolvedVariable(CREDENTIAL_TYPE, "value1"),
+        "second": ResolvedVariable(GENERIC_TYPE, "value2"),
+    }
+
+
+async def test_get_variables__cached_until_changed(service, session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(service.settings_service.settings, "variable_cache_ttl", 60.0)
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "value", session=session)
+    assert (await service.get_variables(user_id, ["name", "missing"], session=session))["name"].value == "value"
+
+    with patch.object(session, "exec", side_effect=AssertionError("queried")):
+        result = await service.get_variables(user_id, ["name", "missing"], session=session)
+    assert result == {"name": ResolvedVariable(CREDENTIAL_TYPE, "value")}
+
+    await service.update_variable(user_id, "name", "new value", session=session)
+    result = await service.get_variables(user_id, ["name"], session=session)
+    assert result["name"].value == "new value"
+
+
 async def test_list_variables(service, session: AsyncSession):
     user_id = uuid4()
     names = ["name1", "name2", "name3"]
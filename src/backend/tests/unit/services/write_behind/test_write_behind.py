@@ -0,0 +1,134 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from langflow.services.database.models.message.model import MessageTable
+from langflow.services.database.models.transactions.model import TransactionBase, TransactionTable
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
+from langflow.services.settings.base import Settings
+from langflow.services.write_behind import service as write_behind_module
+from langflow.services.write_behind.service import TRANSACTION, VERTEX_BUILD, WriteBehindService
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.fixture
+def settings():
+    settings = Settings()
+    # Settings are only read from the environment, so override them after creation
+    settings.write_behind_batch_size = 100
+    settings.write_behind_flush_interval = 60
+    settings.write_behind_max_buffer_size = 5
+    settings.write_behind_retention_interval = 3600
+    settings.max_transactions_to_keep = 2
+    settings.max_vertex_builds_to_keep = 10
+    settings.max_vertex_builds_per_vertex = 1
+    return settings
+
+
+@pytest.fixture
+async def service(settings, async_session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(write_behind_module, "get_db_service", lambda: SimpleNamespace(engine=async_session.bind))
+    service = WriteBehindService(SimpleNamespace(settings=settings))
+    service.start()
+    yield service
+    await service.stop()
+    await async_session.execute(delete(TransactionTable))
+    await async_session.execute(delete(VertexBuildTable))
+    await async_session.commit()
+
+
+def make_transaction(flow_id, offset: int = 0) -> TransactionBase:
+    return TransactionBase(
+        vertex_id="vertex",
+        status="success",
+        flow_id=flow_id,
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=offset),
+    )
+
+
+async def count(async_session: AsyncSession, table) -> int:
+    return (await async_session.execute(select(func.count()).select_from(table))).scalar()
+
+
+async def test_rows_are_buffered_and_written_in_bulk(service, async_session):
+    flow_id = uuid4()
+    for offset in range(3):
+        assert service.enqueue_transaction(make_transaction(flow_id, offset))
+    assert service.enqueue_vertex_build(VertexBuildBase(id="vertex", flow_id=flow_id, valid=True))
+
+    assert await count(async_session, TransactionTable) == 0
+    assert await service.flush() == 4
+
+    assert await count(async_session, TransactionTable) == 3
+    assert await count(async_session, VertexBuildTable) == 1
+    assert service.stats()["flushed"] == {"transaction": 3, "vertex_build": 1, "message": 0}
+
+
+async def test_batch_size_wakes_up_the_worker(service, async_session):
+    service.batch_size = 2
+    flow_id = uuid4()
+
+    service.enqueue_transaction(make_transaction(flow_id, 0))
+    service.enqueue_transaction(make_transaction(flow_id, 1))
+    for _ in range(50):
+        if service.flushed[TRANSACTION] == 2:
+            break
+        await asyncio.sleep(0.01)
+
+    assert await count(async_session, TransactionTable) == 2
+
+
+async def test_full_buffer_hands_rows_back_to_the_caller(service):
+    flow_id = uuid4()
+    enqueued = [service.enqueue_transaction(make_transaction(flow_id, offset)) for offset in range(6)]
+
+    assert enqueued == [True] * 5 + [False]
+    assert not service.enqueue_message(MessageTable(text="hello", sender="User", sender_name="User", session_id="s"))
+    assert service.pending() == 5
+    assert service.stats()["overflowed"] == {"transaction": 1, "vertex_build": 0, "message": 1}
+
+
+async def test_retention_is_applied_by_prune_not_per_row(service, async_session):
+    service.max_buffer_size = 0
+    flow_id = uuid4()
+    for offset in range(4):
+        service.enqueue_transaction(make_transaction(flow_id, offset))
+        service.enqueue_vertex_build(VertexBuildBase(id="vertex", flow_id=flow_id, valid=True))
+    await service.flush()
+    assert await count(async_session, TransactionTable) == 4
+
+    await service.prune()
+
+    assert await count(async_session, TransactionTable) == 2
+    assert await count(async_session, VertexBuildTable) == 1
+    timestamps = (await async_session.execute(select(TransactionTable.timestamp))).scalars().all()
+    assert sorted(timestamp.second for timestamp in timestamps) == [2, 3]
+
+
+async def test_rows_that_cannot_be_written_do_not_fail_the_batch(service, async_session):
+    flow_id = uuid4()
+    service.enqueue_transaction(make_transaction(flow_id))
+    service._append(TRANSACTION, TransactionTable(vertex_id=None, status="success", flow_id=flow_id))
+    service.enqueue_transaction(make_transaction(flow_id, 1))
+
+    assert await service.flush() == 2
+
+    assert await count(async_session, TransactionTable) == 2
+    assert service.failed[TRANSACTION] == 1
+
+
+async def test_stop_flushes_and_discard_drops_rows_of_deleted_flows(service, async_session):
+    kept_flow, deleted_flow = uuid4(), uuid4()
+    service.enqueue_vertex_build(VertexBuildBase(id="a", flow_id=kept_flow, valid=True))
+    service.enqueue_vertex_build(VertexBuildBase(id="b", flow_id=deleted_flow, valid=True))
+
+    assert service.discard_flow(str(deleted_flow)) == 1
+    await service.stop()
+
+    assert not service.running
+    assert service.flushed[VERTEX_BUILD] == 1
+    assert await count(async_session, VertexBuildTable) == 1
+    assert not service.enqueue_vertex_build(VertexBuildBase(id="a", flow_id=kept_flow, valid=True))
@@ -1,10 +1,12 @@
 import asyncio
+import json
 from uuid import UUID, uuid4
 
 import pytest
 from fastapi import status
 from httpx import AsyncClient
 from langflow.custom.directory_reader.directory_reader import DirectoryReader
+from langflow.graph.graph.plan import graph_plan_cache
 from langflow.services.deps import get_settings_service
 
 
@@ -127,6 +129,23 @@ async def test_get_all(client: AsyncClient, logged_in_headers):
     assert "ChatOutput" in json_response["outputs"]
 
 
+async def test_get_all_is_served_with_an_etag(client: AsyncClient, logged_in_headers):
+    response = await client.get("api/v1/all", headers=logged_in_headers)
+    etag = response.headers["etag"]
+
+    not_modified = await client.get("api/v1/all", headers={**logged_in_headers, "If-None-Match": etag})
+    etags = await client.get("api/v1/all/etags", headers=logged_in_headers)
+    inputs = await client.get("api/v1/all/inputs", headers=logged_in_headers)
+    missing = await client.get("api/v1/all/not-a-component-type", headers=logged_in_headers)
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert not_modified.status_code == 304
+    assert etags.json()["etag"] == etag
+    assert inputs.json() == response.json()["inputs"]
+    assert inputs.headers["etag"] == etags.json()["categories"]["inputs"]
+    assert missing.status_code == 404
+
+
 @pytest.mark.usefixtures("active_user")
 async def test_post_validate_code(client: AsyncClient, logged_in_headers):
     # Test case with a valid import and function
@@ -329,6 +348,28 @@ async def test_successful_run_with_output_type_text(client, simple_api_test, cre
     assert all(key in result for result in inner_results for key in expected_keys), outputs_dict
 
 
+async def test_run_reuses_compiled_plan_until_flow_is_saved(
+    client, simple_api_test, created_api_key, logged_in_headers
+):
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    graph_plan_cache.clear()
+
+    for _ in range(2):
+        response = await client.post(f"/api/v1/run/{flow_id}", headers=headers, json={"output_type": "text"})
+        assert response.status_code == status.HTTP_200_OK, response.text
+    assert graph_plan_cache.stats()["misses"] == 1
+    assert graph_plan_cache.stats()["hits"] == 1
+
+    response = await client.patch(f"api/v1/flows/{flow_id}", json={"description": "Updated"}, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert len(graph_plan_cache) == 0
+
+    response = await client.post(f"/api/v1/run/{flow_id}", headers=headers, json={"output_type": "text"})
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert graph_plan_cache.stats()["misses"] == 2
+
+
 @pytest.mark.benchmark
 async def test_successful_run_with_output_type_any(client, simple_api_test, created_api_key):
     # This one should have both the ChatOutput and TextOutput components
@@ -509,6 +550,39 @@ async def test_successful_run_with_input_type_any(client, simple_api_test, creat
     )
 
 
+@pytest.fixture
+def saturated_run_executor(monkeypatch):
+    from langflow.processing import orchestrator
+    from langflow.processing.executor import RunExecutor
+
+    executor = RunExecutor(max_concurrency=1, policy="reject")
+    executor.active = 1
+    monkeypatch.setattr(orchestrator, "get_run_executor", lambda: executor)
+    return executor
+
+
+async def test_rejected_run_returns_too_many_requests(client, simple_api_test, created_api_key, saturated_run_executor):
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    response = await client.post(f"/api/v1/run/{flow_id}", headers=headers)
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS, response.text
+    assert saturated_run_executor.rejected == 1
+
+
+async def test_rejected_streaming_run_reports_server_busy(
+    client, simple_api_test, created_api_key, saturated_run_executor
+):
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    response = await client.post(f"/api/v1/run/{flow_id}?stream=true", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    events = [json.loads(line) for line in response.text.splitlines() if line.strip()]
+    errors = [event for event in events if event["event"] == "error"]
+    assert len(errors) == 1, events
+    assert "Server busy" in errors[0]["data"]["error"]
+    assert saturated_run_executor.rejected == 1
+
+
 async def test_invalid_flow_id(client, created_api_key):
     headers = {"x-api-key": created_api_key.api_key}
     flow_id = "invalid-flow-id"
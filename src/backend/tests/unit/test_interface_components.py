@@ -1,4 +1,8 @@
-from langflow.interface.components import apply_enterprise_first_pass_component_filter
+import asyncio
+
+import orjson
+from langflow.interface import components as components_module
+from langflow.interface.components import ComponentCache, apply_enterprise_first_pass_component_filter
 
 
 def test_apply_enterprise_first_pass_component_filter_excludes_bundle_types() -> None:
@@ -42,3 +46,37 @@ def test_apply_enterprise_first_pass_component_filter_with_custom_exclusions() -
 
     assert "confluence" in filtered["components"]
     assert "tools" not in filtered["components"]
+
+
+async def test_component_cache_encodes_the_catalog_once_per_change(monkeypatch) -> None:
+    encoded = []
+    encode_payload = components_module.encode_payload
+
+    def recording_encode_payload(data):
+        encoded.append(data)
+        return encode_payload(data)
+
+    monkeypatch.setattr(components_module, "encode_payload", recording_encode_payload)
+    cache = ComponentCache()
+    cache.all_types_dict = {"components": {"inputs": {"ChatInput": {}}, "outputs": {"ChatOutput": {}}}}
+
+    first, second = await asyncio.gather(cache.aget_encoded(), cache.aget_encoded())
+    inputs = await cache.aget_encoded("inputs")
+    outputs = await cache.aget_encoded("outputs")
+
+    assert first is second
+    assert len(encoded) == 3
+    assert orjson.loads(inputs.body) == {"ChatInput": {}}
+    assert await cache.aget_encoded("missing") is None
+
+    # A lazily loaded component only invalidates the catalog and its own category
+    cache.all_types_dict["components"]["inputs"]["ChatInput"] = {"template": {}}
+    cache.invalidate("inputs")
+
+    assert await cache.aget_encoded("outputs") is outputs
+    assert (await cache.aget_encoded("inputs")).etag != inputs.etag
+    assert (await cache.aget_encoded()).etag != first.etag
+
+    cache.all_types_dict = {"inputs": {}}
+    assert cache.encoded == {}
+    assert cache.categories() == {"inputs": {}}
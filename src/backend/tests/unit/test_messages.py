@@ -21,8 +21,9 @@ from langflow.schema.properties import Properties, Source
 # Assuming you have these imports available
 from langflow.services.database.models.message import MessageCreate, MessageRead
 from langflow.services.database.models.message.model import MessageTable
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_db_service, session_scope
 from langflow.services.tracing.utils import convert_to_langchain_type
+from sqlalchemy import event
 
 
 @pytest.fixture
@@ -99,6 +100,57 @@ async def test_aadd_messagetables(async_session):
     assert added_messages[0].text == "New Test message"
 
 
+@pytest.fixture
+def executed_statements():
+    engine = get_db_service().engine.sync_engine
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args):
+        # Only the statements on the message table, other services may query meanwhile
+        if " message " in statement:
+            statements.append(statement.split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.mark.usefixtures("client")
+async def test_aadd_messages_inserts_in_one_statement_without_refreshing(executed_statements):
+    messages = [
+        Message(text=f"Bulk message {i}", sender="User", sender_name="User", session_id="bulk_session")
+        for i in range(5)
+    ]
+
+    stored = await aadd_messages(messages)
+
+    assert [message.text for message in stored] == [f"Bulk message {i}" for i in range(5)]
+    assert all(isinstance(message.id, UUID) for message in stored)
+    assert executed_statements == ["INSERT"]
+
+
+@pytest.mark.usefixtures("client")
+async def test_aadd_messages_keeps_an_assigned_id():
+    message_id = uuid4()
+    message = Message(text="Streamed", sender="AI", sender_name="AI", session_id="bulk_session", id=message_id)
+
+    stored = await aadd_messages(message)
+
+    assert stored[0].id == message_id
+    assert (await aget_messages(session_id="bulk_session"))[0].id == message_id
+
+
+@pytest.mark.usefixtures("client")
+async def test_aupdate_messages_uses_one_statement_per_message(created_messages, executed_statements):
+    for i, message in enumerate(created_messages):
+        message.text = f"Updated message {i}"
+
+    updated = await aupdate_messages(created_messages)
+
+    assert [message.text for message in updated] == [f"Updated message {i}" for i in range(3)]
+    assert executed_statements == ["UPDATE"] * 3
+
+
 @pytest.mark.usefixtures("client")
 def test_delete_messages():
     session_id = "new_session_id"
@@ -0,0 +1,130 @@
+import asyncio
+import time
+
+import pytest
+from langflow.middleware import RequestCancelledMiddleware
+
+SCOPE = {"type": "http", "method": "POST", "path": "/api/v1/run/flow"}
+
+
+class Client:
+    """Plays the server side of one request: sends the body, then disconnects when told to."""
+
+    def __init__(self, body_chunks=(b"",)) -> None:
+        self.body_chunks = list(body_chunks)
+        self.gone = asyncio.Event()
+        self.sent: list[dict] = []
+        self.receive_calls = 0
+
+    async def receive(self) -> dict:
+        self.receive_calls += 1
+        if self.body_chunks:
+            chunk = self.body_chunks.pop(0)
+            return {"type": "http.request", "body": chunk, "more_body": bool(self.body_chunks)}
+        await self.gone.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message: dict) -> None:
+        self.sent.append(message)
+
+
+async def test_disconnect_cancels_the_handler():
+    client = Client()
+    cancelled = asyncio.Event()
+
+    async def app(scope, receive, send):  # noqa: ARG001
+        await receive()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    task = asyncio.create_task(RequestCancelledMiddleware(app)(SCOPE, client.receive, client.send))
+    await asyncio.sleep(0.01)
+    client.gone.set()
+    await asyncio.wait_for(task, 1)
+
+    assert cancelled.is_set()
+    assert client.sent[0] == {"type": "http.response.start", "status": 499, "headers": []}
+
+
+async def test_disconnect_cancels_a_streaming_response():
+    client = Client()
+
+    async def app(scope, receive, send):  # noqa: ARG001
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        while True:
+            await send({"type": "http.response.body", "body": b"chunk", "more_body": True})
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(RequestCancelledMiddleware(app)(SCOPE, client.receive, client.send))
+    await asyncio.sleep(0.05)
+    client.gone.set()
+    await asyncio.wait_for(task, 1)
+
+    assert client.sent[0]["status"] == 200
+    assert all(message["type"] == "http.response.body" for message in client.sent[1:])
+
+
+async def test_request_body_and_work_after_the_response_are_kept():
+    client = Client([b"a", b"b", b"c"])
+    received, finished = [], asyncio.Event()
+
+    async def app(scope, receive, send):  # noqa: ARG001
+        while True:
+            message = await receive()
+            received.append(message["body"])
+            if not message["more_body"]:
+                break
+        await send({"type": "http.response.start", "status": 202, "headers": []})
+        await send({"type": "http.response.body", "body": b"accepted"})
+        # Like background tasks, this runs once the response is complete and the client may be gone
+        client.gone.set()
+        await asyncio.sleep(0.01)
+        finished.set()
+
+    await asyncio.wait_for(RequestCancelledMiddleware(app)(SCOPE, client.receive, client.send), 1)
+
+    assert received == [b"a", b"b", b"c"]
+    assert finished.is_set()
+    assert [message.get("status") for message in client.sent] == [202, None]
+
+
+async def test_receive_errors_reach_the_handler():
+    async def receive():
+        msg = "too large"
+        raise ValueError(msg)
+
+    async def app(scope, receive, send):  # noqa: ARG001
+        await receive()
+
+    with pytest.raises(ValueError, match="too large"):
+        await asyncio.wait_for(RequestCancelledMiddleware(app)(SCOPE, receive, Client().send), 1)
+
+
+@pytest.mark.benchmark
+async def test_idle_requests_cost_no_wakeups():
+    requests, duration = 2000, 1.0
+    clients = [Client() for _ in range(requests)]
+
+    async def app(scope, receive, send):  # noqa: ARG001
+        await receive()
+        await asyncio.sleep(duration)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"done"})
+
+    middleware = RequestCancelledMiddleware(app)
+    wall, cpu = time.perf_counter(), time.process_time()
+    await asyncio.gather(*(middleware(SCOPE, client.receive, client.send) for client in clients))
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+    receive_calls = sum(client.receive_calls for client in clients)
+    # The polling middleware called is_disconnected every 100 ms for each request
+    polled = int(requests * duration / 0.1)
+    print(  # noqa: T201
+        f"{requests} requests held {duration}s: {receive_calls} receive calls (polling: ~{polled}), "
+        f"{cpu:.3f}s CPU over {wall:.3f}s"
+    )
+    assert receive_calls == 2 * requests
+    assert all(client.sent[0]["status"] == 200 for client in clients)
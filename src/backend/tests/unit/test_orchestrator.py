@@ -1,9 +1,12 @@
+import asyncio
 import sys
 from types import ModuleType
 
 import pytest
-
-from langflow.processing.orchestrator import run_graph_with_orchestrator
+from langflow.graph.schema import ResultData
+from langflow.processing import orchestrator as orchestrator_module
+from langflow.processing.executor import RunExecutor, RunRejectedError
+from langflow.processing.orchestrator import _get_orchestrator, run_graph_with_orchestrator
 
 
 class DummyGraph:
@@ -60,3 +63,95 @@ async def test_langgraph_backend_uses_graph_private_run(monkeypatch):
     assert len(result) == 1
     assert result[0].inputs == {"input_value": "hello"}
     assert graph._run_calls == 1
+
+
+class SleepyGraph:
+    """Records how many copies of the graph run at the same time."""
+
+    active = 0
+    peak = 0
+
+    def __init__(self):
+        self.session_id = ""
+        self.context = {}
+        self.run_id = None
+
+    def set_run_id(self):
+        self.run_id = object()
+
+    async def _run(self, *, inputs, **kwargs):  # noqa: ARG002
+        cls = type(self)
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        try:
+            value = inputs["input_value"]
+            if value == "boom":
+                msg = "boom"
+                raise ValueError(msg)
+            # Later inputs finish first, so ordering by completion would reverse the results
+            await asyncio.sleep(0.01 * (10 - int(value)))
+            return [ResultData(results={"value": value})]
+        finally:
+            cls.active -= 1
+
+
+@pytest.fixture
+def sleepy_graph():
+    SleepyGraph.active = 0
+    SleepyGraph.peak = 0
+    return SleepyGraph()
+
+
+async def test_batch_runs_concurrently_and_keeps_input_order(sleepy_graph):
+    inputs = [{"input_value": str(index)} for index in range(6)]
+
+    result = await run_graph_with_orchestrator(graph=sleepy_graph, inputs=inputs, max_concurrency=3)
+
+    assert [run_output.outputs[0].results["value"] for run_output in result] == [str(index) for index in range(6)]
+    assert SleepyGraph.peak == 3
+
+
+async def test_batch_reports_failures_per_input(sleepy_graph):
+    inputs = [{"input_value": "1"}, {"input_value": "boom"}, {"input_value": "2"}]
+
+    result = await run_graph_with_orchestrator(graph=sleepy_graph, inputs=inputs, max_concurrency=2)
+
+    assert [run_output.error for run_output in result] == [None, "boom", None]
+    assert result[1].inputs == {"input_value": "boom"}
+    assert result[2].outputs[0].results == {"value": "2"}
+    assert "error" not in result[0].model_dump()
+    assert result[1].model_dump()["error"] == "boom"
+
+
+async def test_single_input_raises(sleepy_graph):
+    with pytest.raises(ValueError, match="boom"):
+        await run_graph_with_orchestrator(graph=sleepy_graph, inputs=[{"input_value": "boom"}], max_concurrency=4)
+
+
+async def test_concurrency_of_one_runs_sequentially_on_the_same_graph(sleepy_graph):
+    inputs = [{"input_value": str(index)} for index in range(3)]
+
+    result = await run_graph_with_orchestrator(graph=sleepy_graph, inputs=inputs, max_concurrency=1)
+
+    assert len(result) == 3
+    assert SleepyGraph.peak == 1
+
+
+def test_orchestrator_is_compiled_once():
+    assert _get_orchestrator() is _get_orchestrator()
+
+
+async def test_runs_are_admitted_by_the_shared_run_executor(sleepy_graph, monkeypatch):
+    executor = RunExecutor(max_concurrency_per_flow=1, policy="reject")
+    monkeypatch.setattr(orchestrator_module, "get_run_executor", lambda: executor)
+    sleepy_graph.flow_id = "flow-1"
+
+    results = await asyncio.gather(
+        run_graph_with_orchestrator(graph=sleepy_graph, inputs=[{"input_value": "1"}]),
+        run_graph_with_orchestrator(graph=sleepy_graph, inputs=[{"input_value": "2"}]),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[1], RunRejectedError)
+    assert results[0][0].outputs[0].results == {"value": "1"}
+    assert executor.stats()["active"] == 0
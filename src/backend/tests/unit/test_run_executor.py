@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+from langflow.processing.executor import RunExecutor, RunRejectedError
+
+
+async def hold(executor: RunExecutor, flow_id: str | None, started: list, release: asyncio.Event) -> None:
+    async with executor.admit(flow_id):
+        started.append(flow_id)
+        await release.wait()
+
+
+async def test_global_limit_queues_runs_in_arrival_order():
+    executor = RunExecutor(max_concurrency=2)
+    started, release = [], asyncio.Event()
+
+    tasks = [asyncio.create_task(hold(executor, f"flow-{index}", started, release)) for index in range(4)]
+    await asyncio.sleep(0.01)
+    assert started == ["flow-0", "flow-1"]
+    assert executor.stats()["queued"] == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert started == ["flow-0", "flow-1", "flow-2", "flow-3"]
+    stats = executor.stats()
+    assert stats["active"] == 0
+    assert stats["admitted"] == 4
+    assert stats["queued_total"] == 2
+    assert stats["max_queue_time"] > 0
+
+
+async def test_per_flow_limit_does_not_hold_back_other_flows():
+    executor = RunExecutor(max_concurrency=3, max_concurrency_per_flow=1, flow_limits={"cheap": 2})
+    started, release = [], asyncio.Event()
+
+    flow_ids = ["expensive", "expensive", "cheap", "cheap", "cheap"]
+    tasks = [asyncio.create_task(hold(executor, flow_id, started, release)) for flow_id in flow_ids]
+    await asyncio.sleep(0.01)
+
+    assert started == ["expensive", "cheap", "cheap"]
+    assert executor.stats()["active_per_flow"] == {"expensive": 1, "cheap": 2}
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert sorted(started) == sorted(flow_ids)
+
+
+async def test_reject_policy_and_full_queue_raise():
+    release = asyncio.Event()
+    rejecting = RunExecutor(max_concurrency=1, policy="reject")
+    task = asyncio.create_task(hold(rejecting, "flow", [], release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(RunRejectedError):
+        async with rejecting.admit("other-flow"):
+            pass
+
+    queueing = RunExecutor(max_concurrency=1, max_queue_size=1)
+    tasks = [asyncio.create_task(hold(queueing, "flow", [], release)) for _ in range(2)]
+    await asyncio.sleep(0)
+    with pytest.raises(RunRejectedError):
+        async with queueing.admit("flow"):
+            pass
+
+    release.set()
+    await asyncio.gather(task, *tasks)
+    assert rejecting.stats()["rejected"] == queueing.stats()["rejected"] == 1
+
+
+async def test_queue_timeout_and_cancelled_waiters_give_up_their_place():
+    executor = RunExecutor(max_concurrency=1, queue_timeout=0.01)
+    started, release = [], asyncio.Event()
+    task = asyncio.create_task(hold(executor, "flow", started, release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(RunRejectedError):
+        async with executor.admit("flow"):
+            pass
+
+    executor.queue_timeout = 0
+    cancelled = asyncio.create_task(hold(executor, "cancelled", started, release))
+    waiting = asyncio.create_task(hold(executor, "waiting", started, release))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+    await asyncio.gather(task, waiting)
+
+    assert started == ["flow", "waiting"]
+    assert executor.stats() | {"max_queue_time": 0, "mean_queue_time": 0} == {
+        "active": 0,
+        "active_per_flow": {},
+        "queued": 0,
+        "admitted": 2,
+        "rejected": 1,
+        "queued_total": 3,
+        "max_queue_time": 0,
+        "mean_queue_time": 0,
+    }
+
+
+async def test_nested_runs_do_not_wait_for_their_parent_slot():
+    executor = RunExecutor(max_concurrency=1)
+
+    async with executor.admit("parent"), executor.admit("child"):
+        assert executor.stats()["active"] == 1
+
+    assert executor.stats()["active"] == 0
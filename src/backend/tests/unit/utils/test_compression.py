@@ -0,0 +1,57 @@
+import gzip
+
+import orjson
+import pytest
+from langflow.utils.compression import encode_payload, etag_matches, payload_response
+from starlette.requests import Request
+
+
+def make_request(**headers) -> Request:
+    raw_headers = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers})
+
+
+def test_encode_payload_keeps_compressed_variants_of_the_same_body():
+    payload = encode_payload({"inputs": {"ChatInput": {"display_name": "Chat Input"}}})
+
+    assert orjson.loads(payload.body) == {"inputs": {"ChatInput": {"display_name": "Chat Input"}}}
+    assert gzip.decompress(payload.encoded["gzip"]) == payload.body
+    assert payload.etag.startswith('W/"')
+    assert encode_payload({"inputs": {}}).etag != payload.etag
+    assert encode_payload({"inputs": {"ChatInput": {"display_name": "Chat Input"}}}).etag == payload.etag
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [(None, False), ("*", True), ('W/"abc"', True), ('"abc"', True), ('"other", W/"abc"', True), ('"other"', False)],
+)
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, 'W/"abc"') is expected
+
+
+def test_payload_response_negotiates_the_encoding():
+    payload = encode_payload({"a": 1})
+    payload.encoded["br"] = b"brotli"
+
+    brotli_response = payload_response(payload, make_request(accept_encoding="gzip, br"))
+    gzip_response = payload_response(payload, make_request(accept_encoding="gzip, br;q=0"))
+    identity_response = payload_response(payload, make_request())
+
+    assert brotli_response.headers["content-encoding"] == "br"
+    assert brotli_response.body == b"brotli"
+    assert gzip_response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(gzip_response.body) == payload.body
+    assert "content-encoding" not in identity_response.headers
+    assert identity_response.body == payload.body
+    assert identity_response.headers["etag"] == payload.etag
+    assert identity_response.headers["vary"] == "Accept-Encoding"
+
+
+def test_payload_response_returns_not_modified_for_a_matching_etag():
+    payload = encode_payload({"a": 1})
+
+    response = payload_response(payload, make_request(if_none_match=payload.etag, accept_encoding="gzip"))
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == payload.etag